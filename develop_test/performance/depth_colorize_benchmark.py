@@ -0,0 +1,76 @@
+"""
+深度图着色基准测试：逐帧百分位数 + 浮点归一化 + applyColorMap vs 查找表着色
+
+模拟 OAK uint16 毫米深度流（场景缓慢漂移、含无效零值），统计每帧着色的平均耗时
+以及查找表的重建次数。
+
+运行方式：
+    python develop_test/performance/depth_colorize_benchmark.py
+    python develop_test/performance/depth_colorize_benchmark.py quick
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from oak_vision_system.modules.display_modules.depth_colorizer import DepthColorizer
+
+
+def make_depth_frames(rng, width: int, height: int, frames: int):
+    """生成缓慢漂移的深度帧序列（底图 + 每帧小幅噪声，约 5% 无效像素）"""
+    yy, xx = np.mgrid[0:height, 0:width]
+    base = 800 + 2500 * (yy / height) + 300 * np.sin(xx / 40.0)
+    result = []
+    for i in range(frames):
+        noise = rng.normal(0, 15, size=(height, width))
+        depth = np.clip(base + 2.0 * i + noise, 0, 65535).astype(np.uint16)
+        depth[rng.random((height, width)) < 0.05] = 0
+        result.append(depth)
+    return result
+
+
+def colorize_reference(depth: np.ndarray, out: np.ndarray) -> None:
+    """旧实现：float32 暂存 + 降采样百分位数 + 线性归一化 + applyColorMap"""
+    scratch = depth.astype(np.float32)
+    sample = scratch[::4, ::4]
+    min_depth = np.percentile(sample[sample != 0], 1)
+    max_depth = np.percentile(sample, 99)
+    scratch -= min_depth
+    scratch *= 255.0 / (max_depth - min_depth)
+    np.clip(scratch, 0, 255, out=scratch)
+    cv2.applyColorMap(scratch.astype(np.uint8), cv2.COLORMAP_HOT, dst=out)
+
+
+def bench(colorize, frames, out) -> float:
+    start = time.perf_counter()
+    for depth in frames:
+        colorize(depth, out)
+    return (time.perf_counter() - start) / len(frames)
+
+
+def main(quick: bool = False):
+    rng = np.random.default_rng(0)
+    num_frames = 20 if quick else 200
+
+    print("=" * 60)
+    print(f"深度图着色基准测试 ({num_frames} 帧)")
+    print("=" * 60)
+    for width, height in ((640, 400), (1280, 720)):
+        frames = make_depth_frames(rng, width, height, num_frames)
+        out = np.empty((height, width, 3), dtype=np.uint8)
+        colorizer = DepthColorizer()
+        t_ref = bench(colorize_reference, frames, out)
+        t_lut = bench(lambda depth, dst: colorizer.colorize(depth, out=dst), frames, out)
+        print(
+            f"  {width}x{height}   逐帧归一化 {t_ref * 1e3:6.2f} ms   查找表 {t_lut * 1e3:6.2f} ms   "
+            f"加速 {t_ref / t_lut:5.1f}x   查找表重建 {colorizer.lut_rebuilds} 次"
+        )
+
+
+if __name__ == "__main__":
+    main(quick=len(sys.argv) > 1 and sys.argv[1] == "quick")
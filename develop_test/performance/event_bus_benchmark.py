@@ -0,0 +1,104 @@
+"""
+EventBus 发布路径微基准测试
+
+测试场景：
+1. 单线程发布，不同分发策略（INLINE / POOL / DEDICATED_THREAD）
+2. 多线程并发发布（模拟多相机 × 热点事件类型，INLINE 订阅者）
+3. 积压突发：逐条 publish vs publish_many（POOL 订阅者）
+
+运行方式：
+    python develop_test/performance/event_bus_benchmark.py
+    python develop_test/performance/event_bus_benchmark.py quick
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from oak_vision_system.core.event_bus import DispatchMode, EventBus, EventType
+
+HOT_EVENT_TYPES = (
+    EventType.RAW_FRAME_DATA,
+    EventType.RAW_DETECTION_DATA,
+    EventType.PROCESSED_DATA,
+)
+
+
+def bench_single(mode: DispatchMode, n: int) -> float:
+    """单线程发布 n 次，返回每次发布耗时（ns）"""
+    bus = EventBus()
+    bus.subscribe(EventType.RAW_FRAME_DATA, lambda d: None, dispatch_mode=mode)
+    start = time.perf_counter()
+    for i in range(n):
+        bus.publish(EventType.RAW_FRAME_DATA, i)
+    elapsed = time.perf_counter() - start
+    bus.close(wait=True)
+    return elapsed / n * 1e9
+
+
+def bench_concurrent(publishers: int, n: int) -> float:
+    """publishers 个线程并发发布到 3 个热点事件类型，返回总吞吐（次/秒）"""
+    bus = EventBus()
+    for event_type in HOT_EVENT_TYPES:
+        bus.subscribe(event_type, lambda d: None, dispatch_mode=DispatchMode.INLINE)
+
+    def worker():
+        for i in range(n):
+            bus.publish(HOT_EVENT_TYPES[i % 3], i)
+
+    threads = [threading.Thread(target=worker) for _ in range(publishers)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    bus.close()
+    return publishers * n / elapsed
+
+
+def bench_burst(batched: bool, n: int, burst: int) -> float:
+    """每次突发 burst 条消息，返回每条消息的平均分发耗时（ns，含等待订阅者完成）"""
+    bus = EventBus()
+    bus.subscribe(EventType.RAW_FRAME_DATA, lambda d: None)
+    items = list(range(burst))
+    rounds = n // burst
+    start = time.perf_counter()
+    for _ in range(rounds):
+        if batched:
+            bus.publish_many(EventType.RAW_FRAME_DATA, items)
+        else:
+            for item in items:
+                bus.publish(EventType.RAW_FRAME_DATA, item)
+    bus.close(wait=True)
+    elapsed = time.perf_counter() - start
+    return elapsed / (rounds * burst) * 1e9
+
+
+def main(quick: bool = False):
+    n = 20_000 if quick else 200_000
+
+    print("=" * 60)
+    print(f"EventBus 发布基准测试 (n={n})")
+    print("=" * 60)
+
+    print("\n1. 单线程发布（1 个订阅者）")
+    for mode in DispatchMode:
+        print(f"  {mode.name:<18} {bench_single(mode, n):8.1f} ns/publish")
+
+    print("\n2. 并发发布（INLINE 订阅者，3 个热点事件类型）")
+    for publishers in (1, 4, 8):
+        rate = bench_concurrent(publishers, n // publishers)
+        print(f"  {publishers} 个发布线程   {rate / 1000:8.1f} k publish/s")
+
+    print("\n3. 积压突发（每次 8 条，POOL 订阅者）")
+    for batched in (False, True):
+        name = "publish_many" if batched else "逐条 publish"
+        print(f"  {name:<14} {bench_burst(batched, n, 8):8.1f} ns/msg")
+
+
+if __name__ == "__main__":
+    main(quick=len(sys.argv) > 1 and sys.argv[1] == "quick")
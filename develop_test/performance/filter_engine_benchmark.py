@@ -0,0 +1,72 @@
+"""
+FilterManager 引擎基准测试：object vs vectorized
+
+模拟多设备、多标签的持续跟踪场景（目标缓慢移动），
+统计每帧 FilterManager.process 的平均耗时。
+
+运行方式：
+    python develop_test/performance/filter_engine_benchmark.py
+    python develop_test/performance/filter_engine_benchmark.py quick
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from oak_vision_system.core.dto.config_dto.device_binding_dto import DeviceMetadataDTO
+from oak_vision_system.core.dto.config_dto.enums import ConnectionStatus
+from oak_vision_system.modules.data_processing.filter_manager import FilterManager
+
+
+def make_frames(rng, frames: int, objects: int, labels: int):
+    centers = rng.uniform(50, 550, size=(objects, 2))
+    obj_labels = (np.arange(objects) % labels).astype(np.int32)
+    result = []
+    for _ in range(frames):
+        centers += rng.normal(0, 1.5, size=centers.shape)
+        bboxes = np.hstack([centers - 20, centers + 20]).astype(np.float32)
+        coords = rng.normal(0, 500, size=(objects, 3)).astype(np.float32)
+        confs = np.full(objects, 0.9, dtype=np.float32)
+        result.append((coords, bboxes, confs, obj_labels))
+    return result
+
+
+def bench(engine: str, device_ids, frames) -> float:
+    metadata = {
+        d: DeviceMetadataDTO(mxid=d, product_name="OAK-D", connection_status=ConnectionStatus.CONNECTED)
+        for d in device_ids
+    }
+    manager = FilterManager(
+        device_metadata=metadata, label_map=["durian", "person", "car"], pool_size=32, engine=engine
+    )
+    start = time.perf_counter()
+    for coords, bboxes, confs, labels in frames:
+        for device_id in device_ids:
+            manager.process(device_id, coords, bboxes, confs, labels)
+    return (time.perf_counter() - start) / (len(frames) * len(device_ids))
+
+
+def main(quick: bool = False):
+    rng = np.random.default_rng(0)
+    num_frames = 100 if quick else 1000
+    device_ids = ["device_001", "device_002", "device_003", "device_004"]
+
+    print("=" * 60)
+    print(f"FilterManager 引擎基准测试 ({len(device_ids)} 设备, {num_frames} 帧)")
+    print("=" * 60)
+    for objects in (6, 24, 60):
+        frames = make_frames(rng, num_frames, objects, labels=3)
+        t_obj = bench("object", device_ids, frames)
+        t_vec = bench("vectorized", device_ids, frames)
+        print(
+            f"  {objects:>3} 目标/帧   object {t_obj * 1e6:8.1f} us   "
+            f"vectorized {t_vec * 1e6:8.1f} us   加速 {t_obj / t_vec:4.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main(quick=len(sys.argv) > 1 and sys.argv[1] == "quick")
@@ -0,0 +1,129 @@
+"""
+OverflowQueue vs RingOverflowQueue 微基准测试
+
+测试场景：
+1. 单线程入队（含溢出）吞吐
+2. 单生产者/单消费者并发吞吐（模拟 DataProcessor / 渲染包队列）
+3. 生产者高速写入时，背压监控线程每 50ms 轮询指标的开销
+
+运行方式：
+    python develop_test/performance/queue_benchmark.py
+    python develop_test/performance/queue_benchmark.py quick
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+from queue import Empty
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from oak_vision_system.utils.data_structures.Queue import OverflowQueue, RingOverflowQueue
+
+
+def make_queues(maxsize: int):
+    return {
+        "OverflowQueue": lambda: OverflowQueue(maxsize=maxsize),
+        "Ring(mpmc)": lambda: RingOverflowQueue(maxsize=maxsize, mode="mpmc"),
+        "Ring(spsc)": lambda: RingOverflowQueue(maxsize=maxsize, mode="spsc"),
+    }
+
+
+def bench_put_only(factory, n: int) -> float:
+    """单线程持续入队（队列很快写满，之后每次都触发溢出）"""
+    q = factory()
+    item = object()
+    start = time.perf_counter()
+    for _ in range(n):
+        q.put_with_overflow(item)
+    return time.perf_counter() - start
+
+
+def bench_spsc(factory, n: int, with_monitor: bool) -> tuple[float, int]:
+    """单生产者/单消费者并发吞吐，可选附加指标轮询线程"""
+    q = factory()
+    done = threading.Event()
+    consumed = [0]
+    polls = [0]
+
+    def producer():
+        for i in range(n):
+            q.put_with_overflow(i)
+        done.set()
+
+    def consumer():
+        while True:
+            try:
+                q.get(timeout=0.01)
+                consumed[0] += 1
+            except Empty:
+                if done.is_set():
+                    return
+
+    def monitor():
+        # 与 BackpressureMonitor 相同的调用组合
+        while not done.is_set():
+            q.get_usage_ratio()
+            q.get_pressure_level()
+            q.get_drop_count()
+            q.qsize()
+            polls[0] += 1
+            time.sleep(0.05)
+
+    threads = [threading.Thread(target=producer), threading.Thread(target=consumer)]
+    if with_monitor:
+        threads.append(threading.Thread(target=monitor))
+
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - start, consumed[0]
+
+
+def bench_metrics(factory, n: int) -> float:
+    """指标读取开销（监控端视角）"""
+    q = factory()
+    for i in range(q.maxsize // 2):
+        q.put_with_overflow(i)
+    start = time.perf_counter()
+    for _ in range(n):
+        q.get_usage_ratio()
+        q.get_pressure_level()
+        q.get_drop_count()
+    return time.perf_counter() - start
+
+
+def main(quick: bool = False):
+    n = 50_000 if quick else 500_000
+    maxsize = 10
+
+    print("=" * 60)
+    print(f"队列微基准测试 (n={n}, maxsize={maxsize})")
+    print("=" * 60)
+
+    print("\n1. 单线程入队（含溢出）")
+    for name, factory in make_queues(maxsize).items():
+        elapsed = bench_put_only(factory, n)
+        print(f"  {name:<14} {elapsed:.3f}s  {elapsed / n * 1e9:8.1f} ns/op")
+
+    print("\n2. 指标读取（usage + pressure + drop_count）")
+    for name, factory in make_queues(maxsize).items():
+        elapsed = bench_metrics(factory, n)
+        print(f"  {name:<14} {elapsed:.3f}s  {elapsed / n * 1e9:8.1f} ns/op")
+
+    for with_monitor in (False, True):
+        title = "3. SPSC 并发吞吐" + ("（附加 50ms 指标轮询）" if with_monitor else "")
+        print(f"\n{title}")
+        for name, factory in make_queues(maxsize).items():
+            elapsed, consumed = bench_spsc(factory, n, with_monitor)
+            print(
+                f"  {name:<14} {elapsed:.3f}s  {n / elapsed / 1000:8.1f} k put/s  "
+                f"consumed={consumed}"
+            )
+
+
+if __name__ == "__main__":
+    main(quick=len(sys.argv) > 1 and sys.argv[1] == "quick")
@@ -0,0 +1,87 @@
+"""
+DisplayRenderer 半透明文本背景基准测试：整帧复制混合 vs ROI 就地混合
+
+模拟一帧渲染中的全部文本叠加（设备名、设备信息、FPS、按键提示以及每个检测的坐标标签），
+统计每帧叠加绘制的平均耗时。
+
+运行方式：
+    python develop_test/performance/render_overlay_benchmark.py
+    python develop_test/performance/render_overlay_benchmark.py quick
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from oak_vision_system.modules.display_modules.overlay import OVERLAY_ALPHA, blend_rect
+
+
+def make_texts(rng, width: int, height: int, labels: int):
+    """生成一帧的文本叠加：(文本, 位置, 字号)"""
+    texts = [
+        ("left_camera", (10, 50), 1.0),
+        ("FPS: 29.8", (10, 90), 0.7),
+        ("Device: left_camera (14442C10D13EABCE00)", (width - 420, 30), 0.6),
+        ("1:left_camera  2:right_camera  3:Combined  F:Fullscreen  Q:Quit", (width // 2 - 260, height - 10), 0.5),
+    ]
+    for _ in range(labels):
+        x = int(rng.uniform(20, width - 240))
+        y = int(rng.uniform(40, height - 40))
+        texts.append((f"({int(rng.uniform(-2000, 2000))}, {int(rng.uniform(-2000, 2000))}, 1532) mm", (x, y), 0.5))
+    return texts
+
+
+def draw_full_frame(frame, text, position, font_scale, padding=5):
+    """旧实现：每个文本复制整帧并整帧混合"""
+    (tw, th), baseline = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, 1)
+    x, y = position
+    overlay = frame.copy()
+    cv2.rectangle(overlay, (x - padding, y - th - padding), (x + tw + padding, y + baseline + padding), (0, 0, 0), -1)
+    cv2.addWeighted(overlay, OVERLAY_ALPHA, frame, 1 - OVERLAY_ALPHA, 0, frame)
+    cv2.putText(frame, text, (x, y), cv2.FONT_HERSHEY_SIMPLEX, font_scale, (255, 255, 255), 1, cv2.LINE_AA)
+
+
+def draw_roi(frame, text, position, font_scale, padding=5):
+    """新实现：只混合文本背景所在的 ROI"""
+    (tw, th), baseline = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, 1)
+    x, y = position
+    blend_rect(frame, (x - padding, y - th - padding), (x + tw + padding, y + baseline + padding), (0, 0, 0))
+    cv2.putText(frame, text, (x, y), cv2.FONT_HERSHEY_SIMPLEX, font_scale, (255, 255, 255), 1, cv2.LINE_AA)
+
+
+def bench(draw, base: np.ndarray, texts, frames: int) -> float:
+    frame = base.copy()
+    start = time.perf_counter()
+    for _ in range(frames):
+        np.copyto(frame, base)
+        for text, position, font_scale in texts:
+            draw(frame, text, position, font_scale)
+    return (time.perf_counter() - start) / frames
+
+
+def main(quick: bool = False):
+    rng = np.random.default_rng(0)
+    num_frames = 20 if quick else 200
+
+    print("=" * 60)
+    print(f"文本叠加基准测试 ({num_frames} 帧)")
+    print("=" * 60)
+    for width, height in ((1280, 720), (1920, 1080)):
+        base = rng.integers(0, 255, size=(height, width, 3), dtype=np.uint8)
+        for labels in (0, 12, 40):
+            texts = make_texts(rng, width, height, labels)
+            t_full = bench(draw_full_frame, base, texts, num_frames)
+            t_roi = bench(draw_roi, base, texts, num_frames)
+            print(
+                f"  {width}x{height} {len(texts):>3} 文本/帧   整帧混合 {t_full * 1e3:7.2f} ms   "
+                f"ROI 混合 {t_roi * 1e3:6.2f} ms   加速 {t_full / t_roi:5.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main(quick=len(sys.argv) > 1 and sys.argv[1] == "quick")
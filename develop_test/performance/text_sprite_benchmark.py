@@ -0,0 +1,88 @@
+"""
+DisplayRenderer 文本绘制基准测试：逐帧 getTextSize + putText vs 文本精灵缓存
+
+模拟一帧渲染中的全部文本（设备名、设备信息、FPS、按键提示、每个检测的标签与坐标），
+坐标与 FPS 每帧变化（走字形图集），其余文本不变（走整串精灵），统计每帧文本绘制的平均耗时。
+
+运行方式：
+    python develop_test/performance/text_sprite_benchmark.py
+    python develop_test/performance/text_sprite_benchmark.py quick
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from oak_vision_system.modules.display_modules.text_sprites import TextSpriteCache
+
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+
+
+def make_texts(rng, width: int, height: int, labels: int):
+    """生成一帧的文本：(文本, 位置, 字号, 线宽, 是否逐帧变化)"""
+    texts = [
+        ("left_camera", (10, 50), 1.0, 2, False),
+        (f"FPS: {rng.uniform(20, 30):.1f}", (10, 90), 0.7, 2, True),
+        ("Device: left_camera (14442C10D13EABCE00)", (width - 420, 30), 0.6, 1, False),
+        ("1:left_camera  2:right_camera  3:Combined  F:Fullscreen  Q:Quit", (width // 2 - 260, height - 10), 0.5, 1, False),
+    ]
+    for i in range(labels):
+        x = int(rng.uniform(20, width - 240))
+        y = int(rng.uniform(40, height - 40))
+        texts.append((f"Label_{i % 4}", (x, y), 0.5, 1, False))
+        texts.append(
+            (f"({int(rng.uniform(-2000, 2000))}, {int(rng.uniform(-2000, 2000))}, 1532) mm", (x, y + 20), 0.5, 1, True)
+        )
+    return texts
+
+
+def draw_put_text(frame, texts, cache=None):
+    """旧实现：每个文本 getTextSize + 抗锯齿 putText"""
+    for text, position, font_scale, thickness, _ in texts:
+        cv2.getTextSize(text, FONT, font_scale, thickness)
+        cv2.putText(frame, text, position, FONT, font_scale, (255, 255, 255), thickness, cv2.LINE_AA)
+
+
+def draw_sprites(frame, texts, cache):
+    """新实现：文本精灵缓存"""
+    for text, position, font_scale, thickness, volatile in texts:
+        cache.measure(text, font_scale, thickness, volatile=volatile)
+        cache.draw(frame, text, position, font_scale, (255, 255, 255), thickness, volatile=volatile)
+
+
+def bench(draw, base: np.ndarray, frames_texts) -> float:
+    cache = TextSpriteCache(font=FONT)
+    frame = base.copy()
+    start = time.perf_counter()
+    for texts in frames_texts:
+        np.copyto(frame, base)
+        draw(frame, texts, cache)
+    return (time.perf_counter() - start) / len(frames_texts)
+
+
+def main(quick: bool = False):
+    rng = np.random.default_rng(0)
+    num_frames = 20 if quick else 200
+
+    print("=" * 60)
+    print(f"文本绘制基准测试 ({num_frames} 帧)")
+    print("=" * 60)
+    width, height = 1280, 720
+    base = rng.integers(0, 255, size=(height, width, 3), dtype=np.uint8)
+    for labels in (0, 12, 40):
+        frames_texts = [make_texts(rng, width, height, labels) for _ in range(num_frames)]
+        t_put = bench(draw_put_text, base, frames_texts)
+        t_sprite = bench(draw_sprites, base, frames_texts)
+        print(
+            f"  {len(frames_texts[0]):>3} 文本/帧   putText {t_put * 1e3:6.2f} ms   "
+            f"精灵缓存 {t_sprite * 1e3:6.2f} ms   加速 {t_put / t_sprite:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main(quick=len(sys.argv) > 1 and sys.argv[1] == "quick")
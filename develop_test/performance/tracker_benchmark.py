@@ -0,0 +1,73 @@
+"""
+Tracker 关联基准测试：稠密 IoU vs 门控稀疏关联
+
+模拟拥挤场景（大量尺寸相近的目标，逐帧小幅移动），
+对 N, M ∈ {4, 32, 128} 的组合统计每次 match 的平均耗时。
+gated 列强制走门控路径（匈牙利为按连通分量求解）；gated+回退 列使用默认 gate_min_cells
+（小规模自动退回稠密计算），并标出该规模下实际执行的路径。
+
+运行方式：
+    python develop_test/performance/tracker_benchmark.py
+    python develop_test/performance/tracker_benchmark.py quick
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from oak_vision_system.modules.data_processing.tracker import HungarianTracker, OptimizedGreedyTracker
+
+SIZES = (4, 32, 128)
+
+
+def make_scene(rng, n: int, m: int):
+    """目标密度固定（约每 60x60 像素一个），前 min(n, m) 个目标在两帧间保持对应"""
+    k = max(n, m)
+    side = 60.0 * np.sqrt(k)
+    xy = rng.uniform(0, side, size=(k, 2))
+    wh = 40.0 + rng.uniform(-5, 5, size=(k, 2))
+    prev = np.hstack([xy, xy + wh])[:n].astype(np.float32)
+
+    moved = xy + rng.normal(0, 4, size=xy.shape)
+    curr = np.hstack([moved, moved + wh])[:m].astype(np.float32)
+    return prev, curr
+
+
+def bench(tracker, scenes) -> float:
+    tracker.match(*scenes[0])  # 预热
+    start = time.perf_counter()
+    for prev, curr in scenes:
+        tracker.match(prev, curr)
+    return (time.perf_counter() - start) / len(scenes)
+
+
+def main(quick: bool = False):
+    rng = np.random.default_rng(0)
+    rounds = 50 if quick else 500
+
+    print("=" * 72)
+    print(f"Tracker 关联基准测试（每组 {rounds} 次 match）")
+    print("=" * 72)
+    for name, cls in (("greedy", OptimizedGreedyTracker), ("hungarian", HungarianTracker)):
+        print(f"\n{name}")
+        for n in SIZES:
+            for m in SIZES:
+                scenes = [make_scene(rng, n, m) for _ in range(rounds)]
+                t_dense = bench(cls(iou_threshold=0.3), scenes)
+                t_gated = bench(cls(iou_threshold=0.3, gated=True, gate_min_cells=0), scenes)
+                auto = cls(iou_threshold=0.3, gated=True)
+                t_auto = bench(auto, scenes)
+                path = "门控" if auto._use_gating(*scenes[0]) else "稠密"
+                print(
+                    f"  N={n:>3} M={m:>3}   dense {t_dense * 1e6:8.1f} us   "
+                    f"gated {t_gated * 1e6:8.1f} us ({t_dense / t_gated:4.1f}x)   "
+                    f"gated+回退 {t_auto * 1e6:8.1f} us ({t_dense / t_auto:4.1f}x, {path})"
+                )
+
+
+if __name__ == "__main__":
+    main(quick=len(sys.argv) > 1 and sys.argv[1] == "quick")
@@ -13,6 +13,7 @@ class BackpressureConfig:
     low_hits_threshold: int = 2  # 低水位命中次数阈值
     min_capacity: int = 10      # 最小容量
     drop_rate_threshold: float = 0.5 # 窗口期内丢弃率阈值（相对于队列容量的比例）
+    throttle_usage_step: float = 0.05 # THROTTLE 期间使用率变化达到该值时重新发布（供限流比例跟踪使用率），0 表示每个轮询周期都发布
 
 
     def __post_init__(self) -> None:
@@ -24,4 +25,6 @@ class BackpressureConfig:
             raise ValueError("min_capacity 必须 >= 0")
         if self.drop_rate_threshold < 0:
             raise ValueError("drop_rate_threshold 必须 >= 0")
+        if self.throttle_usage_step < 0:
+            raise ValueError("throttle_usage_step 必须 >= 0")
         
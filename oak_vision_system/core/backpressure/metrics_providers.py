@@ -1,5 +1,5 @@
 """
-MetricsProvider 实现：基于 OverflowQueue
+MetricsProvider 实现：基于 OverflowQueue / RingOverflowQueue
 """
 from __future__ import annotations
 
@@ -10,7 +10,7 @@ from typing import TYPE_CHECKING
 from oak_vision_system.core.backpressure.types import QueueMetrics
 
 if TYPE_CHECKING:
-    from oak_vision_system.utils.data_structures.Queue import OverflowQueue
+    from oak_vision_system.utils.data_structures.Queue import OverflowQueue, RingOverflowQueue
 
 
 class OverflowQueueMetricsProvider:
@@ -24,12 +24,12 @@ class OverflowQueueMetricsProvider:
     - 线程安全的增量计算
     """
 
-    def __init__(self, queue: "OverflowQueue", queue_id: str) -> None:
+    def __init__(self, queue: "OverflowQueue | RingOverflowQueue", queue_id: str) -> None:
         """
         初始化指标提供者
         
         Args:
-            queue: OverflowQueue 实例（需要监控的队列）
+            queue: OverflowQueue 或 RingOverflowQueue 实例（需要监控的队列）
             queue_id: 队列唯一标识（用于日志和事件）
         """
         self._queue = queue
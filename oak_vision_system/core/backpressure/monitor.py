@@ -44,7 +44,7 @@ class BackpressureMonitor:
     职责：
     - 周期性轮询已注册队列的指标
     - 根据策略决策背压状态和动作
-    - 状态变化时发布背压事件到事件总线
+    - 状态变化时发布背压事件到事件总线；THROTTLE 期间使用率变化时发布使用率更新
     
     特点：
     - 单线程运行，轻量级循环
@@ -71,6 +71,10 @@ class BackpressureMonitor:
         self._lock = threading.Lock()  # 保护注册表的线程安全
         self._running = False  # 监控循环运行标志
         self._thread: threading.Thread | None = None  # 监控线程
+        # 上次发布的状态、动作和使用率（仅监控线程读写）
+        self._pre_state = BackpressureState.UNKNOWN
+        self._pre_action = BackpressureAction.NORMAL
+        self._pre_usage = 0.0
 
     def register_queue(self, queue_id: str, metrics_provider: MetricsProviderFn, capacity: int) -> None:
         """
@@ -120,6 +124,9 @@ class BackpressureMonitor:
         """
         if self._running:
             return
+        self._pre_state = BackpressureState.UNKNOWN
+        self._pre_action = BackpressureAction.NORMAL
+        self._pre_usage = 0.0
         self._running = True
         self._thread = threading.Thread(target=self._loop, name="BackpressureMonitor", daemon=True)
         self._thread.start()
@@ -145,53 +152,72 @@ class BackpressureMonitor:
         监控循环（在独立线程中运行）
         
         周期性检查所有已注册队列的指标，并根据策略决策背压状态。
-        使用快照机制减少持锁时间，异常隔离确保单个队列错误不影响整体。
         """
         interval = self.config.poll_interval_ms / 1000.0  # 转换为秒
-        pre_state = BackpressureState.UNKNOWN
-        pre_action = BackpressureAction.NORMAL
         while self._running:
-            best_queue_id = ""
-            best_state = BackpressureState.UNKNOWN
-            best_action = BackpressureAction.NORMAL
-            best_reason = ""
-            best_metrics: QueueMetrics | None = None
+            self._poll_once()
+            time.sleep(interval)
 
-            # 快照注册表（减少持锁时间，避免长时间阻塞注册/注销操作）
-            with self._lock:
-                snapshot = list(self._registrations.values())
-            
-            # 检查每个队列（在锁外执行，避免阻塞）
-            for reg in snapshot:
-                try:
-                    new_state, new_action, reason, metrics = self._check(reg)
-                    if (new_action.value, new_state.value) > (best_action.value, best_state.value):
-                        best_queue_id = reg.queue_id
-                        best_state = new_state
-                        best_action = new_action
-                        best_reason = reason
-                        best_metrics = metrics
+    def _poll_once(self) -> None:
+        """
+        执行一次轮询：检查所有队列，取最严重的状态与动作，必要时发布背压事件
+        
+        发布条件：
+        - 状态或动作变化
+        - 动作保持 THROTTLE 且使用率相对上次发布的变化达到 throttle_usage_step，
+          订阅者（如采集速率调节器）据此按当前使用率调整限流比例，而不是停留在进入 THROTTLE 时的使用率
+        
+        使用快照机制减少持锁时间，异常隔离确保单个队列错误不影响整体。
+        """
+        best_queue_id = ""
+        best_state = BackpressureState.UNKNOWN
+        best_action = BackpressureAction.NORMAL
+        best_reason = ""
+        best_metrics: QueueMetrics | None = None
 
-                except Exception:  # 防御性隔离：单个队列错误不影响其他队列
-                    logger.exception("检查队列出错: %s", reg.queue_id)
-            
-            if best_metrics is not None and (best_state != pre_state or best_action != pre_action):
-                self._publish(
-                    BackpressureEventPayload(
-                        queue_id=best_queue_id,
-                        action=best_action,
-                        reason=best_reason,
-                        timestamp=time.time(),
-                        usage=best_metrics.usage,
-                        drop_count=best_metrics.drop_count,
-                        pressure_level=best_metrics.pressure_level,
-                        state=best_state,
-                    )
-                )
-                pre_state = best_state
-                pre_action = best_action
-            
-            time.sleep(interval)
+        # 快照注册表（减少持锁时间，避免长时间阻塞注册/注销操作）
+        with self._lock:
+            snapshot = list(self._registrations.values())
+        
+        # 检查每个队列（在锁外执行，避免阻塞）
+        for reg in snapshot:
+            try:
+                new_state, new_action, reason, metrics = self._check(reg)
+                if (new_action.value, new_state.value) > (best_action.value, best_state.value):
+                    best_queue_id = reg.queue_id
+                    best_state = new_state
+                    best_action = new_action
+                    best_reason = reason
+                    best_metrics = metrics
+
+            except Exception:  # 防御性隔离：单个队列错误不影响其他队列
+                logger.exception("检查队列出错: %s", reg.queue_id)
+        
+        if best_metrics is None:
+            return
+        changed = best_state != self._pre_state or best_action != self._pre_action
+        usage_update = (
+            not changed
+            and best_action == BackpressureAction.THROTTLE
+            and abs(best_metrics.usage - self._pre_usage) >= self.config.throttle_usage_step
+        )
+        if changed or usage_update:
+            self._publish(
+                BackpressureEventPayload(
+                    queue_id=best_queue_id,
+                    action=best_action,
+                    reason=best_reason,
+                    timestamp=time.time(),
+                    usage=best_metrics.usage,
+                    drop_count=best_metrics.drop_count,
+                    pressure_level=best_metrics.pressure_level,
+                    state=best_state,
+                ),
+                usage_update=usage_update,
+            )
+            self._pre_state = best_state
+            self._pre_action = best_action
+            self._pre_usage = best_metrics.usage
 
     def _check(self, reg: _Registration) -> tuple[BackpressureState, BackpressureAction, str, QueueMetrics]:
         """
@@ -241,16 +267,18 @@ class BackpressureMonitor:
         reg.state = state
         return state, action, reason, metrics
 
-    def _publish(self, payload: BackpressureEventPayload) -> None:
+    def _publish(self, payload: BackpressureEventPayload, usage_update: bool = False) -> None:
         """
         发布背压事件到事件总线
         
         Args:
             payload: 背压事件载荷（包含队列ID、动作、原因、指标等）
+            usage_update: 是否仅为 THROTTLE 期间的使用率更新（以 DEBUG 级别记录日志）
         """
         try:
             self._event_bus.publish(EventType.BACKPRESSURE_SIGNAL, payload)
-            logger.info(
+            logger.log(
+                logging.DEBUG if usage_update else logging.INFO,
                 "背压事件: queue=%s action=%s reason=%s usage=%.2f drops=%d level=%s state=%s",
                 payload.queue_id,
                 payload.action,
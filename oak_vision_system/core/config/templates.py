@@ -111,6 +111,11 @@ def template_OAKConfigDTO() -> OAKConfigDTO:
         # ===== 队列相关 =====
         queue_max_size=4,                         # 数据队列最大长度
         queue_blocking=False,                     # 数据队列满时是否阻塞（否则丢弃旧数据）
+        collector_mode="event",                   # 采集循环模式：event（阻塞等待队列事件）/ polling
+
+        # ===== 背压限流 =====
+        rate_priorities={},                       # 设备限流优先级（角色值 -> 0~1，1 表示始终满速）
+        min_rate_fraction=0.1,                    # 背压时每个设备保留的最低发布速率比例
     )
 # role_bindings默认模板函数
 def template_DeviceRoleBindingDTO(
@@ -187,6 +192,14 @@ def template_DisplayConfigDTO() -> DisplayConfigDTO:
         bbox_thickness=2,                    # 边框粗细
         bbox_color_by_label=True,            # 按标签着色
         text_scale=0.6,                      # 文字大小
+
+        # ===== 无头输出 =====
+        enable_window=True,                  # 是否创建本地窗口（无显示器时设为 False）
+        enable_stream=False,                 # 是否通过 HTTP MJPEG 输出渲染画面
+        stream_host="127.0.0.1",             # 视频流监听地址（"0.0.0.0" 允许局域网访问）
+        stream_port=8080,                    # 视频流监听端口
+        stream_jpeg_quality=80,              # JPEG 编码质量
+        stream_encoder_threads=2,            # 编码线程数
     )
 
 
@@ -30,8 +30,10 @@ from .detection_dto import (
     BoundingBoxDTO,
     DetectionDTO,
     DeviceDetectionDataDTO,
+    DeviceDetectionBatch,
     VideoFrameDTO,
     OAKDataCollectionDTO,
+    CameraHeartbeatDTO,
 )
 
 # 配置相关的DTO已迁移到 config_dto 子包
@@ -59,8 +61,10 @@ __all__ = [
     "BoundingBoxDTO", 
     "DetectionDTO",
     "DeviceDetectionDataDTO",
+    "DeviceDetectionBatch",
     "VideoFrameDTO",
     "OAKDataCollectionDTO",
+    "CameraHeartbeatDTO",
     
     # 版本信息
     "__version__",
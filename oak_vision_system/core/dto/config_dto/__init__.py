@@ -50,8 +50,11 @@ from .data_processing_config_dto import (
     CoordinateTransformConfigDTO,
     FilterConfigDTO,
     MovingAverageFilterConfigDTO,
+    KalmanFilterConfigDTO,
     DataProcessingConfigDTO,
     DecisionLayerConfigDTO,
+    FusionConfigDTO,
+    ShardingConfigDTO,
     PersonWarningConfigDTO,
     ObjectZonesConfigDTO,
     GraspZoneConfigDTO,
@@ -92,7 +95,10 @@ __all__ = [
     'CoordinateTransformConfigDTO',
     'FilterConfigDTO',
     'MovingAverageFilterConfigDTO',
+    'KalmanFilterConfigDTO',
     'DecisionLayerConfigDTO',
+    'FusionConfigDTO',
+    'ShardingConfigDTO',
     'PersonWarningConfigDTO',
     'ObjectZonesConfigDTO',
     'GraspZoneConfigDTO',
@@ -5,7 +5,7 @@
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
 from ..base_dto import  validate_numeric_range
 from .base_config_dto import BaseConfigDTO
@@ -15,6 +15,12 @@ from .enums import DeviceRole, FilterType
 # 模块内维护的标定方式白名单（提取自 DTO 外部）
 CALIBRATION_METHODS: tuple[str, ...] = ("manual", "auto")
 
+# 滤波引擎白名单：object=逐槽位滤波器对象，vectorized=结构数组向量化实现（输出一致）
+FILTER_ENGINES: tuple[str, ...] = ("object", "vectorized")
+
+# 关联算法白名单：greedy=全局贪心，hungarian=匈牙利算法（全局最优）
+TRACKER_METHODS: tuple[str, ...] = ("greedy", "hungarian")
+
 
 @dataclass(frozen=True)
 class CoordinateTransformConfigDTO(BaseConfigDTO):
@@ -72,12 +78,33 @@ class MovingAverageFilterConfigDTO(BaseConfigDTO):
         return errors
 
 
+@dataclass(frozen=True)
+class KalmanFilterConfigDTO(BaseConfigDTO):
+    """匀速模型卡尔曼滤波器配置
+    
+    每个坐标轴独立建模为 [位置, 速度]，时间单位为帧。
+    """
+    
+    process_noise: float = 5.0          # 过程噪声：加速度标准差（mm/帧²），越大响应越快
+    measurement_noise: float = 20.0     # 观测噪声：坐标测量标准差（mm），越大越平滑
+    
+    def _validate_data(self) -> List[str]:
+        errors = []
+        errors.extend(validate_numeric_range(
+            self.process_noise, 'process_noise', min_value=0.0, max_value=1000.0
+        ))
+        errors.extend(validate_numeric_range(
+            self.measurement_noise, 'measurement_noise', min_value=0.001, max_value=1000.0
+        ))
+        return errors
+
+
 @dataclass(frozen=True)
 class FilterConfigDTO(BaseConfigDTO):
     """
     滤波配置
     
-    当前只支持滑动平均滤波器。
+    支持滑动平均滤波器与匀速模型卡尔曼滤波器。
     """
     
     # 当前使用的滤波器类型（默认：滑动平均）
@@ -86,17 +113,49 @@ class FilterConfigDTO(BaseConfigDTO):
     # 滑动平均滤波器配置
     moving_average_config: Optional[MovingAverageFilterConfigDTO] = None
     
+    # 卡尔曼滤波器配置
+    kalman_config: Optional[KalmanFilterConfigDTO] = None
+    
+    # 滤波引擎（"object"/"vectorized"）
+    engine: str = "vectorized"
+    
+    # 是否输出丢失期间的目标（卡尔曼为外推位置，滑动平均为保持值），预测行置信度为 0
+    emit_predicted: bool = False
+    
+    # 检测与已有目标的关联算法（"greedy"/"hungarian"）
+    tracker_method: str = "hungarian"
+    
+    # 是否启用门控稀疏关联（只对边界框相交的候选对计算 IoU，拥挤场景下更快，匹配结果不变）
+    tracker_gated: bool = False
+    
     def _validate_data(self) -> List[str]:
         errors = []
         
         if not isinstance(self.filter_type, FilterType):
             errors.append("filter_type必须为FilterType枚举类型")
         
+        if self.engine not in FILTER_ENGINES:
+            errors.append(f"engine必须为: {'/'.join(FILTER_ENGINES)}")
+        
+        if not isinstance(self.emit_predicted, bool):
+            errors.append("emit_predicted必须为布尔值")
+        
+        if self.tracker_method not in TRACKER_METHODS:
+            errors.append(f"tracker_method必须为: {'/'.join(TRACKER_METHODS)}")
+        
+        if not isinstance(self.tracker_gated, bool):
+            errors.append("tracker_gated必须为布尔值")
+        
         # 验证滤波器配置必须存在
         if self.moving_average_config is None:
             errors.append("moving_average_config 不能为空")
         else: 
             errors.extend(self.moving_average_config._validate_data())
+        
+        if self.kalman_config is None:
+            errors.append("kalman_config 不能为空")
+        else:
+            errors.extend(self.kalman_config._validate_data())
 
         return errors
     
@@ -104,14 +163,18 @@ class FilterConfigDTO(BaseConfigDTO):
         """初始化时确保滤波器有默认配置"""
         if self.moving_average_config is None:
             object.__setattr__(self, 'moving_average_config', MovingAverageFilterConfigDTO())
+        if self.kalman_config is None:
+            object.__setattr__(self, 'kalman_config', KalmanFilterConfigDTO())
     
-    def get_active_filter_config(self) -> MovingAverageFilterConfigDTO:
+    def get_active_filter_config(self) -> Union[MovingAverageFilterConfigDTO, KalmanFilterConfigDTO]:
         """
         获取当前激活的滤波器配置
         
         Returns:
-            滑动平均滤波器配置对象
+            filter_type 对应的滤波器配置对象
         """
+        if self.filter_type == FilterType.KALMAN:
+            return self.kalman_config
         return self.moving_average_config
 
 
@@ -278,6 +341,67 @@ class DecisionLayerConfigDTO(BaseConfigDTO):
         return errors
 
 
+@dataclass(frozen=True)
+class FusionConfigDTO(BaseConfigDTO):
+    """
+    多相机融合配置
+    
+    启用后，各设备变换到世界坐标系的检测结果在时间窗口内合并为一个融合帧，
+    跨设备的重复检测按空间距离去重，滤波与决策每个融合帧只执行一次。
+    
+    注意：距离单位为毫米（mm），时间单位为毫秒（ms）
+    """
+    
+    enabled: bool = False
+    time_window_ms: float = 50.0        # 同一融合帧内各设备检测的最大到达时间差
+    merge_distance_mm: float = 200.0    # 不同设备的同类检测距离小于该值时视为同一目标
+    track_box_size_mm: float = 400.0    # 世界坐标系下跟踪用的方形框边长（用于 IoU 匹配）
+    
+    def _validate_data(self) -> List[str]:
+        errors = []
+        errors.extend(validate_numeric_range(
+            self.time_window_ms, 'time_window_ms', min_value=1.0, max_value=1000.0
+        ))
+        errors.extend(validate_numeric_range(
+            self.merge_distance_mm, 'merge_distance_mm', min_value=0.0, max_value=5000.0
+        ))
+        errors.extend(validate_numeric_range(
+            self.track_box_size_mm, 'track_box_size_mm', min_value=1.0, max_value=10000.0
+        ))
+        return errors
+
+
+@dataclass(frozen=True)
+class ShardingConfigDTO(BaseConfigDTO):
+    """
+    多进程分片配置
+    
+    worker_processes > 0 时，坐标变换与滤波按设备分片到独立进程执行，
+    输入输出通过共享内存环形缓冲区传递；决策层仍在主进程中统一执行。
+    """
+    
+    worker_processes: int = 0           # 分片进程数量，0 表示在处理线程内执行（默认）
+    max_detections: int = 128           # 每帧最大检测数（共享内存槽位容量），超出部分截断
+    ring_slots: int = 8                 # 每个共享内存环形缓冲区的槽位数
+    
+    def _validate_data(self) -> List[str]:
+        errors = []
+        errors.extend(validate_numeric_range(
+            self.worker_processes, 'worker_processes', min_value=0, max_value=16
+        ))
+        errors.extend(validate_numeric_range(
+            self.max_detections, 'max_detections', min_value=1, max_value=4096
+        ))
+        errors.extend(validate_numeric_range(
+            self.ring_slots, 'ring_slots', min_value=1, max_value=256
+        ))
+        return errors
+    
+    @property
+    def enabled(self) -> bool:
+        return self.worker_processes > 0
+
+
 @dataclass(frozen=True)
 class DataProcessingConfigDTO(BaseConfigDTO):
     """
@@ -293,6 +417,10 @@ class DataProcessingConfigDTO(BaseConfigDTO):
     filter_config: FilterConfigDTO = field(default_factory=FilterConfigDTO)
     # 决策层配置
     decision_layer_config: DecisionLayerConfigDTO = field(default_factory=DecisionLayerConfigDTO)
+    # 多相机融合配置
+    fusion_config: FusionConfigDTO = field(default_factory=FusionConfigDTO)
+    # 多进程分片配置
+    sharding_config: ShardingConfigDTO = field(default_factory=ShardingConfigDTO)
     
     # 模块级配置
     enable_data_logging: bool = False
@@ -326,11 +454,29 @@ class DataProcessingConfigDTO(BaseConfigDTO):
         else:
             errors.extend(self.decision_layer_config._validate_data())
         
+        if not isinstance(self.fusion_config, FusionConfigDTO):
+            errors.append("fusion_config必须为FusionConfigDTO类型")
+        else:
+            errors.extend(self.fusion_config._validate_data())
+        
+        if not isinstance(self.sharding_config, ShardingConfigDTO):
+            errors.append("sharding_config必须为ShardingConfigDTO类型")
+        else:
+            errors.extend(self.sharding_config._validate_data())
+            # 融合需要在同一处看到所有设备的检测，与按设备分片互斥
+            if self.sharding_config.enabled and isinstance(self.fusion_config, FusionConfigDTO) \
+                    and self.fusion_config.enabled:
+                errors.append("fusion_config 与 sharding_config 不能同时启用")
+        
         return errors
     
     def _post_init_hook(self) -> None:
         if self.filter_config is None:
             object.__setattr__(self, 'filter_config', FilterConfigDTO())
+        if self.fusion_config is None:
+            object.__setattr__(self, 'fusion_config', FusionConfigDTO())
+        if self.sharding_config is None:
+            object.__setattr__(self, 'sharding_config', ShardingConfigDTO())
     
     def get_coordinate_transform(self, role: DeviceRole) -> CoordinateTransformConfigDTO:
         """获取指定角色的坐标变换配置"""
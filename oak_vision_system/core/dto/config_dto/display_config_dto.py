@@ -25,6 +25,7 @@ class DisplayConfigDTO(BaseConfigDTO):
     - 渲染参数
     - 叠加信息显示
     - 深度图显示样式
+    - 无头输出（HTTP MJPEG 视频流）
     """
     
     # ========== 显示开关 ==========
@@ -58,6 +59,14 @@ class DisplayConfigDTO(BaseConfigDTO):
     bbox_color_by_label: bool = True  # 按标签着色
     text_scale: float = 0.6  # 文字大小
     
+    # ========== 无头输出 ==========
+    enable_window: bool = True  # 是否创建本地 OpenCV 窗口（无显示器时设为 False）
+    enable_stream: bool = False  # 是否通过 HTTP MJPEG 输出渲染画面
+    stream_host: str = "127.0.0.1"  # 视频流监听地址（"0.0.0.0" 允许局域网访问）
+    stream_port: int = 8080  # 视频流监听端口
+    stream_jpeg_quality: int = 80  # JPEG 编码质量
+    stream_encoder_threads: int = 2  # 编码线程数
+    
     def _validate_data(self) -> List[str]:
         errors = []
         
@@ -84,4 +93,17 @@ class DisplayConfigDTO(BaseConfigDTO):
             self.text_scale, 'text_scale', min_value=0.3, max_value=2.0
         ))
         
+        # 视频流参数验证
+        if not self.stream_host:
+            errors.append("stream_host不能为空")
+        errors.extend(validate_numeric_range(
+            self.stream_port, 'stream_port', min_value=0, max_value=65535
+        ))
+        errors.extend(validate_numeric_range(
+            self.stream_jpeg_quality, 'stream_jpeg_quality', min_value=1, max_value=100
+        ))
+        errors.extend(validate_numeric_range(
+            self.stream_encoder_threads, 'stream_encoder_threads', min_value=1, max_value=8
+        ))
+        
         return errors
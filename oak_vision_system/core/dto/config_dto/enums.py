@@ -70,3 +70,4 @@ class ConnectionStatus(Enum):
 class FilterType(Enum):
     """滤波器类型枚举"""
     MOVING_AVERAGE = "moving_average"  # 滑动平均滤波（默认推荐）
+    KALMAN = "kalman"                  # 匀速模型卡尔曼滤波（低延迟，丢失时可预测）
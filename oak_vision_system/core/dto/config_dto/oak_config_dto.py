@@ -17,16 +17,18 @@ OAK模块配置DTO
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple
 import os
 
 from ..base_dto import validate_string_length, validate_numeric_range
 from .base_config_dto import BaseConfigDTO
+from .enums import DeviceRole
 import depthai as dai
 
 # 模块内维护的默认标签与中值滤波核大小（提取自 DTO 外部）
 DEFAULT_LABEL_MAP: tuple[str, ...] = ("durian", "person")   # 默认检测模型标签映射
 MEDIAN_FILTER_KERNEL_SIZES: tuple[int, ...] = (3, 5, 7)
+COLLECTOR_MODES: tuple[str, ...] = ("event", "polling")  # 采集循环模式：阻塞等待队列事件 / tryGet 轮询
 
 
 @dataclass(frozen=True)
@@ -84,6 +86,12 @@ class OAKConfigDTO(BaseConfigDTO):
     # OAK设备输出队列的配置
     queue_max_size: int = 4  # 输出队列最大长度
     queue_blocking: bool = False  # 队列满时是否阻塞
+    collector_mode: str = "event"  # 采集循环模式，见 COLLECTOR_MODES
+    
+    # ========== 背压限流配置 ==========
+    # 设备限流优先级（角色值 -> 0~1），1 表示背压时始终满速，未列出的设备为 0
+    rate_priorities: Dict[str, float] = field(default_factory=dict)
+    min_rate_fraction: float = 0.1  # 背压时每个设备保留的最低发布速率比例
     
     def _validate_data(self) -> List[str]:
         errors = []
@@ -139,5 +147,22 @@ class OAKConfigDTO(BaseConfigDTO):
         errors.extend(validate_numeric_range(
             self.queue_max_size, 'queue_max_size', min_value=1, max_value=30
         ))
+        if self.collector_mode not in COLLECTOR_MODES:
+            errors.append(f"collector_mode必须为{'、'.join(COLLECTOR_MODES)}之一")
+        
+        # 背压限流配置验证
+        if not isinstance(self.rate_priorities, dict):
+            errors.append("rate_priorities必须为字典类型")
+        else:
+            role_values = {role.value for role in DeviceRole}
+            for role_key, priority in self.rate_priorities.items():
+                if role_key not in role_values:
+                    errors.append(f"rate_priorities包含未知设备角色: {role_key}")
+                errors.extend(validate_numeric_range(
+                    priority, f'rate_priorities[{role_key}]', min_value=0.0, max_value=1.0
+                ))
+        errors.extend(validate_numeric_range(
+            self.min_rate_fraction, 'min_rate_fraction', min_value=0.0, max_value=1.0
+        ))
         
         return errors
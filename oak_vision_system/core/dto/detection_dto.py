@@ -6,14 +6,16 @@
 - BoundingBoxDTO: 边界框数据传输对象  
 - DetectionDTO: 单个检测结果数据传输对象
 - DeviceDetectionDataDTO: 单个设备的检测数据传输对象
+- DeviceDetectionBatch: 单个设备的列式检测数据传输对象
 - VideoFrameDTO: 视频帧数据传输对象
 - OAKDataCollectionDTO: OAK数据采集模块综合数据传输对象
+- CameraHeartbeatDTO: 设备心跳/状态上报数据传输对象
 """
 
 import math
 import time
 from dataclasses import dataclass, field
-from typing import Optional, Any, Dict, List
+from typing import Optional, Any, Callable, Dict, List
 import numpy as np
 
 from .transport_dto import TransportDTO
@@ -230,14 +232,196 @@ class DeviceDetectionDataDTO(TransportDTO):
         return [det for det in self.detections if det.confidence >= threshold]
 
 
+@dataclass(frozen=True)
+class DeviceDetectionBatch(TransportDTO):
+    """单个设备一帧检测结果的列式（结构数组）传输对象
+
+    与 DeviceDetectionDataDTO 表达相同的信息，但不再为每个检测结果创建
+    DetectionDTO/BoundingBoxDTO/SpatialCoordinatesDTO，而是直接以连续的
+    NumPy 数组承载，供 DataProcessor 零拷贝地进入坐标变换和滤波流程。
+    """
+
+    device_id: str  # 设备唯一标识符（MXid）
+    frame_id: int  # 帧ID（用于与视频帧同步）
+    labels: np.ndarray  # 标签数组，形状 (n,)，dtype=int32
+    confidence: np.ndarray  # 置信度数组，形状 (n,)，dtype=float32
+    bbox: np.ndarray  # 边界框数组，形状 (n, 4)，dtype=float32，[xmin, ymin, xmax, ymax]
+    coords_h: np.ndarray  # 齐次空间坐标数组，形状 (n, 4)，dtype=float32，[x, y, z, 1]（mm）
+    device_alias: Optional[str] = None  # 设备别名
+    capture_ts: Optional[float] = None  # 设备采集时间戳（秒，与 time.monotonic() 同一时钟）
+
+    def _validate_data(self) -> List[str]:
+        """列式检测数据验证"""
+        errors = []
+
+        errors.extend(validate_string_length(
+            self.device_id, 'device_id', min_length=1, max_length=100
+        ))
+        errors.extend(validate_numeric_range(
+            self.frame_id, 'frame_id', min_value=0
+        ))
+        if self.device_alias is not None:
+            errors.extend(validate_string_length(
+                self.device_alias, 'device_alias', min_length=1, max_length=50
+            ))
+
+        expected = {
+            'labels': (1, np.integer),
+            'confidence': (1, np.floating),
+            'bbox': (2, np.floating),
+            'coords_h': (2, np.floating),
+        }
+        n = None
+        for name, (ndim, kind) in expected.items():
+            arr = getattr(self, name)
+            if not isinstance(arr, np.ndarray):
+                errors.append(f"{name}必须为np.ndarray类型")
+                continue
+            if arr.ndim != ndim or (ndim == 2 and arr.shape[1] != 4):
+                errors.append(f"{name}的shape必须为{'(N,)' if ndim == 1 else '(N,4)'}")
+                continue
+            if not np.issubdtype(arr.dtype, kind):
+                errors.append(f"{name}的dtype无效: {arr.dtype}")
+            if n is None:
+                n = arr.shape[0]
+            elif arr.shape[0] != n:
+                errors.append(f"{name}的长度必须与labels一致")
+
+        if isinstance(self.confidence, np.ndarray) and self.confidence.size > 0:
+            if (self.confidence < 0.0).any() or (self.confidence > 1.0).any():
+                errors.append("confidence中的值必须在[0.0, 1.0]范围内")
+
+        return errors
+
+    @property
+    def detection_count(self) -> int:
+        """检测结果数量"""
+        return int(self.labels.shape[0])
+
+    @property
+    def coords(self) -> np.ndarray:
+        """非齐次空间坐标视图，形状 (n, 3)"""
+        return self.coords_h[:, :3]
+
+    @classmethod
+    def empty(
+        cls,
+        device_id: str,
+        frame_id: int,
+        device_alias: Optional[str] = None,
+        capture_ts: Optional[float] = None,
+    ) -> "DeviceDetectionBatch":
+        """创建不含检测结果的空批次"""
+        return cls(
+            device_id=device_id,
+            frame_id=frame_id,
+            labels=np.empty((0,), dtype=np.int32),
+            confidence=np.empty((0,), dtype=np.float32),
+            bbox=np.empty((0, 4), dtype=np.float32),
+            coords_h=np.empty((0, 4), dtype=np.float32),
+            device_alias=device_alias,
+            capture_ts=capture_ts,
+        )
+
+    @classmethod
+    def from_detection_data(cls, data: DeviceDetectionDataDTO) -> "DeviceDetectionBatch":
+        """由旧的逐对象 DeviceDetectionDataDTO 转换（兼容路径）"""
+        detections = data.detections or []
+        n = len(detections)
+        if n == 0:
+            return cls.empty(data.device_id, data.frame_id, data.device_alias)
+
+        raw = np.array(
+            [
+                (
+                    det.label, det.confidence,
+                    det.bbox.xmin, det.bbox.ymin, det.bbox.xmax, det.bbox.ymax,
+                    det.spatial_coordinates.x, det.spatial_coordinates.y, det.spatial_coordinates.z,
+                )
+                for det in detections
+            ],
+            dtype=np.float64,
+        )
+        return cls.from_raw(data.device_id, data.frame_id, raw, data.device_alias)
+
+    @classmethod
+    def from_raw(
+        cls,
+        device_id: str,
+        frame_id: int,
+        raw: np.ndarray,
+        device_alias: Optional[str] = None,
+        capture_ts: Optional[float] = None,
+    ) -> "DeviceDetectionBatch":
+        """由形状 (n, 9) 的原始行矩阵构造批次
+
+        列顺序为 [label, confidence, xmin, ymin, xmax, ymax, x, y, z]，
+        即 dai.SpatialImgDetection 的字段顺序。
+        """
+        n = raw.shape[0]
+        coords_h = np.empty((n, 4), dtype=np.float32)
+        coords_h[:, :3] = raw[:, 6:9]
+        coords_h[:, 3] = 1.0
+        return cls(
+            device_id=device_id,
+            frame_id=frame_id,
+            labels=raw[:, 0].astype(np.int32),
+            confidence=raw[:, 1].astype(np.float32),
+            bbox=np.ascontiguousarray(raw[:, 2:6], dtype=np.float32),
+            coords_h=coords_h,
+            device_alias=device_alias,
+            capture_ts=capture_ts,
+        )
+
+
+class _LazyFrameField:
+    """
+    VideoFrameDTO 图像字段的描述符：首次读取时才调用加载函数解码
+
+    显式传入的数组直接返回；未传入时调用对应的 loader 字段解码一次并缓存，
+    之后释放 loader（及其持有的设备帧）。并发首次读取最多重复解码一次，结果一致。
+    """
+
+    def __init__(self, loader_name: str) -> None:
+        self._loader_name = loader_name
+
+    def __set_name__(self, owner, name: str) -> None:
+        self._value_name = f"_{name}"
+
+    def __get__(self, obj, objtype=None) -> Optional[np.ndarray]:
+        if obj is None:
+            return None  # dataclass 字段默认值
+        values = obj.__dict__
+        value = values.get(self._value_name)
+        if value is None:
+            loader = values.get(self._loader_name)
+            if loader is not None:
+                value = loader()
+                values[self._value_name] = value
+                values[self._loader_name] = None
+        return value
+
+    def __set__(self, obj, value: Optional[np.ndarray]) -> None:
+        obj.__dict__[self._value_name] = value
+
+
 @dataclass(frozen=True)
 class VideoFrameDTO(TransportDTO):
-    """视频帧数据传输对象"""
+    """
+    视频帧数据传输对象
+
+    rgb_frame / depth_frame 既可以直接传入数组，也可以留空并传入零参数加载函数
+    rgb_loader / depth_loader（例如包装 dai.ImgFrame 的转换），此时图像在首次读取
+    对应字段时才解码。被队列丢弃、从未被读取的帧不会产生任何解码和拷贝开销。
+    """
     
     device_id: str  # 设备ID
     frame_id: int  # 帧ID
-    rgb_frame: Optional[np.ndarray] = None  # RGB图像数据 (numpy.ndarray)
-    depth_frame: Optional[np.ndarray] = None  # 深度图像数据 (numpy.ndarray)
+    rgb_frame: Optional[np.ndarray] = _LazyFrameField("rgb_loader")  # RGB图像数据 (numpy.ndarray)
+    depth_frame: Optional[np.ndarray] = _LazyFrameField("depth_loader")  # 深度图像数据 (numpy.ndarray)
+    rgb_loader: Optional[Callable[[], Optional[np.ndarray]]] = None  # RGB延迟解码函数
+    depth_loader: Optional[Callable[[], Optional[np.ndarray]]] = None  # 深度延迟解码函数
+    capture_ts: Optional[float] = None  # 设备采集时间戳（秒，与 time.monotonic() 同一时钟）
     # 注意：时间戳使用继承的 created_at 字段
     
     def _validate_data(self) -> List[str]:
@@ -254,8 +438,8 @@ class VideoFrameDTO(TransportDTO):
             self.frame_id, 'frame_id', min_value=0
         ))
         
-        # 验证至少有一种帧数据
-        if self.rgb_frame is None and self.depth_frame is None:
+        # 验证至少有一种帧数据（不触发延迟解码）
+        if not self.has_rgb and not self.has_depth:
             errors.append("rgb_frame和depth_frame不能同时为None")
         
         return errors
@@ -266,17 +450,22 @@ class VideoFrameDTO(TransportDTO):
     
     @property
     def has_rgb(self) -> bool:
-        """是否包含RGB数据"""
-        return self.rgb_frame is not None
+        """是否包含RGB数据（不触发延迟解码）"""
+        return self.__dict__.get("_rgb_frame") is not None or self.rgb_loader is not None
     
     @property
     def has_depth(self) -> bool:
-        """是否包含深度数据"""
-        return self.depth_frame is not None
+        """是否包含深度数据（不触发延迟解码）"""
+        return self.__dict__.get("_depth_frame") is not None or self.depth_loader is not None
+    
+    @property
+    def is_materialized(self) -> bool:
+        """所有延迟加载的图像是否都已解码"""
+        return self.rgb_loader is None and self.depth_loader is None
     
     @property
     def frame_size(self) -> Optional[tuple[int, int]]:
-        """帧尺寸 (width, height)"""
+        """帧尺寸 (width, height)，延迟加载时会触发解码"""
         # 优先使用 RGB 帧，否则使用深度帧
         if self.rgb_frame is not None and isinstance(self.rgb_frame, np.ndarray):
             h, w = self.rgb_frame.shape[:2]
@@ -372,4 +561,36 @@ class OAKDataCollectionDTO(TransportDTO):
  
 
 # 事件数据DTO
- 
+
+
+# 设备会话状态
+CAMERA_STATES = ("running", "reconnecting", "failed", "stopped")
+
+
+@dataclass(frozen=True)
+class CameraHeartbeatDTO(TransportDTO):
+    """设备心跳/状态上报（CAMERA_HEARTBEAT 事件载荷）"""
+
+    device_id: str  # 设备ID（MXid）
+    state: str  # 设备会话状态，取值见 CAMERA_STATES
+    uptime_s: float  # 当前会话已连续运行的时间（秒），未连接时为 0
+    reconnect_count: int  # 累计重连成功次数
+    consecutive_failures: int = 0  # 当前连续失败次数（重连成功后清零）
+    device_alias: Optional[str] = None  # 设备别名（角色）
+    last_error: Optional[str] = None  # 最近一次会话失败原因
+    timestamp: float = field(default_factory=time.monotonic)  # 上报时间（time.monotonic()）
+
+    def _validate_data(self) -> List[str]:
+        """设备心跳数据验证"""
+        errors = []
+        errors.extend(validate_string_length(
+            self.device_id, 'device_id', min_length=1, max_length=100
+        ))
+        if self.state not in CAMERA_STATES:
+            errors.append(f"state必须为{'/'.join(CAMERA_STATES)}之一")
+        errors.extend(validate_numeric_range(self.uptime_s, 'uptime_s', min_value=0.0))
+        errors.extend(validate_numeric_range(self.reconnect_count, 'reconnect_count', min_value=0))
+        errors.extend(validate_numeric_range(
+            self.consecutive_failures, 'consecutive_failures', min_value=0
+        ))
+        return errors
@@ -15,9 +15,16 @@
     >>> 
     >>> sub_id = event_bus.subscribe(EventType.RAW_FRAME_DATA, handler)
     >>> 
+    >>> # 只做入队的轻量回调可在发布者线程内联执行
+    >>> event_bus.subscribe(EventType.RAW_FRAME_DATA, queue.put_nowait,
+    ...                     dispatch_mode=DispatchMode.INLINE)
+    >>> 
     >>> # 发布事件
     >>> event_bus.publish(EventType.RAW_FRAME_DATA, frame_data)
     >>> 
+    >>> # 批量发布（每个订阅者一批只分发一次）
+    >>> event_bus.publish_many(EventType.RAW_FRAME_DATA, [frame1, frame2])
+    >>> 
     >>> # 取消订阅
     >>> event_bus.unsubscribe(sub_id)
 """
@@ -26,6 +33,7 @@ from .event_bus import (
     EventBus,
     Subscription,
     Priority,
+    DispatchMode,
     initialize_event_bus,
     get_event_bus,
     reset_event_bus,
@@ -40,6 +48,7 @@ __all__ = [
     'Subscription',
     'EventType',
     'Priority',
+    'DispatchMode',
     'initialize_event_bus',
     'get_event_bus',
     'reset_event_bus',
@@ -2,9 +2,10 @@ import logging
 import os
 import threading
 import time
-from dataclasses import dataclass
-from enum import IntEnum
-from typing import Any, Callable, Dict, List, Optional
+from dataclasses import dataclass, field
+from enum import Enum, IntEnum
+from queue import SimpleQueue
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor, Future, wait as futures_wait
 
 
@@ -20,6 +21,93 @@ class Priority(IntEnum):
     LOW = 1
 
 
+# =========================
+# 分发策略定义
+# =========================
+class DispatchMode(Enum):
+    """
+    订阅者回调的执行方式（在 subscribe() 时按订阅选择）
+
+    - INLINE:           在发布者线程中同步执行。适用于只做入队等极轻量操作的回调，
+                        省去 Future 分配、线程切换和上下文切换。回调必须快速返回且不阻塞。
+    - POOL:             提交到共享线程池执行（默认，兼容原有行为）。
+    - DEDICATED_THREAD: 每个订阅独占一个工作线程，按发布顺序串行执行。
+                        适用于较慢、且不希望占用共享线程池的回调。
+    """
+    INLINE = "inline"
+    POOL = "pool"
+    DEDICATED_THREAD = "dedicated_thread"
+
+
+class _DedicatedDispatcher:
+    """
+    DEDICATED_THREAD 模式的专属工作线程。
+
+    内部使用无界 SimpleQueue 保证投递顺序；队列元素为 (fn, sub, payload, future)，
+    工作线程执行 fn(sub, payload)，future 为 None 表示异步投递，不需要回报执行结果。
+    """
+
+    _STOP = object()
+
+    def __init__(self, name: str) -> None:
+        self._queue: SimpleQueue = SimpleQueue()
+        self._thread = threading.Thread(
+            target=self._run, name=name, daemon=True
+        )
+        self._thread.start()
+
+    def submit(
+        self,
+        fn: Callable[[Any, Any], bool],
+        sub: Any,
+        payload: Any,
+        future: Optional[Future] = None,
+    ) -> None:
+        self._queue.put((fn, sub, payload, future))
+
+    def stop(self, wait: bool = False, timeout: Optional[float] = None) -> None:
+        self._queue.put((self._STOP, None, None, None))
+        if wait and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+
+    def _run(self) -> None:
+        while True:
+            fn, sub, payload, future = self._queue.get()
+            if fn is self._STOP:
+                return
+            ok = fn(sub, payload)
+            if future is not None:
+                future.set_result(ok)
+
+
+# =========================
+# 统计计数器
+# =========================
+class _ShardedCounter:
+    """
+    按线程分片的计数器，无锁累加。
+
+    每个线程只写自己的格子（字典按线程 ident 索引），读取时汇总所有格子。
+    线程退出后其计数保留；ident 被新线程复用时两者不会同时写入，因此计数不丢失。
+    """
+
+    __slots__ = ("_cells",)
+
+    def __init__(self) -> None:
+        self._cells: Dict[int, List[int]] = {}
+
+    def add(self, n: int = 1) -> None:
+        ident = threading.get_ident()
+        cell = self._cells.get(ident)
+        if cell is None:
+            cell = self._cells.setdefault(ident, [0])
+        cell[0] += n
+
+    @property
+    def value(self) -> int:
+        return sum(cell[0] for cell in list(self._cells.values()))
+
+
 # =========================
 # 订阅对象
 # =========================
@@ -37,9 +125,34 @@ class Subscription:
     # 新增：订阅者名称，用于记录订阅者名称
     subscriber_name: Optional[str] = None
 
-    # 健康状态（可选，用于统计，逻辑简单化）
-    total_calls: int = 0
-    error_count: int = 0
+    # 回调执行方式，默认提交到共享线程池
+    dispatch_mode: DispatchMode = DispatchMode.POOL
+
+    # 可选批量回调，形如 fn(items: list) -> None，供 publish_many/publish_batch 使用
+    batch_callback: Optional[Callable[[List[Any]], None]] = None
+
+    # 健康状态（按线程分片计数，发布路径无需加锁）
+    _calls: _ShardedCounter = field(
+        default_factory=_ShardedCounter, repr=False, compare=False
+    )
+    _errors: _ShardedCounter = field(
+        default_factory=_ShardedCounter, repr=False, compare=False
+    )
+
+    # DEDICATED_THREAD 模式下的专属工作线程（其他模式为 None）
+    _dispatcher: Optional[_DedicatedDispatcher] = field(
+        default=None, repr=False, compare=False
+    )
+
+    @property
+    def total_calls(self) -> int:
+        """累计投递次数"""
+        return self._calls.value
+
+    @property
+    def error_count(self) -> int:
+        """累计回调异常次数"""
+        return self._errors.value
 
     def should_deliver(self, data: Any) -> bool:
         """
@@ -73,9 +186,13 @@ class EventBus:
     并行事件总线，支持：
     - 订阅/取消订阅
     - 并行发布（订阅者并行执行，提升多核利用率）
+    - 批量发布（publish_many / publish_batch，每个订阅者一批只分发一次）
     - 简单优先级（高优先级订阅者先执行）
+    - 按订阅选择分发策略（INLINE / POOL / DEDICATED_THREAD）
     - 流量控制（按事件类型开关）
     - 统计信息（发布数/投递数/错误数/在途事件）
+    - 无锁发布：订阅关系与流控状态保存在不可变快照中，
+      仅在 subscribe/unsubscribe/set_flow_control 时重建并整体替换引用
     - 可选：同步/异步模式（wait_all 参数）
     """
 
@@ -91,6 +208,12 @@ class EventBus:
         # 流量控制：某些事件类型可以临时禁用（例如背压时暂停 RAW_FRAME_DATA）
         self._flow_control: Dict[str, bool] = {}
 
+        # 发布路径读取的不可变快照（写时复制，持锁重建后整体替换引用）
+        # event_type -> 按优先级排好序的订阅元组
+        self._dispatch_table: Dict[str, Tuple[Subscription, ...]] = {}
+        # 当前被流量控制的事件类型
+        self._blocked_types: FrozenSet[str] = frozenset()
+
         # 并行执行线程池（动态配置大小）
         if max_workers is None:
             # IO密集型场景建议2倍核心数
@@ -102,6 +225,22 @@ class EventBus:
             thread_name_prefix="EventBusWorker"
         )
 
+    def _rebuild_dispatch_table(self) -> None:
+        """
+        根据当前订阅关系与流控状态重建发布快照（调用方需持有 self._lock）。
+
+        新快照构建完成后一次性替换引用，正在发布的线程继续使用旧快照，
+        不会看到构建到一半的状态。
+        """
+        self._dispatch_table = {
+            event_type: tuple(subs)
+            for event_type, subs in self._subscriptions.items()
+            if subs
+        }
+        self._blocked_types = frozenset(
+            event_type for event_type, enabled in self._flow_control.items() if enabled
+        )
+
     # -------- 单例接口（兼容旧调用） --------
     @classmethod
     def get_instance(cls) -> "EventBus":
@@ -115,6 +254,8 @@ class EventBus:
         priority: Priority = Priority.NORMAL,
         filter_func: Optional[Callable[[Any], bool]] = None,
         subscriber_name: Optional[str] = None,
+        dispatch_mode: DispatchMode = DispatchMode.POOL,
+        batch_callback: Optional[Callable[[List[Any]], None]] = None,
     ) -> str:
         """
         订阅某个事件类型，返回 subscription_id。
@@ -123,6 +264,10 @@ class EventBus:
         :param callback:   回调函数，形如 fn(data) -> None
         :param priority:   优先级，高优先级先执行
         :param filter_func: 可选过滤函数，形如 fn(data) -> bool
+        :param dispatch_mode: 回调执行方式，见 DispatchMode。
+                              INLINE 回调运行在发布者线程，只应用于入队等轻量操作。
+        :param batch_callback: 可选批量回调，形如 fn(items) -> None。
+                               批量发布时整批调用一次；未提供时逐条调用 callback。
         """
         with self._lock:
             if self._closed:
@@ -147,10 +292,21 @@ class EventBus:
             priority=priority,
             filter_func=filter_func,
             subscriber_name=subscriber_name,
+            dispatch_mode=dispatch_mode,
+            batch_callback=batch_callback,
         )
 
+        if dispatch_mode is DispatchMode.DEDICATED_THREAD:
+            sub._dispatcher = _DedicatedDispatcher(
+                name=f"EventBusDedicated-{subscriber_name or callback.__name__}",
+            )
+
         # 添加订阅对象到订阅列表
         with self._lock:
+            if self._closed:
+                if sub._dispatcher is not None:
+                    sub._dispatcher.stop()
+                raise RuntimeError("EventBus 已关闭，无法订阅事件。")
             if event_type not in self._subscriptions:
                 self._subscriptions[event_type] = []
             self._subscriptions[event_type].append(sub)
@@ -159,13 +315,16 @@ class EventBus:
             self._subscriptions[event_type].sort(
                 key=lambda s: s.priority, reverse=True
             )
+            self._rebuild_dispatch_table()
 
         # 记录订阅事件
         logger.info(
-            "订阅事件: event_type=%s, subscription_id=%s, priority=%s, subscriber_name=%s",
+            "订阅事件: event_type=%s, subscription_id=%s, priority=%s, "
+            "dispatch_mode=%s, subscriber_name=%s",
             event_type,
             subscription_id,
             priority.name,
+            dispatch_mode.name,
             subscriber_name,
         )
 
@@ -188,12 +347,19 @@ class EventBus:
                     self._subscriptions[event_type] = new_list
                     removed = True
 
+                    # 停止专属工作线程（已入队的事件会先处理完）
+                    for s in subs:
+                        if s.subscription_id == subscription_id and s._dispatcher is not None:
+                            s._dispatcher.stop()
+
                     logger.info(
                         "取消订阅: event_type=%s, subscription_id=%s",
                         event_type,
                         subscription_id,
                     )
 
+            if removed:
+                self._rebuild_dispatch_table()
             return removed
 
     # -------- 流量控制（背压用） --------
@@ -207,6 +373,7 @@ class EventBus:
         """
         with self._lock:
             self._flow_control[event_type] = enabled
+            self._rebuild_dispatch_table()
 
         logger.info(
             "设置流量控制: event_type=%s, enabled=%s",
@@ -218,8 +385,7 @@ class EventBus:
         """
         某事件类型是否被流量控制（禁止发布）。
         """
-        with self._lock:
-            return self._flow_control.get(event_type, False)
+        return event_type in self._blocked_types
 
     # -------- 辅助方法：安全调用订阅者 --------
     def _safe_call(self, sub: Subscription, data: Any) -> bool:
@@ -234,7 +400,7 @@ class EventBus:
             sub.callback(data)
             return True
         except Exception:
-            sub.error_count += 1
+            sub._errors.add()
             logger.exception(
                 "订阅回调执行异常: event_type=%s, subscription_id=%s, subscriber_name=%s",
                 sub.event_type,
@@ -243,6 +409,97 @@ class EventBus:
             )
             return False
 
+    def _safe_call_batch(self, sub: Subscription, items: List[Any]) -> bool:
+        """
+        安全地向订阅者投递一批事件。
+
+        订阅时提供了 batch_callback 则整批调用一次；否则在同一任务内逐条调用 callback，
+        单条异常不影响同批其余事件。
+
+        :param sub: 订阅对象
+        :param items: 事件数据列表
+        :return: 整批是否全部成功执行
+        """
+        if sub.batch_callback is None:
+            ok = True
+            for data in items:
+                ok = self._safe_call(sub, data) and ok
+            return ok
+        try:
+            sub.batch_callback(items)
+            return True
+        except Exception:
+            sub._errors.add()
+            logger.exception(
+                "订阅批量回调执行异常: event_type=%s, subscription_id=%s, subscriber_name=%s, batch_size=%d",
+                sub.event_type,
+                sub.subscription_id,
+                sub.subscriber_name,
+                len(items),
+            )
+            return False
+
+    def _dispatch(
+        self,
+        event_type: str,
+        targets: List[Tuple[Subscription, Any]],
+        call: Callable[[Subscription, Any], bool],
+        wait_all: bool,
+        timeout: Optional[float],
+    ) -> int:
+        """
+        按各订阅的 dispatch_mode 执行 call(sub, payload)，返回成功投递的订阅者数量。
+
+        POOL 提交到线程池，DEDICATED_THREAD 投递到专属线程，INLINE 在当前线程直接执行；
+        按 targets 顺序（即优先级顺序）分发。
+        """
+        futures = []
+        delivered = 0
+        for sub, payload in targets:
+            mode = sub.dispatch_mode
+            if mode is DispatchMode.INLINE:
+                if call(sub, payload):
+                    delivered += 1
+            elif mode is DispatchMode.DEDICATED_THREAD and sub._dispatcher is not None:
+                future = Future() if wait_all else None
+                sub._dispatcher.submit(call, sub, payload, future)
+                if future is not None:
+                    futures.append(future)
+                else:
+                    delivered += 1
+            else:
+                futures.append(self._executor.submit(call, sub, payload))
+
+        if wait_all and futures:
+            # 同步模式：等待所有订阅者完成
+            if timeout is None:
+                timeout = 5.0  # 默认5秒超时
+            # 等待所有订阅者完成
+            done, not_done = futures_wait(futures, timeout=timeout)
+
+            # 统计成功执行的订阅者数量
+            for f in done:
+                try:
+                    if f.result() is True:
+                        delivered += 1
+                except Exception:
+                    # 异常已在 _safe_call 中处理，这里只统计
+                    pass
+
+            if not_done:
+                logger.warning(
+                    "事件分发超时: event_type=%s, 超时订阅者数量=%d, 超时时间=%.1fs",
+                    event_type,
+                    len(not_done),
+                    timeout,
+                )
+        elif not wait_all:
+            # 异步模式：fire-and-forget，不等待完成
+            # 注意：这里无法立即知道成功数量，返回提交的任务数（INLINE 已同步统计）
+            delivered += len(futures)
+
+        return delivered
+
     # -------- 发布事件（并行执行） --------
     def publish(
         self,
@@ -253,7 +510,9 @@ class EventBus:
         timeout: Optional[float] = None,
     ) -> int:
         """
-        并行发布事件，所有订阅者回调在线程池中并行执行。
+        发布事件，按各订阅的 dispatch_mode 分发：
+        POOL 提交到线程池并行执行，DEDICATED_THREAD 投递到专属线程，
+        INLINE 在当前线程直接执行。
 
         :param event_type: 事件类型
         :param data: 事件数据
@@ -262,66 +521,109 @@ class EventBus:
         :param timeout: 等待超时时间（秒），仅在 wait_all=True 时有效
         :return: 成功投递的订阅者数量
         """
-        with self._lock:
-            if self._closed:
-                return 0
+        # 热路径不加锁：_closed 为单次属性读取，订阅与流控状态来自不可变快照
+        if self._closed:
+            return 0
 
         # 流量控制检查（例如底层背压时关闭某类事件）
-        if self.is_flow_controlled(event_type):
+        if event_type in self._blocked_types:
             logger.debug("事件被流量控制丢弃: event_type=%s", event_type)
             return 0
 
-        # 获取订阅者列表
-        with self._lock:
-            subscribers = list(self._subscriptions.get(event_type, []))
+        # 获取订阅者快照（元组，无需复制）
+        subscribers = self._dispatch_table.get(event_type)
+        if not subscribers:
+            return 0
 
         # 过滤并准备有效的订阅者
-        valid_subs = []
+        targets = []
         for sub in subscribers:
             if sub.should_deliver(data):
-                sub.total_calls += 1
-                valid_subs.append(sub)
+                sub._calls.add()
+                targets.append((sub, data))
 
-        if not valid_subs:
+        if not targets:
             return 0
 
-        # 并行提交所有订阅者任务到线程池
-        futures = []
-        for sub in valid_subs:
-            future = self._executor.submit(self._safe_call, sub, data)
-            futures.append(future)
+        return self._dispatch(event_type, targets, self._safe_call, wait_all, timeout)
 
-        delivered = 0
+    # -------- 批量发布 --------
+    def publish_many(
+        self,
+        event_type: str,
+        items: Iterable[Any],
+        wait_all: bool = False,
+        timeout: Optional[float] = None,
+    ) -> int:
+        """
+        批量发布同一类型的多条事件，每个订阅者只产生一次分发（一个任务/一次入队）。
 
-        if wait_all:
-            # 同步模式：等待所有订阅者完成
-            if timeout is None:
-                timeout = 5.0  # 默认5秒超时
-            # 等待所有订阅者完成
-            done, not_done = futures_wait(futures, timeout=timeout)
-            
-            # 统计成功执行的订阅者数量
-            for f in done:
-                try:
-                    if f.result() is True:
-                        delivered += 1
-                except Exception:
-                    # 异常已在 _safe_call 中处理，这里只统计
-                    pass
+        适用于一次取出多帧积压数据的场景，分摊每条消息的线程池提交开销。
+        订阅者提供 batch_callback 时整批调用一次，否则在同一任务内按顺序逐条调用 callback。
+        过滤函数仍按条执行，被过滤掉的事件不会出现在该订阅者的批次中。
 
-            if not_done:
-                logger.warning(
-                    "事件分发超时: event_type=%s, 超时订阅者数量=%d, 超时时间=%.1fs",
-                    event_type,
-                    len(not_done),
-                    timeout,
-                )
-        else:
-            # 异步模式：fire-and-forget，不等待完成
-            # 注意：这里无法立即知道成功数量，返回提交的任务数
-            delivered = len(futures)
+        :param event_type: 事件类型
+        :param items: 事件数据序列（按发布顺序）
+        :param wait_all: 是否等待所有订阅者完成
+        :param timeout: 等待超时时间（秒），仅在 wait_all=True 时有效
+        :return: 成功投递的订阅者数量（每个订阅者的一批计为 1）
+        """
+        if self._closed:
+            return 0
 
-        return delivered
+        if event_type in self._blocked_types:
+            logger.debug("批量事件被流量控制丢弃: event_type=%s", event_type)
+            return 0
+
+        subscribers = self._dispatch_table.get(event_type)
+        if not subscribers:
+            return 0
+
+        items = list(items)
+        if not items:
+            return 0
+
+        targets = []
+        for sub in subscribers:
+            if sub.filter_func is None:
+                batch = items
+            else:
+                batch = [data for data in items if sub.should_deliver(data)]
+                if not batch:
+                    continue
+            sub._calls.add(len(batch))
+            targets.append((sub, batch))
+
+        if not targets:
+            return 0
+
+        return self._dispatch(event_type, targets, self._safe_call_batch, wait_all, timeout)
+
+    def publish_batch(
+        self,
+        events: Iterable[Tuple[str, Any]],
+        wait_all: bool = False,
+        timeout: Optional[float] = None,
+    ) -> int:
+        """
+        批量发布多种类型的事件，例如 [(RAW_FRAME_DATA, frame), (RAW_DETECTION_DATA, det), ...]。
+
+        事件先按类型分组（组内保持原有顺序），再对每个类型调用 publish_many()。
+        不同类型之间的相对顺序不保证。
+
+        :param events: (event_type, data) 序列
+        :param wait_all: 是否等待所有订阅者完成
+        :param timeout: 等待超时时间（秒），仅在 wait_all=True 时有效
+        :return: 各类型 publish_many() 返回值之和
+        """
+        grouped: Dict[str, List[Any]] = {}
+        for event_type, data in events:
+            grouped.setdefault(event_type, []).append(data)
+
+        return sum(
+            self.publish_many(event_type, items, wait_all=wait_all, timeout=timeout)
+            for event_type, items in grouped.items()
+        )
 
     # -------- 异步发布（便捷方法） --------
     def publish_async(
@@ -338,11 +640,10 @@ class EventBus:
 
         :return: Future 对象，可用于查询执行状态
         """
-        with self._lock:
-            if self._closed:
-                f: Future = Future()
-                f.set_result(0)
-                return f
+        if self._closed:
+            f: Future = Future()
+            f.set_result(0)
+            return f
 
         return self._executor.submit(
             self.publish, event_type, data, priority, wait_all=False
@@ -362,8 +663,18 @@ class EventBus:
             if self._closed:
                 return
             self._closed = True
+            dispatchers = [
+                s._dispatcher
+                for subs in self._subscriptions.values()
+                for s in subs
+                if s._dispatcher is not None
+            ]
             self._subscriptions.clear()
             self._flow_control.clear()
+            self._rebuild_dispatch_table()
+
+        for dispatcher in dispatchers:
+            dispatcher.stop(wait=wait, timeout=5.0)
 
         try:
             self._executor.shutdown(wait=wait, cancel_pending=cancel_pending)
@@ -390,6 +701,7 @@ class EventBus:
                             "subscription_id": s.subscription_id,
                             "subscriber_name": s.subscriber_name,
                             "priority": s.priority.name,
+                            "dispatch_mode": s.dispatch_mode.name,
                             "total_calls": s.total_calls,
                             "error_count": s.error_count,
                         }
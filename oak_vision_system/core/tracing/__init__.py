@@ -0,0 +1,25 @@
+"""
+延迟追踪模块对外导出
+"""
+from .types import TraceStage, TRACE_STAGES, StageLatency, PerformanceMetricsPayload
+from .histogram import LatencyHistogram, percentile_us
+from .tracer import LatencyTracer, get_latency_tracer, initialize_latency_tracer
+
+__all__ = [
+    # 阶段常量
+    "TraceStage",                  # 追踪阶段名称：采集、发布、处理、配对、渲染等
+    "TRACE_STAGES",                # 阶段的流水线顺序
+
+    # 数据类
+    "StageLatency",                # 单阶段窗口统计：样本数、FPS、p50/p95/p99、最大值
+    "PerformanceMetricsPayload",   # PERFORMANCE_METRICS 事件载荷
+
+    # 直方图
+    "LatencyHistogram",            # 对数-线性分桶的单写者延迟直方图
+    "percentile_us",               # 从分桶计数计算百分位延迟
+
+    # 追踪器
+    "LatencyTracer",               # 分阶段延迟追踪器：打点并周期性发布统计
+    "get_latency_tracer",
+    "initialize_latency_tracer",
+]
@@ -0,0 +1,94 @@
+"""
+延迟直方图（HDR 风格的对数-线性分桶）
+
+以微秒为单位记录延迟：小于 _SUB_BUCKET_COUNT 微秒的值逐微秒分桶，更大的值按 2 的幂分段，
+每段再线性细分为 _SUB_BUCKET_COUNT / 2 个桶，相对误差不超过 1 / 64。
+桶数固定（约 1.3k），记录只做一次下标计算和一次整数自增。
+
+单个直方图只应由一个线程写入；读取方通过 counts() 复制计数快照，不需要加锁。
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional, Sequence
+
+_SUB_BUCKET_BITS = 7
+_SUB_BUCKET_COUNT = 1 << _SUB_BUCKET_BITS  # 128
+_SUB_BUCKET_HALF = _SUB_BUCKET_COUNT >> 1  # 64
+
+# 可记录的最大延迟（微秒），超过的值计入最后一个桶
+MAX_TRACKABLE_US = 60 * 1_000_000
+
+
+def bucket_index(value_us: int) -> int:
+    """微秒值 -> 桶下标"""
+    if value_us < _SUB_BUCKET_COUNT:
+        return max(0, value_us)
+    shift = value_us.bit_length() - _SUB_BUCKET_BITS
+    return _SUB_BUCKET_COUNT + (shift - 1) * _SUB_BUCKET_HALF + (value_us >> shift) - _SUB_BUCKET_HALF
+
+
+def bucket_value(index: int) -> float:
+    """桶下标 -> 桶内代表值（微秒，取桶区间中点）"""
+    if index < _SUB_BUCKET_COUNT:
+        return float(index)
+    shift = (index - _SUB_BUCKET_COUNT) // _SUB_BUCKET_HALF + 1
+    mantissa = (index - _SUB_BUCKET_COUNT) % _SUB_BUCKET_HALF + _SUB_BUCKET_HALF
+    return ((mantissa << shift) + ((mantissa + 1) << shift) - 1) / 2.0
+
+
+BUCKET_COUNT = bucket_index(MAX_TRACKABLE_US) + 1
+
+
+class LatencyHistogram:
+    """单写者延迟直方图"""
+
+    __slots__ = ("_counts",)
+
+    def __init__(self) -> None:
+        self._counts: List[int] = [0] * BUCKET_COUNT
+
+    def record(self, seconds: float) -> None:
+        """记录一次延迟（秒），负值按 0 计"""
+        value_us = int(seconds * 1_000_000)
+        if value_us > MAX_TRACKABLE_US:
+            value_us = MAX_TRACKABLE_US
+        self._counts[bucket_index(value_us)] += 1
+
+    def counts(self) -> List[int]:
+        """复制当前计数快照"""
+        return list(self._counts)
+
+
+def percentile_us(counts: Sequence[int], percentile: float, total: Optional[int] = None) -> float:
+    """
+    从分桶计数计算百分位延迟（微秒）
+
+    Args:
+        counts: 分桶计数
+        percentile: 百分位（0~100）
+        total: 计数总和（可选，避免重复求和）
+
+    Returns:
+        float: 百分位所在桶的代表值；没有样本时返回 0.0
+    """
+    if total is None:
+        total = sum(counts)
+    if total <= 0:
+        return 0.0
+    rank = max(1, int(total * percentile / 100.0 + 0.5))
+    seen = 0
+    for index, count in enumerate(counts):
+        if count:
+            seen += count
+            if seen >= rank:
+                return bucket_value(index)
+    return bucket_value(len(counts) - 1)
+
+
+def max_us(counts: Sequence[int]) -> float:
+    """最高非空桶的代表值（微秒），没有样本时返回 0.0"""
+    for index in range(len(counts) - 1, -1, -1):
+        if counts[index]:
+            return bucket_value(index)
+    return 0.0
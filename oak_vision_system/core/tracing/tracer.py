@@ -0,0 +1,228 @@
+"""
+延迟追踪器：各阶段按设备采集时间戳打点，周期性发布分阶段延迟统计
+
+打点只在调用线程自己的直方图分片上自增计数，不加锁；发布线程定期合并各分片，
+按窗口差值计算 p50/p95/p99 与每秒样本数，发布 PERFORMANCE_METRICS 事件。
+未启用时 stamp() 在第一行返回，开销只有一次属性判断。
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Dict, List, Optional
+
+from oak_vision_system.core.event_bus import EventBus, EventType, get_event_bus
+from oak_vision_system.core.tracing.histogram import LatencyHistogram, max_us, percentile_us
+from oak_vision_system.core.tracing.types import (
+    TRACE_STAGES,
+    PerformanceMetricsPayload,
+    StageLatency,
+)
+
+logger = logging.getLogger(__name__)
+
+# 默认统计发布间隔（秒）
+DEFAULT_PUBLISH_INTERVAL_S = 1.0
+
+
+class LatencyTracer:
+    """
+    分阶段延迟追踪器
+
+    使用方式：
+    - 各模块在初始化时取得 get_latency_tracer()，在流水线各阶段调用
+      stamp(TraceStage.XXX, capture_ts)
+    - 作为普通模块注册到 SystemManager（start()/stop()），由发布线程周期性发布统计
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        event_bus: EventBus | None = None,
+        publish_interval_s: float = DEFAULT_PUBLISH_INTERVAL_S,
+    ) -> None:
+        """
+        Args:
+            enabled: 是否启用打点（对应 SystemConfigDTO.enable_profiling）
+            event_bus: 事件总线实例（可选，默认使用全局单例）
+            publish_interval_s: 统计发布间隔（秒）
+        """
+        if publish_interval_s <= 0:
+            raise ValueError("publish_interval_s 必须 > 0")
+        self.enabled = enabled
+        self.publish_interval_s = publish_interval_s
+        self._event_bus = event_bus or get_event_bus()
+
+        # 每个打点线程一个分片：阶段 -> 直方图，只由所属线程写入
+        self._local = threading.local()
+        self._shards: List[Dict[str, LatencyHistogram]] = []
+        self._shards_lock = threading.Lock()
+
+        # 上一次发布时的合并计数，用于计算窗口差值（只由发布方读写）
+        self._last_counts: Dict[str, List[int]] = {}
+        self._last_snapshot_time = time.monotonic()
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def stamp(self, stage: str, capture_ts: Optional[float]) -> None:
+        """
+        记录一帧到达某阶段的时刻
+
+        Args:
+            stage: 阶段名称，见 TraceStage
+            capture_ts: 该帧的设备采集时间戳（time.monotonic() 时钟），为 None 时忽略
+        """
+        if not self.enabled or capture_ts is None:
+            return
+        latency = time.monotonic() - capture_ts
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._new_shard()
+        histogram = shard.get(stage)
+        if histogram is None:
+            histogram = shard[stage] = LatencyHistogram()
+        histogram.record(latency)
+
+    def _new_shard(self) -> Dict[str, LatencyHistogram]:
+        shard: Dict[str, LatencyHistogram] = {}
+        with self._shards_lock:
+            self._shards.append(shard)
+        self._local.shard = shard
+        return shard
+
+    def snapshot(self) -> PerformanceMetricsPayload:
+        """
+        合并各分片，返回自上一次 snapshot() 以来窗口内的分阶段统计
+
+        只应由单个发布方调用（发布线程或测试）。
+        """
+        now = time.monotonic()
+        interval = max(now - self._last_snapshot_time, 1e-6)
+        self._last_snapshot_time = now
+
+        with self._shards_lock:
+            shards = list(self._shards)
+        merged: Dict[str, List[int]] = {}
+        for shard in shards:
+            for stage, histogram in list(shard.items()):
+                counts = histogram.counts()
+                total = merged.get(stage)
+                if total is None:
+                    merged[stage] = counts
+                else:
+                    for i, c in enumerate(counts):
+                        if c:
+                            total[i] += c
+
+        stages: Dict[str, StageLatency] = {}
+        ordered = [s for s in TRACE_STAGES if s in merged] + sorted(s for s in merged if s not in TRACE_STAGES)
+        for stage in ordered:
+            counts = merged[stage]
+            last = self._last_counts.get(stage)
+            window = counts if last is None else [c - p for c, p in zip(counts, last)]
+            self._last_counts[stage] = counts
+            count = sum(window)
+            if count == 0:
+                continue
+            stages[stage] = StageLatency(
+                count=count,
+                fps=count / interval,
+                p50_ms=percentile_us(window, 50, count) / 1000.0,
+                p95_ms=percentile_us(window, 95, count) / 1000.0,
+                p99_ms=percentile_us(window, 99, count) / 1000.0,
+                max_ms=max_us(window) / 1000.0,
+            )
+        return PerformanceMetricsPayload(timestamp=now, interval_s=interval, stages=stages)
+
+    # ========== 发布线程（SystemManager 模块接口） ==========
+
+    def start(self) -> bool:
+        """启动统计发布线程；未启用时不启动线程（幂等）"""
+        if not self.enabled:
+            logger.info("延迟追踪未启用（enable_profiling=False）")
+            return True
+        if self._thread is not None and self._thread.is_alive():
+            return True
+        self._stop_event.clear()
+        self.snapshot()  # 丢弃启动前的样本，第一个窗口从此刻开始
+        self._thread = threading.Thread(target=self._loop, name="LatencyTracer", daemon=True)
+        self._thread.start()
+        logger.info("延迟追踪已启动，发布间隔: %.1fs", self.publish_interval_s)
+        return True
+
+    def stop(self, timeout: float = 1.0) -> bool:
+        """停止统计发布线程（幂等）"""
+        thread = self._thread
+        if thread is None:
+            return True
+        self._stop_event.set()
+        thread.join(timeout=timeout)
+        if thread.is_alive():
+            logger.error("延迟追踪发布线程停止超时 (%ss)", timeout)
+            return False
+        self._thread = None
+        return True
+
+    def _loop(self) -> None:
+        while not self._stop_event.wait(self.publish_interval_s):
+            try:
+                payload = self.snapshot()
+                if not payload.stages:
+                    continue
+                self._event_bus.publish(EventType.PERFORMANCE_METRICS, payload)
+                logger.info(
+                    "阶段延迟(ms, p50/p95/p99): %s",
+                    ", ".join(
+                        f"{stage}={s.p50_ms:.1f}/{s.p95_ms:.1f}/{s.p99_ms:.1f}@{s.fps:.1f}fps"
+                        for stage, s in payload.stages.items()
+                    ),
+                )
+            except Exception:
+                logger.exception("发布延迟统计失败")
+
+
+# 单例实例和锁，保证 LatencyTracer 只被创建一次；未初始化时返回未启用的追踪器
+_tracer_instance: LatencyTracer | None = None
+_tracer_lock = threading.Lock()
+
+
+def initialize_latency_tracer(
+    enabled: bool = False,
+    event_bus: EventBus | None = None,
+    publish_interval_s: float = DEFAULT_PUBLISH_INTERVAL_S,
+) -> LatencyTracer:
+    """
+    初始化并返回全局唯一的 LatencyTracer 实例。
+
+    若已存在实例（例如模块先调用了 get_latency_tracer()），只更新 enabled 开关，
+    已持有引用的模块随之生效。
+
+    Args:
+        enabled: 是否启用打点
+        event_bus: 可选，事件总线
+        publish_interval_s: 统计发布间隔（秒）
+
+    Returns:
+        LatencyTracer 单例实例。
+    """
+    global _tracer_instance
+    with _tracer_lock:
+        if _tracer_instance is None:
+            _tracer_instance = LatencyTracer(
+                enabled=enabled, event_bus=event_bus, publish_interval_s=publish_interval_s
+            )
+        else:
+            _tracer_instance.enabled = enabled
+        return _tracer_instance
+
+
+def get_latency_tracer() -> LatencyTracer:
+    """获取全局唯一的 LatencyTracer 实例（未初始化时创建未启用的实例）"""
+    global _tracer_instance
+    with _tracer_lock:
+        if _tracer_instance is None:
+            _tracer_instance = LatencyTracer(enabled=False)
+        return _tracer_instance
@@ -0,0 +1,54 @@
+"""
+延迟追踪模块 - 核心数据类型
+"""
+from dataclasses import dataclass, field
+from typing import Dict, Tuple
+
+
+class TraceStage:
+    """
+    追踪阶段（字符串常量，便于日志和跨模块引用）
+
+    每个阶段记录的都是“从设备采集到该阶段”的累计延迟，相邻阶段的差值即该段耗时。
+    """
+
+    COLLECTOR_PICKUP = "collector_pickup"    # 采集线程取到设备消息
+    BUS_PUBLISH = "bus_publish"              # 采集器发布到事件总线
+    PROCESSOR_DEQUEUE = "processor_dequeue"  # 数据处理线程从队列取出
+    TRANSFORM = "transform"                  # 坐标变换完成
+    FILTER = "filter"                        # 滤波完成
+    DECISION = "decision"                    # 决策完成
+    PACKAGER_PAIR = "packager_pair"          # 渲染包打包器完成视频帧与检测数据配对
+    RENDER = "render"                        # 渲染并显示
+
+
+# 阶段的流水线顺序（发布与日志按此排序）
+TRACE_STAGES: Tuple[str, ...] = (
+    TraceStage.COLLECTOR_PICKUP,
+    TraceStage.BUS_PUBLISH,
+    TraceStage.PROCESSOR_DEQUEUE,
+    TraceStage.TRANSFORM,
+    TraceStage.FILTER,
+    TraceStage.DECISION,
+    TraceStage.PACKAGER_PAIR,
+    TraceStage.RENDER,
+)
+
+
+@dataclass
+class StageLatency:
+    """单个阶段在一个统计窗口内的延迟统计（自设备采集起，单位：毫秒）"""
+    count: int       # 窗口内样本数
+    fps: float       # 窗口内每秒样本数
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+@dataclass
+class PerformanceMetricsPayload:
+    """通过事件总线（PERFORMANCE_METRICS）发布的延迟统计载荷"""
+    timestamp: float    # 发布时间（time.monotonic()）
+    interval_s: float   # 统计窗口长度（秒）
+    stages: Dict[str, StageLatency] = field(default_factory=dict)  # 阶段 -> 统计，只包含有样本的阶段
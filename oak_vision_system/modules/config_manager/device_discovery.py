@@ -8,13 +8,19 @@ OAK设备发现模块
 
 设计理念：
 - 单一职责：仅负责硬件扫描和信息提取
-- 无状态：所有方法为静态方法
+- 静态方法：唯一的状态是进程内共享的扫描结果缓存（带有效期）
 - 纯API：不包含配置逻辑、用户交互、文件操作
+
+扫描缓存：
+每次 USB 扫描（get_all_available_devices）的结果都会写入缓存，
+get_cached_available_devices 在缓存未过期时直接返回缓存结果。
+配置管理器刚完成的设备发现可以被随后启动的采集器复用，避免重复扫描。
 """
 
 import depthai as dai
+import threading
 import time
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import logging
 
 from oak_vision_system.core.dto.config_dto import (
@@ -23,6 +29,10 @@ from oak_vision_system.core.dto.config_dto import (
 )
 
 
+# 扫描结果缓存的默认有效期（秒）
+DISCOVERY_CACHE_TTL_S = 2.0
+
+
 class OAKDeviceDiscovery:
     """
     OAK设备发现类
@@ -38,13 +48,14 @@ class OAKDeviceDiscovery:
     - 用户交互（应在CLI工具中）
     """
     
+    # 扫描结果缓存：(扫描时间 time.monotonic(), 设备列表)
+    _cache_lock = threading.Lock()
+    _cache: Optional[Tuple[float, List[dai.DeviceInfo]]] = None
 
-
-    
     @staticmethod
     def get_all_available_devices(verbose: bool = False) -> List[dai.DeviceInfo]:
         """
-        获取所有可用的OAK设备列表
+        获取所有可用的OAK设备列表（总是执行 USB 扫描，并刷新扫描缓存）
         """
         logger = logging.getLogger(__name__)
         try: 
@@ -55,6 +66,8 @@ class OAKDeviceDiscovery:
                 print(f"获取所有可用的OAK设备失败: {e}")
             logger.warning("getAllAvailableDevices failed: %s", e, exc_info=True)
             return []
+        with OAKDeviceDiscovery._cache_lock:
+            OAKDeviceDiscovery._cache = (time.monotonic(), list(infos or []))
         if not infos:
             if verbose:
                 print("未发现任何设备")
@@ -62,6 +75,32 @@ class OAKDeviceDiscovery:
 
         return infos
 
+    @staticmethod
+    def get_cached_available_devices(
+        max_age_s: float = DISCOVERY_CACHE_TTL_S,
+    ) -> List[dai.DeviceInfo]:
+        """
+        获取可用的OAK设备列表，缓存未超过 max_age_s 时直接返回缓存结果
+        
+        Args:
+            max_age_s: 可接受的缓存最大时长（秒），<= 0 时强制重新扫描
+            
+        Returns:
+            List[dai.DeviceInfo]: 可用设备列表
+        """
+        if max_age_s > 0:
+            with OAKDeviceDiscovery._cache_lock:
+                cached = OAKDeviceDiscovery._cache
+            if cached is not None and time.monotonic() - cached[0] <= max_age_s:
+                return list(cached[1])
+        return OAKDeviceDiscovery.get_all_available_devices(verbose=False)
+
+    @staticmethod
+    def invalidate_cache() -> None:
+        """清空扫描结果缓存（设备插拔或打开设备后状态变化时调用）"""
+        with OAKDeviceDiscovery._cache_lock:
+            OAKDeviceDiscovery._cache = None
+
     # 公有接口：发现所有可用的OAK设备
     @staticmethod
     def discover_devices(verbose: bool = False) -> List[DeviceMetadataDTO]:
@@ -1,13 +1,22 @@
 """
 数据采集模块
 
-包含 OAK 设备数据采集、Pipeline 管理等功能
+包含 OAK 设备数据采集、Pipeline 管理、背压限流、采集数据录制与回放等功能
 """
 
 from .collector import OAKDataCollector
 from .pipelinemanager import PipelineManager
+from .rate_governor import RateGovernor
+from .capture import CaptureReader, CaptureWriter
+from .recorder import CaptureRecorder
+from .replay_collector import ReplayCollector
 
 __all__ = [
     'OAKDataCollector',
     'PipelineManager',
+    'RateGovernor',
+    'CaptureReader',
+    'CaptureWriter',
+    'CaptureRecorder',
+    'ReplayCollector',
 ]
\ No newline at end of file
@@ -0,0 +1,342 @@
+"""
+采集数据捕获文件格式
+
+用于把采集器发布的检测批次与视频帧录制到单个文件，并在没有相机的机器上回放。
+
+文件由若干独立的数据块组成，每个数据块自带索引，写入方异常退出时已完整写入的数据块
+仍可读取。读取方用 np.memmap 映射整个文件，检测列和原始图像直接以文件视图返回，
+不做拷贝；JPEG 图像在首次访问时才解码。
+
+文件布局（小端）：
+    文件头：FILE_MAGIC(8) + version(u4) + reserved(u4)
+    数据块：CHUNK_MAGIC(8) + n_records(u4) + meta_len(u4) + payload_len(u8)
+            + meta（JSON，设备表）+ 索引（n_records × INDEX_DTYPE）+ 载荷
+meta、索引和每条记录的载荷都按 16 字节对齐。
+
+检测记录载荷：labels(int32) | confidence(float32) | bbox(float32×4) | coords_h(float32×4)，
+按列连续存放。视频帧记录载荷：RGB 数据（原始 HWC uint8 或 JPEG），
+其后按 16 字节对齐存放原始深度数据（uint16），可选。
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+import cv2
+import numpy as np
+
+from oak_vision_system.core.dto import DeviceDetectionBatch, VideoFrameDTO
+
+FILE_MAGIC = b"OAKCAP\x00\x01"
+CHUNK_MAGIC = b"OAKCHUNK"
+FORMAT_VERSION = 1
+
+_FILE_HEADER = struct.Struct("<8sII")
+_CHUNK_HEADER = struct.Struct("<8sIIQ")
+_ALIGN = 16
+
+# 记录类型
+RECORD_DETECTION = 0
+RECORD_FRAME = 1
+
+# RGB 图像编码
+CODEC_NONE = 0  # 不录制图像
+CODEC_RAW = 1   # 原始 HWC uint8
+CODEC_JPEG = 2  # JPEG 压缩
+FRAME_CODECS: Dict[str, int] = {"none": CODEC_NONE, "raw": CODEC_RAW, "jpeg": CODEC_JPEG}
+
+# 单条记录的索引项（80 字节）
+INDEX_DTYPE = np.dtype([
+    ("kind", "<u1"),          # 记录类型
+    ("codec", "<u1"),         # RGB 编码（视频帧记录）
+    ("device", "<u2"),        # 设备表下标
+    ("n_rows", "<u4"),        # 检测数量（检测记录）
+    ("frame_id", "<i8"),      # 帧ID
+    ("ts", "<f8"),            # 录制时间（秒，time.monotonic() 时钟），用于回放节奏
+    ("capture_ts", "<f8"),    # 设备采集时间戳（秒），缺失时为 NaN
+    ("offset", "<u8"),        # 载荷在文件中的绝对偏移
+    ("length", "<u8"),        # 主载荷长度（检测列 / RGB 数据）
+    ("aux_length", "<u8"),    # 深度数据长度，0 表示无深度
+    ("height", "<u4"),        # RGB 高度
+    ("width", "<u4"),         # RGB 宽度
+    ("channels", "<u4"),      # RGB 通道数
+    ("depth_height", "<u4"),  # 深度高度
+    ("depth_width", "<u4"),   # 深度宽度
+    ("reserved", "<u4"),
+])
+
+_DETECTION_ROW_BYTES = 4 + 4 + 16 + 16
+
+
+def _align(n: int) -> int:
+    return (n + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def _nan_if_none(value: Optional[float]) -> float:
+    return float("nan") if value is None else float(value)
+
+
+class CaptureWriter:
+    """
+    捕获文件写入器
+
+    记录先累积在内存中，达到 chunk_bytes 后作为一个数据块写入文件。
+    非线程安全，由 CaptureRecorder 在单一线程中调用。
+    """
+
+    def __init__(self, path: str, *, chunk_bytes: int = 4 << 20, jpeg_quality: int = 90) -> None:
+        """
+        Args:
+            path: 输出文件路径（已存在时覆盖）
+            chunk_bytes: 单个数据块的目标载荷大小（字节）
+            jpeg_quality: JPEG 编码质量（1-100）
+        """
+        if chunk_bytes <= 0:
+            raise ValueError("chunk_bytes 必须大于0")
+        self._file: Optional[BinaryIO] = open(path, "wb")
+        self._file.write(_FILE_HEADER.pack(FILE_MAGIC, FORMAT_VERSION, 0))
+        self._chunk_bytes = chunk_bytes
+        self._jpeg_params = [int(cv2.IMWRITE_JPEG_QUALITY), int(jpeg_quality)]
+        self._devices: Dict[str, int] = {}
+        self._device_table: List[Tuple[str, Optional[str]]] = []
+        self._index: List[tuple] = []
+        self._payload = bytearray()
+        self.records_written = 0
+
+    @property
+    def closed(self) -> bool:
+        return self._file is None
+
+    def _device_index(self, device_id: str, device_alias: Optional[str]) -> int:
+        idx = self._devices.get(device_id)
+        if idx is None:
+            idx = len(self._device_table)
+            self._devices[device_id] = idx
+            self._device_table.append((device_id, device_alias))
+        return idx
+
+    def _append_payload(self, *parts: bytes) -> int:
+        """追加一条记录的载荷（各部分之间按 16 字节对齐），返回块内偏移"""
+        offset = len(self._payload)
+        for i, part in enumerate(parts):
+            if i > 0:
+                self._payload.extend(b"\0" * (_align(len(self._payload)) - len(self._payload)))
+            self._payload.extend(part)
+        self._payload.extend(b"\0" * (_align(len(self._payload)) - len(self._payload)))
+        return offset
+
+    def write_detections(self, batch: DeviceDetectionBatch, ts: float) -> None:
+        """写入一条检测批次记录"""
+        n = batch.detection_count
+        offset = self._append_payload(
+            np.ascontiguousarray(batch.labels, dtype="<i4").tobytes()
+            + np.ascontiguousarray(batch.confidence, dtype="<f4").tobytes()
+            + np.ascontiguousarray(batch.bbox, dtype="<f4").tobytes()
+            + np.ascontiguousarray(batch.coords_h, dtype="<f4").tobytes()
+        )
+        self._index.append((
+            RECORD_DETECTION, CODEC_NONE, self._device_index(batch.device_id, batch.device_alias), n,
+            batch.frame_id, ts, _nan_if_none(batch.capture_ts),
+            offset, n * _DETECTION_ROW_BYTES, 0,
+            0, 0, 0, 0, 0, 0,
+        ))
+        self._after_record()
+
+    def write_frame(self, frame: VideoFrameDTO, ts: float, codec: int = CODEC_RAW) -> None:
+        """
+        写入一条视频帧记录
+
+        Args:
+            frame: 视频帧（延迟加载的图像在此处解码）
+            ts: 录制时间（秒，time.monotonic() 时钟）
+            codec: RGB 编码，CODEC_NONE 时只记录帧ID和时间戳
+        """
+        rgb_bytes = b""
+        height = width = channels = 0
+        rgb = frame.rgb_frame if codec != CODEC_NONE else None
+        if rgb is not None:
+            height, width = rgb.shape[:2]
+            channels = rgb.shape[2] if rgb.ndim == 3 else 1
+            if codec == CODEC_JPEG:
+                ok, encoded = cv2.imencode(".jpg", rgb, self._jpeg_params)
+                if not ok:
+                    raise ValueError("JPEG 编码失败")
+                rgb_bytes = encoded.tobytes()
+            else:
+                rgb_bytes = np.ascontiguousarray(rgb, dtype=np.uint8).tobytes()
+        else:
+            codec = CODEC_NONE
+
+        depth_bytes = b""
+        depth_height = depth_width = 0
+        depth = frame.depth_frame if codec != CODEC_NONE else None
+        if depth is not None:
+            depth_height, depth_width = depth.shape[:2]
+            depth_bytes = np.ascontiguousarray(depth, dtype="<u2").tobytes()
+
+        parts = (rgb_bytes, depth_bytes) if depth_bytes else (rgb_bytes,)
+        offset = self._append_payload(*parts)
+        self._index.append((
+            RECORD_FRAME, codec, self._device_index(frame.device_id, None), 0,
+            frame.frame_id, ts, _nan_if_none(frame.capture_ts),
+            offset, len(rgb_bytes), len(depth_bytes),
+            height, width, channels, depth_height, depth_width, 0,
+        ))
+        self._after_record()
+
+    def _after_record(self) -> None:
+        self.records_written += 1
+        if len(self._payload) >= self._chunk_bytes:
+            self.flush()
+
+    def flush(self) -> None:
+        """把已累积的记录写成一个数据块"""
+        if self._file is None or not self._index:
+            return
+        meta = json.dumps({"devices": self._device_table}).encode("utf-8")
+        meta += b"\0" * (_align(len(meta)) - len(meta))
+        index = np.array(self._index, dtype=INDEX_DTYPE)
+        self._file.write(_CHUNK_HEADER.pack(CHUNK_MAGIC, len(self._index), len(meta), len(self._payload)))
+        self._file.write(b"\0" * (_align(_CHUNK_HEADER.size) - _CHUNK_HEADER.size))
+        self._file.write(meta)
+        self._file.write(index.tobytes())
+        self._file.write(self._payload)
+        self._file.flush()
+        self._index.clear()
+        self._payload = bytearray()
+
+    def close(self) -> None:
+        """写出剩余记录并关闭文件（幂等）"""
+        if self._file is None:
+            return
+        self.flush()
+        self._file.close()
+        self._file = None
+
+
+class CaptureReader:
+    """
+    捕获文件读取器
+
+    以写时复制模式（mode="c"）映射文件：返回的数组可写，修改不会写回文件。
+    检测列与原始 RGB/深度图像都是文件映射的视图；JPEG 图像在首次访问时解码。
+    末尾不完整的数据块（写入方异常退出）会被忽略。
+    """
+
+    def __init__(self, path: str) -> None:
+        self._mm: Optional[np.memmap] = np.memmap(path, dtype=np.uint8, mode="c")
+        size = self._mm.shape[0]
+        if size < _FILE_HEADER.size:
+            raise ValueError(f"不是有效的捕获文件: {path}")
+        magic, version, _ = _FILE_HEADER.unpack(self._mm[:_FILE_HEADER.size].tobytes())
+        if magic != FILE_MAGIC:
+            raise ValueError(f"不是有效的捕获文件: {path}")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"不支持的捕获文件版本: {version}")
+
+        indexes: List[np.ndarray] = []
+        self.devices: List[Tuple[str, Optional[str]]] = []
+        pos = _FILE_HEADER.size
+        chunk_header_size = _align(_CHUNK_HEADER.size)
+        while pos + chunk_header_size <= size:
+            magic, n_records, meta_len, payload_len = _CHUNK_HEADER.unpack(
+                self._mm[pos:pos + _CHUNK_HEADER.size].tobytes()
+            )
+            index_pos = pos + chunk_header_size + meta_len
+            payload_pos = index_pos + n_records * INDEX_DTYPE.itemsize
+            end = payload_pos + payload_len
+            if magic != CHUNK_MAGIC or end > size:
+                break  # 不完整的数据块
+            meta = json.loads(self._mm[pos + chunk_header_size:index_pos].tobytes().rstrip(b"\0"))
+            self.devices = [(device_id, alias) for device_id, alias in meta["devices"]]
+            index = np.frombuffer(
+                self._mm[index_pos:payload_pos].tobytes(), dtype=INDEX_DTYPE
+            ).copy()
+            index["offset"] += payload_pos
+            indexes.append(index)
+            pos = end
+
+        self.index: np.ndarray = (
+            np.concatenate(indexes) if indexes else np.empty((0,), dtype=INDEX_DTYPE)
+        )
+
+    def __len__(self) -> int:
+        return int(self.index.shape[0])
+
+    @property
+    def duration(self) -> float:
+        """录制时长（秒，按记录的录制时间）"""
+        if len(self) < 2:
+            return 0.0
+        return float(self.index["ts"][-1] - self.index["ts"][0])
+
+    def _array(self, offset: int, dtype, shape) -> np.ndarray:
+        return np.ndarray(shape, dtype=dtype, buffer=self._mm, offset=int(offset))
+
+    def detection_batch(self, i: int) -> DeviceDetectionBatch:
+        """读取第 i 条记录（须为检测记录）"""
+        rec = self.index[i]
+        if rec["kind"] != RECORD_DETECTION:
+            raise ValueError(f"第{i}条记录不是检测记录")
+        n = int(rec["n_rows"])
+        off = int(rec["offset"])
+        device_id, alias = self.devices[int(rec["device"])]
+        capture_ts = float(rec["capture_ts"])
+        return DeviceDetectionBatch(
+            device_id=device_id,
+            frame_id=int(rec["frame_id"]),
+            labels=self._array(off, "<i4", (n,)),
+            confidence=self._array(off + 4 * n, "<f4", (n,)),
+            bbox=self._array(off + 8 * n, "<f4", (n, 4)),
+            coords_h=self._array(off + 24 * n, "<f4", (n, 4)),
+            device_alias=alias,
+            capture_ts=None if np.isnan(capture_ts) else capture_ts,
+        )
+
+    def video_frame(self, i: int) -> VideoFrameDTO:
+        """读取第 i 条记录（须为视频帧记录），图像延迟加载"""
+        rec = self.index[i]
+        if rec["kind"] != RECORD_FRAME:
+            raise ValueError(f"第{i}条记录不是视频帧记录")
+        off = int(rec["offset"])
+        length = int(rec["length"])
+        codec = int(rec["codec"])
+        device_id, _ = self.devices[int(rec["device"])]
+
+        rgb_loader = None
+        if codec == CODEC_RAW:
+            shape = (int(rec["height"]), int(rec["width"]), int(rec["channels"]))
+            rgb_loader = lambda: self._array(off, np.uint8, shape)
+        elif codec == CODEC_JPEG:
+            rgb_loader = lambda: cv2.imdecode(self._array(off, np.uint8, (length,)), cv2.IMREAD_COLOR)
+
+        depth_loader = None
+        if rec["aux_length"] > 0:
+            depth_shape = (int(rec["depth_height"]), int(rec["depth_width"]))
+            depth_off = off + _align(length)
+            depth_loader = lambda: self._array(depth_off, "<u2", depth_shape)
+
+        capture_ts = float(rec["capture_ts"])
+        return VideoFrameDTO(
+            device_id=device_id,
+            frame_id=int(rec["frame_id"]),
+            rgb_loader=rgb_loader,
+            depth_loader=depth_loader,
+            capture_ts=None if np.isnan(capture_ts) else capture_ts,
+        )
+
+    def read(self, i: int) -> Union[DeviceDetectionBatch, VideoFrameDTO]:
+        """按记录类型读取第 i 条记录"""
+        if self.index[i]["kind"] == RECORD_DETECTION:
+            return self.detection_batch(i)
+        return self.video_frame(i)
+
+    def __iter__(self) -> Iterator[Union[DeviceDetectionBatch, VideoFrameDTO]]:
+        for i in range(len(self)):
+            yield self.read(i)
+
+    def close(self) -> None:
+        """释放文件映射（已返回的数组仍持有映射，直到被回收；未解码的延迟帧将无法再读取）"""
+        self._mm = None
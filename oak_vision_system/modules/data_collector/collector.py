@@ -13,36 +13,95 @@ OAK数据采集模块，负责启动OAK设备的pipeline并采集数据，发布
 
 """
 from __future__ import annotations
-from typing import Optional, Dict, Union, List, Set
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Callable, Optional, Dict, Union, List, Set, Tuple
 import threading
 import time
 from oak_vision_system.modules.data_collector.pipelinemanager import PipelineManager
-from oak_vision_system.core.backpressure import (
-    BackpressureState,
-    BackpressureAction,
-    BackpressureEventPayload,
-)
+from oak_vision_system.modules.data_collector.frame_sync import FrameSyncBuffer, SyncedFrame
+from oak_vision_system.modules.data_collector.rate_governor import RateGovernor
+from oak_vision_system.core.backpressure import BackpressureEventPayload
 from oak_vision_system.core.dto import (
     SpatialCoordinatesDTO,
     BoundingBoxDTO,
     DetectionDTO,
     DeviceDetectionDataDTO,
+    DeviceDetectionBatch,
     VideoFrameDTO,
+    CameraHeartbeatDTO,
 )
 from oak_vision_system.core.dto.config_dto.oak_module_config_dto import OAKModuleConfigDTO
+from oak_vision_system.core.dto.config_dto.system_config_dto import SystemConfigDTO
 from oak_vision_system.core.dto.config_dto import DeviceRoleBindingDTO, DeviceMetadataDTO
 from oak_vision_system.core.event_bus import EventBus, EventType, get_event_bus
+from oak_vision_system.core.tracing import TraceStage, get_latency_tracer
 import logging
+import numpy as np
 import depthai as dai
 from oak_vision_system.modules.config_manager.device_discovery import OAKDeviceDiscovery
 
 
+# 事件模式下等待队列事件的超时（秒），决定 stop() 的最大响应延迟
+_QUEUE_EVENT_TIMEOUT_S = 0.1
+# 单次唤醒最多取走的队列事件数
+_MAX_QUEUE_EVENTS = 64
+
+# start() 等待全部设备启动就绪的超时（秒）
+_DEVICE_BOOT_TIMEOUT_S = 30.0
+
+# 设备心跳（CAMERA_HEARTBEAT）发布间隔（秒）
+_HEARTBEAT_INTERVAL_S = 1.0
+# 重连退避的上限（秒）：reconnect_interval 按 2 的幂增长，不超过此值
+_MAX_RECONNECT_BACKOFF_S = 60.0
+# 重连前确认 MXID 可见时可接受的扫描缓存时长（秒），多个设备同时重连时共享扫描结果
+_REDISCOVERY_MAX_AGE_S = 0.5
+
+
+@dataclass
+class _DeviceHealth:
+    """单个设备的会话健康状态（仅由该设备的监护线程读写）"""
+
+    state: str = "stopped"  # 取值见 CAMERA_STATES
+    session_started: Optional[float] = None  # 当前会话就绪时刻（time.monotonic()）
+    sessions: int = 0  # 已就绪的会话数
+    reconnect_count: int = 0  # 重连成功次数
+    consecutive_failures: int = 0  # 连续失败次数
+    last_error: Optional[str] = None
+    last_heartbeat: float = 0.0
+
+
+def _rgb_frame_loader(rgb_frame: dai.ImgFrame) -> Callable[[], np.ndarray]:
+    """
+    返回 RGB 帧的延迟解码函数。
+    
+    - BGR 交错帧（HWC）即为 OpenCV 布局，直接返回 ImgFrame 缓冲区的无拷贝视图
+    - BGR 平面帧（CHW，管线默认输出）一次转置拷贝为 HWC 数组。
+      解码结果随 VideoFrameDTO 被所有 RAW_FRAME_DATA 订阅者共享（如录制线程、显示模块），
+      无法确定最后一个持有者，因此不从帧缓冲区池分配，由垃圾回收释放
+    - 其余布局（如 NV12）需要颜色转换，使用 getCvFrame()
+    
+    加载函数持有 ImgFrame 引用，保证视图有效。
+    """
+    frame_type = rgb_frame.getType()
+    if frame_type == dai.ImgFrame.Type.BGR888i:
+        return rgb_frame.getFrame
+    if frame_type == dai.ImgFrame.Type.BGR888p:
+        def load_planar() -> np.ndarray:
+            height, width = rgb_frame.getHeight(), rgb_frame.getWidth()
+            planar = rgb_frame.getFrame().reshape(3, height, width)
+            return np.ascontiguousarray(planar.transpose(1, 2, 0))
+        return load_planar
+    return rgb_frame.getCvFrame
+
+
 class OAKDataCollector:
     def __init__(
         self,
         config: OAKModuleConfigDTO,
         event_bus: Optional[EventBus] = None,
-        available_devices: Optional[List[DeviceMetadataDTO]] = None
+        available_devices: Optional[List[DeviceMetadataDTO]] = None,
+        system_config: Optional[SystemConfigDTO] = None,
     ) -> None:
         """
         初始化采集器，注入 PipelineManager、事件总线与系统配置
@@ -53,15 +112,29 @@ class OAKDataCollector:
             available_devices: 可用设备元数据列表（可选）
                 用于在 start() 时预检设备可用性，避免启动不可用的设备
                 如果为 None，则跳过预检（向后兼容）
+            system_config: 系统配置（可选），提供 auto_reconnect / reconnect_interval /
+                max_reconnect_attempts 重连设置，默认使用 SystemConfigDTO()
         """
         self.config = config
-        self.pipeline_manager = PipelineManager(config.hardware_config)
+        self.system_config = system_config or SystemConfigDTO()
+        self.pipeline_manager = PipelineManager(config.hardware_config, system_config=self.system_config)
         self.event_bus = event_bus or get_event_bus()
         self.running: Dict[str, bool] = self._init_running_from_config()
         self._worker_threads: Dict[str, threading.Thread] = {}
         self._running_lock = threading.Lock()
         self.logger = logging.getLogger(__name__)
 
+        # 按 pipeline 定义缓存已构建的 pipeline，所有设备共用（键：是否带深度输出）
+        self._pipelines: Dict[bool, dai.Pipeline] = {}
+        self._pipeline_lock = threading.Lock()
+        # 设备启动就绪屏障：设备打开并创建输出队列后（或启动失败时）置位
+        self._ready_events: Dict[str, threading.Event] = {}
+        self._boot_errors: Dict[str, str] = {}
+        # 设备会话健康状态（断线重连与心跳）
+        self._health: Dict[str, _DeviceHealth] = {
+            role_key: _DeviceHealth() for role_key in self.running
+        }
+
         # 存储可用设备列表（用于启动前预检）
         self._available_devices = available_devices
         self._available_mxids: Set[str] = set()
@@ -75,27 +148,28 @@ class OAKDataCollector:
             # 执行设备可用性检查
             self._validate_device_availability()
 
-        # 背压配置
-        self._bp_lock = threading.Lock()
-        self._bp_action = BackpressureAction.NORMAL
+        # 分阶段延迟追踪（未启用时打点立即返回）
+        self._tracer = get_latency_tracer()
+
+        # 背压限流：按设备令牌桶降低发布速率，优先级高的设备少降速
+        self._rate_governor = RateGovernor(
+            self.running.keys(),
+            priorities=self.config.hardware_config.rate_priorities,
+            min_fraction=self.config.hardware_config.min_rate_fraction,
+        )
 
         fps = getattr(self.config.hardware_config, "hardware_fps", 20)
         fps = max(1, int(fps))
 
-        # 时间闸门（单位：秒）
-        self._pause_min_interval_s = 1.0 / fps          # PAUSE = 暂停
-        self._pressure_time_interval_s = 2.0 / fps        # THROTTLE = 半速
-
-        self._gate_lock = threading.Lock()
-        self._next_allowed_ts: Dict[str, float] = {}
+        # 帧同步缓冲区中未凑齐的帧最长等待一个帧间隔
+        self._sync_wait_s = 1.0 / fps
 
         self._init_subscribers()
         
-        # 帧计数器（按设备绑定管理）
+        # 帧计数器（按设备绑定管理）：消息不带序列号时作为 frame_id 的后备
         self._frame_counters: Dict[str, int] = {}
         for role in self.running.keys():
             self._frame_counters[role] = 0
-            self._next_allowed_ts[role] = 0.0
 
     def _set_running_state(self, binding: DeviceRoleBindingDTO | str, value: bool) -> None:
         """线程安全地更新设备运行状态"""
@@ -182,16 +256,18 @@ class OAKDataCollector:
         self.event_bus.subscribe(EventType.BACKPRESSURE_SIGNAL, self._handle_backpressure_signal)
     
     def _handle_backpressure_signal(self, event: BackpressureEventPayload) -> None:
-        """处理背压事件"""
-        with self._bp_lock:
-            self._bp_action = event.action
+        """处理背压事件：更新限流速率比例"""
+        self._rate_governor.on_backpressure(event)
 
 
-    def _publish_data(self, data: Union[VideoFrameDTO, DeviceDetectionDataDTO]) -> None:
+    def _publish_data(
+        self,
+        data: Union[VideoFrameDTO, DeviceDetectionBatch, DeviceDetectionDataDTO],
+    ) -> None:
         """发布视频帧或检测数据的私有方法"""
         if isinstance(data, VideoFrameDTO):
             self.event_bus.publish(EventType.RAW_FRAME_DATA, data)
-        elif isinstance(data, DeviceDetectionDataDTO):
+        elif isinstance(data, (DeviceDetectionBatch, DeviceDetectionDataDTO)):
             self.event_bus.publish(EventType.RAW_DETECTION_DATA, data)
         else:
             self.logger.error("不支持的数据类型: %s", type(data))
@@ -202,19 +278,21 @@ class OAKDataCollector:
         device_binding: DeviceRoleBindingDTO,
         rgb_frame: dai.ImgFrame,
         depth_frame: Optional[dai.ImgFrame] = None,
-        frame_id: Optional[int] = None
+        frame_id: Optional[int] = None,
+        capture_ts: Optional[float] = None,
     ) -> Optional[VideoFrameDTO]:
         """
         组装原始视频帧数据 DTO。
 
-        将 DepthAI 的 ImgFrame 转换为 VideoFrameDTO。
+        将 DepthAI 的 ImgFrame 包装为延迟解码的 VideoFrameDTO。
 
         Args:
             device_binding: 设备角色绑定信息
             rgb_frame: DepthAI 的 ImgFrame 对象（RGB 帧）
             depth_frame: DepthAI 的 ImgFrame 对象（深度帧），可选
                         如果配置中 enable_depth_output=True，则此参数必须提供
-            frame_id: 采集循环级别的帧ID，用于数据对齐。如果未提供则使用计数器
+            frame_id: 帧ID（设备序列号），用于数据对齐。如果未提供则使用计数器
+            capture_ts: 设备采集时间戳（秒，与 time.monotonic() 同一时钟），可选
         
         Returns:
             VideoFrameDTO 对象，如果转换失败返回 None
@@ -247,43 +325,22 @@ class OAKDataCollector:
                 role_key = device_binding.role.value
                 frame_id = self._frame_counters.get(role_key, 0)
             
-            # 从 DepthAI ImgFrame 转换为 OpenCV 格式
-            cv_frame = rgb_frame.getCvFrame()
-            if cv_frame is None:
-                self.logger.warning("无法从 ImgFrame 获取 OpenCV 帧: device=%s", device_binding.role.value)
-                return None
-            
-            
-            # 处理深度数据（如果启用）
-            depth_frame_data = None
+            # 延迟解码：只挂载加载函数，图像在消费者首次读取时才从 ImgFrame 转换，
+            # 被 OverflowQueue 丢弃或未被渲染的帧不会解码
+            depth_loader = None
             if enable_depth_output:
                 # 此时 depth_frame 已经确保不为 None（前面已检查）
-                try:
-                    # 从 DepthAI ImgFrame 获取深度数据（numpy.ndarray，uint16，单位：毫米）
-                    depth_frame_data = depth_frame.getFrame()
-                    if depth_frame_data is None:
-                        self.logger.warning(
-                            "无法从深度 ImgFrame 获取深度数据: device=%s",
-                            device_binding.role.value
-                        )
-                        # 如果深度数据获取失败，返回 None（因为配置要求启用深度）
-                        return None
-                except Exception as e:
-                    self.logger.error(
-                        "获取深度数据失败: device=%s, error=%s",
-                        device_binding.role.value,
-                        e
-                    )
-                    # 如果深度数据获取失败，返回 None（因为配置要求启用深度）
-                    return None
-            # 如果未启用深度，depth_frame_data 保持为 None，即使传入了 depth_frame 也不会使用
+                # 深度数据为 uint16（单位：毫米），getFrame() 直接返回 ImgFrame 缓冲区的视图
+                depth_loader = depth_frame.getFrame
+            # 如果未启用深度，depth_loader 保持为 None，即使传入了 depth_frame 也不会使用
             
             # 创建 VideoFrameDTO
             video_frame = VideoFrameDTO(
                 device_id=device_id,
                 frame_id=frame_id,
-                rgb_frame=cv_frame,
-                depth_frame=depth_frame_data
+                rgb_loader=_rgb_frame_loader(rgb_frame),
+                depth_loader=depth_loader,
+                capture_ts=capture_ts,
             )
             
             return video_frame
@@ -306,6 +363,7 @@ class OAKDataCollector:
         组装原始检测数据 DTO。
 
         将 DepthAI 的 SpatialImgDetections 转换为 DeviceDetectionDataDTO。
+        逐对象的兼容路径；采集循环使用 _assemble_detection_batch。
 
         Args:
             device_binding: 设备角色绑定信息
@@ -399,6 +457,67 @@ class OAKDataCollector:
             )
             return None
 
+    def _assemble_detection_batch(
+        self,
+        device_binding: DeviceRoleBindingDTO,
+        detections_data: dai.SpatialImgDetections,
+        frame_id: Optional[int] = None,
+        capture_ts: Optional[float] = None,
+    ) -> Optional[DeviceDetectionBatch]:
+        """
+        组装列式检测数据批次。
+
+        直接从 DepthAI 的 SpatialImgDetections 一次性填充连续数组，
+        不为单个检测结果创建 DTO 对象，是采集循环使用的热路径。
+
+        Args:
+            device_binding: 设备角色绑定信息
+            detections_data: DepthAI 的 SpatialImgDetections 对象
+            frame_id: 帧ID（设备序列号），用于数据对齐。如果未提供则使用计数器
+            capture_ts: 设备采集时间戳（秒，与 time.monotonic() 同一时钟），可选
+
+        Returns:
+            DeviceDetectionBatch 对象，如果转换失败返回 None
+        """
+        if detections_data is None:
+            return None
+
+        try:
+            device_id = device_binding.active_mxid
+            if device_id is None:
+                self.logger.error("设备ID为空，无法组装检测数据: %s", device_binding.role)
+                return None
+
+            if frame_id is None:
+                frame_id = self._frame_counters.get(device_binding.role.value, 0)
+
+            device_alias = device_binding.role.value
+            detections = detections_data.detections
+            if len(detections) == 0:
+                return DeviceDetectionBatch.empty(device_id, frame_id, device_alias, capture_ts)
+
+            # 单次遍历收集原始字段，列顺序与 DeviceDetectionBatch.from_raw 约定一致
+            raw = np.array(
+                [
+                    (
+                        det.label, det.confidence,
+                        det.xmin, det.ymin, det.xmax, det.ymax,
+                        det.spatialCoordinates.x, det.spatialCoordinates.y, det.spatialCoordinates.z,
+                    )
+                    for det in detections
+                ],
+                dtype=np.float64,
+            )
+            return DeviceDetectionBatch.from_raw(device_id, frame_id, raw, device_alias, capture_ts)
+
+        except Exception as e:
+            self.logger.exception(
+                "组装列式检测数据失败: device=%s, error=%s",
+                device_binding.role.value,
+                e
+            )
+            return None
+
     def _create_pipeline_for_device(self, device_binding: DeviceRoleBindingDTO) -> dai.Pipeline:
         """
         为指定设备创建 pipeline（根据配置选择创建方式）
@@ -439,35 +558,201 @@ class OAKDataCollector:
         
         return pipeline
 
+    def _get_pipeline(self, device_binding: DeviceRoleBindingDTO) -> dai.Pipeline:
+        """
+        获取设备使用的 pipeline，同一定义只构建一次
+        
+        pipeline 定义只取决于硬件配置，所有设备共用同一个 pipeline 对象，
+        模型 blob 只从 model_path 读取一次；dai.Device 打开设备时只读取 pipeline 进行序列化。
+        
+        Raises:
+            RuntimeError: pipeline 创建失败
+        """
+        key = bool(self.config.hardware_config.enable_depth_output)
+        with self._pipeline_lock:
+            pipeline = self._pipelines.get(key)
+            if pipeline is not None:
+                return pipeline
+            try:
+                self.logger.info(f"为设备 {device_binding.role.value} 创建 pipeline...")
+                pipeline = self._create_pipeline_for_device(device_binding)
+                self.logger.info(f"设备 {device_binding.role.value} 的 pipeline 创建成功")
+            except Exception as e:
+                self.logger.error(
+                    f"为设备 {device_binding.role.value} 创建 pipeline 失败: {e}",
+                    exc_info=True
+                )
+                raise RuntimeError(f"创建 pipeline 失败: {e}") from e
+            self._pipelines[key] = pipeline
+            return pipeline
+
+    def _mark_device_ready(self, role_key: str, error: Optional[str] = None) -> None:
+        """置位设备启动就绪屏障，error 不为空表示启动失败"""
+        if error is not None:
+            self._boot_errors[role_key] = error
+        event = self._ready_events.get(role_key)
+        if event is not None:
+            event.set()
+
+    def _on_session_ready(self, device_binding: DeviceRoleBindingDTO, reconnect: bool) -> None:
+        """设备会话就绪：更新健康状态、置位就绪屏障并立即上报心跳"""
+        role_key = device_binding.role.value
+        health = self._health.setdefault(role_key, _DeviceHealth())
+        health.state = "running"
+        health.session_started = time.monotonic()
+        health.sessions += 1
+        health.consecutive_failures = 0
+        if reconnect:
+            health.reconnect_count += 1
+            self.logger.info("设备 %s 重连成功 (累计重连: %d)", role_key, health.reconnect_count)
+        else:
+            self.logger.info("设备 %s 已就绪", role_key)
+        self._mark_device_ready(role_key)
+        self._publish_heartbeat(device_binding)
+
+    def _publish_heartbeat(self, device_binding: DeviceRoleBindingDTO) -> None:
+        """发布设备心跳（CAMERA_HEARTBEAT）"""
+        role_key = device_binding.role.value
+        health = self._health.get(role_key)
+        if health is None or device_binding.active_mxid is None:
+            return
+        now = time.monotonic()
+        health.last_heartbeat = now
+        uptime = now - health.session_started if health.session_started is not None else 0.0
+        self.event_bus.publish(
+            EventType.CAMERA_HEARTBEAT,
+            CameraHeartbeatDTO(
+                device_id=device_binding.active_mxid,
+                state=health.state,
+                uptime_s=uptime,
+                reconnect_count=health.reconnect_count,
+                consecutive_failures=health.consecutive_failures,
+                device_alias=role_key,
+                last_error=health.last_error,
+            ),
+        )
+
+    def _maybe_publish_heartbeat(self, device_binding: DeviceRoleBindingDTO) -> None:
+        """距上次心跳超过 _HEARTBEAT_INTERVAL_S 时发布心跳（采集循环中调用）"""
+        health = self._health.get(device_binding.role.value)
+        if health is not None and time.monotonic() - health.last_heartbeat >= _HEARTBEAT_INTERVAL_S:
+            self._publish_heartbeat(device_binding)
+
+    def _wait_while_running(self, device_binding: DeviceRoleBindingDTO, delay: float) -> bool:
+        """等待 delay 秒，期间收到停止请求立即返回 False"""
+        deadline = time.monotonic() + delay
+        while self._is_running(device_binding):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return True
+            time.sleep(min(remaining, _QUEUE_EVENT_TIMEOUT_S))
+        return False
+
+    @staticmethod
+    def _is_mxid_visible(mxid: str) -> bool:
+        """重新发现设备：确认 MXID 出现在 USB 扫描结果中"""
+        infos = OAKDeviceDiscovery.get_cached_available_devices(max_age_s=_REDISCOVERY_MAX_AGE_S)
+        return any(info.mxid == mxid for info in infos)
 
-    def _start_OAK_with_device(self, device_binding: DeviceRoleBindingDTO) -> None:
+    def _supervise_device(self, device_binding: DeviceRoleBindingDTO) -> None:
+        """
+        设备监护线程：运行设备会话，会话异常退出时按指数退避自动重连。
+        
+        - 首次会话在就绪前失败时不重试，由 start() 记为启动失败
+        - 会话运行中失败（如 USB 断开）且 system_config.auto_reconnect 为 True 时，
+          等待 reconnect_interval × 2^(n-1) 秒（不超过 _MAX_RECONNECT_BACKOFF_S），
+          确认 MXID 重新可见后重建设备会话；连续失败超过 max_reconnect_attempts 次后放弃
+        - 每个设备独立监护，重连不影响其他设备
+        """
+        role_key = device_binding.role.value
+        health = self._health.setdefault(role_key, _DeviceHealth())
+        reconnect = False
+
+        while True:
+            if reconnect and not self._is_mxid_visible(device_binding.active_mxid):
+                error = "设备不可见"
+            else:
+                try:
+                    self._start_OAK_with_device(device_binding, reconnect=reconnect)
+                    break  # 会话正常结束：收到停止请求
+                except Exception as e:
+                    error = str(e)
+
+            health.session_started = None
+            health.last_error = error
+            if not self._is_running(device_binding):
+                break
+            if health.sessions == 0:
+                # 首次启动失败：不重试
+                health.state = "failed"
+                break
+            if not self.system_config.auto_reconnect:
+                self.logger.error("设备 %s 会话中断，未启用自动重连: %s", role_key, error)
+                health.state = "failed"
+                break
+
+            health.consecutive_failures += 1
+            if health.consecutive_failures > self.system_config.max_reconnect_attempts:
+                self.logger.error(
+                    "设备 %s 连续重连失败 %d 次，放弃重连: %s",
+                    role_key, health.consecutive_failures - 1, error,
+                )
+                health.state = "failed"
+                break
+
+            delay = min(
+                self.system_config.reconnect_interval * 2 ** (health.consecutive_failures - 1),
+                _MAX_RECONNECT_BACKOFF_S,
+            )
+            health.state = "reconnecting"
+            self._publish_heartbeat(device_binding)
+            self.logger.warning(
+                "设备 %s 会话中断 (%s)，%.1fs 后第 %d 次重连",
+                role_key, error, delay, health.consecutive_failures,
+            )
+            if not self._wait_while_running(device_binding, delay):
+                break
+            reconnect = True
+
+        if health.state != "failed":
+            health.state = "stopped"
+        else:
+            self._set_running_state(device_binding, False)
+        self._publish_heartbeat(device_binding)
+
+    def _start_OAK_with_device(
+        self,
+        device_binding: DeviceRoleBindingDTO,
+        reconnect: bool = False,
+    ) -> None:
 
         """
         通过使用device_binding中的MXid启动OAK设备，组装视频帧和数据帧并发布，开启OAK检测循环。
 
+        设备打开并创建输出队列后置位该设备的就绪屏障；启动失败时同样置位并记录原因。
+        采集循环中按 _HEARTBEAT_INTERVAL_S 间隔发布设备心跳。
+
         Args:
             device_binding: 设备角色绑定信息
+            reconnect: 是否为监护线程发起的重连（重连时不重新置位运行状态，
+                避免覆盖重连等待期间收到的停止请求）
 
         Raises:
             ValueError: 设备未绑定MXid，无法启动采集
             RuntimeError: 启动OAK设备失败，包括 pipeline 创建失败
         """
+        role_key = device_binding.role.value
         # 验证设备绑定
         if device_binding.active_mxid is None:
             self.logger.error("设备%s未绑定MXid，无法启动采集", device_binding.role)
+            self._mark_device_ready(role_key, "no_active_mxid")
             raise ValueError(f"设备{device_binding.role}未绑定MXid，无法启动采集")
 
-        # 线程内创建 pipeline（局部变量）
         try:
-            self.logger.info(f"为设备 {device_binding.role.value} 创建 pipeline...")
-            pipeline = self._create_pipeline_for_device(device_binding)
-            self.logger.info(f"设备 {device_binding.role.value} 的 pipeline 创建成功")
-        except Exception as e:
-            self.logger.error(
-                f"为设备 {device_binding.role.value} 创建 pipeline 失败: {e}",
-                exc_info=True
-            )
-            raise RuntimeError(f"创建 pipeline 失败: {e}") from e
+            pipeline = self._get_pipeline(device_binding)
+        except RuntimeError:
+            self._mark_device_ready(role_key, "pipeline_failed")
+            raise
 
         # 使用dai.Device启动OAK设备
         device_info = dai.DeviceInfo(device_binding.active_mxid)
@@ -475,106 +760,213 @@ class OAKDataCollector:
         enable_depth_output = self.config.hardware_config.enable_depth_output
         queue_max_size = self.config.hardware_config.queue_max_size
         queue_blocking = self.config.hardware_config.queue_blocking
-        self._set_running_state(device_binding, True)
+        if not reconnect:
+            self._set_running_state(device_binding, True)
         
         # 添加调试信息
         self.logger.info(f"尝试连接设备: MXID={device_binding.active_mxid}, USB2模式={usb_mode}")
         
+        collector_mode = self.config.hardware_config.collector_mode
+        
         try:
             with dai.Device(pipeline, device_info, usb2Mode=usb_mode) as device:
                 rgb_queue = device.getOutputQueue(name="rgb", maxSize=queue_max_size, blocking=queue_blocking)
                 detections_queue = device.getOutputQueue(name="detections", maxSize=queue_max_size, blocking=queue_blocking)
                 
+                queues: Dict[str, dai.DataOutputQueue] = {
+                    "rgb": rgb_queue,
+                    "detections": detections_queue,
+                }
                 # 根据配置决定是否创建深度队列
-                depth_queue = None
                 if enable_depth_output:
-                    depth_queue = device.getOutputQueue(name="depth", maxSize=queue_max_size, blocking=queue_blocking)
+                    queues["depth"] = device.getOutputQueue(name="depth", maxSize=queue_max_size, blocking=queue_blocking)
+                
+                # 按设备序列号对齐 RGB / 检测 / 深度，凑齐后输出同一帧
+                frame_sync = FrameSyncBuffer(
+                    list(queues.keys()),
+                    max_pending=queue_max_size * 2,
+                    max_wait_s=self._sync_wait_s,
+                )
+                self._on_session_ready(device_binding, reconnect)
 
                 while self._is_running(device_binding):
-                    # 背压处理：根据当前系统压力（由 BACKPRESSURE_SIGNAL 事件更新）动态调整采样行为
-                    # - NORMAL   : 正常频率采样
-                    # - THROTTLE : 降低采样频率，减轻后端处理压力
-                    # - PAUSE    : 暂停采样，只做最小休眠，不再从队列取新数据
-                    with self._bp_lock:
-                        action = self._bp_action
-                    if action == BackpressureAction.PAUSE:
-                        # 处于 PAUSE 状态时，不再继续后续处理，直接按最小间隔 sleep
-                        time.sleep(self._pause_min_interval_s)
-                        continue
-
-                    # interval_s 表示当前循环允许的采样间隔（秒）
-                    # NORMAL 下为 _pause_min_interval_s；THROTTLE 下使用更大的 _pressure_time_interval_s 以实现限流
-                    interval_s = self._pause_min_interval_s
-                    if action == BackpressureAction.THROTTLE:
-                        interval_s = self._pressure_time_interval_s
-
-                    # 时间闸门：为每个设备角色维护“下一次允许拉取/处理数据的时间戳”
-                    now_ts = time.time()
-                    role_key = device_binding.role.value
-                    # 读出当前角色的下一次允许时间戳；若尚未设置，则默认 0.0（立即允许）
-                    with self._gate_lock:
-                        next_allowed_ts = self._next_allowed_ts.get(role_key, 0.0)
-                    if now_ts < next_allowed_ts:
-                        # 若当前时间尚未到达下一允许时间，则睡眠剩余时间并跳过本轮循环，从而实现节流
-                        time.sleep(next_allowed_ts - now_ts)
-                        continue
-                    # 已到允许时间：更新该角色的下一次允许时间 = 当前时间 + interval_s
-                    # 不同角色使用独立的 key，实现“按设备角色维度”的节流控制
-                    with self._gate_lock:
-                        self._next_allowed_ts[role_key] = now_ts + interval_s
-
-                    # 使用 tryGet() 非阻塞获取数据，避免 stop() 后线程阻塞在 get() 上
-                    rgb_frame = rgb_queue.tryGet()
-                    det_frame = detections_queue.tryGet()
-                    
-                    # 获取深度数据（如果启用）
-                    depth_frame = None
-                    if enable_depth_output and depth_queue is not None:
-                        depth_frame = depth_queue.tryGet()
-                    
-                    # 如果所有队列都为空，检查运行状态并短暂休眠，避免 CPU 空转
-                    if rgb_frame is None and det_frame is None:
-                        if not self._is_running(device_binding):
-                            break  # 如果已停止，立即退出循环
-                        # 短暂休眠，避免 CPU 空转
-                        time.sleep(0.01)  # 10ms
-                        continue
-                    
-                    # 为本轮循环分配统一的frame_id，确保RGB帧和检测数据使用相同的ID进行对齐
-                    # 只在至少获取到一个数据时递增计数器
-                    current_frame_id = self._frame_counters.get(role_key, 0)
-                    self._frame_counters[role_key] = current_frame_id + 1
-                    
-                    # 组装视频帧数据（仅在获取到数据时）
-                    if rgb_frame is not None:
-                        frame_dto = self._assemble_frame_data(
-                            device_binding, rgb_frame, depth_frame,
-                            frame_id=current_frame_id
-                        )
-                        if frame_dto is not None:
-                            self._publish_data(frame_dto)
+                    self._maybe_publish_heartbeat(device_binding)
+                    if collector_mode == "event":
+                        # 阻塞等待设备输出队列事件，空闲时不占用 CPU，消息到达后立即被取走
+                        ready_names = self._wait_for_queue_events(device, list(queues.keys()))
+                        messages = self._drain_queues(queues, ready_names)
+                    else:
+                        # 轮询模式：非阻塞获取，所有队列为空时短暂休眠
+                        messages = self._drain_queues(queues, queues.keys())
+                        if not messages:
+                            time.sleep(0.01)  # 10ms
                     
-                    # 组装检测数据（仅在获取到数据时）
-                    if det_frame is not None:
-                        detection_dto = self._assemble_detection_data(
-                            device_binding, det_frame,
-                            frame_id=current_frame_id
-                        )
-                        if detection_dto is not None:
-                            self._publish_data(detection_dto)        
+                    ready = []
+                    for stream, message in messages:
+                        seq = self._sequence_num(message)
+                        if seq is None:
+                            # 无法对齐的消息单独输出，frame_id 使用本地计数器
+                            ready.append(SyncedFrame(seq=-1, messages={stream: message}, complete=False))
+                            continue
+                        ready.extend(frame_sync.push(stream, seq, message))
+                    ready.extend(frame_sync.flush_expired())
+                    self._dispatch_synced(device_binding, ready)
                 
-
+                # 会话结束时输出缓冲区中尚未凑齐的帧，避免丢弃最后几帧
+                self._dispatch_synced(device_binding, frame_sync.flush())
+                stats = frame_sync.get_stats()
+                self.logger.info(
+                    "设备 %s 帧同步统计 - 完整: %d, 不完整: %d",
+                    device_binding.role.value, stats["complete"], stats["partial"]
+                )
                 
         
         except Exception as e:
             self.logger.exception("启动OAK设备%s失败: %s", device_binding.role, e)
+            self._mark_device_ready(role_key, "boot_failed")
             raise RuntimeError(f"启动OAK设备{device_binding.role}失败: {e}")
+        finally:
+            # 正常退出时屏障已置位，此处为幂等操作
+            self._mark_device_ready(role_key)
 
 
     
     
 
 
+    def _wait_for_queue_events(
+        self,
+        device: dai.Device,
+        queue_names: List[str],
+    ) -> List[str]:
+        """
+        事件模式：阻塞等待任一输出队列收到消息。
+        
+        一次取走所有已到达的队列事件，避免每条消息各唤醒一次。
+        
+        Returns:
+            收到消息的队列名称列表（去重），等待超时返回空列表
+        """
+        events = device.getQueueEvents(
+            queue_names, _MAX_QUEUE_EVENTS, timedelta(seconds=_QUEUE_EVENT_TIMEOUT_S)
+        )
+        return list(dict.fromkeys(events))
+
+    @staticmethod
+    def _drain_queues(
+        queues: Dict[str, dai.DataOutputQueue],
+        names,
+    ) -> List[Tuple[str, object]]:
+        """非阻塞地取出指定队列中的全部消息，返回 (数据流名称, 消息) 列表"""
+        messages = []
+        for name in names:
+            for message in queues[name].tryGetAll():
+                messages.append((name, message))
+        return messages
+
+    def _dispatch_synced(
+        self,
+        device_binding: DeviceRoleBindingDTO,
+        ready: List[SyncedFrame],
+    ) -> None:
+        """按到达顺序处理对齐后的帧，丢弃仅含深度的帧和被限流的帧"""
+        for synced in ready:
+            rgb_frame = synced.get("rgb")
+            det_frame = synced.get("detections")
+            if rgb_frame is None and det_frame is None:
+                continue  # 只有深度帧，无法单独使用
+            # 背压处理：按设备令牌桶抽帧（消息已从设备队列取出，被跳过的帧直接丢弃）
+            if self._should_skip_frame(device_binding.role.value, rgb_frame, det_frame):
+                continue
+            self._handle_messages(device_binding, synced)
+
+    def _should_skip_frame(
+        self,
+        role_key: str,
+        rgb_frame: Optional[dai.ImgFrame],
+        det_frame: Optional[dai.SpatialImgDetections],
+    ) -> bool:
+        """
+        根据该设备的令牌桶判断是否跳过本帧。
+        
+        令牌按设备序列号补充，抽帧结果与主机调度抖动无关；
+        消息不带序列号时按相邻一帧补充。
+        """
+        seq = self._sequence_num(rgb_frame)
+        if seq is None:
+            seq = self._sequence_num(det_frame)
+        return not self._rate_governor.admit(role_key, seq)
+
+    @staticmethod
+    def _sequence_num(message) -> Optional[int]:
+        """读取 DepthAI 消息的设备序列号，不可用时返回 None"""
+        if message is None:
+            return None
+        try:
+            seq = message.getSequenceNum()
+        except Exception:
+            return None
+        return seq if isinstance(seq, int) else None
+
+    @staticmethod
+    def _capture_timestamp(message) -> Optional[float]:
+        """
+        读取 DepthAI 消息的采集时间戳（秒）。
+        
+        getTimestamp() 已与主机 steady_clock 同步，与 time.monotonic() 可直接相减得到
+        采集到主机处理的真实延迟。不可用时返回 None。
+        """
+        if message is None:
+            return None
+        try:
+            return message.getTimestamp().total_seconds()
+        except Exception:
+            return None
+
+    def _handle_messages(
+        self,
+        device_binding: DeviceRoleBindingDTO,
+        synced: SyncedFrame,
+    ) -> None:
+        """以设备序列号作为 frame_id，组装并发布对齐后的一帧"""
+        rgb_frame = synced.get("rgb")
+        det_frame = synced.get("detections")
+        depth_frame = synced.get("depth")
+        
+        frame_id = synced.seq
+        if frame_id < 0:
+            # 消息不带序列号：退回到本地计数器
+            role_key = device_binding.role.value
+            frame_id = self._frame_counters.get(role_key, 0)
+            self._frame_counters[role_key] = frame_id + 1
+        
+        capture_ts = self._capture_timestamp(rgb_frame if rgb_frame is not None else det_frame)
+        self._tracer.stamp(TraceStage.COLLECTOR_PICKUP, capture_ts)
+        
+        # 组装视频帧数据（仅在获取到数据时）
+        frame_dto = None
+        if rgb_frame is not None:
+            frame_dto = self._assemble_frame_data(
+                device_binding, rgb_frame, depth_frame,
+                frame_id=frame_id,
+                capture_ts=capture_ts,
+            )
+        
+        # 组装列式检测数据（仅在获取到数据时）
+        detection_dto = None
+        if det_frame is not None:
+            detection_dto = self._assemble_detection_batch(
+                device_binding, det_frame,
+                frame_id=frame_id,
+                capture_ts=capture_ts,
+            )
+        
+        self._tracer.stamp(TraceStage.BUS_PUBLISH, capture_ts)
+        if frame_dto is not None:
+            self._publish_data(frame_dto)
+        if detection_dto is not None:
+            self._publish_data(detection_dto)
+
     def _wait_for_required_mxids_visible(
         self,
         required_mxids: Set[str],
@@ -603,7 +995,8 @@ class OAKDataCollector:
             if elapsed >= timeout_sec:
                 return False
 
-            infos = OAKDeviceDiscovery.get_all_available_devices(verbose=False)
+            # 首轮可直接复用配置管理器刚完成的扫描结果，之后每轮最多扫描一次
+            infos = OAKDeviceDiscovery.get_cached_available_devices(max_age_s=poll_interval_sec)
             present_mxids = {info.mxid for info in infos}
             missing = required_mxids - present_mxids
             if not missing:
@@ -619,6 +1012,9 @@ class OAKDataCollector:
         注意：设备可用性检查已在 __init__() 中完成。
         如果所有设备都不可用，__init__() 会抛出异常。
         这里只处理部分设备不可用的情况（跳过不可用的设备）。
+        
+        pipeline 在启动线程之前构建一次，所有设备共用；各设备线程同时打开设备，
+        start() 等待每个设备的就绪屏障（最长 _DEVICE_BOOT_TIMEOUT_S 秒）后返回。
 
         Returns:
             Dict: 结构化结果，包含以下键：
@@ -626,6 +1022,10 @@ class OAKDataCollector:
                 - skipped: Dict[str, str]，跳过的角色及原因
                     - "no_active_mxid": 未绑定 MXid
                     - "device_not_available": 设备不可用
+                    - "pipeline_failed": pipeline 创建失败
+                    - "boot_failed": 打开设备失败
+                    - "boot_timeout": 等待设备就绪超时
+            没有任何设备启动成功时返回 False
         """
         required_mxids: Set[str] = set()
         for role, binding in self.config.role_bindings.items():
@@ -643,7 +1043,7 @@ class OAKDataCollector:
                 poll_interval_sec=wait_poll_interval_sec,
             )
             if not ok:
-                infos = OAKDeviceDiscovery.get_all_available_devices(verbose=False)
+                infos = OAKDeviceDiscovery.get_cached_available_devices(max_age_s=wait_poll_interval_sec)
                 present_mxids = {info.mxid for info in infos}
                 missing = required_mxids - present_mxids
                 self.logger.error(
@@ -655,16 +1055,20 @@ class OAKDataCollector:
 
         # 遍历 binding，启动对应的设备
         self._worker_threads.clear()
+        self._ready_events.clear()
+        self._boot_errors.clear()
+        for role_key in self.running:
+            self._health[role_key] = _DeviceHealth()
         result: Dict[str, Union[List[str], Dict[str, str]]] = {
             "started": [],
             "skipped": {},
         }
+        cast_skipped = result["skipped"]  # type: ignore[assignment]
+        assert isinstance(cast_skipped, dict)
         for role, binding in self.config.role_bindings.items():
             role_key = role.value
             if not binding.active_mxid:
                 # 未绑定有效的 MXid，跳过
-                cast_skipped = result["skipped"]  # type: ignore[assignment]
-                assert isinstance(cast_skipped, dict)
                 cast_skipped[role_key] = "no_active_mxid"
                 continue
             
@@ -672,8 +1076,6 @@ class OAKDataCollector:
             if self._available_devices is not None:
                 if binding.active_mxid not in self._available_mxids:
                     # 设备不可用，跳过
-                    cast_skipped = result["skipped"]  # type: ignore[assignment]
-                    assert isinstance(cast_skipped, dict)
                     cast_skipped[role_key] = "device_not_available"
                     self.logger.warning(
                         "跳过设备 %s (role=%s): 设备不可用",
@@ -682,22 +1084,37 @@ class OAKDataCollector:
                     )
                     continue
 
+            # 在主线程中构建共用的 pipeline，设备线程直接复用
+            try:
+                self._get_pipeline(binding)
+            except RuntimeError:
+                cast_skipped[role_key] = "pipeline_failed"
+                continue
+
+            self._ready_events[role_key] = threading.Event()
             t = threading.Thread(
-                target=self._start_OAK_with_device,
+                target=self._supervise_device,
                 args=(binding,),
                 name=f"OAKWorker-{binding.role.value}",
                 daemon=True,
             )
             t.start()
             self._worker_threads[role_key] = t
-            cast_started = result["started"]  # type: ignore[assignment]
-            assert isinstance(cast_started, list)
-            cast_started.append(role_key)
-            
-            # 可选：在设备线程启动之间添加短暂间隔（额外的保险措施）
-            # 理论上不需要，因为每个线程独立创建 pipeline，但这可以进一步降低并发压力
-            if len(self._worker_threads) < len(self.config.role_bindings):
-                time.sleep(0.1)  # 100ms
+        
+        # 就绪屏障：等待所有设备并行完成启动
+        deadline = time.monotonic() + _DEVICE_BOOT_TIMEOUT_S
+        cast_started = result["started"]  # type: ignore[assignment]
+        assert isinstance(cast_started, list)
+        for role_key, ready in self._ready_events.items():
+            if not ready.wait(timeout=max(0.0, deadline - time.monotonic())):
+                self.logger.error("等待设备 %s 就绪超时 (%ss)", role_key, _DEVICE_BOOT_TIMEOUT_S)
+                # 通知仍在启动的线程打开设备后立即退出
+                self._set_running_state(role_key, False)
+                cast_skipped[role_key] = "boot_timeout"
+            elif role_key in self._boot_errors:
+                cast_skipped[role_key] = self._boot_errors[role_key]
+            else:
+                cast_started.append(role_key)
         
         # 检查是否至少启动了一个设备
         if not result["started"]:
@@ -0,0 +1,149 @@
+"""
+按设备序列号对齐同一帧的多路输出
+
+OAK 设备的 RGB 透传帧、空间检测结果和深度透传帧来自同一输入帧时，
+携带相同的序列号（getSequenceNum()），但分别经由不同的 XLink 队列到达主机，
+到达顺序和时间不固定。FrameSyncBuffer 以序列号为键暂存各路消息，
+凑齐全部数据流后立即输出对齐的一帧。
+
+凑不齐的帧不会无限等待：
+- 更新的序列号已经凑齐时，更旧的未完成帧不可能再凑齐（每路队列内部有序），立即输出；
+- 等待超过 max_wait_s 或暂存帧数超过 max_pending 时，按序列号顺序输出；
+- 序列号不大于最近输出帧的迟到消息直接单独输出。
+提前输出的帧标记为不完整（complete=False），缺失的数据流为 None。
+
+非线程安全：每个设备的采集线程各自持有一个实例。
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+
+@dataclass
+class SyncedFrame:
+    """对齐后的一帧"""
+
+    seq: int  # 设备序列号
+    messages: Dict[str, Any]  # 数据流名称 -> 消息，缺失的数据流不在字典中
+    complete: bool  # 是否凑齐了全部数据流
+
+    def get(self, stream: str) -> Optional[Any]:
+        """获取指定数据流的消息，缺失时返回 None"""
+        return self.messages.get(stream)
+
+
+@dataclass
+class _PendingFrame:
+    messages: Dict[str, Any] = field(default_factory=dict)
+    first_seen: float = 0.0
+
+
+class FrameSyncBuffer:
+    """单设备的序列号重排/同步缓冲区"""
+
+    def __init__(
+        self,
+        streams: Sequence[str],
+        *,
+        max_pending: int = 8,
+        max_wait_s: float = 0.1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            streams: 需要对齐的数据流名称，例如 ("rgb", "detections", "depth")
+            max_pending: 最多暂存的未完成帧数
+            max_wait_s: 未完成帧的最长等待时间（秒）
+            clock: 时钟函数（测试时可注入）
+        """
+        if not streams:
+            raise ValueError("streams 不能为空")
+        if max_pending <= 0:
+            raise ValueError("max_pending 必须大于0")
+        self._streams = frozenset(streams)
+        self._max_pending = max_pending
+        self._max_wait_s = max_wait_s
+        self._clock = clock
+        self._pending: Dict[int, _PendingFrame] = {}
+        self._last_emitted_seq: Optional[int] = None
+        self._stats = {"complete": 0, "partial": 0}
+
+    @property
+    def pending_count(self) -> int:
+        """当前暂存的未完成帧数"""
+        return len(self._pending)
+
+    def push(self, stream: str, seq: int, message: Any) -> List[SyncedFrame]:
+        """
+        放入一条消息
+
+        Args:
+            stream: 数据流名称
+            seq: 消息的设备序列号
+            message: 消息对象
+
+        Returns:
+            因本条消息而可以输出的帧列表（按序列号升序）
+        """
+        if stream not in self._streams:
+            raise ValueError(f"未知的数据流: {stream}")
+
+        if self._last_emitted_seq is not None and seq <= self._last_emitted_seq:
+            # 迟到消息：所属帧已经输出，单独输出，不再等待
+            self._stats["partial"] += 1
+            return [SyncedFrame(seq=seq, messages={stream: message}, complete=False)]
+
+        pending = self._pending.get(seq)
+        if pending is None:
+            pending = _PendingFrame(first_seen=self._clock())
+            self._pending[seq] = pending
+        pending.messages[stream] = message
+
+        if self._streams.issubset(pending.messages):
+            # 凑齐：更旧的未完成帧已不可能凑齐，先按顺序输出
+            ready = self._pop_older_than(seq)
+            del self._pending[seq]
+            ready.append(self._emit(seq, pending, complete=True))
+            return ready
+
+        if len(self._pending) > self._max_pending:
+            return self._pop_oldest(len(self._pending) - self._max_pending)
+        return []
+
+    def flush_expired(self) -> List[SyncedFrame]:
+        """输出等待超时的未完成帧（采集线程空闲时调用）"""
+        if not self._pending:
+            return []
+        deadline = self._clock() - self._max_wait_s
+        expired = [seq for seq, p in self._pending.items() if p.first_seen <= deadline]
+        if not expired:
+            return []
+        # 超时帧之前的帧同样输出，保证输出按序列号递增
+        return self._pop_older_than(max(expired) + 1)
+
+    def flush(self) -> List[SyncedFrame]:
+        """输出全部暂存帧（采集结束时调用）"""
+        return self._pop_oldest(len(self._pending))
+
+    def get_stats(self) -> dict:
+        """获取统计信息：complete（完整帧数）/ partial（不完整帧数）/ pending"""
+        stats = dict(self._stats)
+        stats["pending"] = len(self._pending)
+        return stats
+
+    def _pop_older_than(self, seq: int) -> List[SyncedFrame]:
+        older = sorted(s for s in self._pending if s < seq)
+        return [self._emit(s, self._pending.pop(s), complete=False) for s in older]
+
+    def _pop_oldest(self, count: int) -> List[SyncedFrame]:
+        oldest = sorted(self._pending)[:count]
+        return [self._emit(s, self._pending.pop(s), complete=False) for s in oldest]
+
+    def _emit(self, seq: int, pending: _PendingFrame, *, complete: bool) -> SyncedFrame:
+        self._stats["complete" if complete else "partial"] += 1
+        if self._last_emitted_seq is None or seq > self._last_emitted_seq:
+            self._last_emitted_seq = seq
+        return SyncedFrame(seq=seq, messages=pending.messages, complete=complete)
@@ -0,0 +1,188 @@
+"""
+采集速率调节器
+
+按设备维护令牌桶，根据背压信号按比例降低各设备向下游发布的帧率，替代原先
+“NORMAL / THROTTLE / PAUSE 三档全局抽帧”的做法：
+
+- 背压动作与队列使用率映射为连续的速率比例（见 rate_fraction_for_signal），
+  PAUSE 不再让所有相机停止发布，而是降到最低速率比例
+- 系统总负载预算为 比例 × 设备数；优先级高的设备少降速甚至不降速，
+  省出的预算由其余设备分摊（见 RateGovernor.shares）
+- 令牌按设备序列号补充（每经过一个设备帧间隔补充“份额”个令牌），
+  抽帧结果与主机调度抖动无关
+
+速率比例在背压回调线程中更新，令牌桶只由各设备自己的采集线程读写。THROTTLE 期间
+背压监控器在队列使用率变化时重新发布事件（见 BackpressureConfig.throttle_usage_step），
+速率比例随当前使用率连续调整。
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, Mapping, Optional
+
+from oak_vision_system.core.backpressure import BackpressureAction, BackpressureEventPayload
+
+# 默认最低速率比例：过载时每个设备仍保留的发布比例
+DEFAULT_MIN_RATE_FRACTION = 0.1
+# THROTTLE 时的速率比例上限，避免在使用率不高但已开始丢弃时不降速
+_THROTTLE_MAX_FRACTION = 0.75
+# 视为“无压力”的队列使用率：使用率从此值升至 1.0 时，速率比例由 1.0 线性降至 0
+_TARGET_USAGE = 0.5
+# 令牌桶容量（帧）：只允许攒下一帧，避免背压解除后突发发布
+_BUCKET_CAPACITY = 1.0
+# 浮点累加误差容限
+_EPSILON = 1e-9
+
+
+def rate_fraction_for_signal(
+    payload: BackpressureEventPayload,
+    min_fraction: float = DEFAULT_MIN_RATE_FRACTION,
+) -> float:
+    """
+    将背压事件映射为连续的速率比例（0~1，1 表示满速）
+
+    - NORMAL   : 1.0
+    - THROTTLE : 按队列使用率线性降低，不超过 _THROTTLE_MAX_FRACTION
+    - PAUSE    : min_fraction
+    """
+    if payload.action == BackpressureAction.NORMAL:
+        return 1.0
+    if payload.action == BackpressureAction.PAUSE:
+        return min_fraction
+    headroom = (1.0 - payload.usage) / (1.0 - _TARGET_USAGE)
+    return max(min_fraction, min(_THROTTLE_MAX_FRACTION, headroom))
+
+
+@dataclass
+class _TokenBucket:
+    """单个设备的令牌桶（单位：帧）"""
+
+    tokens: float = _BUCKET_CAPACITY
+    last_seq: Optional[int] = None
+    admitted: int = 0
+    dropped: int = 0
+
+
+class RateGovernor:
+    """按设备令牌桶限流的采集速率调节器"""
+
+    def __init__(
+        self,
+        role_keys: Iterable[str],
+        priorities: Optional[Mapping[str, float]] = None,
+        min_fraction: float = DEFAULT_MIN_RATE_FRACTION,
+    ) -> None:
+        """
+        Args:
+            role_keys: 参与调节的设备角色键
+            priorities: 设备优先级（0~1，默认 0）。优先级 p 的设备在系统速率比例为 f 时
+                至少保留 f + (1 - f) × p 的速率，p = 1 表示始终满速（如人员安全相机）
+            min_fraction: 每个设备的最低速率比例
+        """
+        self._role_keys = list(role_keys)
+        self._priorities = {
+            key: max(0.0, min(1.0, float((priorities or {}).get(key, 0.0))))
+            for key in self._role_keys
+        }
+        self._min_fraction = min_fraction
+        self._lock = threading.Lock()
+        self._fraction = 1.0
+        self._shares: Dict[str, float] = {key: 1.0 for key in self._role_keys}
+        self._buckets: Dict[str, _TokenBucket] = {key: _TokenBucket() for key in self._role_keys}
+
+    @property
+    def fraction(self) -> float:
+        """当前系统速率比例"""
+        with self._lock:
+            return self._fraction
+
+    def shares(self) -> Dict[str, float]:
+        """各设备当前的速率份额（满速的比例）"""
+        with self._lock:
+            return dict(self._shares)
+
+    def on_backpressure(self, payload: BackpressureEventPayload) -> None:
+        """根据背压事件更新系统速率比例"""
+        self.set_fraction(rate_fraction_for_signal(payload, self._min_fraction))
+
+    def set_fraction(self, fraction: float) -> None:
+        """设置系统速率比例，并重新分配各设备份额"""
+        fraction = max(self._min_fraction, min(1.0, fraction))
+        shares = self._allocate(fraction)
+        with self._lock:
+            self._fraction = fraction
+            self._shares = shares
+
+    def admit(self, role_key: str, seq: Optional[int] = None) -> bool:
+        """
+        判断设备的本帧是否放行（只应由该设备的采集线程调用）
+
+        Args:
+            role_key: 设备角色键
+            seq: 设备序列号；为 None 时按相邻一帧补充令牌
+
+        Returns:
+            bool: True 表示发布本帧，False 表示丢弃
+        """
+        bucket = self._buckets.get(role_key)
+        if bucket is None:
+            return True
+        with self._lock:
+            share = self._shares.get(role_key, 1.0)
+
+        # 按经过的设备帧间隔补充令牌；序列号回绕或重连后重置时按一帧计
+        elapsed = 1
+        if seq is not None:
+            if bucket.last_seq is not None and seq > bucket.last_seq:
+                elapsed = seq - bucket.last_seq
+            bucket.last_seq = seq
+        bucket.tokens = min(_BUCKET_CAPACITY, bucket.tokens + share * elapsed)
+
+        if bucket.tokens + _EPSILON >= 1.0:
+            bucket.tokens -= 1.0
+            bucket.admitted += 1
+            return True
+        bucket.dropped += 1
+        return False
+
+    def get_stats(self) -> Dict[str, object]:
+        """
+        获取调节器统计信息
+
+        Returns:
+            dict: fraction（系统速率比例）、shares（各设备份额）、
+                  admitted / dropped（各设备放行 / 丢弃帧数）
+        """
+        with self._lock:
+            fraction, shares = self._fraction, dict(self._shares)
+        return {
+            "fraction": fraction,
+            "shares": shares,
+            "admitted": {key: b.admitted for key, b in self._buckets.items()},
+            "dropped": {key: b.dropped for key, b in self._buckets.items()},
+        }
+
+    def _allocate(self, fraction: float) -> Dict[str, float]:
+        """
+        在总预算 fraction × 设备数 内分配各设备份额
+
+        先按优先级给出各设备的保底份额，超出预算的部分从低优先级设备中
+        按 (1 - 优先级) × 可削减余量 的权重扣除，且不低于最低速率比例。
+        """
+        shares = {
+            key: fraction + (1.0 - fraction) * p for key, p in self._priorities.items()
+        }
+        excess = sum(shares.values()) - fraction * len(shares)
+        if excess > _EPSILON:
+            weights = {
+                key: (1.0 - self._priorities[key]) * max(0.0, share - self._min_fraction)
+                for key, share in shares.items()
+            }
+            total = sum(weights.values())
+            if total > 0:
+                cut = min(excess, total)
+                for key, weight in weights.items():
+                    shares[key] -= cut * weight / total
+        return {key: max(self._min_fraction, min(1.0, share)) for key, share in shares.items()}
@@ -0,0 +1,152 @@
+"""
+采集数据录制器
+
+订阅 RAW_FRAME_DATA 与 RAW_DETECTION_DATA，把采集器输出写入捕获文件（见 capture.py），
+供 ReplayCollector 在没有相机的机器上回放。
+
+写入在事件总线的专属线程中按发布顺序串行执行（DispatchMode.DEDICATED_THREAD），
+JPEG 编码和磁盘写入不会阻塞采集线程或共享线程池。
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Optional, Union
+
+from oak_vision_system.core.dto import DeviceDetectionBatch, DeviceDetectionDataDTO, VideoFrameDTO
+from oak_vision_system.core.event_bus import DispatchMode, EventBus, EventType, get_event_bus
+from oak_vision_system.modules.data_collector.capture import CODEC_NONE, FRAME_CODECS, CaptureWriter
+
+
+class CaptureRecorder:
+    """录制采集器输出到捕获文件"""
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        event_bus: Optional[EventBus] = None,
+        frame_codec: str = "jpeg",
+        jpeg_quality: int = 90,
+        chunk_bytes: int = 4 << 20,
+    ) -> None:
+        """
+        Args:
+            path: 输出文件路径
+            event_bus: 事件总线实例（可选，默认使用全局单例）
+            frame_codec: 视频帧编码，"jpeg" / "raw" / "none"（"none" 只录制检测数据）
+            jpeg_quality: JPEG 编码质量（1-100）
+            chunk_bytes: 单个数据块的目标大小（字节）
+        """
+        if frame_codec not in FRAME_CODECS:
+            raise ValueError(f"frame_codec必须为{'、'.join(FRAME_CODECS)}之一")
+        self._path = path
+        self._event_bus = event_bus or get_event_bus()
+        self._codec = FRAME_CODECS[frame_codec]
+        self._jpeg_quality = jpeg_quality
+        self._chunk_bytes = chunk_bytes
+
+        self._writer: Optional[CaptureWriter] = None
+        self._write_lock = threading.Lock()
+        self._running_lock = threading.Lock()
+        self._sub_ids: list[str] = []
+        self._stats = {"detections": 0, "frames": 0, "errors": 0}
+
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def is_running(self) -> bool:
+        return self._writer is not None
+
+    def start(self) -> bool:
+        """创建捕获文件并订阅采集事件（幂等）"""
+        with self._running_lock:
+            if self._writer is not None:
+                self.logger.info("CaptureRecorder 已在运行")
+                return True
+            self._writer = CaptureWriter(
+                self._path, chunk_bytes=self._chunk_bytes, jpeg_quality=self._jpeg_quality
+            )
+            self._sub_ids = [
+                self._event_bus.subscribe(
+                    EventType.RAW_DETECTION_DATA,
+                    self._handle_detection_data,
+                    subscriber_name="CaptureRecorder.detections",
+                    dispatch_mode=DispatchMode.DEDICATED_THREAD,
+                ),
+            ]
+            if self._codec != CODEC_NONE:
+                self._sub_ids.append(self._event_bus.subscribe(
+                    EventType.RAW_FRAME_DATA,
+                    self._handle_video_frame,
+                    subscriber_name="CaptureRecorder.frames",
+                    dispatch_mode=DispatchMode.DEDICATED_THREAD,
+                ))
+            self.logger.info("CaptureRecorder 已启动: %s", self._path)
+            return True
+
+    def stop(self, timeout: float = 5.0) -> bool:
+        """
+        取消订阅并关闭捕获文件（幂等）
+
+        Args:
+            timeout: 保留参数，与其他模块的 stop() 签名一致
+
+        Returns:
+            bool: 是否成功停止
+        """
+        with self._running_lock:
+            if self._writer is None:
+                return True
+            for sub_id in self._sub_ids:
+                self._event_bus.unsubscribe(sub_id)
+            self._sub_ids.clear()
+            with self._write_lock:
+                try:
+                    self._writer.close()
+                except Exception as e:
+                    self.logger.error("关闭捕获文件失败: %s", e, exc_info=True)
+                    return False
+                finally:
+                    records = self._writer.records_written
+                    self._writer = None
+            self.logger.info(
+                "CaptureRecorder 已停止 - 记录数: %d, 检测: %d, 视频帧: %d, 错误: %d",
+                records, self._stats["detections"], self._stats["frames"], self._stats["errors"],
+            )
+            return True
+
+    def get_stats(self) -> dict:
+        """获取录制统计信息"""
+        return dict(self._stats)
+
+    @staticmethod
+    def _record_ts(capture_ts: Optional[float]) -> float:
+        """
+        录制时间：优先使用设备采集时间戳，不受录制线程排队延迟影响；
+        缺失时退回到接收时刻。两者都是 time.monotonic() 时钟。
+        """
+        return capture_ts if capture_ts is not None else time.monotonic()
+
+    def _handle_detection_data(self, data: Union[DeviceDetectionBatch, DeviceDetectionDataDTO]) -> None:
+        if isinstance(data, DeviceDetectionDataDTO):
+            data = DeviceDetectionBatch.from_detection_data(data)
+        ts = self._record_ts(data.capture_ts)
+        self._write(lambda writer: writer.write_detections(data, ts), "detections")
+
+    def _handle_video_frame(self, frame: VideoFrameDTO) -> None:
+        ts = self._record_ts(frame.capture_ts)
+        self._write(lambda writer: writer.write_frame(frame, ts, self._codec), "frames")
+
+    def _write(self, write, stat_key: str) -> None:
+        with self._write_lock:
+            if self._writer is None:
+                return
+            try:
+                write(self._writer)
+                self._stats[stat_key] += 1
+            except Exception as e:
+                self._stats["errors"] += 1
+                self.logger.error("写入捕获记录失败: %s", e, exc_info=True)
@@ -0,0 +1,176 @@
+"""
+回放采集器
+
+从捕获文件（见 capture.py）读取录制的检测批次与视频帧，按录制顺序重新发布
+RAW_DETECTION_DATA / RAW_FRAME_DATA，与 OAKDataCollector 遵循相同的 start()/stop() 约定，
+可以直接替换采集器，在没有相机的机器上对 DataProcessor / DisplayManager 做可复现的吞吐测试。
+
+回放速度：
+- speed = 1.0：按录制时的时间间隔实时回放
+- speed = N  ：N 倍速
+- speed <= 0 ：不等待，尽快发布（REPLAY_AS_FAST_AS_POSSIBLE）
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Union
+
+from oak_vision_system.core.event_bus import EventBus, EventType, get_event_bus
+from oak_vision_system.modules.data_collector.capture import RECORD_DETECTION, CaptureReader
+
+# 尽快回放（不按录制时间间隔等待）
+REPLAY_AS_FAST_AS_POSSIBLE = 0.0
+
+
+class ReplayCollector:
+    """按录制节奏重新发布捕获文件中的采集数据"""
+
+    def __init__(
+        self,
+        capture_path: str,
+        event_bus: Optional[EventBus] = None,
+        *,
+        speed: float = 1.0,
+        loop: bool = False,
+    ) -> None:
+        """
+        Args:
+            capture_path: 捕获文件路径
+            event_bus: 事件总线实例（可选，默认使用全局单例）
+            speed: 回放倍速，<= 0 表示尽快回放
+            loop: 播放到结尾后是否从头循环
+        """
+        self._reader = CaptureReader(capture_path)
+        self.event_bus = event_bus or get_event_bus()
+        self._speed = speed
+        self._loop = loop
+
+        self._running = False
+        self._running_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._finished = threading.Event()
+        self._worker_thread: Optional[threading.Thread] = None
+        self._stats = {"published": 0, "loops": 0, "behind_s": 0.0}
+
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def is_running(self) -> bool:
+        with self._running_lock:
+            return self._running
+
+    @property
+    def devices(self) -> List[str]:
+        """捕获文件中的设备ID列表"""
+        return [device_id for device_id, _ in self._reader.devices]
+
+    def wait_finished(self, timeout: Optional[float] = None) -> bool:
+        """等待非循环回放播放完毕，返回是否已播放完毕"""
+        return self._finished.wait(timeout)
+
+    def start(self) -> Union[Dict[str, Union[List[str], Dict[str, str]]], bool]:
+        """
+        启动回放线程
+
+        Returns:
+            Dict: 与 OAKDataCollector.start() 结构一致：
+                - started: List[str]，回放的设备ID列表
+                - skipped: Dict[str, str]，始终为空
+            捕获文件中没有记录时返回 False
+        """
+        with self._running_lock:
+            if self._running:
+                self.logger.info("ReplayCollector 已在运行")
+                return {"started": self.devices, "skipped": {}}
+            if len(self._reader) == 0:
+                self.logger.error("捕获文件中没有记录")
+                return False
+            self._stop_event.clear()
+            self._finished.clear()
+            self._running = True
+            self._worker_thread = threading.Thread(
+                target=self._replay_loop, name="ReplayCollector", daemon=True
+            )
+            self._worker_thread.start()
+        self.logger.info(
+            "ReplayCollector 已启动 - 记录数: %d, 设备数: %d, 速度: %s",
+            len(self._reader), len(self.devices),
+            f"{self._speed}x" if self._speed > 0 else "尽快",
+        )
+        return {"started": self.devices, "skipped": {}}
+
+    def stop(self, timeout: float = 5.0) -> bool:
+        """
+        停止回放（幂等）
+
+        Args:
+            timeout: 等待回放线程停止的超时时间（秒）
+
+        Returns:
+            bool: 是否成功停止
+        """
+        with self._running_lock:
+            thread = self._worker_thread
+            if thread is None:
+                self._running = False
+                return True
+            self._stop_event.set()
+
+        thread.join(timeout=timeout)
+        if thread.is_alive():
+            self.logger.error("回放线程停止超时 (%ss)", timeout)
+            return False
+
+        with self._running_lock:
+            self._running = False
+            self._worker_thread = None
+        self.logger.info(
+            "ReplayCollector 已停止 - 已发布: %d, 循环次数: %d",
+            self._stats["published"], self._stats["loops"],
+        )
+        return True
+
+    def get_stats(self) -> dict:
+        """
+        获取回放统计信息
+
+        Returns:
+            dict: published（已发布记录数）、loops（完整播放次数）、
+                  behind_s（按节奏回放时累计落后于录制时间的秒数，反映下游处理跟不上）
+        """
+        return dict(self._stats)
+
+    def _replay_loop(self) -> None:
+        index = self._reader.index
+        ts = index["ts"]
+        kinds = index["kind"]
+        try:
+            while not self._stop_event.is_set():
+                start_wall = time.monotonic()
+                start_ts = float(ts[0])
+                for i in range(len(self._reader)):
+                    if self._stop_event.is_set():
+                        return
+                    if self._speed > 0:
+                        due = start_wall + (float(ts[i]) - start_ts) / self._speed
+                        delay = due - time.monotonic()
+                        if delay > 0:
+                            if self._stop_event.wait(delay):
+                                return
+                        else:
+                            self._stats["behind_s"] -= delay
+                    if kinds[i] == RECORD_DETECTION:
+                        self.event_bus.publish(EventType.RAW_DETECTION_DATA, self._reader.detection_batch(i))
+                    else:
+                        self.event_bus.publish(EventType.RAW_FRAME_DATA, self._reader.video_frame(i))
+                    self._stats["published"] += 1
+                self._stats["loops"] += 1
+                if not self._loop:
+                    break
+        except Exception as e:
+            self.logger.exception("回放失败: %s", e)
+        finally:
+            self._finished.set()
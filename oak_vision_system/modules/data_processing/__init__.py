@@ -9,6 +9,8 @@
 - Tracker: 目标跟踪匹配算法
 - Filter: 空间坐标滤波器
 - Transformer: 坐标变换工具
+- CrossCameraFusion: 多相机检测融合
+- ShardedPipeline: 按设备分片的多进程处理
 """
 
 # DataProcessor 相关
@@ -38,12 +40,20 @@ from .tracker import (
 from .filter_base import (
     BaseSpatialFilter,
     MovingAverageFilter,
+    KalmanFilter,
 )
 
 from .filterpool import FilterPool
+from .vectorized_filterpool import VectorizedFilterPool
 
 # FilterManager 相关
-from .filter_manager import FilterManager
+from .filter_manager import FilterManager, create_filter_factory
+
+# 多相机融合
+from .fusion import FUSED_DEVICE_ID, CrossCameraFusion, FusedFrame, FusionContribution
+
+# 多进程分片
+from .process_sharding import ShardedPipeline, assign_shards
 
 # Transform 相关
 from .transform_module import CoordinateTransfomer
@@ -76,8 +86,19 @@ __all__ = [
     # Filter
     "BaseSpatialFilter",
     "MovingAverageFilter",
+    "KalmanFilter",
     "FilterPool",
+    "VectorizedFilterPool",
     "FilterManager",
+    "create_filter_factory",
+    # Fusion
+    "CrossCameraFusion",
+    "FusedFrame",
+    "FusionContribution",
+    "FUSED_DEVICE_ID",
+    # Sharding
+    "ShardedPipeline",
+    "assign_shards",
     # Transformer
     "CoordinateTransfomer",
     # Transform Utils
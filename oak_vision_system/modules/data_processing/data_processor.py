@@ -9,12 +9,14 @@ DataProcessor 是数据处理流水线的顶层协调组件，负责协调坐标
 3. 线程管理：内置队列缓冲和线程管理功能
 4. 事件驱动：自动订阅上游数据事件，异步处理
 5. 可扩展性：通过依赖注入支持不同的坐标变换和滤波实现
+6. 多相机融合（可选）：坐标变换后合并各设备的检测，滤波和决策每个融合帧只执行一次
+7. 多进程分片（可选）：坐标变换和滤波按设备分片到工作进程，决策仍在主进程执行
 """
 
 import logging
 import threading
 import time
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 from queue import Empty
 
 import numpy as np
@@ -24,15 +26,23 @@ from oak_vision_system.core.dto.config_dto.device_binding_dto import (
     DeviceMetadataDTO,
     DeviceRoleBindingDTO,
 )
-from oak_vision_system.core.dto.config_dto.enums import DeviceRole
-from oak_vision_system.core.dto.detection_dto import DeviceDetectionDataDTO
+from oak_vision_system.core.dto.config_dto.enums import ConnectionStatus, DeviceRole
+from oak_vision_system.core.dto.detection_dto import DeviceDetectionDataDTO, DeviceDetectionBatch
 from oak_vision_system.core.dto.data_processing_dto import DeviceProcessedDataDTO, DetectionStatusLabel
-from oak_vision_system.core.event_bus import get_event_bus, EventBus
+from oak_vision_system.core.event_bus import get_event_bus, EventBus, DispatchMode
 from oak_vision_system.core.event_bus.event_types import EventType
+from oak_vision_system.core.tracing import TraceStage, get_latency_tracer
 from oak_vision_system.modules.data_processing.transform_module import CoordinateTransfomer
 from oak_vision_system.modules.data_processing.filter_manager import FilterManager
 from oak_vision_system.modules.data_processing.decision_layer import DecisionLayer
-from oak_vision_system.utils.data_structures.Queue import OverflowQueue
+from oak_vision_system.modules.data_processing.fusion import (
+    FUSED_DEVICE_ID,
+    CrossCameraFusion,
+    FusedFrame,
+    FusionContribution,
+)
+from oak_vision_system.modules.data_processing.process_sharding import ShardedPipeline
+from oak_vision_system.utils.data_structures.Queue import RingOverflowQueue
 
 
 logger = logging.getLogger(__name__)
@@ -44,7 +54,7 @@ class DataProcessor:
     集成了数据处理逻辑和线程管理功能。
     
     架构特点：
-    - 内置队列缓冲：使用 OverflowQueue 缓冲上游数据
+    - 内置队列缓冲：使用 RingOverflowQueue 缓冲上游数据
     - 事件订阅：自动订阅 RAW_DETECTION_DATA 事件
     - 线程管理：内置 start/stop 方法管理工作线程
     - 数据处理：协调坐标变换和滤波流程
@@ -117,14 +127,53 @@ class DataProcessor:
             bindings=bindings,
         )
         
-        # 初始化 FilterManager 实例
-        self._filter_manager = FilterManager(
-            device_metadata=device_metadata,
+        # 多相机融合（可选）：启用后只为融合帧这一个虚拟设备创建滤波器池
+        self._fusion: Optional[CrossCameraFusion] = None
+        filter_metadata = device_metadata
+        fusion_config = config.fusion_config
+        if fusion_config.enabled:
+            self._fusion = CrossCameraFusion(
+                device_ids=self._fusion_device_ids(device_metadata, bindings),
+                label_count=len(self._label_map),
+                time_window=fusion_config.time_window_ms / 1000.0,
+                merge_distance=fusion_config.merge_distance_mm,
+                track_box_size=fusion_config.track_box_size_mm,
+            )
+            filter_metadata = {
+                FUSED_DEVICE_ID: DeviceMetadataDTO(
+                    mxid=FUSED_DEVICE_ID,
+                    product_name="fused",
+                    connection_status=ConnectionStatus.CONNECTED,
+                )
+            }
+        
+        # 初始化 FilterManager 实例（滤波器类型、引擎与参数来自配置）
+        self._filter_manager = FilterManager.from_config(
+            config.filter_config,
+            device_metadata=filter_metadata,
             label_map=self._label_map,
         )
         
-        # 初始化队列缓冲
-        self._queue = OverflowQueue[DeviceDetectionDataDTO](maxsize=queue_size)
+        # 多进程分片（可选）：start() 时启动分片进程，处理线程只负责把数据写入共享内存
+        self._shards: Optional[ShardedPipeline] = None
+        self._device_aliases: Dict[str, Optional[str]] = {}
+        sharding_config = config.sharding_config
+        if sharding_config.enabled:
+            self._shards = ShardedPipeline(
+                config=config,
+                device_ids=list(device_metadata.keys()),
+                bindings=bindings,
+                label_map=self._label_map,
+                worker_processes=sharding_config.worker_processes,
+                max_detections=sharding_config.max_detections,
+                ring_slots=sharding_config.ring_slots,
+                on_result=self._handle_shard_result,
+            )
+        
+        # 初始化队列缓冲（事件总线的回调可能来自多个线程，使用 mpmc 模式）
+        self._queue = RingOverflowQueue[Union[DeviceDetectionBatch, DeviceDetectionDataDTO]](
+            maxsize=queue_size, mode="mpmc"
+        )
         
         # 线程控制
         self._thread: Optional[threading.Thread] = None
@@ -146,6 +195,9 @@ class DataProcessor:
         # 统计信息（保留用于 get_stats 方法）
         self._last_drop_count = 0  # 用于跟踪队列溢出情况
         
+        # 分阶段延迟追踪（未启用时打点立即返回）
+        self._tracer = get_latency_tracer()
+        
         # 自动订阅事件（在初始化时完成）
         self._subscribe_events()
         
@@ -153,13 +205,28 @@ class DataProcessor:
         self._register_to_backpressure_monitor()
         
         logger.info(
-            "DataProcessor 初始化完成: devices=%d, labels=%d, queue_size=%d, decision_layer_initialized=%s",
+            "DataProcessor 初始化完成: devices=%d, labels=%d, queue_size=%d, decision_layer_initialized=%s, "
+            "fusion=%s, shards=%d",
             len(device_metadata),
             len(self._label_map),
             queue_size,
             self.decision_layer is not None,
+            self._fusion is not None,
+            len(self._shards.shards) if self._shards is not None else 0,
         )
     
+    @staticmethod
+    def _fusion_device_ids(
+        device_metadata: Dict[str, DeviceMetadataDTO],
+        bindings: Dict[DeviceRole, DeviceRoleBindingDTO],
+    ) -> List[str]:
+        """融合帧需要等待的设备：优先使用已激活的绑定设备，否则使用全部已知设备"""
+        active = [
+            b.active_mxid for b in bindings.values()
+            if b.active_mxid is not None and b.active_mxid in device_metadata
+        ]
+        return active if active else list(device_metadata.keys())
+    
     # ========== 事件订阅管理 ==========
     
     def _subscribe_events(self) -> bool:
@@ -173,9 +240,11 @@ class DataProcessor:
             return False  # 已订阅
         
         try:
+            # 回调只做入队，直接在发布者线程执行，省去线程池切换
             self._subscription_id = self._event_bus.subscribe(
                 EventType.RAW_DETECTION_DATA,
-                self._on_detection_data_received
+                self._on_detection_data_received,
+                dispatch_mode=DispatchMode.INLINE,
             )
             logger.info("已订阅 RAW_DETECTION_DATA 事件")
             return True
@@ -246,6 +315,15 @@ class DataProcessor:
                 return False
             
             self._stop_event.clear()
+            
+            if self._shards is not None:
+                try:
+                    self._shards.start()
+                except Exception as e:
+                    logger.error(f"分片进程启动失败: {e}", exc_info=True)
+                    self._shards.stop()
+                    return False
+            
             self._is_running = True
             
             # 启动工作线程（事件订阅已在初始化时完成）
@@ -286,11 +364,15 @@ class DataProcessor:
                     logger.error(f"线程停止超时 ({timeout}s)")
                     return False
             
-            # 3. 清理状态
+            # 3. 停止分片进程（处理线程已退出，不会再写入输入环）
+            if self._shards is not None:
+                self._shards.stop(timeout=timeout)
+            
+            # 4. 清理状态
             self._is_running = False
             self._thread = None
             
-            # 4. 输出统计信息
+            # 5. 输出统计信息
             drop_count = self._queue.get_drop_count()
             logger.info(
                 "DataProcessor 已停止: dropped=%d",
@@ -320,7 +402,10 @@ class DataProcessor:
     
     # ========== 事件订阅回调 ==========
     
-    def _on_detection_data_received(self, data: DeviceDetectionDataDTO) -> None:
+    def _on_detection_data_received(
+        self,
+        data: Union[DeviceDetectionBatch, DeviceDetectionDataDTO],
+    ) -> None:
         """处理接收到的检测数据事件（回调函数）
         
         轻量级回调，只负责数据入队。
@@ -339,21 +424,28 @@ class DataProcessor:
         
         职责：
         1. 循环从队列中获取数据
-        2. 调用 process() 方法处理数据
+        2. 调用 process() 方法处理数据（启用分片时改为提交到分片进程）
         3. 处理异常和停止信号
         4. 定期监控队列压力
         """
         logger.info("DataProcessor 主循环开始")
         
+        # 启用融合时按融合时间窗口唤醒，及时闭合缺少设备的融合帧
+        get_timeout = 1.0 if self._fusion is None else min(1.0, self._fusion.time_window)
+        
         try:
             while not self._stop_event.is_set():
                 try:
-                    # 阻塞获取队列数据（超时1秒）
-                    data = self._queue.get(block=True, timeout=1.0)
+                    # 阻塞获取队列数据
+                    data = self._queue.get(block=True, timeout=get_timeout)
+                    self._tracer.stamp(TraceStage.PROCESSOR_DEQUEUE, getattr(data, "capture_ts", None))
                     
                     # 处理数据
                     try:
-                        self.process(data)
+                        if self._shards is not None:
+                            self._submit_to_shards(data)
+                        else:
+                            self.process(data)
                     except Exception as e:
                         logger.error(
                             f"数据处理失败: device_id={data.device_id}, frame_id={data.frame_id}, error={e}",
@@ -364,7 +456,9 @@ class DataProcessor:
                     self._queue.task_done()
                     
                 except Empty:
-                    # 超时，继续循环
+                    # 超时，闭合已过期的融合帧后继续循环
+                    if self._fusion is not None:
+                        self._flush_fusion()
                     continue
                 except Exception as e:
                     logger.error(f"处理数据异常: {e}", exc_info=True)
@@ -378,7 +472,7 @@ class DataProcessor:
     
     def process(
         self,
-        detection_data: DeviceDetectionDataDTO,
+        detection_data: Union[DeviceDetectionBatch, DeviceDetectionDataDTO],
     ) -> Optional[DeviceProcessedDataDTO]:
         """处理一帧检测数据（原有方法，保持不变）
         
@@ -386,27 +480,48 @@ class DataProcessor:
         也可以作为同步处理接口供外部直接调用。
         
         工作流：
-        1. 提取数据并转换为 NumPy 格式
+        1. 提取数据并转换为 NumPy 格式（列式批次直接使用其数组）
         2. 坐标变换
         3. 滤波处理
         4. 重新组装为输出 DTO
         5. 发布事件
         
         Args:
-            detection_data: 设备检测数据
+            detection_data: 设备检测数据，推荐使用列式的 DeviceDetectionBatch；
+                DeviceDetectionDataDTO 仍被接受（兼容路径）
             
         Returns:
-            Optional[DeviceProcessedDataDTO]: 处理后的数据，如果输入为空则返回 None
+            Optional[DeviceProcessedDataDTO]: 处理后的数据；启用融合时，
+                若本帧所在的融合帧尚未闭合则返回 None
         """
+        if self._fusion is not None:
+            return self._process_with_fusion(detection_data)
         
         # 提取元数据
         device_id = detection_data.device_id
         frame_id = detection_data.frame_id
         device_alias = detection_data.device_alias
-        detections = detection_data.detections
+        capture_ts = getattr(detection_data, "capture_ts", None)
         
-        # 处理空输入（创建空 DTO 并发布事件）
-        if not detections or len(detections) == 0:
+        # 1. 提取数据并转换为 NumPy 格式（包括齐次坐标）
+        if isinstance(detection_data, DeviceDetectionBatch):
+            # 列式批次：数组已由采集端填充，无需逐对象处理
+            is_empty = detection_data.detection_count == 0
+            if not is_empty:
+                coords_homogeneous = detection_data.coords_h
+                bboxes = detection_data.bbox
+                confidences = detection_data.confidence
+                labels = detection_data.labels
+        else:
+            detections = detection_data.detections
+            is_empty = not detections or len(detections) == 0
+            if not is_empty:
+                coords_homogeneous, bboxes, confidences, labels = self._extract_arrays(detections)
+        
+        # 处理空输入（创建空 DTO 并发布事件）；输出预测行时仍需推进滤波器，
+        # 让本帧全部丢失的目标以预测值输出
+        emit_predicted = self._filter_manager.emit_predicted
+        if is_empty and not emit_predicted:
             processed_data = self._create_empty_output(
                 device_id=device_id,
                 frame_id=frame_id,
@@ -419,15 +534,19 @@ class DataProcessor:
             )
             return processed_data
         
-        # 1. 提取数据并转换为 NumPy 格式（包括齐次坐标）
-        coords_homogeneous, bboxes, confidences, labels = self._extract_arrays(detections)
-        
         # 2. 坐标变换
-        try:
-            transformed_coords = self._transformer.transform_coordinates(device_id, coords_homogeneous)
-        except Exception as e:
-            logger.error(f"坐标变换失败: device_id={device_id}, frame_id={frame_id}, error={e}")
-            raise
+        if is_empty:
+            transformed_coords = np.empty((0, 3), dtype=np.float32)
+            bboxes = np.empty((0, 4), dtype=np.float32)
+            confidences = np.empty((0,), dtype=np.float32)
+            labels = np.empty((0,), dtype=np.int32)
+        else:
+            try:
+                transformed_coords = self._transformer.transform_coordinates(device_id, coords_homogeneous)
+            except Exception as e:
+                logger.error(f"坐标变换失败: device_id={device_id}, frame_id={frame_id}, error={e}")
+                raise
+        self._tracer.stamp(TraceStage.TRANSFORM, capture_ts)
         
         # 3. 滤波处理
         try:
@@ -442,6 +561,7 @@ class DataProcessor:
         except Exception as e:
             logger.error(f"滤波处理失败: device_id={device_id}, frame_id={frame_id}, error={e}")
             raise
+        self._tracer.stamp(TraceStage.FILTER, capture_ts)
         
         # 4. 决策层处理
         state_labels = []
@@ -458,6 +578,7 @@ class DataProcessor:
             )
             # 决策层失败时，使用空状态标签列表，不中断整个流程
             state_labels = []
+        self._tracer.stamp(TraceStage.DECISION, capture_ts)
         
         # 5. 重新组装为输出 DTO
         processed_data = self._assemble_output(
@@ -484,6 +605,229 @@ class DataProcessor:
         
         return processed_data
     
+    # ========== 多相机融合 ==========
+    
+    def _process_with_fusion(
+        self,
+        detection_data: Union[DeviceDetectionBatch, DeviceDetectionDataDTO],
+    ) -> Optional[DeviceProcessedDataDTO]:
+        """融合模式下处理一帧：坐标变换后提交到融合阶段，闭合的融合帧统一滤波和决策
+        
+        Returns:
+            Optional[DeviceProcessedDataDTO]: 本设备在已闭合融合帧中的输出，未闭合时返回 None
+        """
+        device_id = detection_data.device_id
+        frame_id = detection_data.frame_id
+        
+        if isinstance(detection_data, DeviceDetectionBatch):
+            if detection_data.detection_count > 0:
+                arrays = (
+                    detection_data.coords_h,
+                    detection_data.bbox,
+                    detection_data.confidence,
+                    detection_data.labels,
+                )
+            else:
+                arrays = None
+        else:
+            detections = detection_data.detections
+            arrays = self._extract_arrays(detections) if detections else None
+        
+        if arrays is None:
+            coords = np.empty((0, 3), dtype=np.float32)
+            bboxes = np.empty((0, 4), dtype=np.float32)
+            confidences = np.empty((0,), dtype=np.float32)
+            labels = np.empty((0,), dtype=np.int32)
+        else:
+            coords_homogeneous, bboxes, confidences, labels = arrays
+            try:
+                coords = self._transformer.transform_coordinates(device_id, coords_homogeneous)
+            except Exception as e:
+                logger.error(f"坐标变换失败: device_id={device_id}, frame_id={frame_id}, error={e}")
+                raise
+            self._tracer.stamp(TraceStage.TRANSFORM, getattr(detection_data, "capture_ts", None))
+        
+        contribution = FusionContribution(
+            device_id=device_id,
+            frame_id=frame_id,
+            device_alias=detection_data.device_alias,
+            coords=coords,
+            bboxes=bboxes,
+            confidences=confidences,
+            labels=labels,
+        )
+        
+        result: Optional[DeviceProcessedDataDTO] = None
+        for frame in self._fusion.submit(contribution):
+            outputs = self._process_fused_frame(frame)
+            result = outputs.get(device_id, result)
+        return result
+    
+    def _flush_fusion(self) -> None:
+        """闭合已超过时间窗口的融合帧（处理线程空闲时调用）"""
+        frame = self._fusion.flush_expired()
+        if frame is not None:
+            try:
+                self._process_fused_frame(frame)
+            except Exception as e:
+                logger.error(f"融合帧处理失败: {e}", exc_info=True)
+    
+    def _process_fused_frame(self, frame: FusedFrame) -> Dict[str, DeviceProcessedDataDTO]:
+        """对融合帧执行一次滤波和决策，再拆分回各设备输出并发布
+        
+        各设备输出保留自身的图像边界框、置信度和标签，坐标与状态标签取自对应的融合目标。
+        标签超出 label_map 的检测不输出（与非融合模式一致）。
+        
+        Returns:
+            Dict[str, DeviceProcessedDataDTO]: 设备ID到输出数据的映射
+        """
+        filtered_coords = np.empty((0, 3), dtype=np.float32)
+        state_labels: List[DetectionStatusLabel] = []
+        
+        if frame.target_count > 0:
+            # 融合目标已按标签稳定排序，滤波输出顺序与输入一致；
+            # 预测行（emit_predicted）追加在末尾，没有对应的设备检测，拆分时不输出
+            try:
+                filtered_coords, _, _, filtered_labels = self._filter_manager.process(
+                    device_id=FUSED_DEVICE_ID,
+                    coordinates=frame.coords,
+                    bboxes=frame.track_bboxes,
+                    confidences=frame.confidences,
+                    labels=frame.labels,
+                )
+            except Exception as e:
+                logger.error(f"融合帧滤波处理失败: targets={frame.target_count}, error={e}")
+                raise
+            
+            try:
+                state_labels = self.decision_layer.decide(
+                    device_id=FUSED_DEVICE_ID,
+                    filtered_coords=filtered_coords,
+                    filtered_labels=filtered_labels,
+                )
+            except Exception as e:
+                logger.error(f"决策层处理失败: fused targets={frame.target_count}, error={e}", exc_info=True)
+                state_labels = []
+        
+        outputs: Dict[str, DeviceProcessedDataDTO] = {}
+        for contribution, index in zip(frame.contributions, frame.indices):
+            keep = index >= 0
+            if not keep.any():
+                processed_data = self._create_empty_output(
+                    device_id=contribution.device_id,
+                    frame_id=contribution.frame_id,
+                    device_alias=contribution.device_alias,
+                )
+            else:
+                target = index[keep]
+                processed_data = self._assemble_output(
+                    device_id=contribution.device_id,
+                    frame_id=contribution.frame_id,
+                    device_alias=contribution.device_alias,
+                    coords=filtered_coords[target],
+                    bboxes=contribution.bboxes[keep],
+                    confidences=contribution.confidences[keep],
+                    labels=contribution.labels[keep].astype(np.int32, copy=False),
+                    state_labels=[state_labels[i] for i in target.tolist()] if state_labels else [],
+                )
+            outputs[contribution.device_id] = processed_data
+        
+        try:
+            self._event_bus.publish_many(EventType.PROCESSED_DATA, list(outputs.values()), wait_all=False)
+        except Exception as e:
+            logger.error(f"事件发布失败: {e}")
+        
+        return outputs
+    
+    # ========== 多进程分片 ==========
+    
+    def _submit_to_shards(
+        self,
+        detection_data: Union[DeviceDetectionBatch, DeviceDetectionDataDTO],
+    ) -> bool:
+        """将一帧数据写入对应分片进程的输入环（不阻塞，分片落后时丢弃该帧）
+        
+        Returns:
+            bool: 是否提交成功
+        """
+        device_id = detection_data.device_id
+        self._device_aliases[device_id] = detection_data.device_alias
+        
+        if isinstance(detection_data, DeviceDetectionBatch):
+            arrays = (
+                detection_data.coords_h,
+                detection_data.bbox,
+                detection_data.confidence,
+                detection_data.labels,
+            )
+        else:
+            detections = detection_data.detections
+            if detections:
+                arrays = self._extract_arrays(detections)
+            else:
+                arrays = (
+                    np.empty((0, 4), dtype=np.float32),
+                    np.empty((0, 4), dtype=np.float32),
+                    np.empty((0,), dtype=np.float32),
+                    np.empty((0,), dtype=np.int32),
+                )
+        
+        submitted = self._shards.submit(device_id, detection_data.frame_id, *arrays)
+        if not submitted:
+            logger.debug(f"分片输入环已满，丢弃帧: device_id={device_id}, frame_id={detection_data.frame_id}")
+        return submitted
+    
+    def _handle_shard_result(
+        self,
+        device_id: str,
+        frame_id: int,
+        coords: np.ndarray,
+        bboxes: np.ndarray,
+        confidences: np.ndarray,
+        labels: np.ndarray,
+    ) -> None:
+        """分片结果回调（在聚合线程中执行）：决策层处理、组装输出并发布"""
+        device_alias = self._device_aliases.get(device_id)
+        
+        if len(labels) == 0:
+            processed_data = self._create_empty_output(
+                device_id=device_id,
+                frame_id=frame_id,
+                device_alias=device_alias,
+            )
+        else:
+            try:
+                state_labels = self.decision_layer.decide(
+                    device_id=device_id,
+                    filtered_coords=coords,
+                    filtered_labels=labels,
+                )
+            except Exception as e:
+                logger.error(
+                    f"决策层处理失败: device_id={device_id}, frame_id={frame_id}, error={e}",
+                    exc_info=True
+                )
+                state_labels = []
+            processed_data = self._assemble_output(
+                device_id=device_id,
+                frame_id=frame_id,
+                device_alias=device_alias,
+                coords=coords,
+                bboxes=bboxes,
+                confidences=confidences,
+                labels=labels,
+                state_labels=state_labels,
+            )
+        
+        try:
+            self._event_bus.publish(
+                EventType.PROCESSED_DATA,
+                processed_data,
+                wait_all=False,
+            )
+        except Exception as e:
+            logger.error(f"事件发布失败: {e}")
+    
     def _extract_arrays(
         self,
         detections: List,
@@ -619,7 +963,7 @@ class DataProcessor:
     
     def get_stats(self) -> dict:
         """获取处理统计信息"""
-        return {
+        stats = {
             "is_running": self.is_running,
             "queue_stats": {
                 "size": self._queue.qsize(),
@@ -630,6 +974,9 @@ class DataProcessor:
                 "pressure_level": self._queue.get_pressure_level(),
             }
         }
+        if self._shards is not None:
+            stats["shard_stats"] = self._shards.get_stats()
+        return stats
     
     def reset_stats(self) -> None:
         """重置统计信息"""
@@ -80,6 +80,11 @@ class BaseSpatialFilter(ABC):
             return None
         return self._current_value
 
+    @property
+    def missed_count(self) -> int:
+        """连续丢失的帧数（大于 0 表示当前输出为丢失期间的保持/预测值）"""
+        return self._missed_count
+
     @property
     def current_bbox(self) -> Optional[np.ndarray]:
         """获取当前的边界框信息
@@ -89,6 +94,17 @@ class BaseSpatialFilter(ABC):
         """
         return self._current_bbox
 
+    @property
+    def match_bbox(self) -> Optional[np.ndarray]:
+        """获取用于下一帧匹配的边界框
+        
+        默认与 current_bbox 相同；带运动模型的滤波器可返回外推到下一帧的预测框。
+        
+        Returns:
+            用于匹配的边界框数组，如果没有则返回 None
+        """
+        return self._current_bbox
+
 
 class MovingAverageFilter(BaseSpatialFilter):
     """移动平均滤波器
@@ -179,3 +195,154 @@ class MovingAverageFilter(BaseSpatialFilter):
         self._next_recalc = self._recalc_interval
 
 
+class KalmanFilter(BaseSpatialFilter):
+    """匀速模型卡尔曼滤波器
+    
+    每个坐标轴独立建模为 [位置, 速度] 两状态匀速模型（时间单位为帧），
+    三个轴的预测/更新以 NumPy 数组一次完成。相比滑动平均没有窗口滞后，
+    检测丢失期间（未超过 max_missed_count）继续按速度外推位置和边界框，
+    匹配时使用外推到下一帧的预测框。
+    
+    过程噪声采用离散白噪声加速度模型：Q = q² · [[dt⁴/4, dt³/2], [dt³/2, dt²]]。
+    
+    Attributes:
+        _pos / _vel: 各轴位置与速度估计
+        _p00 / _p01 / _p11: 各轴 2x2 协方差矩阵的三个独立元素
+        _bbox_vel: 边界框每帧位移的指数平滑估计
+        _initialized: 是否已收到第一次观测
+    """
+    
+    __slots__ = (
+        '_dt', '_q', '_r', '_initial_velocity_var', '_bbox_alpha',
+        '_pos', '_vel', '_p00', '_p01', '_p11', '_bbox_vel', '_initialized',
+    )
+    
+    def __init__(
+        self,
+        *,
+        process_noise: float = 5.0,
+        measurement_noise: float = 20.0,
+        max_missed_count: int = 5,
+        dt: float = 1.0,
+        initial_velocity_std: float = 100.0,
+        bbox_velocity_alpha: float = 0.5,
+    ) -> None:
+        """初始化卡尔曼滤波器
+        
+        Args:
+            process_noise: 加速度标准差（mm/帧²）
+            measurement_noise: 坐标测量标准差（mm）
+            max_missed_count: 允许的最大连续丢失次数
+            dt: 相邻两帧的时间间隔（帧）
+            initial_velocity_std: 首次观测时速度的先验标准差（mm/帧）
+            bbox_velocity_alpha: 边界框速度指数平滑系数（0~1，越大越跟手）
+        """
+        super().__init__(max_missed_count=max_missed_count)
+        self._dt = float(dt)
+        self._q = float(process_noise) ** 2
+        self._r = float(measurement_noise) ** 2
+        self._initial_velocity_var = float(initial_velocity_std) ** 2
+        self._bbox_alpha = float(bbox_velocity_alpha)
+        
+        self._pos = np.zeros(3, dtype=np.float64)
+        self._vel = np.zeros(3, dtype=np.float64)
+        self._p00 = np.zeros(3, dtype=np.float64)
+        self._p01 = np.zeros(3, dtype=np.float64)
+        self._p11 = np.zeros(3, dtype=np.float64)
+        self._bbox_vel = np.zeros(4, dtype=np.float32)
+        self._initialized = False
+    
+    def input(
+        self, values: np.ndarray, iou_info: np.ndarray,
+    ) -> Optional[np.ndarray]:
+        """输入新的观测（先预测一步再更新）并返回滤波后的位置
+        
+        Args:
+            values: 输入的坐标数组 [x, y, z, ...]
+            iou_info: 边界框信息 [x_min, y_min, x_max, y_max]
+            
+        Returns:
+            滤波后的坐标值
+        """
+        self._missed_count = 0
+        self.active_state = True
+        z = np.asarray(values[:3], dtype=np.float64)
+        bbox = np.asarray(iou_info, dtype=np.float32).reshape(4)
+        
+        if not self._initialized:
+            self._pos[:] = z
+            self._vel[:] = 0.0
+            self._p00[:] = self._r
+            self._p01[:] = 0.0
+            self._p11[:] = self._initial_velocity_var
+            self._bbox_vel[:] = 0.0
+            self._initialized = True
+        else:
+            self._predict()
+            # 更新：K = P Hᵀ / (H P Hᵀ + R)，H = [1, 0]
+            s = self._p00 + self._r
+            k0 = self._p00 / s
+            k1 = self._p01 / s
+            y = z - self._pos
+            self._pos += k0 * y
+            self._vel += k1 * y
+            p01 = self._p01
+            self._p11 = self._p11 - k1 * p01
+            self._p01 = (1.0 - k0) * p01
+            self._p00 = (1.0 - k0) * self._p00
+            
+            # 边界框速度：相对上一帧框（丢失期间已外推）的位移做指数平滑
+            if self._current_bbox is not None:
+                delta = bbox - self._current_bbox
+                self._bbox_vel += self._bbox_alpha * (delta - self._bbox_vel)
+        
+        self._current_bbox = bbox
+        self._current_value[:] = self._pos
+        return self._current_value
+    
+    def miss(self) -> bool:
+        """处理丢失的检测：未超过阈值时按匀速模型外推一帧
+        
+        Returns:
+            bool: 滤波器是否仍然活跃
+        """
+        active = super().miss()
+        if active and self._initialized:
+            self._predict()
+            self._current_value[:] = self._pos
+            if self._current_bbox is not None:
+                self._current_bbox = self._current_bbox + self._bbox_vel
+        return active
+    
+    def _predict(self) -> None:
+        """时间更新：x = F x，P = F P Fᵀ + Q"""
+        dt = self._dt
+        q = self._q
+        self._pos += self._vel * dt
+        p00, p01, p11 = self._p00, self._p01, self._p11
+        self._p00 = p00 + 2.0 * dt * p01 + dt * dt * p11 + q * dt ** 4 / 4.0
+        self._p01 = p01 + dt * p11 + q * dt ** 3 / 2.0
+        self._p11 = p11 + q * dt * dt
+    
+    @property
+    def velocity(self) -> np.ndarray:
+        """当前速度估计（mm/帧）"""
+        return self._vel.astype(np.float32)
+    
+    @property
+    def match_bbox(self) -> Optional[np.ndarray]:
+        """外推到下一帧的预测边界框，用于跟踪匹配"""
+        if self._current_bbox is None:
+            return None
+        return self._current_bbox + self._bbox_vel
+    
+    def reset(self) -> None:
+        """重置滤波器到初始状态"""
+        super().reset()
+        self._pos[:] = 0.0
+        self._vel[:] = 0.0
+        self._p00[:] = 0.0
+        self._p01[:] = 0.0
+        self._p11[:] = 0.0
+        self._bbox_vel[:] = 0.0
+        self._initialized = False
@@ -8,19 +8,64 @@ FilterManager 是数据处理流水线中的核心协调组件，负责管理多
 2. 可扩展：支持多设备、多标签的灵活组合
 3. 简洁接口：最小化依赖，只接受必要的配置参数
 4. 自动管理：依赖 FilterPool 的自管理机制，无需手动重置
+5. 双引擎：默认逐槽位对象引擎（FilterPool），可选向量化引擎（VectorizedFilterPool /
+   VectorizedKalmanFilterPool），两者输出逐位一致
+6. 预测输出（可选）：本帧未检测到、仍在丢失容忍期内的目标以预测行追加在输出末尾，
+   置信度为 PREDICTED_CONFIDENCE
 """
 
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
+from oak_vision_system.core.dto.config_dto.data_processing_config_dto import (
+    FILTER_ENGINES,
+    FilterConfigDTO,
+)
+from oak_vision_system.core.dto.config_dto.enums import FilterType
 from oak_vision_system.core.dto.config_dto.device_binding_dto import DeviceMetadataDTO
 from oak_vision_system.modules.data_processing.filter_base import (
     BaseSpatialFilter,
+    KalmanFilter,
     MovingAverageFilter,
 )
 from oak_vision_system.modules.data_processing.filterpool import FilterPool
-from oak_vision_system.modules.data_processing.tracker import BaseTracker, HungarianTracker
+from oak_vision_system.modules.data_processing.tracker import BaseTracker, create_tracker
+from oak_vision_system.modules.data_processing.vectorized_filterpool import (
+    VectorizedFilterPool,
+    VectorizedKalmanFilterPool,
+)
+
+# 预测行（丢失期间的外推/保持值）的置信度，检测得到的行置信度恒大于 0
+PREDICTED_CONFIDENCE = 0.0
+
+# 向量化引擎实现的滤波器类型，其他类型由 FilterManager.from_config 回退到对象引擎
+VECTORIZED_FILTER_TYPES = frozenset({FilterType.MOVING_AVERAGE, FilterType.KALMAN})
+
+_EMPTY_COORDS = np.empty((0, 3), dtype=np.float32)
+_EMPTY_BBOXES = np.empty((0, 4), dtype=np.float32)
+_EMPTY_CONFIDENCES = np.empty((0,), dtype=np.float32)
+_EMPTY_LABELS = np.empty((0,), dtype=np.int32)
+
+
+def create_filter_factory(filter_config: FilterConfigDTO) -> Callable[[], BaseSpatialFilter]:
+    """
+    根据滤波配置创建滤波器工厂函数
+    
+    Args:
+        filter_config: 滤波配置
+    
+    Returns:
+        无参工厂函数，每次调用返回一个新的滤波器实例
+    """
+    if filter_config.filter_type == FilterType.KALMAN:
+        kalman = filter_config.kalman_config
+        return lambda: KalmanFilter(
+            process_noise=kalman.process_noise,
+            measurement_noise=kalman.measurement_noise,
+        )
+    window_size = filter_config.moving_average_config.window_size
+    return lambda: MovingAverageFilter(queue_maxsize=window_size)
 
 
 class FilterManager:
@@ -75,6 +120,10 @@ class FilterManager:
         filter_factory: Optional[Callable[[], BaseSpatialFilter]] = None,
         tracker: Optional[BaseTracker] = None,
         iou_threshold: float = 0.5,
+        tracker_method: str = "hungarian",
+        gated: bool = False,
+        engine: str = "object",
+        emit_predicted: bool = False,
     ) -> None:
         """初始化 FilterManager
         
@@ -83,14 +132,22 @@ class FilterManager:
             label_map: 标签映射列表，定义所有检测类别
             pool_size: 每个 FilterPool 的大小（默认 32）
             filter_factory: 滤波器工厂函数（默认 MovingAverageFilter）
-            tracker: 跟踪器实例（默认 HungarianTracker）
+            tracker: 跟踪器实例（默认按 tracker_method / iou_threshold / gated 创建）
             iou_threshold: IoU 匹配阈值（默认 0.5）
+            tracker_method: 未指定 tracker 时的关联算法，"greedy" 或 "hungarian"（默认）
+            gated: 未指定 tracker 时是否启用门控稀疏关联
+            engine: 滤波引擎，"object"（逐槽位滤波器对象）或 "vectorized"
+                （结构数组实现，支持 MovingAverageFilter 与 KalmanFilter）
+            emit_predicted: 是否输出丢失期间的目标（预测行，见 process）；启用后本帧没有检测的
+                标签池也会执行一次空输入，使其中的目标外推一帧并累计丢失次数
         
         Raises:
             ValueError: 当配置参数无效时
         """
         # 验证配置参数
         self._validate_config(device_metadata, label_map, pool_size)
+        if engine not in FILTER_ENGINES:
+            raise ValueError(f"engine 必须为: {'/'.join(FILTER_ENGINES)}")
         
         # 存储配置参数
         self._device_ids: List[str] = list(device_metadata.keys())
@@ -100,14 +157,51 @@ class FilterManager:
             filter_factory if filter_factory is not None else lambda: MovingAverageFilter()
         )
         self._tracker: BaseTracker = (
-            tracker if tracker is not None else HungarianTracker(iou_threshold=iou_threshold)
+            tracker if tracker is not None
+            else create_tracker(tracker_method, iou_threshold=iou_threshold, gated=gated)
         )
         self._iou_threshold: float = iou_threshold
+        self._engine: str = engine
+        self._emit_predicted: bool = emit_predicted
         
         # 预先创建所有 (device_id, label) 组合的 FilterPool 实例
-        self._pools: Dict[Tuple[str, int], FilterPool] = {}
+        self._pools: Dict[Tuple[str, int], Union[FilterPool, VectorizedFilterPool]] = {}
         self._create_all_pools()
     
+    @classmethod
+    def from_config(
+        cls,
+        filter_config: FilterConfigDTO,
+        *,
+        device_metadata: Dict[str, DeviceMetadataDTO],
+        label_map: List[str],
+        pool_size: int = 32,
+    ) -> "FilterManager":
+        """根据滤波配置创建 FilterManager
+        
+        滤波器类型与参数、引擎、关联算法、预测输出均取自配置；配置为向量化引擎但滤波器类型
+        不在 VECTORIZED_FILTER_TYPES 中时回退到对象引擎。
+        
+        Args:
+            filter_config: 滤波配置
+            device_metadata: 设备元数据字典，映射 MXid 到 DeviceMetadataDTO
+            label_map: 标签映射列表
+            pool_size: 每个滤波器池的大小
+        """
+        engine = filter_config.engine
+        if engine == "vectorized" and filter_config.filter_type not in VECTORIZED_FILTER_TYPES:
+            engine = "object"
+        return cls(
+            device_metadata=device_metadata,
+            label_map=label_map,
+            pool_size=pool_size,
+            filter_factory=create_filter_factory(filter_config),
+            tracker_method=filter_config.tracker_method,
+            gated=filter_config.tracker_gated,
+            engine=engine,
+            emit_predicted=filter_config.emit_predicted,
+        )
+    
     def _validate_config(
         self,
         device_metadata: Dict[str, DeviceMetadataDTO],
@@ -147,6 +241,9 @@ class FilterManager:
         为每个设备和标签组合创建一个独立的 FilterPool，
         避免运行时动态创建的开销。
         """
+        if self._engine == "vectorized":
+            self._create_vectorized_pools()
+            return
         for device_id in self._device_ids:
             for label_idx in range(len(self._label_map)):
                 key = (device_id, label_idx)
@@ -157,6 +254,51 @@ class FilterManager:
                     iou_threshold=self._iou_threshold,
                 )
     
+    def _create_vectorized_pools(self) -> None:
+        """创建向量化引擎的滤波器池
+
+        滤波器参数取自 filter_factory 生成的样例滤波器，保证与对象引擎一致。
+
+        Raises:
+            ValueError: 当 filter_factory 生成的不是 MovingAverageFilter 或 KalmanFilter 时
+        """
+        sample = self._filter_factory()
+        if type(sample) is MovingAverageFilter:
+            def create_pool() -> VectorizedFilterPool:
+                return VectorizedFilterPool(
+                    pool_size=self._pool_size,
+                    queue_maxsize=sample._queue_maxsize,
+                    max_missed_count=sample._max_missed_count,
+                    tracker=self._tracker,
+                    iou_threshold=self._iou_threshold,
+                )
+        elif type(sample) is KalmanFilter:
+            def create_pool() -> VectorizedKalmanFilterPool:
+                return VectorizedKalmanFilterPool.from_filter(
+                    sample,
+                    pool_size=self._pool_size,
+                    tracker=self._tracker,
+                    iou_threshold=self._iou_threshold,
+                )
+        else:
+            raise ValueError(
+                "vectorized 引擎仅支持 MovingAverageFilter / KalmanFilter，"
+                f"当前为 {type(sample).__name__}"
+            )
+        for device_id in self._device_ids:
+            for label_idx in range(len(self._label_map)):
+                self._pools[(device_id, label_idx)] = create_pool()
+
+    @property
+    def engine(self) -> str:
+        """当前使用的滤波引擎"""
+        return self._engine
+
+    @property
+    def emit_predicted(self) -> bool:
+        """是否输出丢失期间的预测行"""
+        return self._emit_predicted
+
     def process(
         self,
         device_id: str,
@@ -184,17 +326,32 @@ class FilterManager:
         注意：
             - 不进行任何输入验证，假设调用方保证数据正确性
             - 使用 NumPy 向量化操作进行高效处理
+            - 启用 emit_predicted 时，本帧检测的滤波结果之后追加丢失期间目标的预测行
+              （按标签升序、池内按槽位顺序），预测行的边界框为外推/保持的边界框，
+              置信度为 PREDICTED_CONFIDENCE
         """
         # 处理空输入
         n = len(coordinates)
         if n == 0:
-            return (
-                np.empty((0, 3), dtype=np.float32),
-                np.empty((0, 4), dtype=np.float32),
-                np.empty((0,), dtype=np.float32),
-                np.empty((0,), dtype=np.int32),
-            )
+            result = (_EMPTY_COORDS, _EMPTY_BBOXES, _EMPTY_CONFIDENCES, _EMPTY_LABELS)
+        elif self._engine == "vectorized":
+            result = self._process_sorted(device_id, coordinates, bboxes, confidences, labels)
+        else:
+            result = self._process_grouped(device_id, coordinates, bboxes, confidences, labels)
         
+        if self._emit_predicted:
+            result = self._append_predicted(device_id, labels, result)
+        return result
+    
+    def _process_grouped(
+        self,
+        device_id: str,
+        coordinates: np.ndarray,
+        bboxes: np.ndarray,
+        confidences: np.ndarray,
+        labels: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """对象引擎的分组处理：按标签布尔掩码分组，逐组调用 FilterPool.step_v2"""
         # 提取唯一标签
         unique_labels = np.unique(labels)
         
@@ -254,6 +411,86 @@ class FilterManager:
         
         return result_coords, result_bboxes, result_confidences, result_labels
     
+    def _process_sorted(
+        self,
+        device_id: str,
+        coordinates: np.ndarray,
+        bboxes: np.ndarray,
+        confidences: np.ndarray,
+        labels: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """向量化引擎的分组处理
+
+        用一次稳定排序代替逐标签布尔掩码：排序后同一标签的数据连续，
+        输出顺序（标签升序、组内保持原顺序）与对象引擎的块状拼接结果一致。
+        """
+        order = np.argsort(labels, kind="stable")
+        sorted_labels = labels[order]
+        # 每个标签分组的起止位置
+        boundaries = (sorted_labels[1:] != sorted_labels[:-1]).nonzero()[0] + 1
+        starts = [0] + boundaries.tolist()
+        ends = boundaries.tolist() + [len(order)]
+
+        keep = np.ones(len(order), dtype=bool)
+        result_coords = np.empty((len(order), 3), dtype=np.float32)
+        for start, end in zip(starts, ends):
+            label = int(sorted_labels[start])
+            pool = self._pools.get((device_id, label))
+            if pool is None:
+                # 标签超出 label_map 范围，跳过（与对象引擎一致）
+                keep[start:end] = False
+                continue
+            idx = order[start:end]
+            result_coords[start:end] = pool.step_v2(
+                coordinates=coordinates[idx],
+                bboxes=bboxes[idx],
+                confidences=confidences[idx],
+            )
+
+        if not keep.all():
+            order = order[keep]
+            result_coords = result_coords[keep]
+        return (
+            result_coords,
+            bboxes[order].astype(np.float32, copy=False),
+            confidences[order].astype(np.float32, copy=False),
+            labels[order].astype(np.int32, copy=False),
+        )
+
+    def _append_predicted(
+        self,
+        device_id: str,
+        labels: np.ndarray,
+        result: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """推进本帧没有检测的标签池，并在输出末尾追加所有丢失期间目标的预测行"""
+        present = set(np.unique(labels).tolist())
+        coords_list: List[np.ndarray] = [result[0]]
+        bboxes_list: List[np.ndarray] = [result[1]]
+        labels_list: List[np.ndarray] = [result[3]]
+        for label_idx in range(len(self._label_map)):
+            pool = self._pools.get((device_id, label_idx))
+            if pool is None or pool.active_count == 0:
+                continue
+            if label_idx not in present:
+                # 空输入：活跃目标全部记为丢失（外推一帧或失效）
+                pool.step_v2(_EMPTY_COORDS, _EMPTY_BBOXES, _EMPTY_CONFIDENCES)
+            coords, boxes = pool.coasting_tracks()
+            if len(coords) > 0:
+                coords_list.append(coords)
+                bboxes_list.append(boxes)
+                labels_list.append(np.full(len(coords), label_idx, dtype=np.int32))
+        
+        k = sum(len(c) for c in coords_list[1:])
+        if k == 0:
+            return result
+        return (
+            np.concatenate(coords_list).astype(np.float32, copy=False),
+            np.concatenate(bboxes_list).astype(np.float32, copy=False),
+            np.concatenate((result[2], np.full(k, PREDICTED_CONFIDENCE, dtype=np.float32))),
+            np.concatenate(labels_list).astype(np.int32, copy=False),
+        )
+
     def get_pool_stats(self) -> Dict[Tuple[str, int], Dict[str, int]]:
         """获取所有滤波器池的统计信息
         
@@ -26,6 +26,7 @@ class FilterPool:
         filter_factory: Optional[Callable[[], BaseSpatialFilter]] = None,
         tracker: Optional[BaseTracker] = None,
         iou_threshold: float = 0.5,
+        gated: bool = False,
     ) -> None:
         """
         初始化滤波器池
@@ -35,6 +36,7 @@ class FilterPool:
             filter_factory: 滤波器工厂函数，用于创建滤波器实例
             tracker: 匹配算法实例
             iou_threshold: IoU匹配阈值
+            gated: 未指定 tracker 时，默认 HungarianTracker 是否启用门控稀疏关联
         """
         if pool_size <= 0:
             raise ValueError("pool_size must be > 0")
@@ -44,7 +46,7 @@ class FilterPool:
 
         self._filters: list[BaseSpatialFilter] = [filter_factory() for _ in range(pool_size)]  # 预分配所有滤波器槽位
         self._active_mask: np.ndarray = np.zeros(pool_size, dtype=bool)  # 活跃状态掩码，True表示该槽位正在跟踪目标
-        self._tracker: BaseTracker = tracker if tracker is not None else HungarianTracker(iou_threshold=iou_threshold)  # 匹配算法
+        self._tracker: BaseTracker = tracker if tracker is not None else HungarianTracker(iou_threshold=iou_threshold, gated=gated)  # 匹配算法
 
     @property
     def active_mask(self) -> np.ndarray:
@@ -235,7 +237,7 @@ class FilterPool:
                 self._active_mask[slot_idx] = self._filters[slot_idx].miss()
             # 清理失效的滤波器
             self._cleanup_inactive()
-            return []
+            return np.zeros((0, 3), dtype=np.float32)
 
         # 预分配输出数组
         outputs: np.ndarray =  np.zeros((n,3), dtype=np.float32)
@@ -287,6 +289,28 @@ class FilterPool:
         return outputs
 
 
+    def coasting_tracks(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        获取本帧未匹配到检测、仍在丢失容忍期内的目标
+
+        丢失期间滤波器继续输出：卡尔曼滤波器为按匀速模型外推的预测位置和边界框，
+        滑动平均滤波器为最后一次的平滑值。尚未记录边界框的槽位不输出。
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]，坐标矩阵 (k, 3) 与边界框矩阵 (k, 4)，按槽位顺序
+        """
+        coords: list[np.ndarray] = []
+        boxes: list[np.ndarray] = []
+        for idx in np.flatnonzero(self._active_mask):
+            fi = self._filters[int(idx)]
+            if fi.missed_count == 0 or fi.current_bbox is None:
+                continue
+            coords.append(fi.current_value)
+            boxes.append(np.asarray(fi.current_bbox, dtype=np.float32).reshape(4,))
+        if not coords:
+            return np.empty((0, 3), dtype=np.float32), np.empty((0, 4), dtype=np.float32)
+        return np.stack(coords).astype(np.float32, copy=False), np.stack(boxes)
+
     def _cleanup_inactive(self) -> None:
         """
         清理失效的滤波器
@@ -319,7 +343,7 @@ class FilterPool:
         boxes: list[np.ndarray] = []
         for idx in active_indices:
             fi = self._filters[int(idx)]
-            cb = fi.current_bbox
+            cb = fi.match_bbox  # 带运动模型的滤波器返回外推到当前帧的预测框
             if cb is None:
                 self._active_mask[int(idx)] = False
                 continue
@@ -0,0 +1,289 @@
+"""
+多相机融合模块
+
+坐标变换之后，各设备的检测结果都已位于同一世界坐标系。CrossCameraFusion 在一个
+时间窗口内收集各设备的检测，把不同设备对同一目标的重复检测合并为一个融合目标，
+输出单个融合帧，使滤波和决策每个融合帧只执行一次。
+
+融合帧的闭合条件（先满足者生效）：
+- 所有设备都已提交本帧
+- 某个设备在本帧已提交后再次提交（说明其他设备落后）
+- 本帧第一次提交后超过 time_window（由 flush_expired 检查）
+
+空间关联：
+- 只合并标签相同、来自不同设备、距离小于 merge_distance 的检测
+- 候选对按距离从小到大贪心合并，一个融合目标中每个设备最多贡献一个检测
+- 融合坐标为按置信度加权的均值，融合置信度取最大值
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+# 融合帧在滤波器和决策层中使用的虚拟设备ID
+FUSED_DEVICE_ID = "fused"
+
+
+@dataclass
+class FusionContribution:
+    """
+    单个设备提交给融合阶段的一帧数据（世界坐标系）
+
+    Attributes:
+        device_id: 设备ID
+        frame_id: 帧ID
+        device_alias: 设备别名
+        coords: 世界坐标，形状 (n, 3)，单位：毫米（mm）
+        bboxes: 图像边界框，形状 (n, 4)
+        confidences: 置信度，形状 (n,)
+        labels: 标签，形状 (n,)
+    """
+    device_id: str
+    frame_id: int
+    device_alias: Optional[str]
+    coords: np.ndarray
+    bboxes: np.ndarray
+    confidences: np.ndarray
+    labels: np.ndarray
+
+
+@dataclass
+class FusedFrame:
+    """
+    融合帧
+
+    Attributes:
+        coords: 融合目标世界坐标，形状 (K, 3)，按标签稳定排序
+        track_bboxes: 世界坐标系 XY 平面上以目标为中心的方形框，形状 (K, 4)，用于跟踪匹配
+        confidences: 融合置信度，形状 (K,)
+        labels: 融合标签，形状 (K,)
+        contributions: 参与本帧的设备数据
+        indices: 与 contributions 一一对应，每个设备检测对应的融合目标下标，
+            标签超出 label_map 的检测为 -1
+    """
+    coords: np.ndarray
+    track_bboxes: np.ndarray
+    confidences: np.ndarray
+    labels: np.ndarray
+    contributions: List[FusionContribution]
+    indices: List[np.ndarray]
+
+    @property
+    def target_count(self) -> int:
+        """融合目标数量"""
+        return len(self.labels)
+
+
+class CrossCameraFusion:
+    """
+    跨相机检测融合
+
+    非线程安全，由 DataProcessor 的处理线程独占使用。
+    """
+
+    def __init__(
+        self,
+        *,
+        device_ids: Sequence[str],
+        label_count: int,
+        time_window: float = 0.05,
+        merge_distance: float = 200.0,
+        track_box_size: float = 400.0,
+    ) -> None:
+        """
+        Args:
+            device_ids: 参与融合的设备ID
+            label_count: 标签数量，超出范围的标签不参与融合
+            time_window: 融合帧时间窗口（秒）
+            merge_distance: 跨设备合并距离阈值（mm）
+            track_box_size: 跟踪用方形框边长（mm）
+        """
+        if not device_ids:
+            raise ValueError("device_ids 不能为空")
+        if time_window <= 0:
+            raise ValueError("time_window 必须大于 0")
+
+        self._device_ids = frozenset(device_ids)
+        self._label_count = label_count
+        self._time_window = time_window
+        self._merge_distance = merge_distance
+        self._half_box = track_box_size / 2.0
+
+        self._pending: Dict[str, FusionContribution] = {}
+        self._pending_since: Optional[float] = None
+
+    @property
+    def time_window(self) -> float:
+        """融合帧时间窗口（秒）"""
+        return self._time_window
+
+    @property
+    def pending_count(self) -> int:
+        """当前未闭合融合帧中已提交的设备数量"""
+        return len(self._pending)
+
+    def submit(self, contribution: FusionContribution, now: Optional[float] = None) -> List[FusedFrame]:
+        """
+        提交一个设备的一帧数据
+
+        Args:
+            contribution: 设备数据
+            now: 当前时间（time.monotonic()），默认自动获取
+
+        Returns:
+            本次提交闭合的融合帧列表（0~2 个，按时间顺序）
+        """
+        now = time.monotonic() if now is None else now
+        ready: List[FusedFrame] = []
+
+        # 窗口过期，或者该设备已在本帧提交过：先闭合当前帧
+        if self._pending and (
+            contribution.device_id in self._pending or now - self._pending_since > self._time_window
+        ):
+            ready.append(self._close())
+
+        if not self._pending:
+            self._pending_since = now
+        self._pending[contribution.device_id] = contribution
+
+        if self._device_ids.issubset(self._pending):
+            ready.append(self._close())
+        return ready
+
+    def flush_expired(self, now: Optional[float] = None) -> Optional[FusedFrame]:
+        """若当前帧已超过时间窗口则闭合并返回，否则返回 None"""
+        now = time.monotonic() if now is None else now
+        if self._pending and now - self._pending_since > self._time_window:
+            return self._close()
+        return None
+
+    def flush(self) -> Optional[FusedFrame]:
+        """立即闭合当前帧（无数据时返回 None）"""
+        return self._close() if self._pending else None
+
+    # ------ 内部实现 ------
+
+    def _close(self) -> FusedFrame:
+        contributions = list(self._pending.values())
+        self._pending = {}
+        self._pending_since = None
+        return self._fuse(contributions)
+
+    def _fuse(self, contributions: List[FusionContribution]) -> FusedFrame:
+        counts = [len(c.labels) for c in contributions]
+        n = sum(counts)
+        if n == 0:
+            return self._build_frame(contributions, counts, np.empty(0, dtype=np.int64),
+                                     np.empty((0, 3), np.float32), np.empty(0, np.float32),
+                                     np.empty(0, np.int32))
+
+        coords = np.concatenate([c.coords for c in contributions]).astype(np.float32, copy=False)
+        confidences = np.concatenate([c.confidences for c in contributions]).astype(np.float32, copy=False)
+        labels = np.concatenate([c.labels for c in contributions]).astype(np.int32, copy=False)
+        devices = np.repeat(np.arange(len(contributions)), counts)
+
+        valid = (labels >= 0) & (labels < self._label_count)
+        cluster = self._associate(coords, labels, devices, valid)
+
+        # 按 (标签, 首个成员位置) 排序融合目标，使滤波输出顺序与输入一致
+        valid_idx = np.flatnonzero(valid)
+        roots, first_pos, inverse = np.unique(cluster[valid_idx], return_index=True, return_inverse=True)
+        root_labels = labels[valid_idx[first_pos]]
+        order = np.lexsort((first_pos, root_labels))
+        rank = np.empty(len(order), dtype=np.int64)
+        rank[order] = np.arange(len(order))
+
+        target = np.full(n, -1, dtype=np.int64)
+        target[valid_idx] = rank[inverse]
+        k = len(roots)
+
+        # 置信度加权平均坐标，置信度取最大值
+        t = target[valid_idx]
+        w = np.maximum(confidences[valid_idx].astype(np.float64), 1e-6)
+        weight_sum = np.bincount(t, weights=w, minlength=k)
+        fused_coords = np.empty((k, 3), dtype=np.float32)
+        for axis in range(3):
+            fused_coords[:, axis] = np.bincount(t, weights=w * coords[valid_idx, axis], minlength=k) / weight_sum
+        fused_conf = np.zeros(k, dtype=np.float32)
+        np.maximum.at(fused_conf, t, confidences[valid_idx])
+        fused_labels = root_labels[order].astype(np.int32)
+
+        return self._build_frame(contributions, counts, target, fused_coords, fused_conf, fused_labels)
+
+    def _associate(
+        self,
+        coords: np.ndarray,
+        labels: np.ndarray,
+        devices: np.ndarray,
+        valid: np.ndarray,
+    ) -> np.ndarray:
+        """
+        跨设备空间关联，返回每个检测所属簇的代表元下标
+
+        候选对：标签相同、设备不同、距离 < merge_distance。
+        按距离升序贪心合并，两个簇包含相同设备时不合并。
+        """
+        n = len(labels)
+        parent = np.arange(n)
+        if len(set(devices.tolist())) < 2 or self._merge_distance <= 0:
+            return parent
+
+        diff = coords[:, None, :] - coords[None, :, :]
+        dist = np.sqrt(np.einsum("ijk,ijk->ij", diff, diff))
+        candidate = (
+            (labels[:, None] == labels[None, :])
+            & (devices[:, None] < devices[None, :])
+            & (dist < self._merge_distance)
+            & valid[:, None] & valid[None, :]
+        )
+        rows, cols = np.nonzero(candidate)
+        if len(rows) == 0:
+            return parent
+
+        order = np.argsort(dist[rows, cols], kind="stable")
+        device_bits = [{int(d)} for d in devices]
+        root = list(range(n))
+
+        def find(i: int) -> int:
+            while root[i] != i:
+                root[i] = root[root[i]]
+                i = root[i]
+            return i
+
+        for i, j in zip(rows[order].tolist(), cols[order].tolist()):
+            ri, rj = find(i), find(j)
+            if ri == rj or device_bits[ri] & device_bits[rj]:
+                continue
+            # 以较小下标为代表元，保证结果与遍历顺序无关
+            if rj < ri:
+                ri, rj = rj, ri
+            root[rj] = ri
+            device_bits[ri] |= device_bits[rj]
+
+        return np.array([find(i) for i in range(n)], dtype=np.int64)
+
+    def _build_frame(
+        self,
+        contributions: List[FusionContribution],
+        counts: List[int],
+        target: np.ndarray,
+        coords: np.ndarray,
+        confidences: np.ndarray,
+        labels: np.ndarray,
+    ) -> FusedFrame:
+        h = self._half_box
+        xy = coords[:, :2]
+        track_bboxes = np.hstack([xy - h, xy + h]).astype(np.float32)
+        bounds = np.cumsum(counts)[:-1]
+        return FusedFrame(
+            coords=coords,
+            track_bboxes=track_bboxes,
+            confidences=confidences,
+            labels=labels,
+            contributions=contributions,
+            indices=np.split(target, bounds),
+        )
@@ -0,0 +1,343 @@
+"""
+多进程分片数据处理
+
+按设备把 坐标变换 -> 滤波 放到独立的工作进程中执行，绕开单个处理线程的 GIL 限制。
+输入和输出都通过共享内存列式环形缓冲区（SharedColumnRing）传递，不 pickle DTO。
+
+数据流：
+    DataProcessor 处理线程 --(输入环, 每分片一个)--> 分片进程：坐标变换 + 滤波
+    分片进程 --(输出环, 每分片一个)--> 聚合线程（主进程）：决策层 + 组装 DTO + 发布事件
+
+决策层保留在主进程的单个聚合线程中执行：它持有全局待抓取目标和人员警告状态机，
+并通过主进程的事件总线发布 PERSON_WARNING，必须只有一个所有者。
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing as mp
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from oak_vision_system.core.dto.config_dto import DataProcessingConfigDTO
+from oak_vision_system.core.dto.config_dto.device_binding_dto import (
+    DeviceMetadataDTO,
+    DeviceRoleBindingDTO,
+)
+from oak_vision_system.core.dto.config_dto.enums import DeviceRole
+from oak_vision_system.utils.data_structures.shared_ring import ColumnSpec, SharedColumnRing
+
+logger = logging.getLogger(__name__)
+
+INPUT_COLUMNS: ColumnSpec = {
+    "coords_h": (np.float32, (4,)),
+    "bbox": (np.float32, (4,)),
+    "confidence": (np.float32, ()),
+    "labels": (np.int32, ()),
+}
+
+OUTPUT_COLUMNS: ColumnSpec = {
+    "coords": (np.float32, (3,)),
+    "bbox": (np.float32, (4,)),
+    "confidence": (np.float32, ()),
+    "labels": (np.int32, ()),
+}
+
+# 分片结果回调：(device_id, frame_id, coords, bboxes, confidences, labels)
+ShardResultCallback = Callable[[str, int, np.ndarray, np.ndarray, np.ndarray, np.ndarray], None]
+
+
+def assign_shards(device_ids: Sequence[str], worker_processes: int) -> List[List[str]]:
+    """
+    将设备按排序后轮询分配到各分片（空分片被省略）
+
+    Args:
+        device_ids: 设备ID列表
+        worker_processes: 分片进程数量
+
+    Returns:
+        每个分片负责的设备ID列表
+    """
+    if worker_processes <= 0:
+        raise ValueError("worker_processes 必须大于 0")
+    shards: List[List[str]] = [[] for _ in range(worker_processes)]
+    for i, device_id in enumerate(sorted(device_ids)):
+        shards[i % worker_processes].append(device_id)
+    return [s for s in shards if s]
+
+
+@dataclass
+class _ShardSpec:
+    """传给分片进程的启动参数（全部可 pickle）"""
+    shard_index: int
+    device_ids: List[str]
+    all_device_ids: List[str]
+    config: DataProcessingConfigDTO
+    bindings: Dict[DeviceRole, DeviceRoleBindingDTO]
+    label_map: List[str]
+    input_ring: SharedColumnRing
+    output_ring: SharedColumnRing
+    ready: object  # multiprocessing.Semaphore，输出环写入后释放，通知聚合线程
+    stop_event: object  # multiprocessing.Event
+
+
+def _shard_worker_main(spec: _ShardSpec) -> None:
+    """分片进程入口：循环读取输入环，执行坐标变换和滤波，结果写入输出环"""
+    # 在子进程中导入，避免模块导入时的循环依赖
+    from oak_vision_system.modules.data_processing.filter_manager import FilterManager
+    from oak_vision_system.modules.data_processing.transform_module import CoordinateTransfomer
+
+    config = spec.config
+    transformer = CoordinateTransfomer(calibrations=config.coordinate_transforms, bindings=spec.bindings)
+    filter_manager = FilterManager.from_config(
+        config.filter_config,
+        device_metadata={d: DeviceMetadataDTO(mxid=d) for d in spec.device_ids},
+        label_map=spec.label_map,
+    )
+
+    input_ring, output_ring = spec.input_ring, spec.output_ring
+    try:
+        while not spec.stop_event.is_set():
+            item = input_ring.read(timeout=0.2)
+            if item is None:
+                continue
+            key, frame_id, cols = item
+            device_id = spec.all_device_ids[key]
+
+            n = len(cols["labels"])
+            out: Dict[str, np.ndarray] = {}  # 空帧只写入头部（0 行）
+            # 输出预测行时空帧也要推进滤波器，结果可能非空
+            if n > 0 or filter_manager.emit_predicted:
+                try:
+                    if n > 0:
+                        coords = transformer.transform_coordinates(device_id, cols["coords_h"])
+                    else:
+                        coords = np.empty((0, 3), dtype=np.float32)
+                    coords, bboxes, confidences, labels = filter_manager.process(
+                        device_id=device_id,
+                        coordinates=coords,
+                        bboxes=cols["bbox"],
+                        confidences=cols["confidence"],
+                        labels=cols["labels"],
+                    )
+                except Exception as e:
+                    logger.error(f"分片处理失败: shard={spec.shard_index}, device_id={device_id}, error={e}")
+                    continue
+                out = {"coords": coords, "bbox": bboxes, "confidence": confidences, "labels": labels}
+                n = len(labels)
+
+            # 聚合线程落后时等待，停止时放弃
+            while not output_ring.write(key, frame_id, out, n, timeout=0.2):
+                if spec.stop_event.is_set():
+                    return
+            spec.ready.release()
+    finally:
+        input_ring.close()
+        output_ring.close()
+
+
+class ShardedPipeline:
+    """
+    分片进程池 + 结果聚合线程
+
+    submit() 由单个线程调用（DataProcessor 处理线程），聚合线程在主进程中
+    按到达顺序对每个结果调用 on_result。
+    """
+
+    def __init__(
+        self,
+        *,
+        config: DataProcessingConfigDTO,
+        device_ids: Sequence[str],
+        bindings: Dict[DeviceRole, DeviceRoleBindingDTO],
+        label_map: List[str],
+        worker_processes: int,
+        max_detections: int,
+        ring_slots: int,
+        on_result: ShardResultCallback,
+    ) -> None:
+        """
+        Args:
+            config: 数据处理配置（坐标变换与滤波参数）
+            device_ids: 全部设备ID
+            bindings: 设备角色绑定
+            label_map: 标签映射
+            worker_processes: 分片进程数量
+            max_detections: 每帧最大检测数，超出部分被截断
+            ring_slots: 每个环形缓冲区的槽位数
+            on_result: 结果回调，在聚合线程中执行
+        """
+        self._config = config
+        self._bindings = bindings
+        self._label_map = label_map
+        self._device_ids = list(device_ids)
+        self._device_index = {d: i for i, d in enumerate(self._device_ids)}
+        self._shards = assign_shards(self._device_ids, worker_processes)
+        self._shard_of = {d: i for i, shard in enumerate(self._shards) for d in shard}
+        self._max_detections = max_detections
+        self._ring_slots = ring_slots
+        self._on_result = on_result
+
+        self._ctx = mp.get_context("spawn")
+        self._processes: List[mp.process.BaseProcess] = []
+        self._input_rings: List[SharedColumnRing] = []
+        self._output_rings: List[SharedColumnRing] = []
+        self._ready = None
+        self._stop_event = None
+        self._aggregator: Optional[threading.Thread] = None
+        self._aggregator_stop = threading.Event()
+
+        self._drop_count = 0
+        self._truncated_count = 0
+
+    @property
+    def shards(self) -> List[List[str]]:
+        """每个分片负责的设备ID"""
+        return [list(s) for s in self._shards]
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._processes)
+
+    def start(self) -> None:
+        """创建共享内存环、启动分片进程和聚合线程"""
+        if self._processes:
+            return
+        ctx = self._ctx
+        self._ready = ctx.Semaphore(0)
+        self._stop_event = ctx.Event()
+        self._aggregator_stop.clear()
+
+        for index, device_ids in enumerate(self._shards):
+            input_ring = SharedColumnRing(
+                INPUT_COLUMNS, slots=self._ring_slots, max_rows=self._max_detections, ctx=ctx
+            )
+            output_ring = SharedColumnRing(
+                OUTPUT_COLUMNS, slots=self._ring_slots, max_rows=self._max_detections, ctx=ctx
+            )
+            spec = _ShardSpec(
+                shard_index=index,
+                device_ids=device_ids,
+                all_device_ids=self._device_ids,
+                config=self._config,
+                bindings=self._bindings,
+                label_map=self._label_map,
+                input_ring=input_ring,
+                output_ring=output_ring,
+                ready=self._ready,
+                stop_event=self._stop_event,
+            )
+            process = ctx.Process(
+                target=_shard_worker_main, args=(spec,), name=f"DataProcessorShard-{index}", daemon=True
+            )
+            self._input_rings.append(input_ring)
+            self._output_rings.append(output_ring)
+            self._processes.append(process)
+
+        for process in self._processes:
+            process.start()
+
+        self._aggregator = threading.Thread(
+            target=self._run_aggregator, name="DataProcessorAggregator", daemon=True
+        )
+        self._aggregator.start()
+        logger.info("分片处理已启动: shards=%s", self._shards)
+
+    def stop(self, timeout: float = 5.0) -> bool:
+        """停止分片进程和聚合线程并释放共享内存
+
+        Returns:
+            bool: 所有进程是否在超时内退出
+        """
+        if not self._processes:
+            return True
+
+        self._stop_event.set()
+        clean = True
+        for process in self._processes:
+            process.join(timeout=timeout)
+            if process.is_alive():
+                logger.error("分片进程停止超时，强制终止: %s", process.name)
+                process.terminate()
+                process.join(timeout=1.0)
+                clean = False
+
+        self._aggregator_stop.set()
+        if self._aggregator is not None:
+            self._aggregator.join(timeout=timeout)
+            self._aggregator = None
+
+        for ring in self._input_rings + self._output_rings:
+            ring.close()
+        self._input_rings = []
+        self._output_rings = []
+        self._processes = []
+        logger.info("分片处理已停止: dropped=%d, truncated=%d", self._drop_count, self._truncated_count)
+        return clean
+
+    def submit(
+        self,
+        device_id: str,
+        frame_id: int,
+        coords_h: np.ndarray,
+        bboxes: np.ndarray,
+        confidences: np.ndarray,
+        labels: np.ndarray,
+    ) -> bool:
+        """
+        将一帧列式数据写入对应分片的输入环（不阻塞）
+
+        Returns:
+            bool: 是否写入成功；未知设备、未启动或输入环已满时返回 False
+        """
+        shard = self._shard_of.get(device_id)
+        if shard is None or not self._input_rings:
+            self._drop_count += 1
+            return False
+
+        n = len(labels)
+        if n > self._max_detections:
+            self._truncated_count += 1
+        columns = {"coords_h": coords_h, "bbox": bboxes, "confidence": confidences, "labels": labels}
+        if not self._input_rings[shard].write(self._device_index[device_id], frame_id, columns, n):
+            self._drop_count += 1
+            return False
+        return True
+
+    def get_stats(self) -> dict:
+        """获取分片统计信息"""
+        return {
+            "shards": self.shards,
+            "alive_processes": sum(p.is_alive() for p in self._processes),
+            "drop_count": self._drop_count,
+            "truncated_count": self._truncated_count,
+        }
+
+    def _run_aggregator(self) -> None:
+        """聚合线程：每个 ready 信号对应某个输出环中的一个结果，轮询取出后回调"""
+        rings = self._output_rings
+        next_ring = 0
+        while not self._aggregator_stop.is_set():
+            if not self._ready.acquire(True, 0.2):
+                continue
+            item = None
+            for _ in range(len(rings)):
+                ring = rings[next_ring]
+                next_ring = (next_ring + 1) % len(rings)
+                item = ring.try_read()
+                if item is not None:
+                    break
+            if item is None:
+                continue
+
+            key, frame_id, cols = item
+            try:
+                self._on_result(
+                    self._device_ids[key], frame_id,
+                    cols["coords"], cols["bbox"], cols["confidence"], cols["labels"],
+                )
+            except Exception as e:
+                logger.error(f"分片结果处理失败: device_id={self._device_ids[key]}, error={e}", exc_info=True)
@@ -1,16 +1,39 @@
 """
 匹配算法文件，用于检测结果的追踪匹配，维护检测结果的轨迹，方便持续滤波
 当前实现基于IoU
+
+门控模式（gated=True）：
+    先用按 x_min 排序的扫描窗口筛出边界框实际相交的候选对，只在候选对上计算 IoU，
+    避免拥挤场景下构建稠密 N×M 矩阵并逐格遍历。IoU 为 0 的对永远不会被匹配，
+    因此门控模式的匹配结果与稠密模式一致（匈牙利算法仅在总 IoU 相同的并列最优解间可能不同）。
+    问题规模小于 gate_min_cells 时自动退回稠密计算。
 """
 import numpy as np
 from abc import ABC, abstractmethod
+from typing import Optional
 from scipy.optimize import linear_sum_assignment
 
 class BaseTracker(ABC):
     """目标跟踪器抽象基类"""
+
+    # 门控模式的默认启用规模（N*M），小于该值时稠密计算更快
+    GATED_MIN_CELLS = 0
     
-    def __init__(self, iou_threshold: float = 0.5):
+    def __init__(self, iou_threshold: float = 0.5, gated: bool = False, gate_min_cells: Optional[int] = None):
+        """
+        Args:
+            iou_threshold: IoU匹配阈值
+            gated: 是否启用门控稀疏关联（只考虑相交的候选对）
+            gate_min_cells: N*M 达到该值时才走门控路径，None 表示使用类默认值 GATED_MIN_CELLS
+        """
+        if gated and iou_threshold <= 0:
+            raise ValueError("gated 模式要求 iou_threshold > 0")
         self.threshold = iou_threshold
+        self.gated = gated
+        self.gate_min_cells = self.GATED_MIN_CELLS if gate_min_cells is None else gate_min_cells
+
+    def _use_gating(self, prev_boxes: np.ndarray, curr_boxes: np.ndarray) -> bool:
+        return self.gated and len(prev_boxes) * len(curr_boxes) >= self.gate_min_cells
     
     @abstractmethod
     def match(
@@ -62,6 +85,60 @@ class BaseTracker(ABC):
         # 返回一个（N,M）的矩阵，每个元素表示boxes1中第i个框与boxes2中第j个框的IoU
         return intersection / (union + 1e-6)  # 避免除零
 
+    def _sparse_iou(self, boxes1: np.ndarray, boxes2: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """只对相交的框对计算 IoU
+
+        将 boxes2 按 x_min 排序，boxes1 中每个框的 x 方向候选是排序数组上的一段连续窗口
+        (x_min1 - 最大宽度, x_max1)，窗口展开为扁平候选对后再精确判断相交。
+        数值与 _batch_iou 对应元素逐位一致。
+
+        Returns:
+            rows: (K,) boxes1 索引
+            cols: (K,) boxes2 索引
+            ious: (K,) 对应 IoU，均 > 0
+        """
+        empty = np.empty(0, dtype=np.int64)
+        if len(boxes1) == 0 or len(boxes2) == 0:
+            return empty, empty, np.empty(0)
+
+        # 窗口计算使用 float64，float32 坐标的差值精确可表示，不会漏掉边界候选
+        x1 = boxes1[:, [0, 2]].astype(np.float64)
+        x2 = boxes2[:, [0, 2]].astype(np.float64)
+        order = np.argsort(x2[:, 0], kind="stable")
+        sorted_xmin = x2[order, 0]
+        max_w = max((x2[:, 1] - x2[:, 0]).max(), 0.0)
+
+        lo = sorted_xmin.searchsorted(x1[:, 0] - max_w, side="right")
+        counts = sorted_xmin.searchsorted(x1[:, 1], side="left") - lo
+        np.maximum(counts, 0, out=counts)
+
+        # 展开每行的 [lo, lo + count) 窗口
+        rows = np.repeat(np.arange(len(boxes1)), counts)
+        offsets = np.repeat(np.cumsum(counts) - counts - lo, counts)
+        cols = order[np.arange(len(rows)) - offsets]
+
+        b1 = boxes1[rows]
+        b2 = boxes2[cols]
+        x1 = np.maximum(b1[:, 0], b2[:, 0])
+        y1 = np.maximum(b1[:, 1], b2[:, 1])
+        x2 = np.minimum(b1[:, 2], b2[:, 2])
+        y2 = np.minimum(b1[:, 3], b2[:, 3])
+        intersection = np.maximum(0, x2 - x1) * np.maximum(0, y2 - y1)
+
+        keep = intersection > 0
+        rows, cols, b1, b2, intersection = rows[keep], cols[keep], b1[keep], b2[keep], intersection[keep]
+        area1 = (b1[:, 2] - b1[:, 0]) * (b1[:, 3] - b1[:, 1])
+        area2 = (b2[:, 2] - b2[:, 0]) * (b2[:, 3] - b2[:, 1])
+        union = area1 + area2 - intersection
+        return rows, cols, intersection / (union + 1e-6)
+
+    @staticmethod
+    def _scatter_iou(shape: tuple[int, int], rows: np.ndarray, cols: np.ndarray, ious: np.ndarray) -> np.ndarray:
+        """将稀疏候选对还原为 (N, M) IoU 矩阵（门控外的元素为 0，用于调试）"""
+        iou_matrix = np.zeros(shape, dtype=ious.dtype)
+        iou_matrix[rows, cols] = ious
+        return iou_matrix
+
 
 class OptimizedGreedyTracker(BaseTracker):
     """
@@ -69,6 +146,8 @@ class OptimizedGreedyTracker(BaseTracker):
     
     按 IoU 从大到小排序，依次分配，保证一对一匹配
     """
+
+    GATED_MIN_CELLS = 512
     
     def match(
         self, 
@@ -84,6 +163,9 @@ class OptimizedGreedyTracker(BaseTracker):
         """
         if len(prev_boxes) == 0 or len(curr_boxes) == 0:
             return {}, np.array([])
+
+        if self._use_gating(prev_boxes, curr_boxes):
+            return self._match_gated(prev_boxes, curr_boxes)
         
         iou_matrix = self._batch_iou(prev_boxes, curr_boxes)
         
@@ -110,8 +192,56 @@ class OptimizedGreedyTracker(BaseTracker):
         
         return matches, iou_matrix
 
+    def _match_gated(
+        self,
+        prev_boxes: np.ndarray,
+        curr_boxes: np.ndarray
+    ) -> tuple[dict[int, int], np.ndarray]:
+        """
+        在扁平候选数组上向量化执行全局贪心
+
+        候选对按 (IoU 降序, prev_id, curr_id) 排序，与逐格遍历 + 稳定排序的顺序相同。
+        每一轮接受“在剩余候选中既是所在行第一个、又是所在列第一个”的候选对——
+        顺序贪心必然接受它们——然后删除与之冲突的候选，直到候选为空。
+        """
+        rows, cols, ious = self._sparse_iou(prev_boxes, curr_boxes)
+        iou_matrix = self._scatter_iou((len(prev_boxes), len(curr_boxes)), rows, cols, ious)
+
+        valid = ious >= self.threshold
+        order = np.lexsort((cols[valid], rows[valid], -ious[valid]))
+        sorted_rows = rows[valid][order]
+        sorted_cols = cols[valid][order]
+
+        rows, cols, pos = sorted_rows, sorted_cols, np.arange(len(order))
+        used_prev = np.zeros(len(prev_boxes), dtype=bool)
+        used_curr = np.zeros(len(curr_boxes), dtype=bool)
+        accepted = []
+        while len(pos) > 0:
+            first_row = np.zeros(len(pos), dtype=bool)
+            first_row[np.unique(rows, return_index=True)[1]] = True
+            first_col = np.zeros(len(pos), dtype=bool)
+            first_col[np.unique(cols, return_index=True)[1]] = True
+            take = first_row & first_col
+
+            accepted.append(pos[take])
+            used_prev[rows[take]] = True
+            used_curr[cols[take]] = True
+            keep = ~(used_prev[rows] | used_curr[cols])
+            rows, cols, pos = rows[keep], cols[keep], pos[keep]
+
+        if not accepted:
+            return {}, iou_matrix
+        # 按排序位置恢复顺序贪心的插入顺序
+        taken = np.sort(np.concatenate(accepted))
+        matches = dict(zip(sorted_rows[taken].tolist(), sorted_cols[taken].tolist()))
+        return matches, iou_matrix
+
 class HungarianTracker(BaseTracker):
     """基于匈牙利算法的全局最优匹配（推荐用于 < 100 个目标）"""
+
+    # 稠密 linear_sum_assignment 为 C 实现，极小规模下门控的候选展开开销更大；
+    # 约 32×32 以上的拥挤场景按连通分量求解更快
+    GATED_MIN_CELLS = 1024
     
     def match(
         self, 
@@ -120,6 +250,9 @@ class HungarianTracker(BaseTracker):
     ) -> tuple[dict[int, int], np.ndarray]:
         if len(prev_boxes) == 0 or len(curr_boxes) == 0:
             return {}, np.array([])
+
+        if self._use_gating(prev_boxes, curr_boxes):
+            return self._match_gated(prev_boxes, curr_boxes)
         
         iou_matrix = self._batch_iou(prev_boxes, curr_boxes)
         cost_matrix = 1 - iou_matrix
@@ -135,6 +268,67 @@ class HungarianTracker(BaseTracker):
         
         return matches, iou_matrix
 
+    def _match_gated(
+        self,
+        prev_boxes: np.ndarray,
+        curr_boxes: np.ndarray
+    ) -> tuple[dict[int, int], np.ndarray]:
+        """
+        按门控图的连通分量分别求解匈牙利算法
+
+        相交关系构成二分图，不同连通分量之间 IoU 全为 0，全局最优分配的总 IoU
+        等于各分量最优分配之和。某一侧只有一个节点的星形分量（含单候选对）
+        的最优解就是分量内 IoU 最大的候选对，由节点度数直接判定并向量化求出；
+        其余分量的行列压缩成块对角小矩阵，只调用一次 linear_sum_assignment。
+        显式标记连通分量（scipy.sparse.csgraph）在常见规模下比分配本身更慢，因此不使用。
+        """
+        n_prev, n_curr = len(prev_boxes), len(curr_boxes)
+        rows, cols, ious = self._sparse_iou(prev_boxes, curr_boxes)
+        iou_matrix = self._scatter_iou((n_prev, n_curr), rows, cols, ious)
+        if len(rows) == 0:
+            return {}, iou_matrix
+
+        # 星形分量判定：行 r 的所有邻居列度数为 1 时，r 与其邻居恰好构成一个连通分量（列同理）
+        row_deg = np.bincount(rows, minlength=n_prev)
+        col_deg = np.bincount(cols, minlength=n_curr)
+        row_is_center = np.bincount(rows, weights=col_deg[cols] > 1, minlength=n_prev) == 0
+        col_is_center = np.bincount(cols, weights=row_deg[rows] > 1, minlength=n_curr) == 0
+        star = row_is_center[rows] | col_is_center[cols]
+        # 星形分量编号：以中心节点编号（行中心优先，列中心偏移 n_prev）
+        comp = np.where(row_is_center[rows], rows, cols + n_prev)
+
+        matched_rows = []
+        matched_cols = []
+
+        # 星形分量（含单候选对）：最优分配即分量内 IoU 最大的候选对
+        if star.any():
+            s_idx = np.flatnonzero(star)
+            s_idx = s_idx[np.lexsort((-ious[s_idx], comp[s_idx]))]
+            s_comp = comp[s_idx]
+            best = s_idx[np.r_[True, s_comp[1:] != s_comp[:-1]]]
+            best = best[ious[best] >= self.threshold]
+            matched_rows.append(rows[best])
+            matched_cols.append(cols[best])
+
+        # 其余分量：各分量互不相交，压缩为一个块对角矩阵后一次求解（等价于逐分量求解）
+        multi = ~star
+        if multi.any():
+            rows_m, cols_m = rows[multi], cols[multi]
+            sub_rows, r_inv = np.unique(rows_m, return_inverse=True)
+            sub_cols, c_inv = np.unique(cols_m, return_inverse=True)
+            sub_iou = np.zeros((len(sub_rows), len(sub_cols)), dtype=ious.dtype)
+            sub_iou[r_inv, c_inv] = ious[multi]
+            r, k = linear_sum_assignment(1 - sub_iou)
+            ok = sub_iou[r, k] >= self.threshold
+            matched_rows.append(sub_rows[r[ok]])
+            matched_cols.append(sub_cols[k[ok]])
+
+        all_rows = np.concatenate(matched_rows)
+        all_cols = np.concatenate(matched_cols)
+        order = np.argsort(all_rows, kind="stable")
+        matches = dict(zip(all_rows[order].tolist(), all_cols[order].tolist()))
+        return matches, iou_matrix
+
 # 向后兼容的别名（保留原接口）
 IoUMatcher = OptimizedGreedyTracker
 
@@ -147,7 +341,7 @@ def create_tracker(method: str = "greedy", **kwargs) -> BaseTracker:
         method: 匹配方法
             - "greedy": 优化贪心（推荐，默认）
             - "hungarian": 匈牙利算法（全局最优）
-        **kwargs: 传递给 Tracker 的参数（如 iou_threshold）
+        **kwargs: 传递给 Tracker 的参数（如 iou_threshold、gated）
     
     Returns:
         BaseTracker 实例
@@ -0,0 +1,461 @@
+"""
+向量化滤波器池
+
+与 FilterPool + MovingAverageFilter / KalmanFilter 组合行为完全一致的结构数组（SoA）实现。
+
+VectorizedFilterPool（滑动平均）：
+一个 (device, label) 池内所有槽位的滑动窗口保存在一个预分配的
+(pool_size, window, 3) 数组中，计数器、丢失次数、bbox 等状态均为数组，
+匹配结果应用、丢失处理、槽位分配和滑动平均更新全部向量化完成，
+避免每个槽位一次 Python 方法调用、deque 操作和 np.vstack。
+
+与对象引擎保持一致的行为细节（输出逐位相同）：
+- 窗口未满时输出为窗口内全部值的均值，且不更新 bbox；
+  窗口已满后采用增量更新，每 recalc_interval 次重新求和消除误差，并记录 bbox。
+- 没有 bbox 的活跃槽位在匹配前被标记为非活跃（不清空窗口），之后可被新目标复用。
+- 连续丢失达到 max_missed_count 时槽位被完全重置。
+
+VectorizedKalmanFilterPool（匀速模型卡尔曼）：各槽位的位置、速度和 2x2 协方差的三个独立元素
+保存为 (pool_size, 3) 数组，预测/更新公式与 KalmanFilter 逐项相同，输出逐位一致。
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+import numpy as np
+
+from .filter_base import KalmanFilter
+from .tracker import BaseTracker, HungarianTracker
+
+
+class _VectorizedPoolBase(ABC):
+    """向量化滤波器池的公共部分：匹配、丢失计数、槽位分配和状态掩码"""
+
+    def __init__(
+        self,
+        *,
+        pool_size: int,
+        max_missed_count: int,
+        tracker: Optional[BaseTracker],
+        iou_threshold: float,
+        gated: bool,
+    ) -> None:
+        if pool_size <= 0:
+            raise ValueError("pool_size must be > 0")
+        self._max_missed_count = max_missed_count
+        self._missed = np.zeros(pool_size, dtype=np.int64)  # 连续丢失次数
+        self._active_mask = np.zeros(pool_size, dtype=bool)  # 活跃状态掩码
+        self._tracker: BaseTracker = (
+            tracker if tracker is not None else HungarianTracker(iou_threshold=iou_threshold, gated=gated)
+        )
+
+    @property
+    def active_mask(self) -> np.ndarray:
+        """活跃状态掩码，形状为(pool_size,)"""
+        return self._active_mask
+
+    @property
+    def capacity(self) -> int:
+        """滤波器池容量（总槽位数）"""
+        return len(self._active_mask)
+
+    @property
+    def active_count(self) -> int:
+        """当前活跃的槽位数量"""
+        return int(self._active_mask.sum())
+
+    def reset(self) -> None:
+        """重置所有槽位状态"""
+        self._reset_slots(np.arange(self.capacity))
+
+    def get_active_indices(self) -> np.ndarray:
+        """获取所有活跃的槽位索引"""
+        return np.flatnonzero(self._active_mask)
+
+    def get_bbox_matrix(self) -> np.ndarray:
+        """获取所有可参与匹配的活跃槽位的bbox矩阵，形状为(N, 4)"""
+        _, boxes = self._active_candidates_and_boxes()
+        return boxes
+
+    def step_v2(
+        self,
+        coordinates: np.ndarray,
+        bboxes: np.ndarray,
+        confidences: np.ndarray,
+    ) -> np.ndarray:
+        """
+        处理一帧检测结果，语义与 FilterPool.step_v2 相同
+
+        args:
+            coordinates: np.ndarray，坐标矩阵,形状为(n,3)
+            bboxes: np.ndarray，bbox矩阵,形状为(n,4)
+            confidences: np.ndarray，置信度数组,形状为(n,)
+        return:
+            np.ndarray，滤波后的坐标数据，形状为(n,3)；未分配到槽位的检测输出为 0
+        """
+        coordinates = np.asarray(coordinates, dtype=np.float32)
+        bboxes = np.asarray(bboxes, dtype=np.float32)
+        confidences = np.asarray(confidences, dtype=np.float32)
+
+        n = len(coordinates)
+        if len(bboxes) != n or len(confidences) != n:
+            raise ValueError(f"coordinates({n}), bboxes({len(bboxes)}), confidences({len(confidences)})长度必须一致")
+
+        if n == 0:
+            self._miss(self._active_mask.nonzero()[0])
+            return np.zeros((0, 3), dtype=np.float32)
+
+        outputs = np.zeros((n, 3), dtype=np.float32)
+        candidates, prev_bboxes = self._active_candidates_and_boxes()
+
+        if len(prev_bboxes) == 0:
+            matched_slots = np.empty(0, dtype=np.int64)
+            matched_curr = np.empty(0, dtype=np.int64)
+        else:
+            matches, _ = self._tracker.match(prev_bboxes, bboxes)  # {prev_local_idx: curr_idx}
+            prev_local = np.fromiter(matches.keys(), dtype=np.int64, count=len(matches))
+            matched_curr = np.fromiter(matches.values(), dtype=np.int64, count=len(matches))
+            matched_slots = candidates[prev_local]
+
+        # 未匹配的活跃槽位：丢失计数 +1，达到阈值的槽位被重置
+        if len(matched_slots) < len(candidates):
+            unmatched = self._active_mask.copy()
+            unmatched[matched_slots] = False
+            self._miss(unmatched.nonzero()[0])
+
+        # 未匹配的检测：按检测顺序依次分配到编号最小的空闲槽位
+        used = np.zeros(n, dtype=bool)
+        used[matched_curr] = True
+        unmatched_curr = (~used).nonzero()[0]
+        free_slots = (~self._active_mask).nonzero()[0]
+        k = min(len(unmatched_curr), len(free_slots))
+
+        # 匹配槽位与新分配槽位互不重叠，合并为一次向量化输入
+        slots = np.concatenate((matched_slots, free_slots[:k]))
+        curr = np.concatenate((matched_curr, unmatched_curr[:k]))
+        if len(slots) > 0:
+            self._input(slots, coordinates[curr], bboxes[curr])
+            self._active_mask[slots] = True
+            outputs[curr] = self._current[slots]
+        return outputs
+
+    def coasting_tracks(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        获取本帧未匹配到检测、仍在丢失容忍期内的目标，语义与 FilterPool.coasting_tracks 相同
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]，坐标矩阵 (k, 3) 与边界框矩阵 (k, 4)，按槽位顺序
+        """
+        slots = (self._active_mask & (self._missed > 0) & self._has_bbox).nonzero()[0]
+        return self._current[slots], self._bbox[slots]
+
+    def _miss(self, slots: np.ndarray) -> None:
+        """对一组槽位记录一次丢失（等价于逐个调用滤波器的 miss）"""
+        if len(slots) == 0:
+            return
+        missed = self._missed[slots] + 1
+        self._missed[slots] = missed
+        expired = missed >= self._max_missed_count
+        if expired.any():
+            self._reset_slots(slots[expired])
+        self._coast(slots[~expired])
+
+    def _coast(self, slots: np.ndarray) -> None:
+        """丢失但未失效的槽位在本帧的状态更新，默认保持不变"""
+
+    @abstractmethod
+    def _input(self, slots: np.ndarray, coords: np.ndarray, boxes: np.ndarray) -> None:
+        """对一组槽位输入新观测（等价于逐个调用滤波器的 input）"""
+
+    @abstractmethod
+    def _reset_slots(self, slots: np.ndarray) -> None:
+        """将一组槽位重置为空闲状态"""
+
+    @abstractmethod
+    def _active_candidates_and_boxes(self) -> tuple[np.ndarray, np.ndarray]:
+        """获取可参与匹配的活跃槽位索引和用于匹配的bbox矩阵"""
+
+
+class VectorizedFilterPool(_VectorizedPoolBase):
+    """滑动平均滤波器池（对应 FilterPool + MovingAverageFilter）"""
+
+    def __init__(
+        self,
+        *,
+        pool_size: int = 32,
+        queue_maxsize: int = 8,
+        max_missed_count: int = 5,
+        tracker: Optional[BaseTracker] = None,
+        iou_threshold: float = 0.5,
+        gated: bool = False,
+    ) -> None:
+        """
+        初始化向量化滤波器池
+
+        Args:
+            pool_size: 滤波器池的大小（槽位数）
+            queue_maxsize: 滑动窗口大小，对应 MovingAverageFilter 的 queue_maxsize
+            max_missed_count: 允许的最大连续丢失次数，对应 MovingAverageFilter 的 max_missed_count
+            tracker: 匹配算法实例
+            iou_threshold: IoU匹配阈值
+            gated: 未指定 tracker 时，默认 HungarianTracker 是否启用门控稀疏关联
+        """
+        if queue_maxsize <= 0:
+            raise ValueError("queue_maxsize must be > 0")
+        super().__init__(
+            pool_size=pool_size,
+            max_missed_count=max_missed_count,
+            tracker=tracker,
+            iou_threshold=iou_threshold,
+            gated=gated,
+        )
+
+        self._window = queue_maxsize
+        self._recalc_interval = max(queue_maxsize * 2, 10)  # 与 MovingAverageFilter 一致
+
+        self._values = np.zeros((pool_size, queue_maxsize, 3), dtype=np.float32)  # 滑动窗口（环形缓冲）
+        self._count = np.zeros(pool_size, dtype=np.int64)  # 窗口内有效值数量
+        self._head = np.zeros(pool_size, dtype=np.int64)  # 窗口已满时最旧值的位置
+        self._current = np.zeros((pool_size, 3), dtype=np.float32)  # 当前滤波输出
+        self._bbox = np.zeros((pool_size, 4), dtype=np.float32)  # 最近一次记录的 bbox
+        self._has_bbox = np.zeros(pool_size, dtype=bool)
+        self._next_recalc = np.full(pool_size, self._recalc_interval, dtype=np.int64)
+
+    # ------ 向量化内部操作 ------
+
+    def _input(self, slots: np.ndarray, coords: np.ndarray, boxes: np.ndarray) -> None:
+        """对一组槽位输入新坐标（等价于逐个调用 MovingAverageFilter.input）"""
+        w = self._window
+        self._missed[slots] = 0
+
+        counts = self._count[slots]
+        full = counts == w
+        n_full = int(full.sum())
+        if n_full < len(slots):
+            not_full = ~full
+            s = slots[not_full]
+            pos = counts[not_full]  # 窗口未满时 head 恒为 0，写入位置即有效值数量
+            self._values[s, pos] = coords[not_full]
+            self._count[s] = pos + 1
+            self._current[s] = self._window_mean(self._values[s], pos + 1)
+
+        if n_full > 0:
+            s = slots[full]
+            head = self._head[s]
+            new = coords[full]
+            old = self._values[s, head]
+            self._values[s, head] = new
+            self._head[s] = (head + 1) % w
+            self._current[s] += (new - old) / w
+
+            # 定期按时间顺序（最旧 -> 最新）重新求均值
+            self._next_recalc[s] -= 1
+            recalc = s[self._next_recalc[s] <= 0]
+            if len(recalc) > 0:
+                order = (self._head[recalc, None] + np.arange(w)) % w
+                ordered = self._values[recalc[:, None], order]
+                self._current[recalc] = self._window_mean(ordered, np.full(len(recalc), w))
+                self._next_recalc[recalc] = self._recalc_interval
+
+            self._bbox[s] = boxes[full]
+            self._has_bbox[s] = True
+
+    def _reset_slots(self, slots: np.ndarray) -> None:
+        self._values[slots] = 0.0
+        self._count[slots] = 0
+        self._head[slots] = 0
+        self._current[slots] = 0.0
+        self._has_bbox[slots] = False
+        self._missed[slots] = 0
+        self._next_recalc[slots] = self._recalc_interval
+        self._active_mask[slots] = False
+
+    @staticmethod
+    def _window_mean(windows: np.ndarray, counts: np.ndarray) -> np.ndarray:
+        """
+        按窗口顺序逐项累加后求均值
+
+        windows: (m, w, 3)，未使用的位置为 0；counts: (m,)
+        逐项累加保证与 np.mean(np.vstack(queue), axis=0) 的 float32 结果逐位一致。
+        """
+        acc = windows[:, 0].copy()
+        for j in range(1, windows.shape[1]):
+            acc += windows[:, j]
+        return (acc / counts[:, None]).astype(np.float32)
+
+    def _active_candidates_and_boxes(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        获取可参与匹配的活跃槽位索引和bbox矩阵
+
+        尚未记录 bbox 的活跃槽位会被标记为非活跃（不清空窗口）。
+        """
+        self._active_mask &= self._has_bbox
+        candidates = self._active_mask.nonzero()[0]
+        return candidates, self._bbox[candidates]
+
+
+class VectorizedKalmanFilterPool(_VectorizedPoolBase):
+    """匀速模型卡尔曼滤波器池（对应 FilterPool + KalmanFilter）"""
+
+    def __init__(
+        self,
+        *,
+        pool_size: int = 32,
+        process_noise: float = 5.0,
+        measurement_noise: float = 20.0,
+        max_missed_count: int = 5,
+        dt: float = 1.0,
+        initial_velocity_std: float = 100.0,
+        bbox_velocity_alpha: float = 0.5,
+        tracker: Optional[BaseTracker] = None,
+        iou_threshold: float = 0.5,
+        gated: bool = False,
+    ) -> None:
+        """
+        初始化向量化卡尔曼滤波器池
+
+        Args:
+            pool_size: 滤波器池的大小（槽位数）
+            process_noise / measurement_noise / max_missed_count / dt /
+            initial_velocity_std / bbox_velocity_alpha: 与 KalmanFilter 的同名参数一致
+            tracker: 匹配算法实例
+            iou_threshold: IoU匹配阈值
+            gated: 未指定 tracker 时，默认 HungarianTracker 是否启用门控稀疏关联
+        """
+        super().__init__(
+            pool_size=pool_size,
+            max_missed_count=max_missed_count,
+            tracker=tracker,
+            iou_threshold=iou_threshold,
+            gated=gated,
+        )
+        self._dt = float(dt)
+        self._q = float(process_noise) ** 2
+        self._r = float(measurement_noise) ** 2
+        self._initial_velocity_var = float(initial_velocity_std) ** 2
+        self._bbox_alpha = float(bbox_velocity_alpha)
+
+        self._pos = np.zeros((pool_size, 3), dtype=np.float64)
+        self._vel = np.zeros((pool_size, 3), dtype=np.float64)
+        self._p00 = np.zeros((pool_size, 3), dtype=np.float64)
+        self._p01 = np.zeros((pool_size, 3), dtype=np.float64)
+        self._p11 = np.zeros((pool_size, 3), dtype=np.float64)
+        self._bbox_vel = np.zeros((pool_size, 4), dtype=np.float32)
+        self._initialized = np.zeros(pool_size, dtype=bool)
+        self._current = np.zeros((pool_size, 3), dtype=np.float32)  # 当前滤波输出
+        self._bbox = np.zeros((pool_size, 4), dtype=np.float32)  # 当前边界框（丢失期间为外推框）
+        self._has_bbox = np.zeros(pool_size, dtype=bool)
+
+    @classmethod
+    def from_filter(
+        cls,
+        sample: KalmanFilter,
+        *,
+        pool_size: int = 32,
+        tracker: Optional[BaseTracker] = None,
+        iou_threshold: float = 0.5,
+        gated: bool = False,
+    ) -> "VectorizedKalmanFilterPool":
+        """按样例 KalmanFilter 的参数创建（直接复制方差参数，保证与对象引擎逐位一致）"""
+        pool = cls(
+            pool_size=pool_size,
+            max_missed_count=sample._max_missed_count,
+            dt=sample._dt,
+            bbox_velocity_alpha=sample._bbox_alpha,
+            tracker=tracker,
+            iou_threshold=iou_threshold,
+            gated=gated,
+        )
+        pool._q = sample._q
+        pool._r = sample._r
+        pool._initial_velocity_var = sample._initial_velocity_var
+        return pool
+
+    # ------ 向量化内部操作 ------
+
+    def _input(self, slots: np.ndarray, coords: np.ndarray, boxes: np.ndarray) -> None:
+        """对一组槽位输入新观测（等价于逐个调用 KalmanFilter.input）"""
+        self._missed[slots] = 0
+        z = coords[:, :3].astype(np.float64)
+
+        init = self._initialized[slots]
+        if not init.all():
+            s = slots[~init]
+            self._pos[s] = z[~init]
+            self._vel[s] = 0.0
+            self._p00[s] = self._r
+            self._p01[s] = 0.0
+            self._p11[s] = self._initial_velocity_var
+            self._bbox_vel[s] = 0.0
+            self._initialized[s] = True
+
+        if init.any():
+            s = slots[init]
+            self._predict(s)
+            p00, p01, p11 = self._p00[s], self._p01[s], self._p11[s]
+            # 更新：K = P Hᵀ / (H P Hᵀ + R)，H = [1, 0]
+            sv = p00 + self._r
+            k0 = p00 / sv
+            k1 = p01 / sv
+            y = z[init] - self._pos[s]
+            self._pos[s] += k0 * y
+            self._vel[s] += k1 * y
+            self._p11[s] = p11 - k1 * p01
+            self._p01[s] = (1.0 - k0) * p01
+            self._p00[s] = (1.0 - k0) * p00
+
+            # 边界框速度：相对上一帧框（丢失期间已外推）的位移做指数平滑
+            has_box = self._has_bbox[s]
+            sb = s[has_box]
+            delta = boxes[init][has_box] - self._bbox[sb]
+            bbox_vel = self._bbox_vel[sb]
+            bbox_vel += self._bbox_alpha * (delta - bbox_vel)
+            self._bbox_vel[sb] = bbox_vel
+
+        self._bbox[slots] = boxes
+        self._has_bbox[slots] = True
+        self._current[slots] = self._pos[slots]
+
+    def _coast(self, slots: np.ndarray) -> None:
+        """丢失但未失效的槽位按匀速模型外推一帧（等价于 KalmanFilter.miss）"""
+        slots = slots[self._initialized[slots]]
+        if len(slots) == 0:
+            return
+        self._predict(slots)
+        self._current[slots] = self._pos[slots]
+        self._bbox[slots] += self._bbox_vel[slots]
+
+    def _predict(self, slots: np.ndarray) -> None:
+        """时间更新：x = F x，P = F P Fᵀ + Q"""
+        dt = self._dt
+        q = self._q
+        self._pos[slots] += self._vel[slots] * dt
+        p00, p01, p11 = self._p00[slots], self._p01[slots], self._p11[slots]
+        self._p00[slots] = p00 + 2.0 * dt * p01 + dt * dt * p11 + q * dt ** 4 / 4.0
+        self._p01[slots] = p01 + dt * p11 + q * dt ** 3 / 2.0
+        self._p11[slots] = p11 + q * dt * dt
+
+    def _reset_slots(self, slots: np.ndarray) -> None:
+        self._pos[slots] = 0.0
+        self._vel[slots] = 0.0
+        self._p00[slots] = 0.0
+        self._p01[slots] = 0.0
+        self._p11[slots] = 0.0
+        self._bbox_vel[slots] = 0.0
+        self._initialized[slots] = False
+        self._current[slots] = 0.0
+        self._has_bbox[slots] = False
+        self._missed[slots] = 0
+        self._active_mask[slots] = False
+
+    def _active_candidates_and_boxes(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        获取可参与匹配的活跃槽位索引和外推到当前帧的预测框（等价于 KalmanFilter.match_bbox）
+
+        尚未记录 bbox 的活跃槽位会被标记为非活跃。
+        """
+        self._active_mask &= self._has_bbox
+        candidates = self._active_mask.nonzero()[0]
+        return candidates, self._bbox[candidates] + self._bbox_vel[candidates]
@@ -0,0 +1,171 @@
+"""
+深度图伪彩色着色
+
+OAK 深度图为 uint16 毫米值，着色可以归结为一次 65536 项的查找表（uint16 → BGR）索引：
+- 归一化范围（1%/99% 百分位数）由降采样直方图的指数滑动平均（EMA）增量跟踪，
+  每帧只统计 1/16 的像素，百分位数在 4096 个直方图桶上求得
+- 查找表只在归一化范围（按直方图桶量化）变化时重建，稳定场景下不重建
+- 着色为 np.take 直接写入输出画布，不产生浮点临时数组
+
+百分位数语义与旧实现一致：下界为非零（有效）深度的 1% 分位，上界为全部像素的 99% 分位。
+"""
+
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+# uint16 深度值的查找表大小
+DEPTH_LUT_SIZE = 1 << 16
+# 直方图桶宽度为 2**_HIST_SHIFT 毫米（16mm，共 4096 个桶），也是归一化范围的量化步长
+_HIST_SHIFT = 4
+_HIST_BINS = DEPTH_LUT_SIZE >> _HIST_SHIFT
+# 百分位统计的降采样步长（每个方向）
+_SUBSAMPLE_STEP = 4
+# 直方图 EMA 的默认平滑系数（新帧权重）
+DEFAULT_EMA_ALPHA = 0.2
+
+
+class DepthColorizer:
+    """
+    基于查找表的深度着色器（单线程使用：渲染线程）
+
+    每个设备使用独立实例，各自跟踪深度分布。
+    """
+
+    def __init__(
+        self,
+        normalize: bool = True,
+        colormap: int = cv2.COLORMAP_HOT,
+        ema_alpha: float = DEFAULT_EMA_ALPHA,
+        low_percentile: float = 1.0,
+        high_percentile: float = 99.0,
+    ) -> None:
+        """
+        Args:
+            normalize: 是否按百分位数归一化；为 False 时按 depth / 256 固定映射
+            colormap: OpenCV 伪彩色映射
+            ema_alpha: 直方图 EMA 的新帧权重，(0, 1]，1 表示只使用当前帧
+            low_percentile: 归一化下界百分位数（只统计非零深度）
+            high_percentile: 归一化上界百分位数（统计全部像素）
+        """
+        if not 0.0 < ema_alpha <= 1.0:
+            raise ValueError("ema_alpha 必须在 (0, 1] 范围内")
+        if not 0.0 <= low_percentile < high_percentile <= 100.0:
+            raise ValueError("百分位数必须满足 0 <= low_percentile < high_percentile <= 100")
+        self.normalize = normalize
+        self.ema_alpha = ema_alpha
+        self._low_q = low_percentile / 100.0
+        self._high_q = high_percentile / 100.0
+
+        # 256 色调色板，查找表由其按归一化范围展开
+        self._palette = cv2.applyColorMap(
+            np.arange(256, dtype=np.uint8).reshape(256, 1), colormap
+        ).reshape(256, 3)
+
+        # 降采样深度分布的 EMA：非零深度各桶占比 + 零值占比
+        self._hist = np.zeros(_HIST_BINS, dtype=np.float64)
+        self._zero_fraction = 0.0
+        self._primed = False
+
+        self._lut = np.empty((DEPTH_LUT_SIZE, 3), dtype=np.uint8)
+        self._lut_range: Optional[Tuple[int, int]] = None
+        self.lut_rebuilds = 0
+
+    @property
+    def depth_range(self) -> Optional[Tuple[int, int]]:
+        """当前查找表对应的归一化范围 (下界, 上界)，单位毫米；未着色过或未归一化时为 None"""
+        return self._lut_range
+
+    def colorize(self, depth: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        将 uint16 深度图着色为 BGR 图像
+
+        Args:
+            depth: (H, W) uint16 深度图（毫米，0 为无效）
+            out: 可选输出画布 (H, W, 3) uint8
+
+        Returns:
+            BGR 彩色深度图（若提供 out 则为 out 本身）
+        """
+        if depth.dtype != np.uint16:
+            raise TypeError(f"深度图必须为 uint16，实际为 {depth.dtype}")
+        if self.normalize:
+            self._update_distribution(depth)
+            depth_range = self._percentile_range()
+        else:
+            depth_range = None
+        if depth_range != self._lut_range or self.lut_rebuilds == 0:
+            self._rebuild_lut(depth_range)
+        if out is None:
+            out = np.empty(depth.shape + (3,), dtype=np.uint8)
+        np.take(self._lut, depth, axis=0, out=out, mode="clip")
+        return out
+
+    def reset(self) -> None:
+        """丢弃已跟踪的深度分布（例如切换场景或设备重连后）"""
+        self._hist.fill(0.0)
+        self._zero_fraction = 0.0
+        self._primed = False
+
+    # ==================== 内部实现 ====================
+
+    def _update_distribution(self, depth: np.ndarray) -> None:
+        """统计降采样深度的直方图，并入 EMA"""
+        sample = depth[::_SUBSAMPLE_STEP, ::_SUBSAMPLE_STEP]
+        total = sample.size
+        zeros = total - np.count_nonzero(sample)
+        counts = np.bincount((sample >> _HIST_SHIFT).ravel(), minlength=_HIST_BINS)
+        counts[0] -= zeros
+
+        scale = 1.0 / total
+        if not self._primed:
+            np.multiply(counts, scale, out=self._hist)
+            self._zero_fraction = zeros * scale
+            self._primed = True
+            return
+        alpha = self.ema_alpha
+        self._hist *= 1.0 - alpha
+        self._hist += counts * (alpha * scale)
+        self._zero_fraction += alpha * (zeros * scale - self._zero_fraction)
+
+    def _percentile_range(self) -> Tuple[int, int]:
+        """从 EMA 直方图求归一化范围，按桶边界量化（桶内变化不触发查找表重建）"""
+        cumulative = np.cumsum(self._hist)
+        valid = cumulative[-1]
+        if valid <= 0.0:
+            return (0, 0)
+
+        low_bin = int(np.searchsorted(cumulative, self._low_q * valid))
+        low = low_bin << _HIST_SHIFT
+
+        # 上界统计全部像素（含零值），分位点落在零值内时上界为 0
+        rank = self._high_q * (valid + self._zero_fraction) - self._zero_fraction
+        if rank <= 0.0:
+            return (low, 0)
+        high_bin = min(int(np.searchsorted(cumulative, rank)), _HIST_BINS - 1)
+        return (low, (high_bin + 1) << _HIST_SHIFT)
+
+    def _rebuild_lut(self, depth_range: Optional[Tuple[int, int]]) -> None:
+        """
+        按归一化范围重建查找表
+
+        [low, high] 线性映射到 0..255（与 np.interp + 截断取整一致）后展开调色板；
+        depth_range 为 None 时为固定映射 depth / 256。
+        """
+        if depth_range is None:
+            np.take(self._palette, np.arange(256, dtype=np.uint8).repeat(256), axis=0, out=self._lut)
+            self._lut_range = None
+            self.lut_rebuilds += 1
+            return
+        low, high = depth_range
+        if high > low:
+            values = np.arange(DEPTH_LUT_SIZE, dtype=np.float32)
+            values -= low
+            values *= 255.0 / (high - low)
+            np.clip(values, 0, 255, out=values)
+            np.take(self._palette, values.astype(np.uint8), axis=0, out=self._lut)
+        else:
+            self._lut[:] = self._palette[0]
+        self._lut_range = depth_range
+        self.lut_rebuilds += 1
@@ -16,6 +16,9 @@ from oak_vision_system.modules.display_modules.render_packet_packager import (
 from oak_vision_system.modules.display_modules.display_renderer import (
     DisplayRenderer,
 )
+from oak_vision_system.modules.display_modules.stream_server import (
+    MjpegStreamServer,
+)
 
 
 class DisplayManager:
@@ -24,6 +27,7 @@ class DisplayManager:
     职责：
     - 创建和管理 RenderPacketPackager（适配器子模块）
     - 创建和管理 DisplayRenderer（渲染器子模块）
+    - 创建和管理 MjpegStreamServer（可选，enable_stream=True 时的无头视频流输出）
     - 提供统一的 start/stop 接口
     - 聚合统计信息
     - 处理配置验证
@@ -64,13 +68,26 @@ class DisplayManager:
         self._enable_depth_output = enable_depth_output  # 存储深度输出配置（子任务 6.1）
         
         # 创建 RenderPacketPackager 实例（适配器子模块）
+        # 只显示最新帧：配对环容量有界，检测数据滞后数百毫秒时仍能配对，旧帧被新帧取代后立即丢弃
         self._packager = RenderPacketPackager(
             queue_maxsize=8,
-            timeout_sec=0.2,
+            timeout_sec=0.5,
             devices_list=devices_list,
             cache_max_age_sec=1.0,
+            pairing_capacity=32,
+            latest_only=True,
         )
         
+        # 创建 MjpegStreamServer 实例（可选，无头视频流输出）
+        self._stream_server: Optional[MjpegStreamServer] = None
+        if config.enable_stream:
+            self._stream_server = MjpegStreamServer(
+                host=config.stream_host,
+                port=config.stream_port,
+                jpeg_quality=config.stream_jpeg_quality,
+                encoder_threads=config.stream_encoder_threads,
+            )
+        
         # 创建 DisplayRenderer 实例（渲染器子模块）
         self._renderer = DisplayRenderer(
             config=config,
@@ -79,6 +96,7 @@ class DisplayManager:
             role_bindings=role_bindings,  # 传入角色绑定（子任务 5.1）
             enable_depth_output=enable_depth_output,  # 传入深度输出配置（子任务 6.1）
             event_bus=self._packager.event_bus,  # 传入事件总线（保留用于向后兼容，当前未使用）
+            stream_server=self._stream_server,
         )
         
         # 日志（需求 5.5）
@@ -130,7 +148,12 @@ class DisplayManager:
                 if not packager_started:
                     raise RuntimeError("RenderPacketPackager 启动失败")
                 
-                # 3. 初始化 DisplayRenderer（但不启动渲染线程）
+                # 3. 启动视频流服务（可选），失败时不影响本地显示
+                if self._stream_server is not None and self._config.enable_display:
+                    if not self._stream_server.start():
+                        self.logger.warning("视频流服务启动失败，继续运行（无视频流输出）")
+                
+                # 初始化 DisplayRenderer（但不启动渲染线程）
                 if self._config.enable_display:
                     self.logger.info("初始化 DisplayRenderer（主线程渲染模式）...")
                     self._renderer.initialize()
@@ -202,6 +225,17 @@ class DisplayManager:
                     )
                     renderer_success = False
             
+            # 停止视频流服务（断开客户端，等待编码线程退出）
+            if self._stream_server is not None:
+                try:
+                    self._stream_server.stop(timeout=timeout)
+                except Exception as e:
+                    self.logger.error(
+                        "停止视频流服务时发生异常: %s",
+                        e,
+                        exc_info=True
+                    )
+            
             # 3. 停止 RenderPacketPackager
             if self._packager is not None:
                 self.logger.info("停止 RenderPacketPackager...")
@@ -276,6 +310,7 @@ class DisplayManager:
                         - drop_count: 队列溢出丢弃的数据包数量
                 - total_queue_drops: 所有队列的总丢弃数量
                 - total_drops: 总丢弃数量（配对超时 + 队列溢出）
+                - stream: 视频流服务统计（仅 enable_stream=True 时）
         """
         stats = {}
         
@@ -330,6 +365,9 @@ class DisplayManager:
         if self._renderer is not None:
             stats["renderer"] = self._renderer.get_stats()
         
+        if self._stream_server is not None:
+            stats["stream"] = self._stream_server.get_stats()
+        
         return stats
 
     def render_once(self) -> bool:
@@ -14,10 +14,16 @@ import numpy as np
 
 from oak_vision_system.core.dto.config_dto import DisplayConfigDTO, DeviceRole
 from oak_vision_system.core.dto.data_processing_dto import DetectionStatusLabel
+from oak_vision_system.core.tracing import TraceStage, get_latency_tracer
 from oak_vision_system.modules.display_modules.render_packet_packager import (
     RenderPacket,
     RenderPacketPackager,
 )
+from oak_vision_system.modules.display_modules.depth_colorizer import DepthColorizer
+from oak_vision_system.modules.display_modules.overlay import OVERLAY_ALPHA, blend_rect
+from oak_vision_system.modules.display_modules.stream_server import MjpegStreamServer
+from oak_vision_system.modules.display_modules.text_sprites import TextSpriteCache
+from oak_vision_system.utils import get_frame_buffer_pool
 from oak_vision_system.modules.display_modules.render_config import (
     STATUS_COLOR_MAP,
     DEFAULT_DETECTION_COLOR,
@@ -49,6 +55,7 @@ class DisplayRenderer:
         role_bindings: Optional[Dict[DeviceRole, str]] = None,
         enable_depth_output: bool = False,
         event_bus = None,
+        stream_server: Optional[MjpegStreamServer] = None,
     ) -> None:
         """初始化显示渲染器
         
@@ -60,6 +67,7 @@ class DisplayRenderer:
                           由外部通过配置管理器获取并传入
             enable_depth_output: 是否启用深度数据处理
             event_bus: 事件总线实例（未使用，保留用于向后兼容）
+            stream_server: MJPEG 视频流服务（可选），每帧合成画面同时提交给它编码输出
         """
         self._config = config
         self._packager = packager
@@ -67,8 +75,9 @@ class DisplayRenderer:
         self._role_bindings = role_bindings or {}  # 存储角色绑定
         self._enable_depth_output = enable_depth_output  # 存储深度输出配置
         self._event_bus = event_bus  # 保留用于向后兼容
+        self._stream_server = stream_server
         
-        # 单窗口管理
+        # 单窗口管理（enable_window=False 时为无头模式：不创建窗口，不处理按键）
         self._main_window_name = "OAK Display"
         self._window_created = False
         self._is_fullscreen = False
@@ -104,6 +113,21 @@ class DisplayRenderer:
         self._target_frame_interval = 1.0 / config.target_fps if config.target_fps > 0 else 0.0
         self._last_frame_time = 0.0
         
+        # 渲染画布：从共享帧缓冲区池取得，按用途复用，尺寸变化时归还旧画布
+        self._buffer_pool = get_frame_buffer_pool()
+        self._canvases: Dict[str, np.ndarray] = {}
+        
+        # 文本精灵缓存：标签、设备信息、按键提示等文本只光栅化一次，数字文本走字形图集
+        self._text = TextSpriteCache(font=LABEL_FONT)
+        
+        # 深度着色器：按设备跟踪深度分布，查找表只在归一化范围变化时重建
+        self._depth_colorizers: Dict[str, DepthColorizer] = {}
+        
+        # 打包器在没有新包时返回缓存包：记录每个设备最近显示的帧号，
+        # 只为首次显示的帧打点、提交视频流；无头模式下没有新包时跳过合成
+        self._tracer = get_latency_tracer()
+        self._shown_frames: Dict[str, int] = {}
+        
         self.logger = logging.getLogger(__name__)
         
         self.logger.info(
@@ -134,7 +158,13 @@ class DisplayRenderer:
         - 输出统计信息
         - 清理状态
         """
-        cv2.destroyAllWindows()
+        if self._config.enable_window:
+            cv2.destroyAllWindows()
+        
+        for canvas in self._canvases.values():
+            self._buffer_pool.release(canvas)
+        self._canvases.clear()
+        self._depth_colorizers.clear()
         
         with self._stats_lock:
             runtime = time.time() - self._stats["start_time"]
@@ -203,11 +233,16 @@ class DisplayRenderer:
             
             if not packets:
                 # 无数据时仍需处理按键
-                key = cv2.waitKey(1) & 0xFF
+                key = self._poll_key()
                 if key == ord('q'):
                     return True
                 return False
             
+            rendered = list(packets.values())
+            new_packets = self._take_new_packets(rendered)
+            if not new_packets and not self._config.enable_window:
+                return False
+            
             # 渲染拼接帧（内部已完成 Stretch Resize 到目标尺寸）
             frame = self._render_combined_devices(packets)
         else:
@@ -219,23 +254,33 @@ class DisplayRenderer:
                 
                 if packet is None:
                     # 无数据时仍需处理按键
-                    key = cv2.waitKey(1) & 0xFF
+                    key = self._poll_key()
                     if key == ord('q'):
                         return True
                     return False
                 
+                new_packets = self._take_new_packets([packet])
+                if not new_packets and not self._config.enable_window:
+                    return False
+                
                 # 渲染单设备帧（内部已完成 Stretch Resize 到目标尺寸）
                 frame = self._render_single_device(packet)
             else:
                 return False
         
         if frame is not None:
-            # 2. 创建窗口（如果尚未创建）
-            if not self._window_created:
-                self._create_main_window()
+            if self._config.enable_window:
+                # 2. 创建窗口（如果尚未创建）
+                if not self._window_created:
+                    self._create_main_window()
+                
+                # 3. 显示帧（已经是目标尺寸，无需再次 resize）
+                cv2.imshow(self._main_window_name, frame)
             
-            # 3. 显示帧（已经是目标尺寸，无需再次 resize）
-            cv2.imshow(self._main_window_name, frame)
+            # 有新帧时提交到视频流服务（复制后异步编码，不阻塞渲染），重复的缓存帧不再编码
+            if self._stream_server is not None and new_packets:
+                self._stream_server.submit(frame)
+            self._trace_rendered(new_packets)
             
             # 更新统计
             with self._stats_lock:
@@ -244,7 +289,7 @@ class DisplayRenderer:
             self._update_fps()
         
         # 4. 处理键盘输入（任务 3.10）
-        key = cv2.waitKey(1) & 0xFF
+        key = self._poll_key()
         if key == ord('q'):
             self.logger.info("用户按下 'q' 键")
             return True
@@ -270,6 +315,30 @@ class DisplayRenderer:
         
         return False
     
+    def _poll_key(self) -> int:
+        """处理窗口事件并读取按键；无头模式下没有窗口，返回 0xFF（无按键）"""
+        if not self._config.enable_window:
+            return 0xFF
+        return cv2.waitKey(1) & 0xFF
+    
+    def _take_new_packets(self, packets: List[RenderPacket]) -> List[RenderPacket]:
+        """返回其中首次显示的渲染包（不是打包器返回的缓存包），并记录为已显示"""
+        new_packets = []
+        for packet in packets:
+            video_frame = packet.video_frame
+            if self._shown_frames.get(video_frame.device_id) == video_frame.frame_id:
+                continue
+            self._shown_frames[video_frame.device_id] = video_frame.frame_id
+            new_packets.append(packet)
+        return new_packets
+    
+    def _trace_rendered(self, packets: List[RenderPacket]) -> None:
+        """为本次首次显示的帧记录渲染阶段延迟"""
+        if not self._tracer.enabled:
+            return
+        for packet in packets:
+            self._tracer.stamp(TraceStage.RENDER, packet.video_frame.capture_ts)
+    
     def _create_main_window(self) -> None:
         """创建主窗口
         
@@ -371,9 +440,10 @@ class DisplayRenderer:
                     confidence_percent = round(confidence * 100)
                     label_text = f"{label_text} {confidence_percent}%"
                 
-                # 计算标签背景位置
-                (label_w, label_h), baseline = cv2.getTextSize(
-                    label_text, LABEL_FONT, LABEL_FONT_SCALE, LABEL_THICKNESS
+                # 计算标签背景位置（带置信度时文本逐帧变化，使用字形图集）
+                volatile = self._config.show_confidence
+                (label_w, label_h), baseline = self._text.measure(
+                    label_text, LABEL_FONT_SCALE, LABEL_THICKNESS, volatile=volatile
                 )
                 
                 # 绘制标签背景（填充矩形）
@@ -386,14 +456,14 @@ class DisplayRenderer:
                 )
                 
                 # 绘制标签文字（白色，确保可读性）
-                cv2.putText(
+                self._text.draw(
                     canvas,
                     label_text,
                     (x1, y1 - baseline - 5),
-                    LABEL_FONT,
                     LABEL_FONT_SCALE,
                     (255, 255, 255),  # 白色文字
-                    LABEL_THICKNESS
+                    LABEL_THICKNESS,
+                    volatile=volatile
                 )
             
             # 5. 绘制3D坐标（如果启用）
@@ -411,7 +481,8 @@ class DisplayRenderer:
                 self._draw_text_with_background(
                     canvas, coord_text, (text_x, text_y), 
                     font_scale=self._config.text_scale,
-                    text_color=(255, 255, 255), bg_color=(0, 0, 0), thickness=1
+                    text_color=(255, 255, 255), bg_color=(0, 0, 0), thickness=1,
+                    volatile=True
                 )
     
     def _draw_detection_boxes(self, frame: np.ndarray, processed_data) -> None:
@@ -460,14 +531,17 @@ class DisplayRenderer:
         text_color: tuple = (255, 255, 255),
         bg_color: tuple = (0, 0, 0),
         thickness: int = 1,
-        padding: int = 5
+        padding: int = 5,
+        volatile: bool = False
     ) -> None:
         """绘制带半透明背景的文本
         
-        提高文本在复杂背景下的可读性。
+        提高文本在复杂背景下的可读性。背景只在文本所在区域内就地混合，
+        不复制整帧；文本从精灵缓存混合，volatile=True 表示文本逐帧变化
+        （坐标、FPS、置信度），按字形拼接而不缓存整串。
         """
-        (text_width, text_height), baseline = cv2.getTextSize(
-            text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, thickness
+        (text_width, text_height), baseline = self._text.measure(
+            text, font_scale, thickness, volatile=volatile
         )
         
         x, y = position
@@ -478,19 +552,11 @@ class DisplayRenderer:
         bg_x2 = x + text_width + padding
         bg_y2 = y + baseline + padding
         
-        # 绘制半透明背景
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (bg_x1, bg_y1), (bg_x2, bg_y2), bg_color, -1)
-        alpha = 0.6
-        cv2.addWeighted(overlay, alpha, frame, 1 - alpha, 0, frame)
+        # 绘制半透明背景（仅混合背景矩形区域）
+        blend_rect(frame, (bg_x1, bg_y1), (bg_x2, bg_y2), bg_color, OVERLAY_ALPHA)
         
         # 绘制文本
-        cv2.putText(
-            frame, text, (x, y), 
-            cv2.FONT_HERSHEY_SIMPLEX, 
-            font_scale, text_color, thickness, 
-            cv2.LINE_AA
-        )
+        self._text.draw(frame, text, (x, y), font_scale, text_color, thickness, volatile=volatile)
     
     def _draw_labels(self, frame: np.ndarray, processed_data) -> None:
         """绘制检测标签和置信度"""
@@ -530,7 +596,8 @@ class DisplayRenderer:
             
             self._draw_text_with_background(
                 frame, label_text, (text_x, text_y), font_scale,
-                text_color=(255, 255, 255), bg_color=(0, 0, 0), thickness=thickness
+                text_color=(255, 255, 255), bg_color=(0, 0, 0), thickness=thickness,
+                volatile=self._config.show_confidence
             )
     
     def _draw_coordinates(self, frame: np.ndarray, processed_data) -> None:
@@ -564,7 +631,8 @@ class DisplayRenderer:
             
             self._draw_text_with_background(
                 frame, coord_text, (text_x, text_y), font_scale,
-                text_color=(255, 255, 255), bg_color=(0, 0, 0), thickness=thickness
+                text_color=(255, 255, 255), bg_color=(0, 0, 0), thickness=thickness,
+                volatile=True
             )
     
     def _update_fps(self) -> None:
@@ -612,7 +680,8 @@ class DisplayRenderer:
         
         self._draw_text_with_background(
             frame, fps_text, (10, 30), font_scale=0.7,
-            text_color=(0, 255, 0), bg_color=(0, 0, 0), thickness=2
+            text_color=(0, 255, 0), bg_color=(0, 0, 0), thickness=2,
+            volatile=True
         )
     
     def _draw_device_info(
@@ -634,8 +703,8 @@ class DisplayRenderer:
         
         font_scale = 0.6
         thickness = 1
-        (text_width, text_height), baseline = cv2.getTextSize(
-            device_info_text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, thickness
+        (text_width, text_height), baseline = self._text.measure(
+            device_info_text, font_scale, thickness
         )
         
         # 右上角显示
@@ -686,8 +755,8 @@ class DisplayRenderer:
         # 计算文本位置（窗口底部居中）
         font_scale = 0.5
         thickness = 1
-        (text_width, text_height), baseline = cv2.getTextSize(
-            hint_text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, thickness
+        (text_width, text_height), baseline = self._text.measure(
+            hint_text, font_scale, thickness
         )
         
         # 底部居中显示
@@ -701,22 +770,26 @@ class DisplayRenderer:
     
     # ==================== 深度图处理 ====================
     
-    def _visualize_depth(self, depth_frame: np.ndarray) -> Optional[np.ndarray]:
+    def _visualize_depth(
+        self, depth_frame: np.ndarray, device_id: str = ""
+    ) -> Optional[np.ndarray]:
         """将深度图转换为彩色可视化（使用HOT颜色映射）（子任务 6.1 + 6.2）
         
         处理步骤：
         1. 检查是否启用深度输出（子任务 6.1）
-        2. 清理无效值（NaN、Inf）
+        2. 清理无效值（NaN、Inf），非 uint16 输入转换为 uint16 毫米值
         3. 使用百分位数归一化深度值（避免极值影响）
         4. 应用HOT伪彩色映射
         
-        参考旧实现的百分位数归一化方法，比简单的 cv2.normalize 更鲁棒。
+        百分位数由 DepthColorizer 按设备增量跟踪（降采样直方图 + EMA），
+        归一化与着色合并为一次 uint16 → BGR 查找表索引。
         
         Args:
             depth_frame: 深度帧数据
+            device_id: 设备ID，每个设备独立跟踪深度分布
             
         Returns:
-            彩色深度图，如果未启用深度输出或数据无效则返回 None
+            彩色深度图（复用画布，下一次调用前有效），如果未启用深度输出或数据无效则返回 None
         """
         # 子任务 6.1：检查是否启用深度输出
         if not self._enable_depth_output:
@@ -725,36 +798,29 @@ class DisplayRenderer:
         if depth_frame is None or depth_frame.size == 0:
             return None
         
-        depth_frame = depth_frame.copy()
-        depth_frame[np.isnan(depth_frame)] = 0
-        depth_frame[np.isinf(depth_frame)] = 0
-        
-        # 降采样以提高性能
-        depth_downscaled = depth_frame[::4, ::4]
-        
-        # 归一化深度值（子任务 6.2：确认百分位数归一化逻辑）
-        if self._config.normalize_depth:
-            # 使用百分位数归一化（避免极值影响）
-            if np.all(depth_downscaled == 0):
-                min_depth = 0
-            else:
-                min_depth = np.percentile(depth_downscaled[depth_downscaled != 0], 1)
-            
-            max_depth = np.percentile(depth_downscaled, 99)
-            
-            if max_depth > min_depth:
-                depth_normalized = np.interp(
-                    depth_frame, (min_depth, max_depth), (0, 255)
-                ).astype(np.uint8)
-            else:
-                depth_normalized = np.zeros_like(depth_frame, dtype=np.uint8)
-        else:
-            depth_normalized = (depth_frame / 256).astype(np.uint8)
-        
-        # 子任务 6.2：确认使用 HOT 颜色映射（与旧实现一致）
-        depth_colored = cv2.applyColorMap(depth_normalized, cv2.COLORMAP_HOT)
-        
-        return depth_colored
+        colorizer = self._depth_colorizers.get(device_id)
+        if colorizer is None:
+            colorizer = DepthColorizer(normalize=self._config.normalize_depth)
+            self._depth_colorizers[device_id] = colorizer
+        
+        # 输出写入复用画布，返回值在下一次调用前有效
+        depth_colored = self._get_canvas("depth", depth_frame.shape[:2] + (3,))
+        if depth_frame.dtype == np.uint16:
+            return colorizer.colorize(depth_frame, out=depth_colored)
+        
+        # 非 uint16 输入（如浮点深度）：在池中的暂存区上清理并转换，不修改输入
+        scratch = self._buffer_pool.acquire(depth_frame.shape, np.float32)
+        depth_u16 = self._buffer_pool.acquire(depth_frame.shape, np.uint16)
+        try:
+            np.copyto(scratch, depth_frame, casting="unsafe")
+            if np.issubdtype(depth_frame.dtype, np.floating):
+                scratch[~np.isfinite(scratch)] = 0
+            np.clip(scratch, 0, np.iinfo(np.uint16).max, out=scratch)
+            np.copyto(depth_u16, scratch, casting="unsafe")
+            return colorizer.colorize(depth_u16, out=depth_colored)
+        finally:
+            self._buffer_pool.release(scratch)
+            self._buffer_pool.release(depth_u16)
     
     # ==================== 显示模式 ====================
     
@@ -768,7 +834,10 @@ class DisplayRenderer:
         Returns:
             已经 resize 到目标尺寸（窗口或全屏）的画布，可直接用于 cv2.imshow()
         """
+        # 延迟解码的帧在此处首次物化，解码失败时跳过本帧
         frame = packet.video_frame.rgb_frame
+        if frame is None:
+            return None
         
         # 确定目标尺寸（根据状态 2：视图属性）
         if self._is_fullscreen:
@@ -778,12 +847,9 @@ class DisplayRenderer:
             target_width = self._window_width
             target_height = self._window_height
         
-        # Stretch resize 到目标尺寸（直接拉伸，不保持宽高比）
-        frame_resized = cv2.resize(frame, (target_width, target_height))
-        
-        # 检查可写性
-        if not frame_resized.flags.writeable:
-            frame_resized = frame_resized.copy()
+        # Stretch resize 到目标尺寸（直接拉伸，不保持宽高比），写入复用画布
+        canvas = self._get_canvas("single", (target_height, target_width, 3))
+        frame_resized = self._resize_into(frame, canvas)
         
         # 绘制检测信息（使用归一化坐标映射）
         self._draw_detection_boxes_normalized(
@@ -832,42 +898,44 @@ class DisplayRenderer:
         roiW_left = target_width // 2
         roiW_right = target_width - roiW_left
         
-        rgb_frames = []
-        
-        # 处理每个设备
-        for i, device_id in enumerate(self._devices_list):
+        # 复用画布（尺寸正好是 target_width × target_height），各设备直接 resize 到各自 ROI，
+        # 无需再水平拼接
+        combined = self._get_canvas("combined", (target_height, target_width, 3))
+        rendered_count = 0
+        
+        # 处理每个设备（画布左右两个 ROI）
+        for i, device_id in enumerate(self._devices_list[:2]):
+            # 确定当前设备的 ROI
+            offsetX = 0 if i == 0 else roiW_left
+            roiW = roiW_left if i == 0 else roiW_right
+            roi = combined[:, offsetX:offsetX + roiW]
+            
+            frame = None
             if device_id in packets:
                 packet = packets[device_id]
                 frame = packet.video_frame.rgb_frame
-                
-                # 确定当前设备的 ROI 尺寸
-                roiW = roiW_left if i == 0 else roiW_right
-                
-                # Stretch resize 到 ROI 尺寸（直接拉伸，不保持宽高比）
-                frame_resized = cv2.resize(frame, (roiW, target_height))
-                
-                # 检查可写性
-                if not frame_resized.flags.writeable:
-                    frame_resized = frame_resized.copy()
-                
-                # 添加设备名称标签
-                device_name = packet.processed_detections.device_alias or device_id
-                self._draw_text_with_background(
-                    frame_resized, device_name, (10, 30), 
-                    font_scale=0.7, text_color=(0, 255, 255)
-                )
-                
-                rgb_frames.append(frame_resized)
+            if frame is None:
+                # 无数据或解码失败，该 ROI 显示黑色
+                roi.fill(0)
+                continue
+            
+            # Stretch resize 到 ROI 尺寸（直接拉伸，不保持宽高比）
+            self._resize_into(frame, roi)
+            rendered_count += 1
+            
+            # 添加设备名称标签
+            device_name = packet.processed_detections.device_alias or device_id
+            self._draw_text_with_background(
+                roi, device_name, (10, 30), 
+                font_scale=0.7, text_color=(0, 255, 255)
+            )
         
-        if not rgb_frames:
+        if rendered_count == 0:
             return None
-        
-        # 水平拼接（拼接后的画布尺寸正好是 target_width × target_height）
-        combined = np.hstack(rgb_frames)
 
         # 在最终画布上绘制检测信息（使用归一化坐标映射）
         # 说明：检测框坐标使用归一化坐标（0~1），映射到目标画布 ROI 后，再加 offsetX
-        for i, device_id in enumerate(self._devices_list):
+        for i, device_id in enumerate(self._devices_list[:2]):
             if device_id in packets:
                 packet = packets[device_id]
                 roiW = roiW_left if i == 0 else roiW_right
@@ -885,6 +953,29 @@ class DisplayRenderer:
     
 
     
+    # ==================== 画布管理 ====================
+    
+    def _get_canvas(self, name: str, shape: tuple) -> np.ndarray:
+        """取得按用途复用的 uint8 画布，尺寸变化时归还旧画布并从缓冲区池重新取得
+        
+        返回的画布在下一次以同一用途调用前有效。
+        """
+        canvas = self._canvases.get(name)
+        if canvas is None or canvas.shape != shape:
+            self._buffer_pool.release(canvas)
+            canvas = self._buffer_pool.acquire(shape, np.uint8)
+            self._canvases[name] = canvas
+        return canvas
+    
+    @staticmethod
+    def _resize_into(src: np.ndarray, dst: np.ndarray) -> np.ndarray:
+        """将 src stretch resize 到 dst（可以是画布的 ROI 视图），不分配新的输出数组"""
+        out = cv2.resize(src, (dst.shape[1], dst.shape[0]), dst=dst)
+        if not np.may_share_memory(out, dst):
+            # OpenCV 无法直接写入该视图时退回到拷贝
+            dst[...] = out
+        return dst
+    
     # ==================== 窗口控制 ====================
     
     def _switch_to_device(self, device_role: DeviceRole) -> None:
@@ -0,0 +1,45 @@
+"""
+半透明叠加绘制
+
+只在受影响的矩形区域（ROI）内就地混合纯色背景，不复制整帧、不做整帧混合。
+每个文本背景的开销与其面积成正比，与画布分辨率无关。
+"""
+
+from typing import Tuple
+
+import cv2
+import numpy as np
+
+# 文本背景的默认不透明度（背景色权重）
+OVERLAY_ALPHA = 0.6
+
+
+def blend_rect(
+    frame: np.ndarray,
+    top_left: Tuple[int, int],
+    bottom_right: Tuple[int, int],
+    color: Tuple[int, int, int],
+    alpha: float = OVERLAY_ALPHA,
+) -> None:
+    """
+    在 frame 上就地绘制半透明的填充矩形
+
+    坐标含义与 cv2.rectangle(..., thickness=-1) 一致（包含右下角像素），
+    超出画布的部分被裁剪。
+
+    Args:
+        frame: BGR 画布（H, W, 3），就地修改
+        top_left: 左上角 (x1, y1)
+        bottom_right: 右下角 (x2, y2)
+        color: 填充颜色（BGR）
+        alpha: 填充颜色的权重，0 为完全透明，1 为不透明
+    """
+    height, width = frame.shape[:2]
+    x1, y1 = max(0, top_left[0]), max(0, top_left[1])
+    x2, y2 = min(width, bottom_right[0] + 1), min(height, bottom_right[1] + 1)
+    if x1 >= x2 or y1 >= y2:
+        return
+    roi = frame[y1:y2, x1:x2]
+    fill = np.empty_like(roi)
+    fill[:] = color
+    roi[...] = cv2.addWeighted(fill, alpha, roi, 1.0 - alpha, 0)
@@ -7,10 +7,11 @@
 2. 处理后的检测数据ProcessedDetectionDTO
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum, auto
 import logging
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Deque, Dict, List, Optional
 import threading
 import time
 
@@ -18,8 +19,9 @@ from oak_vision_system.core.dto.data_processing_dto import DeviceProcessedDataDT
 from oak_vision_system.core.dto.detection_dto import VideoFrameDTO
 from oak_vision_system.core.dto.transport_dto import TransportDTO
 from queue import Queue, Empty
-from oak_vision_system.core.event_bus import get_event_bus, EventType
-from oak_vision_system.utils import OverflowQueue
+from oak_vision_system.core.event_bus import get_event_bus, EventType, DispatchMode
+from oak_vision_system.core.tracing import TraceStage, get_latency_tracer
+from oak_vision_system.utils import RingOverflowQueue
 
 
 @dataclass(frozen=True)
@@ -80,25 +82,143 @@ class _PartialMatch:
 
     device_id: str
     frame_id: int
-    first_arrival_ts: float
+    first_arrival_ts: float  # 首次到达时间（time.monotonic()）
     video_frame: Optional[VideoFrameDTO] = None
     processed_detection: Optional[DeviceProcessedDataDTO] = None
 
 
+class _PairingRing:
+    """
+    单设备的配对环。
+
+    - 定长槽位按 frame_id % capacity 索引，查找/插入/删除均为 O(1)，内存有界；
+      槽位冲突时（帧号相差 capacity 的整数倍）后到达者覆盖先到达者
+    - 到达顺序队列用于过期：过期条目只会出现在队首，每个条目入队、出队各一次，
+      过期检查均摊 O(1)；已配对或被覆盖的条目在到达队首时顺带移除
+
+    只由打包线程访问，不加锁。
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self._slots: List[Optional[_PartialMatch]] = [None] * capacity
+        self._arrivals: Deque[_PartialMatch] = deque()
+        self._size = 0
+        # 最近一次配对成功的帧号（latest-only 模式据此丢弃旧帧）
+        self.last_paired_frame_id: Optional[int] = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def get(self, frame_id: int) -> Optional[_PartialMatch]:
+        partial = self._slots[frame_id % self.capacity]
+        if partial is not None and partial.frame_id == frame_id:
+            return partial
+        return None
+
+    def insert(self, partial: _PartialMatch) -> Optional[_PartialMatch]:
+        """插入半配对，返回被覆盖的旧半配对（若有）"""
+        index = partial.frame_id % self.capacity
+        evicted = self._slots[index]
+        self._slots[index] = partial
+        self._arrivals.append(partial)
+        if evicted is None:
+            self._size += 1
+        return evicted
+
+    def remove(self, partial: _PartialMatch) -> None:
+        """移除半配对（其到达队列条目延迟到队首时移除）"""
+        index = partial.frame_id % self.capacity
+        if self._slots[index] is partial:
+            self._slots[index] = None
+            self._size -= 1
+
+    def _is_live(self, partial: _PartialMatch) -> bool:
+        return self._slots[partial.frame_id % self.capacity] is partial
+
+    def expire(self, deadline: float) -> int:
+        """丢弃首次到达早于 deadline 的半配对，返回丢弃数量"""
+        dropped = 0
+        arrivals = self._arrivals
+        while arrivals:
+            head = arrivals[0]
+            if self._is_live(head):
+                if head.first_arrival_ts >= deadline:
+                    break
+                self.remove(head)
+                dropped += 1
+            arrivals.popleft()
+        return dropped
+
+    def discard_older_than(self, frame_id: int) -> int:
+        """
+        丢弃到达队列头部帧号小于 frame_id 的半配对，返回丢弃数量
+
+        帧号与到达顺序基本一致，遇到更新的帧即停止；乱序残留的旧帧由过期或下一次调用处理。
+        """
+        dropped = 0
+        arrivals = self._arrivals
+        while arrivals:
+            head = arrivals[0]
+            if self._is_live(head):
+                if head.frame_id >= frame_id:
+                    break
+                self.remove(head)
+                dropped += 1
+            arrivals.popleft()
+        return dropped
+
+    def clear(self) -> int:
+        """清空所有半配对，返回清除数量"""
+        dropped = self._size
+        self._slots = [None] * self.capacity
+        self._arrivals.clear()
+        self._size = 0
+        self.last_paired_frame_id = None
+        return dropped
+
+
 class RenderPacketPackager:
     """渲染数据包打包器"""
-    def __init__(self, *, queue_maxsize: int = 8, timeout_sec: float = 0.2, devices_list: list[str] = [], cache_max_age_sec: float = 1.0):
+    def __init__(
+        self,
+        *,
+        queue_maxsize: int = 8,
+        timeout_sec: float = 0.2,
+        devices_list: list[str] = [],
+        cache_max_age_sec: float = 1.0,
+        pairing_capacity: int = 32,
+        latest_only: bool = False,
+    ):
+        """
+        Args:
+            queue_maxsize: 事件输入队列与每个设备渲染包队列的最大长度
+            timeout_sec: 配对等待的超时时长（秒）
+            devices_list: 设备ID列表
+            cache_max_age_sec: 缓存帧的最大年龄（秒）
+            pairing_capacity: 每个设备配对环的槽位数，需大于检测数据相对视频帧的最大滞后帧数
+            latest_only: 只保留最新帧：某帧配对成功后立即丢弃更早的半配对，
+                         并丢弃之后到达的更早帧数据
+        """
+        if pairing_capacity <= 0:
+            raise ValueError("pairing_capacity 必须 > 0")
+
         # 获取事件总线实例（用于后续扩展和消息通信，可选，不依赖事件总线也可运行）
         self.event_bus = get_event_bus()
 
         # 事件输入队列，存储RawDataEvent。设置最大长度防止内存泄漏
-        self.event_queue: OverflowQueue[RawDataEvent] = OverflowQueue(maxsize=queue_maxsize)
+        # 视频帧与检测数据来自不同的发布线程，使用 mpmc 模式
+        self.event_queue: RingOverflowQueue[RawDataEvent] = RingOverflowQueue(maxsize=queue_maxsize, mode="mpmc")
 
         # 用于存储输出的渲染包队列。
-        self.packet_queue: Dict[str, OverflowQueue[RenderPacket]] = self._init_inner_queue(devices_list,maxsize=queue_maxsize)
+        self.packet_queue: Dict[str, RingOverflowQueue[RenderPacket]] = self._init_inner_queue(devices_list,maxsize=queue_maxsize)
 
-        # 内部缓存：用于临时存储未配对的视频帧和检测结果，key为(device_id, frame_id)
-        self._buffer: Dict[Tuple[str, int], _PartialMatch] = {}
+        # 内部缓存：每个设备一个定长配对环，临时存储未配对的视频帧和检测结果
+        self.pairing_capacity = pairing_capacity
+        self.latest_only = latest_only
+        self._rings: Dict[str, _PairingRing] = {
+            device_id: _PairingRing(pairing_capacity) for device_id in devices_list
+        }
 
         # 内部缓存：用于临时存储旧帧
         self._latest_packets: Dict[str, RenderPacket] = self._init_latest_packets(devices_list)
@@ -106,6 +226,9 @@ class RenderPacketPackager:
         # 缓存时间戳：记录每个设备缓存帧的时间
         self._packet_timestamps: Dict[str, float] = {device_id: 0.0 for device_id in devices_list}
 
+        # 分阶段延迟追踪（未启用时打点立即返回）
+        self._tracer = get_latency_tracer()
+
         # 线程控制事件，指示打包线程的运行状态
         self._running = threading.Event()
         
@@ -125,7 +248,8 @@ class RenderPacketPackager:
         # 统计数据：成功配对包数和丢弃包数（需求 13.4）
         self._stats = {
             "render_packets": 0,
-            "drops": 0,
+            "drops": 0,  # 超时、槽位覆盖或被更新帧取代而丢弃的半配对
+            "duplicates": 0,  # 重复到达的数据（保留最新一份）
         }
         self._stats_lock = threading.Lock()  # 线程安全保护（需求 13.4）
         # 事件订阅ID（用于取消订阅）
@@ -138,8 +262,9 @@ class RenderPacketPackager:
         # 日志模块
         self.logger = logging.getLogger(__name__)
 
-        self.logger.info("渲染包打包器已初始化，队列最大长度: %d, 超时时间: %.2f 秒, 缓存最大年龄: %.2f 秒", 
-                        queue_maxsize, timeout_sec, cache_max_age_sec)
+        self.logger.info("渲染包打包器已初始化，队列最大长度: %d, 超时时间: %.2f 秒, 缓存最大年龄: %.2f 秒, "
+                         "配对环容量: %d, 仅最新帧: %s",
+                        queue_maxsize, timeout_sec, cache_max_age_sec, pairing_capacity, latest_only)
 
     
 
@@ -148,10 +273,19 @@ class RenderPacketPackager:
 
     #------私有接口------
     def _subscribe_event(self):
-        """订阅数据源模块的视频帧，订阅数据处理模块发布的数据帧"""
+        """订阅数据源模块的视频帧，订阅数据处理模块发布的数据帧
+
+        两个回调都只做入队，使用 INLINE 模式在发布者线程直接执行。
+        """
 
-        self._video_frame_sub_id = self.event_bus.subscribe(EventType.RAW_FRAME_DATA, self._handle_video_frame)
-        self._processed_data_sub_id = self.event_bus.subscribe(EventType.PROCESSED_DATA, self._handle_processed_data)
+        self._video_frame_sub_id = self.event_bus.subscribe(
+            EventType.RAW_FRAME_DATA, self._handle_video_frame,
+            dispatch_mode=DispatchMode.INLINE,
+        )
+        self._processed_data_sub_id = self.event_bus.subscribe(
+            EventType.PROCESSED_DATA, self._handle_processed_data,
+            dispatch_mode=DispatchMode.INLINE,
+        )
 
 
     def _handle_processed_data(self,processed_data:DeviceProcessedDataDTO):
@@ -193,8 +327,12 @@ class RenderPacketPackager:
         初始化内部队列的方法
         
         初始化内部队列，用于存放设备渲染包。
+        每个设备队列只有打包线程写入、渲染线程读取，使用无锁的 spsc 模式。
         """
-        return {device_id: OverflowQueue[RenderPacket](maxsize=maxsize) for device_id in devices_list}
+        return {
+            device_id: RingOverflowQueue[RenderPacket](maxsize=maxsize, mode="spsc")
+            for device_id in devices_list
+        }
 
 
 
@@ -202,18 +340,18 @@ class RenderPacketPackager:
 
 
     def _clean_buffer(self):
-        """清理缓冲区的过期数据"""
-        now = time.time()
+        """清理各设备配对环中的过期数据（每个环均摊 O(1)）"""
+        deadline = time.monotonic() - self.timeout_sec
         drops_count = 0
-        for key, value in list(self._buffer.items()):
-            if now - value.first_arrival_ts > self.timeout_sec:
-                self._buffer.pop(key, None)
-                drops_count += 1
-        
+        for ring in self._rings.values():
+            drops_count += ring.expire(deadline)
+        self._add_drops(drops_count)
+
+    def _add_drops(self, count: int) -> None:
         # 线程安全地更新统计数据（需求 13.4）
-        if drops_count > 0:
+        if count > 0:
             with self._stats_lock:
-                self._stats["drops"] += drops_count
+                self._stats["drops"] += count
 
 
     def _process_event(self):
@@ -246,45 +384,61 @@ class RenderPacketPackager:
             new_video = None
             new_detection = event.pro_data
         
-        key = (device_id, frame_id)
-        partial_match = self._buffer.get(key)
+        ring = self._rings.get(device_id)
+        if ring is None:
+            ring = self._rings[device_id] = _PairingRing(self.pairing_capacity)
         
-        # 情况1：首次到达，创建半配对
+        last_paired = ring.last_paired_frame_id
+        if last_paired is not None and frame_id <= last_paired:
+            if frame_id < last_paired - ring.capacity:
+                # 帧号大幅回退：设备重连后重新计数，丢弃旧状态
+                self._add_drops(ring.clear())
+            elif self.latest_only:
+                # 已有更新的帧配对成功，旧帧数据直接丢弃
+                self._add_drops(1)
+                return
+        
+        partial_match = ring.get(frame_id)
+        
+        # 情况1：首次到达，创建半配对（槽位被其他帧占用时覆盖之）
         if partial_match is None:
-            self._buffer[key] = _PartialMatch(
+            evicted = ring.insert(_PartialMatch(
                 device_id=device_id,
                 frame_id=frame_id,
-                first_arrival_ts=time.time(),
+                first_arrival_ts=time.monotonic(),
                 video_frame=new_video,
                 processed_detection=new_detection
-            )
+            ))
+            if evicted is not None:
+                self._add_drops(1)
             return
         
-        # 情况2：配对成功，生成渲染包
-        if self._can_create_packet(partial_match, new_video, new_detection):
-            packet = self._create_render_packet(partial_match, new_video, new_detection)
-            self.packet_queue[device_id].put_with_overflow(packet)
-            self._buffer.pop(key)
-            # 线程安全地更新统计数据（需求 13.4）
+        # 情况2：重复到达，保留最新数据继续等待配对
+        if (new_video is not None and partial_match.video_frame is not None) or (
+            new_detection is not None and partial_match.processed_detection is not None
+        ):
+            if new_video is not None:
+                partial_match.video_frame = new_video
+            else:
+                partial_match.processed_detection = new_detection
             with self._stats_lock:
-                self._stats["render_packets"] += 1
+                self._stats["duplicates"] += 1
+            data_type_name = "视频帧" if new_video else "检测数据"
+            self.logger.debug("重复的%s：device_id=%s, frame_id=%d", data_type_name, device_id, frame_id)
             return
         
-        # 情况3：重复数据错误
-        data_type_name = "视频帧" if new_video else "检测数据"
-        raise ValueError(f"检测到重复的{data_type_name}：device_id={device_id}, frame_id={frame_id}")
-
-    def _can_create_packet(
-        self, 
-        partial: _PartialMatch, 
-        new_video: Optional[VideoFrameDTO],
-        new_detection: Optional[DeviceProcessedDataDTO]
-    ) -> bool:
-        """判断是否可以创建渲染包"""
-
-        has_video = bool(partial.video_frame or new_video)
-        has_detection = bool(partial.processed_detection or new_detection)
-        return has_video and has_detection
+        # 情况3：配对成功，生成渲染包
+        packet = self._create_render_packet(partial_match, new_video, new_detection)
+        self._tracer.stamp(TraceStage.PACKAGER_PAIR, packet.video_frame.capture_ts)
+        self.packet_queue[device_id].put_with_overflow(packet)
+        ring.remove(partial_match)
+        if ring.last_paired_frame_id is None or frame_id > ring.last_paired_frame_id:
+            ring.last_paired_frame_id = frame_id
+        if self.latest_only:
+            self._add_drops(ring.discard_older_than(frame_id))
+        # 线程安全地更新统计数据（需求 13.4）
+        with self._stats_lock:
+            self._stats["render_packets"] += 1
 
     def _create_render_packet(
         self,
@@ -400,8 +554,9 @@ class RenderPacketPackager:
                         except:
                             break
                 
-                # 清理缓冲区
-                self._buffer.clear()
+                # 清理配对环
+                for ring in self._rings.values():
+                    ring.clear()
                 
                 # 清理缓存
                 for device_id in self._latest_packets.keys():
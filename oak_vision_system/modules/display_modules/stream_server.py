@@ -0,0 +1,324 @@
+"""
+MJPEG 视频流服务（无显示器时替代 cv2.imshow）
+
+渲染器把合成好的帧（已绘制检测框、标签等叠加信息）交给 MjpegStreamServer：
+- submit() 只复制一次帧并提交到编码线程池，立即返回；编码线程全忙或没有观看者时直接跳过，
+  渲染循环永远不会被编码或网络阻塞
+- 编码结果只保留最新一帧；每个客户端在自己的 HTTP 线程中等待比已发送帧更新的帧，
+  慢客户端只会跳过中间帧，不影响渲染器和其他客户端
+
+HTTP 接口：
+- /        简单的观看页面
+- /stream  multipart/x-mixed-replace MJPEG 流（浏览器、VLC、ffplay 可直接打开）
+- /snapshot.jpg  单帧 JPEG
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+from oak_vision_system.utils import get_frame_buffer_pool
+
+logger = logging.getLogger(__name__)
+
+# multipart 分隔符
+_BOUNDARY = "oakframe"
+# 客户端等待新帧的超时（秒），超时后检查服务是否已停止
+_CLIENT_WAIT_S = 1.0
+# 客户端套接字超时（秒），卡死的连接在此时间后被丢弃
+_CLIENT_SOCKET_TIMEOUT_S = 10.0
+
+_INDEX_HTML = (
+    b"<!DOCTYPE html><html><head><meta charset='utf-8'><title>OAK Vision</title></head>"
+    b"<body style='margin:0;background:#000'>"
+    b"<img src='/stream' style='width:100%;height:auto'></body></html>"
+)
+
+
+class MjpegStreamServer:
+    """
+    HTTP MJPEG 视频流服务
+
+    使用方式：
+    - start() 启动 HTTP 服务线程和编码线程池
+    - 渲染循环每帧调用 submit(frame)
+    - stop() 断开所有客户端并停止服务
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        jpeg_quality: int = 80,
+        encoder_threads: int = 2,
+    ) -> None:
+        """
+        Args:
+            host: 监听地址（"0.0.0.0" 允许局域网访问）
+            port: 监听端口（0 表示由系统分配，见 address）
+            jpeg_quality: JPEG 编码质量（1-100）
+            encoder_threads: 编码线程数，也是同时在编码中的最大帧数
+        """
+        if not 1 <= jpeg_quality <= 100:
+            raise ValueError("jpeg_quality 必须在 1-100 范围内")
+        if encoder_threads <= 0:
+            raise ValueError("encoder_threads 必须 > 0")
+        self._host = host
+        self._port = port
+        self._encode_params = [int(cv2.IMWRITE_JPEG_QUALITY), jpeg_quality]
+        self._encoder_threads = encoder_threads
+        self._buffer_pool = get_frame_buffer_pool()
+
+        # 最新编码帧，按提交序号只前进不后退（编码线程可能乱序完成）
+        self._frame_ready = threading.Condition()
+        self._latest_seq = 0
+        self._latest_jpeg: bytes = b""
+        self._submit_seq = 0
+        self._in_flight = 0
+        self._viewers = 0
+        self._stopping = False
+        self._stats = {
+            "frames_submitted": 0,
+            "frames_encoded": 0,
+            "frames_skipped": 0,   # 编码线程全忙而跳过
+            "client_frames_skipped": 0,  # 客户端发送慢而跳过（所有客户端合计）
+        }
+
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> Optional[Tuple[str, int]]:
+        """实际监听的 (地址, 端口)，未启动时为 None"""
+        if self._httpd is None:
+            return None
+        host, port = self._httpd.server_address[:2]
+        return host, port
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    # ==================== 生命周期 ====================
+
+    def start(self) -> bool:
+        """启动 HTTP 服务线程和编码线程池（幂等）"""
+        if self.is_running:
+            return True
+        try:
+            httpd = ThreadingHTTPServer((self._host, self._port), _StreamRequestHandler)
+        except OSError as e:
+            logger.error("视频流服务启动失败 (%s:%d): %s", self._host, self._port, e)
+            return False
+        httpd.daemon_threads = True
+        httpd.stream_server = self
+        self._httpd = httpd
+        with self._frame_ready:
+            self._stopping = False
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._encoder_threads, thread_name_prefix="MjpegEncoder"
+        )
+        self._thread = threading.Thread(
+            target=httpd.serve_forever, kwargs={"poll_interval": 0.2},
+            name="MjpegStreamServer", daemon=True,
+        )
+        self._thread.start()
+        host, port = self.address
+        logger.info("视频流服务已启动: http://%s:%d/stream", host, port)
+        return True
+
+    def stop(self, timeout: float = 2.0) -> bool:
+        """断开所有客户端，停止 HTTP 服务和编码线程池（幂等）"""
+        if self._httpd is None:
+            return True
+        with self._frame_ready:
+            self._stopping = True
+            self._frame_ready.notify_all()
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=timeout)
+            if thread.is_alive():
+                logger.error("视频流服务线程停止超时 (%ss)", timeout)
+                return False
+        self._httpd = None
+        self._thread = None
+        logger.info("视频流服务已停止，统计: %s", self.get_stats())
+        return True
+
+    # ==================== 渲染线程接口 ====================
+
+    def submit(self, frame: np.ndarray) -> bool:
+        """
+        提交一帧合成画面进行编码（不阻塞）
+
+        帧内容会被复制，调用方可以立即复用 frame。
+
+        Returns:
+            bool: 是否提交编码；没有观看者或编码线程全忙时返回 False
+        """
+        executor = self._executor
+        with self._frame_ready:
+            if executor is None or self._stopping:
+                return False
+            self._stats["frames_submitted"] += 1
+            if self._viewers == 0:
+                return False
+            if self._in_flight >= self._encoder_threads:
+                self._stats["frames_skipped"] += 1
+                return False
+            self._in_flight += 1
+            self._submit_seq += 1
+            seq = self._submit_seq
+
+        buf = self._buffer_pool.acquire(frame.shape, frame.dtype)
+        np.copyto(buf, frame)
+        try:
+            executor.submit(self._encode, seq, buf)
+        except RuntimeError:
+            # 编码线程池已关闭（stop() 与 submit() 并发）
+            self._buffer_pool.release(buf)
+            with self._frame_ready:
+                self._in_flight -= 1
+            return False
+        return True
+
+    def get_stats(self) -> dict:
+        """获取统计信息（提交、编码、跳过帧数以及当前观看者数）"""
+        with self._frame_ready:
+            stats = dict(self._stats)
+            stats["viewers"] = self._viewers
+        return stats
+
+    # ==================== 编码线程 ====================
+
+    def _encode(self, seq: int, buf: np.ndarray) -> None:
+        jpeg = None
+        try:
+            ok, encoded = cv2.imencode(".jpg", buf, self._encode_params)
+            if ok:
+                jpeg = encoded.tobytes()
+        except Exception:
+            logger.exception("JPEG 编码失败")
+        finally:
+            self._buffer_pool.release(buf)
+
+        with self._frame_ready:
+            self._in_flight -= 1
+            if jpeg is not None and seq > self._latest_seq:
+                self._latest_seq = seq
+                self._latest_jpeg = jpeg
+                self._stats["frames_encoded"] += 1
+                self._frame_ready.notify_all()
+
+    # ==================== 客户端线程 ====================
+
+    def _add_viewer(self, delta: int) -> int:
+        """增减观看者计数，返回当前最新帧序号"""
+        with self._frame_ready:
+            self._viewers += delta
+            return self._latest_seq
+
+    def _wait_frame(self, last_seq: int) -> Optional[Tuple[int, bytes]]:
+        """
+        等待比 last_seq 更新的编码帧
+
+        Returns:
+            (序号, JPEG 数据)；超时返回 (last_seq, b"")；服务停止时返回 None
+        """
+        with self._frame_ready:
+            self._frame_ready.wait_for(
+                lambda: self._stopping or self._latest_seq > last_seq, _CLIENT_WAIT_S
+            )
+            if self._stopping:
+                return None
+            if self._latest_seq <= last_seq:
+                return last_seq, b""
+            skipped = self._latest_seq - last_seq - 1
+            if last_seq > 0 and skipped > 0:
+                self._stats["client_frames_skipped"] += skipped
+            return self._latest_seq, self._latest_jpeg
+
+
+class _StreamRequestHandler(BaseHTTPRequestHandler):
+    """HTTP 请求处理（每个客户端一个线程）"""
+
+    timeout = _CLIENT_SOCKET_TIMEOUT_S
+
+    def do_GET(self) -> None:
+        stream: MjpegStreamServer = self.server.stream_server
+        path = self.path.split("?", 1)[0]
+        if path == "/stream":
+            self._serve_stream(stream)
+        elif path == "/snapshot.jpg":
+            self._serve_snapshot(stream)
+        elif path in ("/", "/index.html"):
+            self._send_body(200, "text/html; charset=utf-8", _INDEX_HTML)
+        else:
+            self.send_error(404)
+
+    def _serve_stream(self, stream: MjpegStreamServer) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", f"multipart/x-mixed-replace; boundary={_BOUNDARY}")
+        self.send_header("Cache-Control", "no-cache, no-store")
+        self.send_header("Connection", "close")
+        self.end_headers()
+
+        stream._add_viewer(1)
+        logger.info("视频流客户端已连接: %s", self.client_address[0])
+        try:
+            last_seq = 0
+            while True:
+                frame = stream._wait_frame(last_seq)
+                if frame is None:
+                    break
+                last_seq, jpeg = frame
+                if not jpeg:
+                    continue
+                self.wfile.write(
+                    f"--{_BOUNDARY}\r\nContent-Type: image/jpeg\r\n"
+                    f"Content-Length: {len(jpeg)}\r\n\r\n".encode("ascii")
+                )
+                self.wfile.write(jpeg)
+                self.wfile.write(b"\r\n")
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError, TimeoutError):
+            pass
+        finally:
+            stream._add_viewer(-1)
+            logger.info("视频流客户端已断开: %s", self.client_address[0])
+
+    def _serve_snapshot(self, stream: MjpegStreamServer) -> None:
+        # 没有观看者时不编码，缓存的最新帧可能已过期，等待下一帧
+        last_seq = stream._add_viewer(1)
+        try:
+            frame = stream._wait_frame(last_seq)
+        finally:
+            stream._add_viewer(-1)
+        if not frame or not frame[1]:
+            self.send_error(503, "no frame available")
+            return
+        self._send_body(200, "image/jpeg", frame[1])
+
+    def _send_body(self, code: int, content_type: str, body: bytes) -> None:
+        self.send_response(code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-cache, no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug("%s - %s", self.client_address[0], format % args)
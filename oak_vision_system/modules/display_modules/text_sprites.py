@@ -0,0 +1,203 @@
+"""
+文本精灵缓存
+
+渲染器每帧绘制的文本大多不变（类别名、设备别名、按键提示），逐帧调用
+cv2.getTextSize 和抗锯齿 cv2.putText 会反复光栅化同样的字符串。本模块把文本预先
+光栅化为带覆盖率（alpha）的位图，绘制时只做一次 ROI 内的 NumPy 混合：
+
+- 整串精灵：按 (文本, 字号, 颜色, 线宽) 缓存，LRU 淘汰，适合不常变化的文本
+- 字形图集：频繁变化的数字文本（坐标、FPS、置信度）按单个字符缓存精灵，
+  绘制时按字形前进宽度逐字拼接，缓存条目数只与字符集大小有关
+
+精灵保存预乘颜色 color × alpha 与 1 - alpha，混合为 dst = dst × (1 - alpha) + color × alpha，
+与 cv2.putText 的 LINE_AA 抗锯齿结果一致（字形按整数像素对齐，拼接文本的字距误差小于 1 像素）。
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+import cv2
+import numpy as np
+
+# 整串精灵与字形精灵共用的缓存条目上限
+DEFAULT_MAX_SPRITES = 512
+# 测量单个字符前进宽度时重复的次数（抵消 getTextSize 的整数取整）
+_ADVANCE_SAMPLES = 16
+
+
+@dataclass(frozen=True)
+class _Sprite:
+    """预光栅化的文本位图"""
+
+    premultiplied: np.ndarray  # (h, w, 3) float32，color × alpha
+    inverse_alpha: np.ndarray  # (h, w, 1) float32，1 - alpha
+    pad: int  # 位图相对文本框左上角的留白（像素）
+    size: Tuple[int, int]  # 与 cv2.getTextSize 一致的 (宽, 高)
+    baseline: int
+
+
+class TextSpriteCache:
+    """有界 LRU 文本精灵缓存（单线程使用：渲染线程）"""
+
+    def __init__(
+        self,
+        max_sprites: int = DEFAULT_MAX_SPRITES,
+        font: int = cv2.FONT_HERSHEY_SIMPLEX,
+    ) -> None:
+        """
+        Args:
+            max_sprites: 缓存的精灵数量上限（整串精灵与字形精灵合计）
+            font: Hershey 字体
+        """
+        if max_sprites <= 0:
+            raise ValueError("max_sprites 必须 > 0")
+        self._max_sprites = max_sprites
+        self._font = font
+        self._sprites: "OrderedDict[tuple, _Sprite]" = OrderedDict()
+        # (字符, 字号, 线宽) -> 前进宽度（浮点像素）
+        self._advances: Dict[Tuple[str, float, int], float] = {}
+        # (字号, 线宽) -> (高, 基线)，Hershey 字体的高度与字符无关
+        self._metrics: Dict[Tuple[float, int], Tuple[int, int]] = {}
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    # ==================== 测量 ====================
+
+    def measure(
+        self,
+        text: str,
+        font_scale: float,
+        thickness: int = 1,
+        volatile: bool = False,
+    ) -> Tuple[Tuple[int, int], int]:
+        """
+        测量文本尺寸，返回值与 cv2.getTextSize 相同：((宽, 高), 基线)
+
+        Args:
+            volatile: 是否为频繁变化的文本；为 True 时按字形前进宽度累加，不缓存整串
+        """
+        if volatile:
+            height, baseline = self._font_metrics(font_scale, thickness)
+            width = int(round(sum(self._advance(ch, font_scale, thickness) for ch in text) + thickness))
+            return (width, height), baseline
+        sprite = self._sprite(text, font_scale, (255, 255, 255), thickness)
+        return sprite.size, sprite.baseline
+
+    # ==================== 绘制 ====================
+
+    def draw(
+        self,
+        frame: np.ndarray,
+        text: str,
+        org: Tuple[int, int],
+        font_scale: float,
+        color: Tuple[int, int, int],
+        thickness: int = 1,
+        volatile: bool = False,
+    ) -> None:
+        """
+        在 frame 上就地绘制文本，org 与 cv2.putText 一致（文本基线左端）
+
+        Args:
+            volatile: 是否为频繁变化的文本；为 True 时使用字形图集逐字拼接
+        """
+        x, y = int(org[0]), int(org[1])
+        if not volatile:
+            self._blit(frame, self._sprite(text, font_scale, color, thickness), x, y)
+            return
+        cursor = float(x)
+        for ch in text:
+            if ch != " ":
+                self._blit(frame, self._sprite(ch, font_scale, color, thickness), int(round(cursor)), y)
+            cursor += self._advance(ch, font_scale, thickness)
+
+    def get_stats(self) -> dict:
+        """获取缓存统计信息：hits / misses / evictions / sprites"""
+        stats = dict(self._stats)
+        stats["sprites"] = len(self._sprites)
+        return stats
+
+    # ==================== 内部实现 ====================
+
+    def _sprite(
+        self,
+        text: str,
+        font_scale: float,
+        color: Tuple[int, int, int],
+        thickness: int,
+    ) -> _Sprite:
+        key = (text, font_scale, tuple(int(c) for c in color), thickness)
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self._sprites.move_to_end(key)
+            self._stats["hits"] += 1
+            return sprite
+
+        self._stats["misses"] += 1
+        sprite = self._rasterize(text, font_scale, key[2], thickness)
+        self._sprites[key] = sprite
+        if len(self._sprites) > self._max_sprites:
+            self._sprites.popitem(last=False)
+            self._stats["evictions"] += 1
+        return sprite
+
+    def _rasterize(
+        self,
+        text: str,
+        font_scale: float,
+        color: Tuple[int, int, int],
+        thickness: int,
+    ) -> _Sprite:
+        """在黑底上用白色绘制文本，灰度值即抗锯齿覆盖率"""
+        (width, height), baseline = cv2.getTextSize(text, self._font, font_scale, thickness)
+        pad = thickness + 2
+        coverage = np.zeros((height + baseline + 2 * pad, width + 2 * pad), dtype=np.uint8)
+        cv2.putText(
+            coverage, text, (pad, pad + height), self._font, font_scale, 255, thickness, cv2.LINE_AA
+        )
+        alpha = coverage.astype(np.float32)[:, :, None] * (1.0 / 255.0)
+        premultiplied = alpha * np.asarray(color, dtype=np.float32)
+        return _Sprite(
+            premultiplied=premultiplied,
+            inverse_alpha=1.0 - alpha,
+            pad=pad,
+            size=(width, height),
+            baseline=baseline,
+        )
+
+    @staticmethod
+    def _blit(frame: np.ndarray, sprite: _Sprite, x: int, y: int) -> None:
+        """以文本基线左端 (x, y) 为锚点混合精灵，超出画布的部分被裁剪"""
+        left = x - sprite.pad
+        top = y - sprite.size[1] - sprite.pad
+        h, w = sprite.inverse_alpha.shape[:2]
+        frame_h, frame_w = frame.shape[:2]
+        x1, y1 = max(0, left), max(0, top)
+        x2, y2 = min(frame_w, left + w), min(frame_h, top + h)
+        if x1 >= x2 or y1 >= y2:
+            return
+        sx, sy = x1 - left, y1 - top
+        roi = frame[y1:y2, x1:x2]
+        blended = roi * sprite.inverse_alpha[sy:sy + y2 - y1, sx:sx + x2 - x1]
+        blended += sprite.premultiplied[sy:sy + y2 - y1, sx:sx + x2 - x1]
+        blended += 0.5
+        np.copyto(roi, blended, casting="unsafe")
+
+    def _advance(self, ch: str, font_scale: float, thickness: int) -> float:
+        """单个字符的前进宽度（getTextSize 宽度 = 前进宽度之和 + 线宽）"""
+        key = (ch, font_scale, thickness)
+        advance = self._advances.get(key)
+        if advance is None:
+            (width, _), _ = cv2.getTextSize(ch * _ADVANCE_SAMPLES, self._font, font_scale, thickness)
+            advance = self._advances[key] = (width - thickness) / _ADVANCE_SAMPLES
+        return advance
+
+    def _font_metrics(self, font_scale: float, thickness: int) -> Tuple[int, int]:
+        key = (font_scale, thickness)
+        metrics = self._metrics.get(key)
+        if metrics is None:
+            (_, height), baseline = cv2.getTextSize("0", self._font, font_scale, thickness)
+            metrics = self._metrics[key] = (height, baseline)
+        return metrics
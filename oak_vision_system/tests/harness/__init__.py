@@ -6,12 +6,19 @@
 主要组件：
 - BaseTestHarness: 测试工具基类，提供事件订阅、生命周期管理、日志记录框架
 - CollectorReceiver: Collector 数据接收器，使用双队列处理视频帧和检测数据
+- SyntheticLoadGenerator: 合成多设备负载发生器，用于扩展性测试
 """
 
 from oak_vision_system.tests.harness.base_harness import BaseTestHarness
 from oak_vision_system.tests.harness.collector_receiver import CollectorReceiver
+from oak_vision_system.tests.harness.synthetic_source import (
+    SyntheticLoadConfig,
+    SyntheticLoadGenerator,
+)
 
 __all__ = [
     "BaseTestHarness",
     "CollectorReceiver",
+    "SyntheticLoadConfig",
+    "SyntheticLoadGenerator",
 ]
@@ -300,9 +300,7 @@ class BaseTestHarness(ABC):
         
         # 取消所有订阅
         for event_type, subscription_id in self._subscriptions:
-            # TODO: 事件总线需要支持取消订阅
-            # self.event_bus.unsubscribe(event_type, subscription_id)
-            pass
+            self.event_bus.unsubscribe(subscription_id)
         
         self._subscriptions.clear()
         
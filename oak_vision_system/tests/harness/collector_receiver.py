@@ -12,7 +12,11 @@ import numpy as np
 import threading
 
 from oak_vision_system.tests.harness.base_harness import BaseTestHarness
-from oak_vision_system.core.dto.detection_dto import VideoFrameDTO, DeviceDetectionDataDTO
+from oak_vision_system.core.dto.detection_dto import (
+    VideoFrameDTO,
+    DeviceDetectionDataDTO,
+    DeviceDetectionBatch,
+)
 from oak_vision_system.core.event_bus import EventBus, EventType
 from oak_vision_system.utils.data_structures.Queue import OverflowQueue
 import logging
@@ -24,7 +28,7 @@ class CollectorReceiver(BaseTestHarness):
     
     订阅 Collector 发布的两种事件：
     - RAW_FRAME_DATA: 视频帧数据（VideoFrameDTO）
-    - RAW_DETECTION_DATA: 检测数据（DeviceDetectionDataDTO）
+    - RAW_DETECTION_DATA: 检测数据（DeviceDetectionBatch / DeviceDetectionDataDTO）
     
     使用两个独立队列分别缓冲和处理这两种数据。
     
@@ -255,7 +259,10 @@ class CollectorReceiver(BaseTestHarness):
             }
             
             # 类别统计
-            if detection_data.detections:
+            if isinstance(detection_data, DeviceDetectionBatch):
+                values, counts = np.unique(detection_data.labels, return_counts=True)
+                analysis["label_counts"] = {int(v): int(c) for v, c in zip(values, counts)}
+            elif detection_data.detections:
                 labels = [det.label for det in detection_data.detections]
                 analysis["label_counts"] = {label: labels.count(label) for label in set(labels)}
             else:
@@ -0,0 +1,364 @@
+"""
+合成多设备负载发生器
+
+模拟 K 台设备以 F FPS 发布检测数据（可选附带 RGB/深度视频帧），每台设备 N 个运动目标，
+可以像 OAKDataCollector 一样注册到 SystemManager，用于在增加相机之前找出
+DataProcessor、事件总线或显示模块开始跟不上的设备数与目标密度。
+
+合成内容：
+- 目标在设备坐标系内匀速运动，碰到边界反弹（轨迹）
+- 按 person_ratio 比例标记为人员标签，其余为随机的其他标签
+- 每帧每个目标按 dropout_prob 概率漏检
+- 边界框叠加高斯抖动（bbox_jitter，归一化坐标）
+
+统计：
+- 实际发布速率与落后节拍数（发布线程本身跟不上目标 FPS）
+- 分阶段延迟（毫秒，按 (device_id, frame_id) 匹配，time.monotonic() 时钟）：
+    event_bus  : 发布 RAW_DETECTION_DATA → 投递到订阅者
+    processing : RAW_DETECTION_DATA 投递 → 对应的 PROCESSED_DATA 投递（DataProcessor 排队与处理）
+    end_to_end : 发布 RAW_DETECTION_DATA → PROCESSED_DATA 投递
+- monitored_modules 中各模块 get_stats() 的结果（例如 DisplayManager 的帧率与丢帧）
+
+注意：DataProcessor 需要为 device_ids 中的设备提供元数据与角色绑定。
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from oak_vision_system.core.dto.data_processing_dto import DeviceProcessedDataDTO
+from oak_vision_system.core.dto.detection_dto import DeviceDetectionBatch, VideoFrameDTO
+from oak_vision_system.core.event_bus import EventBus, EventType
+from oak_vision_system.tests.harness.base_harness import BaseTestHarness
+
+# 目标运动范围（设备坐标系，毫米）
+_X_RANGE = (-2000.0, 2000.0)
+_Y_RANGE = (-500.0, 500.0)
+_Z_RANGE = (800.0, 6000.0)
+
+# 每个阶段保留的延迟样本数
+_LATENCY_SAMPLES = 10000
+# 等待 PROCESSED_DATA 匹配的已发布帧数上限
+_MAX_INFLIGHT = 4096
+
+
+@dataclass
+class SyntheticLoadConfig:
+    """合成负载配置"""
+
+    num_devices: int = 2  # 设备数 K
+    fps: float = 20.0  # 每台设备的帧率 F
+    objects_per_device: int = 5  # 每台设备的目标数 N
+    person_label: int = 0  # 人员标签
+    person_ratio: float = 0.5  # 人员目标比例
+    num_labels: int = 80  # 标签总数（非人员目标在其中随机选取）
+    dropout_prob: float = 0.05  # 单个目标单帧漏检概率
+    bbox_jitter: float = 0.005  # 边界框抖动标准差（归一化坐标）
+    speed_mm_s: float = 800.0  # 目标最大运动速度（毫米/秒）
+    with_frames: bool = False  # 是否同时发布视频帧
+    with_depth: bool = False  # 视频帧是否附带深度图
+    frame_width: int = 640
+    frame_height: int = 360
+    device_prefix: str = "SYNTH"
+    seed: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if self.num_devices <= 0:
+            raise ValueError("num_devices 必须大于0")
+        if self.fps <= 0:
+            raise ValueError("fps 必须大于0")
+        if self.objects_per_device < 0:
+            raise ValueError("objects_per_device 不能为负数")
+        if not 0.0 <= self.dropout_prob <= 1.0:
+            raise ValueError("dropout_prob 必须在 [0, 1] 范围内")
+        if not 0.0 <= self.person_ratio <= 1.0:
+            raise ValueError("person_ratio 必须在 [0, 1] 范围内")
+
+
+class _SyntheticDevice:
+    """单台模拟设备的目标状态"""
+
+    def __init__(self, device_id: str, config: SyntheticLoadConfig, rng: np.random.Generator):
+        self.device_id = device_id
+        self.frame_id = 0
+        self._config = config
+        self._rng = rng
+
+        n = config.objects_per_device
+        low = np.array([_X_RANGE[0], _Y_RANGE[0], _Z_RANGE[0]])
+        high = np.array([_X_RANGE[1], _Y_RANGE[1], _Z_RANGE[1]])
+        self._low, self._high = low, high
+        self.positions = rng.uniform(low, high, size=(n, 3))
+        self.velocities = rng.uniform(-config.speed_mm_s, config.speed_mm_s, size=(n, 3))
+        self.velocities[:, 1] *= 0.1  # 高度方向变化较小
+
+        is_person = rng.random(n) < config.person_ratio
+        others = rng.integers(0, max(config.num_labels, 1), size=n)
+        others[others == config.person_label] = (config.person_label + 1) % max(config.num_labels, 2)
+        self.labels = np.where(is_person, config.person_label, others).astype(np.float32)
+
+        self._rgb_base: Optional[np.ndarray] = None
+        self._depth_base: Optional[np.ndarray] = None
+        if config.with_frames:
+            h, w = config.frame_height, config.frame_width
+            gradient = np.linspace(0, 255, w, dtype=np.uint8)
+            self._rgb_base = np.ascontiguousarray(np.broadcast_to(gradient[None, :, None], (h, w, 3)))
+            if config.with_depth:
+                self._depth_base = np.full((h, w), int(_Z_RANGE[1]), dtype=np.uint16)
+
+    def step(self, dt: float) -> np.ndarray:
+        """推进一帧，返回 (m, 9) 原始检测行矩阵"""
+        self.positions += self.velocities * dt
+        # 碰到边界反弹
+        over = (self.positions < self._low) | (self.positions > self._high)
+        self.velocities[over] *= -1.0
+        np.clip(self.positions, self._low, self._high, out=self.positions)
+
+        visible = self._rng.random(len(self.positions)) >= self._config.dropout_prob
+        pos = self.positions[visible]
+        m = pos.shape[0]
+        raw = np.empty((m, 9), dtype=np.float32)
+        raw[:, 0] = self.labels[visible]
+        raw[:, 1] = self._rng.uniform(0.5, 0.99, size=m)
+
+        # 简化的针孔投影：中心由 x/z、y/z 决定，尺寸与距离成反比
+        cx = 0.5 + 0.5 * pos[:, 0] / pos[:, 2]
+        cy = 0.5 + 0.5 * pos[:, 1] / pos[:, 2]
+        half = np.clip(150.0 / pos[:, 2], 0.01, 0.25)
+        jitter = self._rng.normal(0.0, self._config.bbox_jitter, size=(m, 4))
+        box = np.stack([cx - half, cy - 2 * half, cx + half, cy + 2 * half], axis=1) + jitter
+        raw[:, 2:6] = np.clip(box, 0.0, 1.0)
+        raw[:, 6:9] = pos
+        return raw
+
+    def make_frame(self, frame_id: int, capture_ts: float) -> VideoFrameDTO:
+        """合成视频帧（延迟复制，模拟采集端的延迟解码）"""
+        rgb_base, depth_base = self._rgb_base, self._depth_base
+        return VideoFrameDTO(
+            device_id=self.device_id,
+            frame_id=frame_id,
+            rgb_loader=rgb_base.copy,
+            depth_loader=depth_base.copy if depth_base is not None else None,
+            capture_ts=capture_ts,
+        )
+
+
+class SyntheticLoadGenerator(BaseTestHarness):
+    """
+    合成多设备负载发生器
+
+    实现 start()/stop()，可直接注册到 SystemManager 作为数据源（priority=10）。
+
+    使用示例：
+        generator = SyntheticLoadGenerator(
+            event_bus,
+            SyntheticLoadConfig(num_devices=4, fps=30, objects_per_device=20),
+            monitored_modules={"display": display_manager},
+        )
+        manager.register_module("synthetic", generator, priority=10)
+        manager.start_all()
+        ...
+        report = generator.get_report()
+    """
+
+    def __init__(
+        self,
+        event_bus: EventBus,
+        config: Optional[SyntheticLoadConfig] = None,
+        *,
+        monitored_modules: Optional[Dict[str, Any]] = None,
+        log_dir: str = "test_logs/synthetic",
+        log_prefix: str = "synthetic",
+    ):
+        """
+        Args:
+            event_bus: 事件总线实例
+            config: 合成负载配置，默认使用 SyntheticLoadConfig()
+            monitored_modules: 需要在报告中附带 get_stats() 的模块（名称 -> 实例）
+            log_dir: 日志保存目录
+            log_prefix: 日志文件名前缀
+        """
+        super().__init__(event_bus=event_bus, log_dir=log_dir, log_prefix=log_prefix)
+        self.config = config or SyntheticLoadConfig()
+        self._monitored = dict(monitored_modules or {})
+
+        rng = np.random.default_rng(self.config.seed)
+        self._devices = [
+            _SyntheticDevice(f"{self.config.device_prefix}-{i:02d}", self.config, rng)
+            for i in range(self.config.num_devices)
+        ]
+        self._device_ids = frozenset(d.device_id for d in self._devices)
+
+        self._stats_lock = threading.Lock()
+        # (device_id, frame_id) -> [发布时刻, RAW_DETECTION_DATA 投递时刻]
+        self._inflight: "OrderedDict[Tuple[str, int], List[Optional[float]]]" = OrderedDict()
+        self._latency: Dict[str, Deque[float]] = {
+            stage: deque(maxlen=_LATENCY_SAMPLES)
+            for stage in ("event_bus", "processing", "end_to_end")
+        }
+        self.batches_published = 0
+        self.frames_published = 0
+        self.detections_published = 0
+        self.late_ticks = 0
+        self._publish_started: Optional[float] = None
+
+    @property
+    def device_ids(self) -> List[str]:
+        """模拟设备ID列表（用于构造 DataProcessor 的设备元数据与绑定）"""
+        return [d.device_id for d in self._devices]
+
+    # ========== 事件订阅相关 ==========
+
+    def _setup_subscriptions(self) -> None:
+        self.subscribe(EventType.RAW_DETECTION_DATA, self._on_raw_detection)
+        self.subscribe(EventType.PROCESSED_DATA, self._on_processed)
+
+    def _on_raw_detection(self, data: DeviceDetectionBatch) -> None:
+        if data.device_id not in self._device_ids:
+            return
+        now = time.monotonic()
+        with self._stats_lock:
+            times = self._inflight.get((data.device_id, data.frame_id))
+            if times is None:
+                return
+            times[1] = now
+            self._latency["event_bus"].append(now - times[0])
+
+    def _on_processed(self, data: DeviceProcessedDataDTO) -> None:
+        if data.device_id not in self._device_ids:
+            return
+        now = time.monotonic()
+        with self._stats_lock:
+            times = self._inflight.pop((data.device_id, data.frame_id), None)
+            if times is None:
+                return
+            published_at, delivered_at = times
+            if delivered_at is not None:
+                self._latency["processing"].append(now - delivered_at)
+            self._latency["end_to_end"].append(now - published_at)
+
+    # ========== 数据生成 ==========
+
+    def _start_workers(self) -> None:
+        worker = threading.Thread(
+            target=self._worker_loop,
+            name=f"{self.__class__.__name__}-Worker",
+            daemon=True,
+        )
+        worker.start()
+        self._worker_threads.append(worker)
+
+    def _worker_loop(self) -> None:
+        period = 1.0 / self.config.fps
+        self._publish_started = time.monotonic()
+        next_tick = self._publish_started
+        while self._running:
+            self._tick(period)
+            next_tick += period
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # 发布线程本身跟不上，不补发，从当前时刻重新计时
+                self.late_ticks += 1
+                next_tick = time.monotonic()
+
+    def _tick(self, dt: float) -> None:
+        capture_ts = time.monotonic()
+        for device in self._devices:
+            frame_id = device.frame_id
+            device.frame_id += 1
+            batch = DeviceDetectionBatch.from_raw(
+                device.device_id, frame_id, device.step(dt), capture_ts=capture_ts
+            )
+            with self._stats_lock:
+                self._inflight[(device.device_id, frame_id)] = [time.monotonic(), None]
+                if len(self._inflight) > _MAX_INFLIGHT:
+                    self._inflight.popitem(last=False)
+            self.event_bus.publish(EventType.RAW_DETECTION_DATA, batch)
+            self.batches_published += 1
+            self.detections_published += batch.detection_count
+
+            if self.config.with_frames:
+                self.event_bus.publish(EventType.RAW_FRAME_DATA, device.make_frame(frame_id, capture_ts))
+                self.frames_published += 1
+
+    # ========== 统计 ==========
+
+    def get_report(self) -> dict:
+        """
+        获取负载报告（不停止发生器）
+
+        Returns:
+            dict:
+                - target_fps / achieved_fps: 每台设备的目标与实际发布帧率
+                - batches_published / frames_published / detections_published / late_ticks
+                - latency_ms: 各阶段延迟统计 {stage: {count, mean, p50, p95, p99, max}}
+                - unmatched: 尚未收到 PROCESSED_DATA 的已发布帧数
+                - modules: monitored_modules 的 get_stats() 结果
+        """
+        elapsed = time.monotonic() - self._publish_started if self._publish_started else 0.0
+        with self._stats_lock:
+            latency = {stage: self._summarize(samples) for stage, samples in self._latency.items()}
+            unmatched = len(self._inflight)
+
+        modules = {}
+        for name, module in self._monitored.items():
+            try:
+                modules[name] = module.get_stats()
+            except Exception as e:
+                modules[name] = {"error": str(e)}
+
+        return {
+            "num_devices": self.config.num_devices,
+            "objects_per_device": self.config.objects_per_device,
+            "target_fps": self.config.fps,
+            "achieved_fps": (
+                self.batches_published / self.config.num_devices / elapsed if elapsed > 0 else 0.0
+            ),
+            "batches_published": self.batches_published,
+            "frames_published": self.frames_published,
+            "detections_published": self.detections_published,
+            "late_ticks": self.late_ticks,
+            "latency_ms": latency,
+            "unmatched": unmatched,
+            "modules": modules,
+        }
+
+    @staticmethod
+    def _summarize(samples: Deque[float]) -> dict:
+        if not samples:
+            return {"count": 0}
+        ms = np.fromiter(samples, dtype=np.float64, count=len(samples)) * 1000.0
+        p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+        return {
+            "count": int(ms.size),
+            "mean": float(ms.mean()),
+            "p50": float(p50),
+            "p95": float(p95),
+            "p99": float(p99),
+            "max": float(ms.max()),
+        }
+
+    # ========== 生命周期管理 ==========
+
+    def stop(self, timeout: float = 5.0) -> dict:
+        """
+        停止发生器并返回负载报告
+
+        Args:
+            timeout: 保留参数，与 SystemManager 调用 stop(timeout=...) 的签名一致
+        """
+        if not self._running:
+            return {}
+        report = self.get_report()
+        self.save_to_log({"type": "synthetic_load_report", **report})
+        stats = super().stop()
+        stats.update(report)
+        return stats
@@ -9,6 +9,7 @@
 
 import pytest
 import time
+from datetime import timedelta
 import numpy as np
 from unittest.mock import Mock, MagicMock, patch
 from typing import List, Dict, Optional
@@ -64,10 +65,23 @@ TEST_MODEL_PATH = get_test_model_path()
 class MockImgFrame:
     """Mock 的 DepthAI ImgFrame 对象"""
     
-    def __init__(self, width: int = 640, height: int = 480, is_depth: bool = False):
+    def __init__(self, width: int = 640, height: int = 480, is_depth: bool = False, sequence_num: int = 0):
         self.width = width
         self.height = height
         self.is_depth = is_depth
+        self.sequence_num = sequence_num
+    
+    def getType(self):
+        """返回帧类型（Mock 帧不是 BGR 交错/平面格式，走 getCvFrame 路径）"""
+        return None
+    
+    def getSequenceNum(self):
+        """返回设备序列号"""
+        return self.sequence_num
+    
+    def getTimestamp(self):
+        """返回与主机同步的采集时间戳"""
+        return timedelta(seconds=time.monotonic())
     
     def getCvFrame(self):
         """返回模拟的 OpenCV 帧"""
@@ -121,7 +135,8 @@ class MockSpatialImgDetection:
 class MockSpatialImgDetections:
     """Mock 的检测结果集合"""
     
-    def __init__(self, num_detections: int = 2):
+    def __init__(self, num_detections: int = 2, sequence_num: int = 0):
+        self.sequence_num = sequence_num
         self.detections = [
             MockSpatialImgDetection(
                 label=i % 2,
@@ -136,6 +151,14 @@ class MockSpatialImgDetections:
             )
             for i in range(num_detections)
         ]
+    
+    def getSequenceNum(self):
+        """返回设备序列号"""
+        return self.sequence_num
+    
+    def getTimestamp(self):
+        """返回与主机同步的采集时间戳"""
+        return timedelta(seconds=time.monotonic())
 
 
 class MockOutputQueue:
@@ -159,6 +182,12 @@ class MockOutputQueue:
             return item
         return None
     
+    def tryGetAll(self):
+        """非阻塞获取全部数据"""
+        items = self.items[self.current_index:]
+        self.current_index = len(self.items)
+        return items
+    
     def get(self):
         """阻塞获取数据（简化实现）"""
         return self.tryGet()
@@ -304,6 +333,8 @@ def mock_device(mock_output_queues):
         return mock_output_queues.get(name)
     
     device.getOutputQueue = Mock(side_effect=get_output_queue)
+    # 事件模式：每次等待都报告所有队列有数据
+    device.getQueueEvents = Mock(side_effect=lambda names, max_events, timeout: list(names))
     
     # 配置上下文管理器
     device.__enter__ = Mock(return_value=device)
@@ -30,6 +30,7 @@ from oak_vision_system.modules.data_collector.collector import OAKDataCollector
 from oak_vision_system.core.dto import (
     VideoFrameDTO,
     DeviceDetectionDataDTO,
+    DeviceDetectionBatch,
 )
 from oak_vision_system.core.dto.config_dto import DeviceRole
 from oak_vision_system.core.event_bus import reset_event_bus
@@ -227,6 +228,53 @@ class TestDataAssembly:
         
         print("✅ 检测数据组装成功")
     
+    def test_assemble_detection_batch(self, test_oak_module_config, event_bus):
+        """测试 6b: 组装列式检测数据批次"""
+        from .conftest import MockSpatialImgDetections
+        
+        collector = OAKDataCollector(
+            config=test_oak_module_config,
+            event_bus=event_bus
+        )
+        
+        mock_detections = MockSpatialImgDetections(num_detections=3)
+        binding = test_oak_module_config.role_bindings[DeviceRole.LEFT_CAMERA]
+        
+        batch = collector._assemble_detection_batch(
+            device_binding=binding,
+            detections_data=mock_detections,
+            frame_id=100
+        )
+        legacy = collector._assemble_detection_data(
+            device_binding=binding,
+            detections_data=mock_detections,
+            frame_id=100
+        )
+        
+        # 验证
+        assert isinstance(batch, DeviceDetectionBatch)
+        assert batch.validate(), batch.get_validation_errors()
+        assert batch.device_id == "test_device_001_mxid"
+        assert batch.frame_id == 100
+        assert batch.device_alias == DeviceRole.LEFT_CAMERA.value
+        assert batch.detection_count == 3
+        
+        expected = DeviceDetectionBatch.from_detection_data(legacy)
+        np.testing.assert_array_equal(batch.labels, expected.labels)
+        np.testing.assert_array_equal(batch.confidence, expected.confidence)
+        np.testing.assert_array_equal(batch.bbox, expected.bbox)
+        np.testing.assert_array_equal(batch.coords_h, expected.coords_h)
+        
+        empty = collector._assemble_detection_batch(
+            device_binding=binding,
+            detections_data=MockSpatialImgDetections(num_detections=0),
+            frame_id=101
+        )
+        assert empty.detection_count == 0
+        assert collector._assemble_detection_batch(binding, None, frame_id=102) is None
+        
+        print("✅ 列式检测数据组装成功")
+    
     def test_assemble_empty_detection_data(self, test_oak_module_config, event_bus):
         """测试 7: 组装空检测数据"""
         from .conftest import MockSpatialImgDetections
@@ -381,14 +429,18 @@ class TestCollectionLoopMock:
         
         # 添加测试数据（3 帧）
         for i in range(3):
-            rgb_queue.add_item(MockImgFrame())
-            det_queue.add_item(MockSpatialImgDetections(num_detections=2))
+            rgb_queue.add_item(MockImgFrame(sequence_num=i))
+            det_queue.add_item(MockSpatialImgDetections(num_detections=2, sequence_num=i))
         
         # 配置 getOutputQueue
         def get_output_queue(name, maxSize=4, blocking=False):
             return mock_output_queues.get(name)
         
         mock_device.getOutputQueue = Mock(side_effect=get_output_queue)
+        # 事件模式：每次等待都报告所有队列有数据
+        mock_device.getQueueEvents = Mock(
+            side_effect=lambda names, max_events, timeout: list(names)
+        )
         mock_device_class.return_value = mock_device
         
         # 创建 Collector 并 Mock Pipeline
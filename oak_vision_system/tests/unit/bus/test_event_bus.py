@@ -14,7 +14,9 @@ import threading
 import pytest
 from unittest.mock import Mock, call
 
-from oak_vision_system.core.event_bus import EventBus, EventType, Priority, get_global_event_bus, reset_global_event_bus
+from oak_vision_system.core.event_bus import (
+    EventBus, EventType, Priority, DispatchMode, get_global_event_bus, reset_global_event_bus
+)
 
 
 class TestEventBusBasics:
@@ -237,6 +239,280 @@ class TestEventBusThreadSafety:
         assert len(received) == 50
 
 
+class TestEventBusDispatchMode:
+    """分发策略测试"""
+
+    def test_inline_runs_on_publisher_thread(self):
+        """测试：INLINE 回调在发布者线程同步执行"""
+        event_bus = EventBus()
+        threads = []
+
+        event_bus.subscribe(
+            EventType.RAW_DETECTION_DATA,
+            lambda d: threads.append(threading.current_thread()),
+            dispatch_mode=DispatchMode.INLINE,
+        )
+
+        # 异步模式下 INLINE 回调也已在 publish 返回前完成
+        count = event_bus.publish(EventType.RAW_DETECTION_DATA, "x")
+
+        assert count == 1
+        assert threads == [threading.current_thread()]
+        event_bus.close()
+
+    def test_inline_exception_isolation(self):
+        """测试：INLINE 回调异常不会抛给发布者，且计入错误数"""
+        event_bus = EventBus()
+        received = []
+
+        def bad_handler(data):
+            raise ValueError("故意的错误")
+
+        event_bus.subscribe(EventType.RAW_FRAME_DATA, bad_handler, dispatch_mode=DispatchMode.INLINE)
+        event_bus.subscribe(EventType.RAW_FRAME_DATA, received.append)
+
+        count = event_bus.publish(EventType.RAW_FRAME_DATA, "test", wait_all=True)
+
+        assert count == 1
+        assert received == ["test"]
+        errors = {s["dispatch_mode"]: s["error_count"] for s in event_bus.list_subscriptions()}
+        assert errors == {"INLINE": 1, "POOL": 0}
+        event_bus.close()
+
+    def test_dedicated_thread_preserves_order(self):
+        """测试：DEDICATED_THREAD 回调在专属线程按发布顺序执行"""
+        event_bus = EventBus()
+        received = []
+        threads = set()
+
+        def handler(data):
+            threads.add(threading.current_thread().name)
+            received.append(data)
+
+        event_bus.subscribe(EventType.PROCESSED_DATA, handler, dispatch_mode=DispatchMode.DEDICATED_THREAD)
+
+        for i in range(99):
+            event_bus.publish(EventType.PROCESSED_DATA, i)
+        count = event_bus.publish(EventType.PROCESSED_DATA, 99, wait_all=True)
+
+        assert count == 1
+        assert received == list(range(100))
+        assert len(threads) == 1
+        assert next(iter(threads)).startswith("EventBusDedicated")
+        event_bus.close()
+
+    def test_unsubscribe_stops_dedicated_thread(self):
+        """测试：取消订阅后专属线程退出"""
+        event_bus = EventBus()
+        sub_id = event_bus.subscribe(
+            EventType.PROCESSED_DATA, lambda d: None, dispatch_mode=DispatchMode.DEDICATED_THREAD
+        )
+        assert any(t.name.startswith("EventBusDedicated") for t in threading.enumerate())
+
+        assert event_bus.unsubscribe(sub_id) is True
+        deadline = time.time() + 2.0
+        while time.time() < deadline and any(
+            t.name.startswith("EventBusDedicated") for t in threading.enumerate()
+        ):
+            time.sleep(0.01)
+        assert not any(t.name.startswith("EventBusDedicated") for t in threading.enumerate())
+        event_bus.close()
+
+    def test_mixed_modes_wait_all(self):
+        """测试：混合分发策略下 wait_all 统计所有成功的订阅者"""
+        event_bus = EventBus()
+        received = []
+        lock = threading.Lock()
+
+        def handler(data):
+            with lock:
+                received.append(data)
+
+        for mode in DispatchMode:
+            event_bus.subscribe(EventType.RAW_FRAME_DATA, handler, dispatch_mode=mode)
+
+        count = event_bus.publish(EventType.RAW_FRAME_DATA, "m", wait_all=True)
+
+        assert count == 3
+        assert received == ["m", "m", "m"]
+        event_bus.close()
+
+
+class TestEventBusDispatchTable:
+    """发布快照（写时复制）测试"""
+
+    def test_flow_control_blocks_publish(self):
+        """测试：流量控制开启时事件被丢弃，关闭后恢复"""
+        event_bus = EventBus()
+        received = []
+        event_bus.subscribe(EventType.RAW_FRAME_DATA, received.append, dispatch_mode=DispatchMode.INLINE)
+
+        event_bus.set_flow_control(EventType.RAW_FRAME_DATA, True)
+        assert event_bus.is_flow_controlled(EventType.RAW_FRAME_DATA)
+        assert event_bus.publish(EventType.RAW_FRAME_DATA, 1) == 0
+
+        event_bus.set_flow_control(EventType.RAW_FRAME_DATA, False)
+        assert event_bus.publish(EventType.RAW_FRAME_DATA, 2) == 1
+        assert received == [2]
+        event_bus.close()
+
+    def test_subscribe_during_publish_uses_old_snapshot(self):
+        """测试：发布过程中新增订阅不影响本次发布"""
+        event_bus = EventBus()
+        received = []
+
+        def first(data):
+            received.append(("first", data))
+            event_bus.subscribe(EventType.RAW_FRAME_DATA, lambda d: received.append(("late", d)),
+                                dispatch_mode=DispatchMode.INLINE)
+
+        event_bus.subscribe(EventType.RAW_FRAME_DATA, first, dispatch_mode=DispatchMode.INLINE)
+
+        event_bus.publish(EventType.RAW_FRAME_DATA, 1)
+        assert received == [("first", 1)]
+        assert len(event_bus.list_subscriptions(EventType.RAW_FRAME_DATA)) == 2
+        event_bus.close()
+
+    def test_concurrent_publish_counts_exact(self):
+        """测试：多线程并发发布时投递计数不丢失"""
+        event_bus = EventBus()
+        event_bus.subscribe(EventType.RAW_DETECTION_DATA, lambda d: None, dispatch_mode=DispatchMode.INLINE)
+
+        def publish_worker():
+            for i in range(2000):
+                event_bus.publish(EventType.RAW_DETECTION_DATA, i)
+
+        threads = [threading.Thread(target=publish_worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        subs = event_bus.list_subscriptions(EventType.RAW_DETECTION_DATA)
+        assert subs[0]["total_calls"] == 8000
+        event_bus.close()
+
+    def test_publish_after_close_returns_zero(self):
+        """测试：关闭后发布直接返回 0"""
+        event_bus = EventBus()
+        event_bus.subscribe(EventType.RAW_FRAME_DATA, lambda d: None)
+        event_bus.close()
+        assert event_bus.publish(EventType.RAW_FRAME_DATA, "x") == 0
+        assert event_bus.publish_async(EventType.RAW_FRAME_DATA, "x").result() == 0
+
+
+class TestEventBusBatchPublish:
+    """批量发布测试"""
+
+    def test_publish_many_with_batch_callback(self):
+        """测试：提供 batch_callback 的订阅者整批只调用一次"""
+        event_bus = EventBus()
+        batches = []
+        singles = []
+
+        event_bus.subscribe(
+            EventType.RAW_FRAME_DATA, singles.append,
+            batch_callback=lambda items: batches.append(list(items)),
+        )
+
+        count = event_bus.publish_many(EventType.RAW_FRAME_DATA, [1, 2, 3], wait_all=True)
+
+        assert count == 1
+        assert batches == [[1, 2, 3]]
+        assert singles == []
+        assert event_bus.list_subscriptions()[0]["total_calls"] == 3
+        event_bus.close()
+
+    def test_publish_many_falls_back_to_per_item_callback(self):
+        """测试：未提供 batch_callback 时在同一任务内按顺序逐条调用"""
+        event_bus = EventBus()
+        received = []
+        threads = set()
+
+        def handler(data):
+            threads.add(threading.current_thread())
+            received.append(data)
+
+        event_bus.subscribe(EventType.RAW_FRAME_DATA, handler)
+
+        count = event_bus.publish_many(EventType.RAW_FRAME_DATA, range(10), wait_all=True)
+
+        assert count == 1
+        assert received == list(range(10))
+        assert len(threads) == 1
+        event_bus.close()
+
+    def test_publish_many_applies_filter_per_item(self):
+        """测试：过滤函数按条生效"""
+        event_bus = EventBus()
+        batches = []
+
+        event_bus.subscribe(
+            EventType.RAW_DETECTION_DATA, lambda d: None,
+            filter_func=lambda d: d % 2 == 0,
+            batch_callback=batches.append,
+            dispatch_mode=DispatchMode.INLINE,
+        )
+
+        assert event_bus.publish_many(EventType.RAW_DETECTION_DATA, [1, 2, 3, 4]) == 1
+        assert batches == [[2, 4]]
+        # 全部被过滤时不投递
+        assert event_bus.publish_many(EventType.RAW_DETECTION_DATA, [1, 3]) == 0
+        assert event_bus.publish_many(EventType.RAW_DETECTION_DATA, []) == 0
+        event_bus.close()
+
+    def test_batch_callback_exception_isolation(self):
+        """测试：批量回调异常被捕获并计入错误数"""
+        event_bus = EventBus()
+
+        def bad_batch(items):
+            raise ValueError("故意的错误")
+
+        event_bus.subscribe(EventType.RAW_FRAME_DATA, lambda d: None, batch_callback=bad_batch)
+
+        assert event_bus.publish_many(EventType.RAW_FRAME_DATA, [1, 2], wait_all=True) == 0
+        assert event_bus.list_subscriptions()[0]["error_count"] == 1
+        event_bus.close()
+
+    def test_publish_batch_groups_by_type(self):
+        """测试：多类型批量发布按类型分组，组内保持顺序"""
+        event_bus = EventBus()
+        frames = []
+        detections = []
+
+        event_bus.subscribe(EventType.RAW_FRAME_DATA, lambda d: None,
+                            batch_callback=frames.append, dispatch_mode=DispatchMode.INLINE)
+        event_bus.subscribe(EventType.RAW_DETECTION_DATA, detections.append,
+                            dispatch_mode=DispatchMode.DEDICATED_THREAD)
+
+        count = event_bus.publish_batch(
+            [
+                (EventType.RAW_FRAME_DATA, "f0"),
+                (EventType.RAW_DETECTION_DATA, "d0"),
+                (EventType.RAW_FRAME_DATA, "f1"),
+                (EventType.RAW_DETECTION_DATA, "d1"),
+            ],
+            wait_all=True,
+        )
+
+        assert count == 2
+        assert frames == [["f0", "f1"]]
+        assert detections == ["d0", "d1"]
+        event_bus.close()
+
+    def test_publish_many_respects_flow_control(self):
+        """测试：批量发布同样受流量控制"""
+        event_bus = EventBus()
+        batches = []
+        event_bus.subscribe(EventType.RAW_FRAME_DATA, lambda d: None,
+                            batch_callback=batches.append, dispatch_mode=DispatchMode.INLINE)
+        event_bus.set_flow_control(EventType.RAW_FRAME_DATA, True)
+
+        assert event_bus.publish_many(EventType.RAW_FRAME_DATA, [1, 2]) == 0
+        assert batches == []
+        event_bus.close()
+
+
 class TestGlobalEventBus:
     """全局事件总线测试"""
     
@@ -6,6 +6,7 @@
 - BoundingBoxDTO: 边界框数据传输对象  
 - DetectionDTO: 单个检测结果数据传输对象
 - DeviceDetectionDataDTO: 单个设备的检测数据传输对象
+- DeviceDetectionBatch: 单个设备的列式检测数据传输对象
 - VideoFrameDTO: 视频帧数据传输对象
 - OAKDataCollectionDTO: OAK数据采集模块综合数据传输对象
 """
@@ -19,6 +20,7 @@ from oak_vision_system.core.dto import (
     BoundingBoxDTO,
     DetectionDTO,
     DeviceDetectionDataDTO,
+    DeviceDetectionBatch,
     VideoFrameDTO,
     OAKDataCollectionDTO,
 )
@@ -201,6 +203,64 @@ class TestDeviceDetectionDataDTO:
         assert len(device_data.get_validation_errors()) > 0
 
 
+class TestDeviceDetectionBatch:
+    """列式检测数据DTO测试套件"""
+    
+    def test_empty_batch(self):
+        """测试创建空批次"""
+        batch = DeviceDetectionBatch.empty("OAK_001", 7, "left_camera")
+        
+        assert batch.validate() is True, \
+            f"验证失败: {batch.get_validation_errors()}"
+        assert batch.detection_count == 0
+        assert batch.coords_h.shape == (0, 4)
+        assert batch.bbox.dtype == np.float32
+        assert batch.labels.dtype == np.int32
+    
+    def test_from_detection_data_matches_dto(self):
+        """测试由逐对象DTO转换得到的数组与原始数据一致"""
+        detections = [
+            DetectionDTO(
+                label=i,
+                confidence=0.5 + 0.1 * i,
+                bbox=BoundingBoxDTO(xmin=10.0 * i, ymin=20.0, xmax=10.0 * i + 5, ymax=80.0),
+                spatial_coordinates=SpatialCoordinatesDTO(x=100.0 * i, y=50.0, z=300.0),
+            )
+            for i in range(3)
+        ]
+        device_data = DeviceDetectionDataDTO(
+            device_id="OAK_001", frame_id=5, device_alias="left_camera", detections=detections
+        )
+        
+        batch = DeviceDetectionBatch.from_detection_data(device_data)
+        
+        assert batch.validate() is True, \
+            f"验证失败: {batch.get_validation_errors()}"
+        assert batch.detection_count == 3
+        assert batch.device_alias == "left_camera"
+        np.testing.assert_array_equal(batch.labels, [0, 1, 2])
+        np.testing.assert_allclose(batch.confidence, [0.5, 0.6, 0.7], rtol=1e-6)
+        np.testing.assert_allclose(batch.bbox[2], [20.0, 20.0, 25.0, 80.0])
+        np.testing.assert_allclose(batch.coords_h[1], [100.0, 50.0, 300.0, 1.0])
+        np.testing.assert_allclose(batch.coords, batch.coords_h[:, :3])
+        for arr in (batch.labels, batch.confidence, batch.bbox, batch.coords_h):
+            assert arr.flags["C_CONTIGUOUS"]
+    
+    def test_invalid_batch_shapes(self):
+        """测试长度不一致的批次验证失败"""
+        batch = DeviceDetectionBatch(
+            device_id="OAK_001",
+            frame_id=1,
+            labels=np.zeros((2,), dtype=np.int32),
+            confidence=np.zeros((3,), dtype=np.float32),
+            bbox=np.zeros((2, 4), dtype=np.float32),
+            coords_h=np.zeros((2, 3), dtype=np.float32),
+        )
+        
+        assert batch.validate() is False
+        assert len(batch.get_validation_errors()) == 2
+
+
 class TestVideoFrameDTO:
     """视频帧DTO测试套件"""
     
@@ -247,6 +307,50 @@ class TestVideoFrameDTO:
         assert frame.validate() is False
         assert len(frame.get_validation_errors()) > 0
 
+    def test_lazy_video_frame_decodes_on_first_access(self):
+        """测试延迟加载：首次读取时才解码，且只解码一次"""
+        rgb_frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return rgb_frame
+
+        frame = VideoFrameDTO(
+            device_id="OAK_001",
+            frame_id=123,
+            rgb_loader=loader
+        )
+
+        # 校验与 has_rgb 不触发解码
+        assert frame.validate() is True, \
+            f"验证失败: {frame.get_validation_errors()}"
+        assert frame.has_rgb is True
+        assert frame.has_depth is False
+        assert frame.is_materialized is False
+        assert calls == []
+
+        assert frame.rgb_frame is rgb_frame
+        assert frame.rgb_frame is rgb_frame
+        assert len(calls) == 1
+        assert frame.is_materialized is True
+        assert frame.frame_size == (640, 480)
+
+    def test_dropped_lazy_video_frame_never_decodes(self):
+        """测试未被读取的延迟帧不会解码"""
+        def loader():
+            raise AssertionError("不应解码")
+
+        frame = VideoFrameDTO(
+            device_id="OAK_001",
+            frame_id=1,
+            rgb_loader=loader,
+            depth_loader=loader
+        )
+
+        assert frame.has_rgb is True
+        assert frame.has_depth is True
+
 
 class TestOAKDataCollectionDTO:
     """OAK数据采集DTO测试套件"""
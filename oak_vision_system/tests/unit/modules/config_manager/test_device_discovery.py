@@ -452,3 +452,47 @@ class TestPrintDevicesSummary:
         # Assert
         captured = capsys.readouterr()
         assert "产品名: 未知" in captured.out
+
+
+# ==================== 扫描结果缓存测试 ====================
+
+class TestDiscoveryCache:
+    """测试 get_cached_available_devices 的有效期缓存"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        OAKDeviceDiscovery.invalidate_cache()
+        yield
+        OAKDeviceDiscovery.invalidate_cache()
+
+    @patch('depthai.Device.getAllAvailableDevices')
+    def test_cached_result_reused_within_ttl(self, mock_get_all, mock_device_info_list):
+        """测试：有效期内复用上一次扫描结果"""
+        mock_get_all.return_value = mock_device_info_list
+
+        first = OAKDeviceDiscovery.get_cached_available_devices(max_age_s=60.0)
+        second = OAKDeviceDiscovery.get_cached_available_devices(max_age_s=60.0)
+
+        assert [d.mxid for d in second] == [d.mxid for d in first]
+        mock_get_all.assert_called_once()
+
+    @patch('depthai.Device.getAllAvailableDevices')
+    def test_full_scan_refreshes_cache(self, mock_get_all, mock_device_info_list):
+        """测试：get_all_available_devices 的扫描结果被缓存共享"""
+        mock_get_all.return_value = mock_device_info_list
+
+        OAKDeviceDiscovery.get_all_available_devices(verbose=False)
+        devices = OAKDeviceDiscovery.get_cached_available_devices(max_age_s=60.0)
+
+        assert len(devices) == 2
+        mock_get_all.assert_called_once()
+
+    @patch('depthai.Device.getAllAvailableDevices')
+    def test_zero_max_age_forces_rescan(self, mock_get_all, mock_device_info):
+        """测试：max_age_s <= 0 时强制重新扫描"""
+        mock_get_all.return_value = [mock_device_info]
+
+        OAKDeviceDiscovery.get_cached_available_devices(max_age_s=60.0)
+        OAKDeviceDiscovery.get_cached_available_devices(max_age_s=0)
+
+        assert mock_get_all.call_count == 2
@@ -0,0 +1,162 @@
+"""
+测试采集数据捕获文件与回放
+
+验证：
+- 检测批次与视频帧（原始 / JPEG / 深度）写入后可原样读回
+- 末尾不完整的数据块被忽略
+- ReplayCollector 尽快回放时按录制顺序发布全部记录
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+import numpy as np
+
+from oak_vision_system.core.dto import DeviceDetectionBatch, VideoFrameDTO
+from oak_vision_system.core.event_bus import EventType
+from oak_vision_system.modules.data_collector.capture import (
+    CODEC_JPEG,
+    CODEC_RAW,
+    CaptureReader,
+    CaptureWriter,
+)
+from oak_vision_system.modules.data_collector.replay_collector import (
+    REPLAY_AS_FAST_AS_POSSIBLE,
+    ReplayCollector,
+)
+
+
+def _batch(frame_id, n, device_id="dev_a"):
+    return DeviceDetectionBatch(
+        device_id=device_id,
+        frame_id=frame_id,
+        labels=np.arange(n, dtype=np.int32),
+        confidence=np.linspace(0.5, 0.9, n, dtype=np.float32),
+        bbox=np.tile(np.array([0.1, 0.2, 0.3, 0.4], dtype=np.float32), (n, 1)),
+        coords_h=np.tile(np.array([100.0, 200.0, 300.0, 1.0], dtype=np.float32), (n, 1)),
+        device_alias="left",
+        capture_ts=12.5,
+    )
+
+
+class TestCaptureFile(unittest.TestCase):
+    """测试捕获文件的写入与读取"""
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".oakcap")
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_detection_round_trip(self):
+        writer = CaptureWriter(self.path, chunk_bytes=64)  # 小数据块，覆盖跨块读取
+        for i in range(5):
+            writer.write_detections(_batch(i, i), ts=100.0 + i)
+        writer.close()
+
+        reader = CaptureReader(self.path)
+        self.assertEqual(len(reader), 5)
+        self.assertAlmostEqual(reader.duration, 4.0)
+        for i, batch in enumerate(reader):
+            expected = _batch(i, i)
+            self.assertEqual(batch.frame_id, i)
+            self.assertEqual(batch.device_id, "dev_a")
+            self.assertEqual(batch.device_alias, "left")
+            self.assertEqual(batch.capture_ts, 12.5)
+            np.testing.assert_array_equal(batch.labels, expected.labels)
+            np.testing.assert_array_equal(batch.confidence, expected.confidence)
+            np.testing.assert_array_equal(batch.bbox, expected.bbox)
+            np.testing.assert_array_equal(batch.coords_h, expected.coords_h)
+
+    def test_frame_round_trip(self):
+        rgb = np.random.randint(0, 255, (48, 64, 3), dtype=np.uint8)
+        depth = np.random.randint(0, 5000, (48, 64), dtype=np.uint16)
+        writer = CaptureWriter(self.path)
+        writer.write_frame(VideoFrameDTO(device_id="dev_a", frame_id=1, rgb_frame=rgb, depth_frame=depth),
+                           ts=1.0, codec=CODEC_RAW)
+        writer.write_frame(VideoFrameDTO(device_id="dev_a", frame_id=2, rgb_frame=rgb),
+                           ts=2.0, codec=CODEC_JPEG)
+        writer.close()
+
+        reader = CaptureReader(self.path)
+        raw, jpeg = reader.read(0), reader.read(1)
+
+        self.assertFalse(raw.is_materialized)
+        np.testing.assert_array_equal(raw.rgb_frame, rgb)
+        np.testing.assert_array_equal(raw.depth_frame, depth)
+        self.assertIsNone(raw.capture_ts)
+
+        self.assertEqual(jpeg.frame_id, 2)
+        self.assertFalse(jpeg.has_depth)
+        self.assertEqual(jpeg.rgb_frame.shape, rgb.shape)
+
+    def test_truncated_chunk_is_ignored(self):
+        writer = CaptureWriter(self.path)
+        writer.write_detections(_batch(0, 2), ts=1.0)
+        writer.flush()
+        writer.write_detections(_batch(1, 2), ts=2.0)
+        writer.close()
+
+        size = os.path.getsize(self.path)
+        with open(self.path, "r+b") as f:
+            f.truncate(size - 8)
+
+        reader = CaptureReader(self.path)
+        self.assertEqual(len(reader), 1)
+        self.assertEqual(reader.detection_batch(0).frame_id, 0)
+
+    def test_invalid_file(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not a capture file")
+        with self.assertRaises(ValueError):
+            CaptureReader(self.path)
+
+
+class TestReplayCollector(unittest.TestCase):
+    """测试回放采集器"""
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".oakcap")
+        os.close(fd)
+        writer = CaptureWriter(self.path)
+        for i in range(3):
+            writer.write_detections(_batch(i, 1), ts=100.0 + i)
+            writer.write_frame(VideoFrameDTO(device_id="dev_a", frame_id=i,
+                                             rgb_frame=np.zeros((4, 4, 3), dtype=np.uint8)),
+                               ts=100.0 + i, codec=CODEC_RAW)
+        writer.close()
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_replay_as_fast_as_possible(self):
+        event_bus = Mock()
+        replay = ReplayCollector(self.path, event_bus, speed=REPLAY_AS_FAST_AS_POSSIBLE)
+
+        result = replay.start()
+        self.assertEqual(result, {"started": ["dev_a"], "skipped": {}})
+        self.assertTrue(replay.wait_finished(timeout=5.0))
+        self.assertTrue(replay.stop())
+        self.assertTrue(replay.stop())  # 幂等
+
+        published = [(c.args[0], c.args[1].frame_id) for c in event_bus.publish.call_args_list]
+        self.assertEqual(published, [
+            (EventType.RAW_DETECTION_DATA, 0), (EventType.RAW_FRAME_DATA, 0),
+            (EventType.RAW_DETECTION_DATA, 1), (EventType.RAW_FRAME_DATA, 1),
+            (EventType.RAW_DETECTION_DATA, 2), (EventType.RAW_FRAME_DATA, 2),
+        ])
+        self.assertEqual(replay.get_stats()["published"], 6)
+        self.assertFalse(replay.is_running)
+
+    def test_stop_interrupts_realtime_replay(self):
+        replay = ReplayCollector(self.path, Mock(), speed=0.001)  # 按节奏需要数十分钟
+        replay.start()
+        self.assertTrue(replay.stop(timeout=2.0))
+        self.assertLess(replay.get_stats()["published"], 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
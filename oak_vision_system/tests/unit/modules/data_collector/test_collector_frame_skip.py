@@ -0,0 +1,120 @@
+"""
+测试 OAKDataCollector 的背压抽帧逻辑
+
+验证背压限流按设备令牌桶抽帧，而不是墙钟休眠：
+- NORMAL   : 不跳过任何帧
+- THROTTLE : 按队列使用率比例降速，令牌按设备序列号补充
+- PAUSE    : 降到最低速率比例，不再全部跳过
+- 限流优先级为 1 的设备始终满速
+- 消息不带序列号时按相邻一帧补充令牌
+"""
+
+import unittest
+from unittest.mock import Mock
+
+from oak_vision_system.core.dto.config_dto import (
+    OAKModuleConfigDTO,
+    OAKConfigDTO,
+    DeviceRoleBindingDTO,
+)
+from oak_vision_system.core.dto.config_dto.enums import DeviceRole
+from oak_vision_system.core.backpressure import (
+    BackpressureAction,
+    BackpressureEventPayload,
+    BackpressureState,
+)
+from oak_vision_system.modules.data_collector.collector import OAKDataCollector
+
+
+def _message(seq):
+    msg = Mock()
+    msg.getSequenceNum.return_value = seq
+    return msg
+
+
+def _signal(action, usage):
+    return BackpressureEventPayload(
+        queue_id="data_processor_queue",
+        action=action,
+        reason="test",
+        timestamp=0.0,
+        usage=usage,
+        drop_count=0,
+        pressure_level="high",
+        state=BackpressureState.PRESSURED,
+    )
+
+
+class TestCollectorFrameSkip(unittest.TestCase):
+    """测试按令牌桶抽帧的背压处理"""
+
+    def setUp(self):
+        hardware_config = OAKConfigDTO(
+            enable_depth_output=False,
+            hardware_fps=20,
+            collector_mode="event",
+            rate_priorities={DeviceRole.RIGHT_CAMERA.value: 1.0},
+            min_rate_fraction=0.1,
+        )
+        role_bindings = {
+            DeviceRole.LEFT_CAMERA: DeviceRoleBindingDTO(
+                role=DeviceRole.LEFT_CAMERA,
+                active_mxid="test_device_1",
+            ),
+            DeviceRole.RIGHT_CAMERA: DeviceRoleBindingDTO(
+                role=DeviceRole.RIGHT_CAMERA,
+                active_mxid="test_device_2",
+            ),
+        }
+        config = OAKModuleConfigDTO(
+            hardware_config=hardware_config,
+            role_bindings=role_bindings,
+        )
+        self.collector = OAKDataCollector(config=config, event_bus=Mock())
+        self.left = DeviceRole.LEFT_CAMERA.value
+        self.right = DeviceRole.RIGHT_CAMERA.value
+
+    def _skipped(self, role_key, seqs):
+        return [
+            self.collector._should_skip_frame(role_key, _message(s), None)
+            for s in seqs
+        ]
+
+    def test_normal_keeps_every_frame(self):
+        self.collector._handle_backpressure_signal(_signal(BackpressureAction.NORMAL, 0.1))
+        self.assertEqual(self._skipped(self.left, range(6)), [False] * 6)
+
+    def test_throttle_rate_follows_queue_usage(self):
+        # 使用率 0.8：系统速率比例 0.4；右相机保持满速，左相机承担剩余预算
+        self.collector._handle_backpressure_signal(_signal(BackpressureAction.THROTTLE, 0.8))
+        skipped = self._skipped(self.left, range(100))
+        self.assertEqual(skipped.count(False), 10)  # 份额 0.1：首帧使用桶内令牌，之后每 10 帧一帧
+        self.assertEqual(self._skipped(self.right, range(10)), [False] * 10)
+
+    def test_sequence_gap_refills_tokens(self):
+        self.collector._rate_governor.set_fraction(0.5)
+        # 份额 = 0.5 × 2 - 1.0（右相机满速）-> 最低比例 0.1，间隔 10 帧补满一个令牌
+        self.assertEqual(self._skipped(self.left, [0, 1, 11, 12]), [False, True, False, True])
+
+    def test_throttle_uses_detection_sequence_when_rgb_missing(self):
+        self.collector._rate_governor.set_fraction(0.1)
+        self.assertFalse(self.collector._should_skip_frame(self.left, None, _message(7)))
+        self.assertTrue(self.collector._should_skip_frame(self.left, None, _message(8)))
+
+    def test_pause_degrades_instead_of_stalling(self):
+        self.collector._handle_backpressure_signal(_signal(BackpressureAction.PAUSE, 1.0))
+        skipped = self._skipped(self.left, range(1, 41))
+        self.assertEqual(skipped.count(False), 4)
+        self.assertEqual(self._skipped(self.right, range(5)), [False] * 5)
+
+    def test_falls_back_to_one_frame_without_sequence(self):
+        self.collector._rate_governor.set_fraction(0.1)
+        results = [
+            self.collector._should_skip_frame(self.left, None, None)
+            for _ in range(11)
+        ]
+        self.assertEqual(results.count(False), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+"""
+测试 OAKDataCollector 的设备监护与自动重连
+
+验证：
+- 会话运行中失败后按指数退避重连，重连成功后清零连续失败次数
+- 连续失败超过 max_reconnect_attempts 后放弃并停止该设备
+- 未启用 auto_reconnect 或首次启动失败时不重连
+- 状态变化通过 CAMERA_HEARTBEAT 上报
+"""
+
+import unittest
+from unittest.mock import Mock
+
+from oak_vision_system.core.dto import CameraHeartbeatDTO
+from oak_vision_system.core.dto.config_dto import (
+    OAKModuleConfigDTO,
+    OAKConfigDTO,
+    DeviceRoleBindingDTO,
+)
+from oak_vision_system.core.dto.config_dto.enums import DeviceRole
+from oak_vision_system.core.dto.config_dto.system_config_dto import SystemConfigDTO
+from oak_vision_system.core.event_bus import EventType
+from oak_vision_system.modules.data_collector.collector import OAKDataCollector
+
+
+class TestCollectorReconnect(unittest.TestCase):
+    """测试单设备监护线程的重连逻辑"""
+
+    def _make_collector(self, **system_kwargs):
+        config = OAKModuleConfigDTO(
+            hardware_config=OAKConfigDTO(enable_depth_output=False, hardware_fps=20),
+            role_bindings={
+                DeviceRole.LEFT_CAMERA: DeviceRoleBindingDTO(
+                    role=DeviceRole.LEFT_CAMERA, active_mxid="test_device_1",
+                ),
+            },
+        )
+        self.event_bus = Mock()
+        collector = OAKDataCollector(
+            config=config,
+            event_bus=self.event_bus,
+            system_config=SystemConfigDTO(**system_kwargs),
+        )
+        self.binding = config.role_bindings[DeviceRole.LEFT_CAMERA]
+        self.delays = []
+
+        def fake_wait(binding, delay):
+            self.delays.append(delay)
+            return True
+
+        collector._wait_while_running = fake_wait
+        collector._is_mxid_visible = Mock(return_value=True)
+        return collector
+
+    def _script_sessions(self, collector, outcomes):
+        """
+        按顺序模拟每次会话的结果：
+        - "fail_running": 就绪后运行中失败
+        - "fail_boot"   : 就绪前失败
+        - "stop"        : 就绪后收到停止请求正常结束
+        """
+        calls = []
+
+        def session(binding, reconnect=False):
+            calls.append(reconnect)
+            outcome = outcomes[len(calls) - 1]
+            if not reconnect:
+                collector._set_running_state(binding, True)
+            if outcome == "fail_boot":
+                raise RuntimeError("boot error")
+            collector._on_session_ready(binding, reconnect)
+            if outcome == "fail_running":
+                raise RuntimeError("usb disconnected")
+            collector._set_running_state(binding, False)
+
+        collector._start_OAK_with_device = session
+        return calls
+
+    def _heartbeat_states(self):
+        return [
+            c.args[1].state for c in self.event_bus.publish.call_args_list
+            if c.args[0] == EventType.CAMERA_HEARTBEAT
+        ]
+
+    def test_reconnects_with_exponential_backoff(self):
+        collector = self._make_collector(reconnect_interval=1.0, max_reconnect_attempts=5)
+        calls = self._script_sessions(collector, ["fail_running", "fail_boot", "stop"])
+
+        collector._supervise_device(self.binding)
+
+        self.assertEqual(calls, [False, True, True])
+        self.assertEqual(self.delays, [1.0, 2.0])
+        health = collector._health[DeviceRole.LEFT_CAMERA.value]
+        self.assertEqual(health.reconnect_count, 1)
+        self.assertEqual(health.consecutive_failures, 0)
+        self.assertEqual(health.state, "stopped")
+        self.assertEqual(
+            self._heartbeat_states(),
+            ["running", "reconnecting", "reconnecting", "running", "stopped"],
+        )
+
+    def test_gives_up_after_max_attempts(self):
+        collector = self._make_collector(reconnect_interval=1.0, max_reconnect_attempts=2)
+        calls = self._script_sessions(collector, ["fail_running", "fail_boot", "fail_boot"])
+
+        collector._supervise_device(self.binding)
+
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(self.delays, [1.0, 2.0])
+        self.assertEqual(collector._health[DeviceRole.LEFT_CAMERA.value].state, "failed")
+        self.assertFalse(collector._is_running(self.binding))
+        self.assertEqual(self._heartbeat_states()[-1], "failed")
+
+    def test_no_reconnect_when_disabled(self):
+        collector = self._make_collector(auto_reconnect=False)
+        calls = self._script_sessions(collector, ["fail_running"])
+
+        collector._supervise_device(self.binding)
+
+        self.assertEqual(calls, [False])
+        self.assertEqual(self.delays, [])
+        self.assertEqual(collector._health[DeviceRole.LEFT_CAMERA.value].state, "failed")
+
+    def test_first_boot_failure_is_not_retried(self):
+        collector = self._make_collector()
+        calls = self._script_sessions(collector, ["fail_boot"])
+
+        collector._supervise_device(self.binding)
+
+        self.assertEqual(calls, [False])
+        self.assertEqual(self.delays, [])
+
+    def test_waits_for_device_to_reappear(self):
+        collector = self._make_collector(reconnect_interval=1.0, max_reconnect_attempts=5)
+        collector._is_mxid_visible = Mock(side_effect=[False, True])
+        calls = self._script_sessions(collector, ["fail_running", "stop"])
+
+        collector._supervise_device(self.binding)
+
+        # 第一次重连时设备不可见，不打开设备，计为一次失败
+        self.assertEqual(calls, [False, True])
+        self.assertEqual(self.delays, [1.0, 2.0])
+
+    def test_heartbeat_payload(self):
+        collector = self._make_collector()
+        self._script_sessions(collector, ["stop"])
+
+        collector._supervise_device(self.binding)
+
+        heartbeat = self.event_bus.publish.call_args_list[0].args[1]
+        self.assertIsInstance(heartbeat, CameraHeartbeatDTO)
+        self.assertEqual(heartbeat.device_id, "test_device_1")
+        self.assertEqual(heartbeat.device_alias, DeviceRole.LEFT_CAMERA.value)
+        self.assertTrue(heartbeat.validate())
+
+
+if __name__ == "__main__":
+    unittest.main()
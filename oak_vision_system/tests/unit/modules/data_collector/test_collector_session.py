@@ -0,0 +1,78 @@
+"""
+测试 OAKDataCollector 单次设备会话的收尾
+
+验证：
+- 会话结束时帧同步缓冲区中未凑齐的帧被冲刷并发布，不会随会话丢弃
+"""
+
+import unittest
+from unittest.mock import MagicMock, Mock, patch
+
+from oak_vision_system.core.dto.config_dto import (
+    OAKModuleConfigDTO,
+    OAKConfigDTO,
+    DeviceRoleBindingDTO,
+)
+from oak_vision_system.core.dto.config_dto.enums import DeviceRole
+from oak_vision_system.modules.data_collector.collector import OAKDataCollector
+
+
+def _message(seq):
+    msg = Mock()
+    msg.getSequenceNum.return_value = seq
+    return msg
+
+
+class TestCollectorSession(unittest.TestCase):
+    """测试会话循环退出后的帧同步冲刷"""
+
+    def setUp(self):
+        config = OAKModuleConfigDTO(
+            hardware_config=OAKConfigDTO(
+                enable_depth_output=False, hardware_fps=1, collector_mode="polling",
+            ),
+            role_bindings={
+                DeviceRole.LEFT_CAMERA: DeviceRoleBindingDTO(
+                    role=DeviceRole.LEFT_CAMERA, active_mxid="test_device_1",
+                ),
+            },
+        )
+        self.collector = OAKDataCollector(config=config, event_bus=Mock())
+        self.collector._create_pipeline_for_device = Mock(return_value=object())
+        self.collector._maybe_publish_heartbeat = Mock()
+        self.collector._handle_messages = Mock()
+        self.binding = config.role_bindings[DeviceRole.LEFT_CAMERA]
+
+    def _fake_device(self, batches):
+        """每个队列按轮次返回 batches[name] 中的消息列表"""
+        device = MagicMock()
+        device.__enter__.return_value = device
+
+        def get_queue(name, **kwargs):
+            queue = Mock()
+            queue.tryGetAll.side_effect = list(batches[name]) + [[]] * 10
+            return queue
+
+        device.getOutputQueue.side_effect = get_queue
+        return device
+
+    def test_pending_frame_flushed_when_session_ends(self):
+        # 只收到 RGB，检测结果未到达即停止：该帧仍在缓冲区中等待
+        rgb = _message(5)
+        device = self._fake_device({"rgb": [[rgb]], "detections": [[]]})
+        self.collector._is_running = Mock(side_effect=[True, False])
+
+        with patch("oak_vision_system.modules.data_collector.collector.dai") as dai:
+            dai.Device.return_value = device
+            self.collector._start_OAK_with_device(self.binding)
+
+        self.collector._handle_messages.assert_called_once()
+        binding, synced = self.collector._handle_messages.call_args[0]
+        self.assertIs(binding, self.binding)
+        self.assertEqual(synced.seq, 5)
+        self.assertIs(synced.get("rgb"), rgb)
+        self.assertFalse(synced.complete)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+测试 OAKDataCollector 的并行启动
+
+验证：
+- pipeline 按定义只构建一次，所有设备共用
+- start() 等待各设备的就绪屏障，启动失败的设备记入 skipped
+- 所有设备都启动失败时返回 False
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+
+from oak_vision_system.core.dto.config_dto import (
+    OAKModuleConfigDTO,
+    OAKConfigDTO,
+    DeviceRoleBindingDTO,
+)
+from oak_vision_system.core.dto.config_dto.enums import DeviceRole
+from oak_vision_system.modules.data_collector.collector import OAKDataCollector
+
+
+class TestCollectorStartup(unittest.TestCase):
+    """测试并行启动与就绪屏障"""
+
+    def setUp(self):
+        config = OAKModuleConfigDTO(
+            hardware_config=OAKConfigDTO(enable_depth_output=False, hardware_fps=20),
+            role_bindings={
+                DeviceRole.LEFT_CAMERA: DeviceRoleBindingDTO(
+                    role=DeviceRole.LEFT_CAMERA, active_mxid="test_device_1",
+                ),
+                DeviceRole.RIGHT_CAMERA: DeviceRoleBindingDTO(
+                    role=DeviceRole.RIGHT_CAMERA, active_mxid="test_device_2",
+                ),
+            },
+        )
+        self.collector = OAKDataCollector(config=config, event_bus=Mock())
+        self.collector._wait_for_required_mxids_visible = Mock(return_value=True)
+        self.pipeline = object()
+        self.collector._create_pipeline_for_device = Mock(return_value=self.pipeline)
+
+    def _fake_boot(self, failing_roles=()):
+        booted = []
+
+        def boot(binding, reconnect=False):
+            role_key = binding.role.value
+            booted.append(self.collector._get_pipeline(binding))
+            if role_key in failing_roles:
+                self.collector._mark_device_ready(role_key, "boot_failed")
+            else:
+                self.collector._mark_device_ready(role_key)
+
+        return boot, booted
+
+    def test_pipeline_built_once_and_shared(self):
+        boot, booted = self._fake_boot()
+        with patch.object(self.collector, "_start_OAK_with_device", side_effect=boot):
+            result = self.collector.start()
+
+        self.assertEqual(
+            sorted(result["started"]),
+            sorted([DeviceRole.LEFT_CAMERA.value, DeviceRole.RIGHT_CAMERA.value]),
+        )
+        self.collector._create_pipeline_for_device.assert_called_once()
+        self.assertEqual(booted, [self.pipeline, self.pipeline])
+
+    def test_failed_device_is_skipped(self):
+        boot, _ = self._fake_boot(failing_roles={DeviceRole.RIGHT_CAMERA.value})
+        with patch.object(self.collector, "_start_OAK_with_device", side_effect=boot):
+            result = self.collector.start()
+
+        self.assertEqual(result["started"], [DeviceRole.LEFT_CAMERA.value])
+        self.assertEqual(result["skipped"], {DeviceRole.RIGHT_CAMERA.value: "boot_failed"})
+
+    def test_all_devices_failed_returns_false(self):
+        roles = {DeviceRole.LEFT_CAMERA.value, DeviceRole.RIGHT_CAMERA.value}
+        boot, _ = self._fake_boot(failing_roles=roles)
+        with patch.object(self.collector, "_start_OAK_with_device", side_effect=boot):
+            self.assertFalse(self.collector.start())
+
+    def test_pipeline_failure_skips_devices(self):
+        self.collector._create_pipeline_for_device.side_effect = RuntimeError("blob missing")
+        with patch.object(self.collector, "_start_OAK_with_device") as boot:
+            self.assertFalse(self.collector.start())
+        boot.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+测试 FrameSyncBuffer 的序列号对齐逻辑
+
+验证：
+- 乱序到达的多路消息按序列号凑齐后输出
+- 更新的帧凑齐时，更旧的未完成帧按顺序提前输出
+- 超时、容量上限与迟到消息的处理
+"""
+
+import unittest
+
+from oak_vision_system.modules.data_collector.frame_sync import FrameSyncBuffer
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestFrameSyncBuffer(unittest.TestCase):
+    """测试按序列号对齐的同步缓冲区"""
+
+    def setUp(self):
+        self.clock = _FakeClock()
+        self.sync = FrameSyncBuffer(
+            ["rgb", "detections"], max_pending=3, max_wait_s=0.05, clock=self.clock
+        )
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            FrameSyncBuffer([])
+        with self.assertRaises(ValueError):
+            FrameSyncBuffer(["rgb"], max_pending=0)
+        with self.assertRaises(ValueError):
+            self.sync.push("depth", 1, object())
+
+    def test_emits_complete_frame_when_all_streams_arrive(self):
+        self.assertEqual(self.sync.push("detections", 5, "det5"), [])
+        ready = self.sync.push("rgb", 5, "rgb5")
+
+        self.assertEqual(len(ready), 1)
+        self.assertEqual(ready[0].seq, 5)
+        self.assertTrue(ready[0].complete)
+        self.assertEqual(ready[0].get("rgb"), "rgb5")
+        self.assertEqual(ready[0].get("detections"), "det5")
+        self.assertEqual(self.sync.pending_count, 0)
+
+    def test_interleaved_arrival_keeps_pairs_together(self):
+        self.sync.push("rgb", 1, "rgb1")
+        self.sync.push("rgb", 2, "rgb2")
+        first = self.sync.push("detections", 1, "det1")
+        second = self.sync.push("detections", 2, "det2")
+
+        self.assertEqual([(f.seq, f.complete) for f in first], [(1, True)])
+        self.assertEqual([(f.seq, f.complete) for f in second], [(2, True)])
+        self.assertEqual(second[0].get("rgb"), "rgb2")
+
+    def test_older_incomplete_frames_flushed_in_order(self):
+        self.sync.push("rgb", 1, "rgb1")      # 检测结果丢失
+        self.sync.push("detections", 2, "det2")
+        ready = self.sync.push("rgb", 2, "rgb2")
+
+        self.assertEqual([(f.seq, f.complete) for f in ready], [(1, False), (2, True)])
+        self.assertIsNone(ready[0].get("detections"))
+
+    def test_late_message_is_emitted_alone(self):
+        self.sync.push("rgb", 3, "rgb3")
+        self.sync.push("detections", 3, "det3")
+        ready = self.sync.push("detections", 2, "det2")
+
+        self.assertEqual(len(ready), 1)
+        self.assertEqual(ready[0].seq, 2)
+        self.assertFalse(ready[0].complete)
+
+    def test_flush_expired(self):
+        self.sync.push("rgb", 1, "rgb1")
+        self.clock.now = 0.01
+        self.sync.push("rgb", 2, "rgb2")
+        self.assertEqual(self.sync.flush_expired(), [])
+
+        self.clock.now = 0.055
+        ready = self.sync.flush_expired()
+        self.assertEqual([f.seq for f in ready], [1])
+        self.assertEqual(self.sync.pending_count, 1)
+
+    def test_pending_capacity_is_bounded(self):
+        for seq in range(4):
+            ready = self.sync.push("rgb", seq, f"rgb{seq}")
+        self.assertEqual([f.seq for f in ready], [0])
+        self.assertEqual(self.sync.pending_count, 3)
+
+    def test_flush_and_stats(self):
+        self.sync.push("rgb", 1, "rgb1")
+        self.sync.push("detections", 1, "det1")
+        self.sync.push("rgb", 2, "rgb2")
+
+        self.assertEqual([f.seq for f in self.sync.flush()], [2])
+        stats = self.sync.get_stats()
+        self.assertEqual(stats["complete"], 1)
+        self.assertEqual(stats["partial"], 1)
+        self.assertEqual(stats["pending"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
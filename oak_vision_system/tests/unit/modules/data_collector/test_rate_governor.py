@@ -0,0 +1,149 @@
+"""
+测试采集速率调节器
+
+验证：
+- 背压动作与使用率映射为连续的速率比例
+- 总预算内按优先级分配各设备份额，不低于最低速率比例
+- 令牌桶放行比例与份额一致
+- THROTTLE 期间速率比例随背压监控器发布的使用率更新而变化
+"""
+
+import unittest
+from unittest.mock import Mock
+
+from oak_vision_system.core.backpressure import (
+    BackpressureAction,
+    BackpressureConfig,
+    BackpressureEventPayload,
+    BackpressureMonitor,
+    BackpressureState,
+    QueueMetrics,
+)
+from oak_vision_system.modules.data_collector.rate_governor import (
+    RateGovernor,
+    rate_fraction_for_signal,
+)
+
+
+def _signal(action, usage):
+    return BackpressureEventPayload(
+        queue_id="q",
+        action=action,
+        reason="test",
+        timestamp=0.0,
+        usage=usage,
+        drop_count=0,
+        pressure_level="medium",
+        state=BackpressureState.PRESSURED,
+    )
+
+
+class TestRateFraction(unittest.TestCase):
+    """测试背压信号到速率比例的映射"""
+
+    def test_normal_is_full_rate(self):
+        self.assertEqual(rate_fraction_for_signal(_signal(BackpressureAction.NORMAL, 0.9)), 1.0)
+
+    def test_throttle_is_proportional_to_usage(self):
+        self.assertAlmostEqual(rate_fraction_for_signal(_signal(BackpressureAction.THROTTLE, 0.7)), 0.6)
+        self.assertAlmostEqual(rate_fraction_for_signal(_signal(BackpressureAction.THROTTLE, 0.9)), 0.2)
+        # 使用率不高但已开始丢弃时仍降速
+        self.assertAlmostEqual(rate_fraction_for_signal(_signal(BackpressureAction.THROTTLE, 0.1)), 0.75)
+
+    def test_pause_keeps_min_fraction(self):
+        self.assertEqual(rate_fraction_for_signal(_signal(BackpressureAction.PAUSE, 1.0), 0.2), 0.2)
+
+
+class TestRateGovernor(unittest.TestCase):
+    """测试份额分配与令牌桶"""
+
+    def test_equal_priorities_share_budget_evenly(self):
+        governor = RateGovernor(["a", "b"])
+        governor.set_fraction(0.5)
+        self.assertEqual(governor.shares(), {"a": 0.5, "b": 0.5})
+
+    def test_priority_device_keeps_full_rate(self):
+        governor = RateGovernor(["safety", "a", "b"], priorities={"safety": 1.0}, min_fraction=0.05)
+        governor.set_fraction(0.6)
+        shares = governor.shares()
+        self.assertEqual(shares["safety"], 1.0)
+        self.assertAlmostEqual(shares["a"], 0.4)
+        self.assertAlmostEqual(shares["b"], 0.4)
+        self.assertAlmostEqual(sum(shares.values()), 0.6 * 3)
+
+    def test_shares_never_drop_below_min_fraction(self):
+        governor = RateGovernor(["safety", "a"], priorities={"safety": 1.0}, min_fraction=0.1)
+        governor.set_fraction(0.1)
+        self.assertEqual(governor.shares(), {"safety": 1.0, "a": 0.1})
+
+    def test_admitted_ratio_matches_share(self):
+        governor = RateGovernor(["a"])
+        governor.set_fraction(0.25)
+        admitted = [governor.admit("a", seq) for seq in range(100)]
+        self.assertEqual(admitted.count(True), 25)
+        stats = governor.get_stats()
+        self.assertEqual(stats["admitted"]["a"], 25)
+        self.assertEqual(stats["dropped"]["a"], 75)
+
+    def test_unknown_device_is_not_limited(self):
+        governor = RateGovernor(["a"])
+        governor.set_fraction(0.1)
+        self.assertTrue(governor.admit("other", 1))
+
+
+class TestThrottleUsageUpdates(unittest.TestCase):
+    """测试 THROTTLE 期间使用率变化传递到速率比例"""
+
+    def setUp(self):
+        self.governor = RateGovernor(["a"])
+        event_bus = Mock()
+        event_bus.publish.side_effect = lambda event_type, payload: self.governor.on_backpressure(payload)
+        self.monitor = BackpressureMonitor(
+            config=BackpressureConfig(throttle_usage_step=0.05), event_bus=event_bus
+        )
+        self.published = event_bus.publish
+        self.size = 0
+        self.monitor.register_queue("q", self._metrics, capacity=100)
+
+    def _metrics(self):
+        return QueueMetrics(
+            queue_id="q",
+            usage=self.size / 100,
+            current_size=self.size,
+            capacity=100,
+            drop_count=0,
+            drop_count_delta=0,
+            pressure_level="medium",
+            timestamp=0.0,
+        )
+
+    def _poll(self, size):
+        self.size = size
+        self.monitor._poll_once()
+
+    def test_fraction_follows_usage_while_throttled(self):
+        # 连续两次高水位命中后进入 THROTTLE
+        self._poll(90)
+        self._poll(90)
+        self.assertAlmostEqual(self.governor.fraction, 0.2)
+
+        # 使用率下降但仍高于低水位：动作保持 THROTTLE，速率比例随之回升
+        self._poll(70)
+        self.assertEqual(self.published.call_args[0][1].action, BackpressureAction.THROTTLE)
+        self.assertAlmostEqual(self.governor.fraction, 0.6)
+
+        self._poll(85)
+        self.assertAlmostEqual(self.governor.fraction, 0.3)
+
+    def test_small_usage_changes_are_not_republished(self):
+        self._poll(90)
+        self._poll(90)
+        calls = self.published.call_count
+
+        self._poll(88)
+        self.assertEqual(self.published.call_count, calls)
+        self.assertAlmostEqual(self.governor.fraction, 0.2)
+
+
+if __name__ == "__main__":
+    unittest.main()
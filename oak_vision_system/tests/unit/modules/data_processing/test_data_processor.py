@@ -14,6 +14,7 @@ from oak_vision_system.core.dto.config_dto.device_binding_dto import (
 from oak_vision_system.core.dto.config_dto.enums import DeviceRole, ConnectionStatus
 from oak_vision_system.core.dto.detection_dto import (
     DeviceDetectionDataDTO,
+    DeviceDetectionBatch,
     DetectionDTO,
     SpatialCoordinatesDTO,
     BoundingBoxDTO,
@@ -1929,6 +1930,61 @@ class TestDataProcessorIntegration:
         assert len(result.labels) == 0, "None detections 的 labels 应该为空"
         assert len(result.coords) == 0, "None detections 的 coords 应该为空"
     
+    def test_columnar_batch_matches_dto_path(self, processor, monkeypatch):
+        """测试列式批次与逐对象 DTO 输入得到相同的处理结果"""
+        # Arrange
+        detection_data = DeviceDetectionDataDTO(
+            device_id="device_001_mxid_12345",
+            frame_id=100,
+            device_alias="front_camera",
+            detections=[
+                DetectionDTO(
+                    label=i % 2,
+                    confidence=0.9 - 0.1 * i,
+                    bbox=BoundingBoxDTO(xmin=10.0 * i, ymin=20.0, xmax=10.0 * i + 50, ymax=200.0),
+                    spatial_coordinates=SpatialCoordinatesDTO(x=100.0 * i, y=200.0, z=300.0 + i),
+                )
+                for i in range(4)
+            ],
+        )
+        batch = DeviceDetectionBatch.from_detection_data(detection_data)
+        
+        received = []
+        def mock_transform_coordinates(mxid, coords_homogeneous):
+            received.append(coords_homogeneous.copy())
+            return coords_homogeneous[:, :3] * 2
+        
+        monkeypatch.setattr(processor._transformer, "transform_coordinates", mock_transform_coordinates)
+        monkeypatch.setattr(
+            processor._filter_manager, "process",
+            lambda device_id, coordinates, bboxes, confidences, labels: (coordinates, bboxes, confidences, labels),
+        )
+        
+        # Act
+        result_dto = processor.process(detection_data)
+        result_batch = processor.process(batch)
+        
+        # Assert
+        np.testing.assert_array_equal(received[0], received[1])
+        np.testing.assert_array_equal(result_dto.coords, result_batch.coords)
+        np.testing.assert_array_equal(result_dto.bbox, result_batch.bbox)
+        np.testing.assert_array_equal(result_dto.confidence, result_batch.confidence)
+        np.testing.assert_array_equal(result_dto.labels, result_batch.labels)
+        assert result_batch.frame_id == 100
+        assert result_batch.device_alias == "front_camera"
+    
+    def test_empty_columnar_batch_handling_in_flow(self, processor):
+        """测试完整流程中的空列式批次处理"""
+        # Act
+        result = processor.process(
+            DeviceDetectionBatch.empty("device_001_mxid_12345", 100, "front_camera")
+        )
+        
+        # Assert
+        assert isinstance(result, DeviceProcessedDataDTO)
+        assert len(result.labels) == 0
+        assert result.coords.shape == (0, 3)
+    
     def test_exception_handling_in_flow(self, processor, monkeypatch):
         """测试完整流程中的异常处理"""
         # Arrange
@@ -0,0 +1,251 @@
+"""
+多相机融合单元测试
+
+测试策略：
+- 融合帧闭合条件：全部设备到齐 / 设备重复提交 / 时间窗口过期
+- 空间关联：跨设备同类近距离检测合并，同设备与不同标签不合并，每个融合目标每设备最多一个
+- 融合坐标为置信度加权均值，输出按标签稳定排序
+- DataProcessor 融合模式：每个融合帧只滤波和决策一次，拆分回各设备输出
+"""
+
+import numpy as np
+import pytest
+
+from oak_vision_system.core.dto.config_dto import (
+    CoordinateTransformConfigDTO,
+    DataProcessingConfigDTO,
+    FilterConfigDTO,
+    FusionConfigDTO,
+)
+from oak_vision_system.core.dto.config_dto.device_binding_dto import (
+    DeviceMetadataDTO,
+    DeviceRoleBindingDTO,
+)
+from oak_vision_system.core.dto.config_dto.enums import ConnectionStatus, DeviceRole
+from oak_vision_system.core.dto.detection_dto import DeviceDetectionBatch
+from oak_vision_system.core.event_bus import get_event_bus, reset_event_bus
+from oak_vision_system.core.event_bus.event_types import EventType
+from oak_vision_system.modules.data_processing.data_processor import DataProcessor
+from oak_vision_system.modules.data_processing.decision_layer import DecisionLayer
+from oak_vision_system.modules.data_processing.fusion import (
+    FUSED_DEVICE_ID,
+    CrossCameraFusion,
+    FusionContribution,
+)
+
+
+def _contribution(device_id, coords, labels=None, confidences=None, frame_id=1):
+    coords = np.asarray(coords, dtype=np.float32).reshape(-1, 3)
+    n = len(coords)
+    return FusionContribution(
+        device_id=device_id,
+        frame_id=frame_id,
+        device_alias=None,
+        coords=coords,
+        bboxes=np.tile(np.array([0, 0, 10, 10], dtype=np.float32), (n, 1)),
+        confidences=np.full(n, 0.9, dtype=np.float32) if confidences is None
+        else np.asarray(confidences, dtype=np.float32),
+        labels=np.zeros(n, dtype=np.int32) if labels is None else np.asarray(labels, dtype=np.int32),
+    )
+
+
+class TestFusionWindow:
+    """融合帧闭合条件"""
+
+    def test_closes_when_all_devices_submitted(self):
+        fusion = CrossCameraFusion(device_ids=["a", "b"], label_count=2)
+        assert fusion.submit(_contribution("a", [[0, 0, 0]]), now=0.0) == []
+        assert fusion.pending_count == 1
+        frames = fusion.submit(_contribution("b", [[0, 0, 0]]), now=0.01)
+        assert len(frames) == 1
+        assert [c.device_id for c in frames[0].contributions] == ["a", "b"]
+        assert fusion.pending_count == 0
+
+    def test_repeated_device_closes_previous_frame(self):
+        fusion = CrossCameraFusion(device_ids=["a", "b"], label_count=1)
+        fusion.submit(_contribution("a", [[0, 0, 0]], frame_id=1), now=0.0)
+        frames = fusion.submit(_contribution("a", [[0, 0, 0]], frame_id=2), now=0.01)
+        assert len(frames) == 1
+        assert frames[0].contributions[0].frame_id == 1
+        assert fusion.pending_count == 1
+
+    def test_window_expiry(self):
+        fusion = CrossCameraFusion(device_ids=["a", "b"], label_count=1, time_window=0.05)
+        fusion.submit(_contribution("a", [[0, 0, 0]]), now=0.0)
+        assert fusion.flush_expired(now=0.04) is None
+        frame = fusion.flush_expired(now=0.06)
+        assert frame is not None and len(frame.contributions) == 1
+        assert fusion.flush() is None
+
+    def test_late_device_starts_new_frame(self):
+        fusion = CrossCameraFusion(device_ids=["a", "b"], label_count=1, time_window=0.05)
+        fusion.submit(_contribution("a", [[0, 0, 0]]), now=0.0)
+        frames = fusion.submit(_contribution("b", [[0, 0, 0]]), now=0.2)
+        assert len(frames) == 1
+        assert [c.device_id for c in frames[0].contributions] == ["a"]
+        assert fusion.pending_count == 1
+
+
+class TestFusionAssociation:
+    """空间关联与合并"""
+
+    def _fuse(self, *contributions, label_count=3, merge_distance=200.0):
+        fusion = CrossCameraFusion(
+            device_ids=[c.device_id for c in contributions],
+            label_count=label_count,
+            merge_distance=merge_distance,
+        )
+        frames = []
+        for c in contributions:
+            frames.extend(fusion.submit(c, now=0.0))
+        assert len(frames) == 1
+        return frames[0]
+
+    def test_overlapping_detections_are_merged(self):
+        frame = self._fuse(
+            _contribution("a", [[1000, 0, 0], [3000, 0, 0]], confidences=[0.6, 0.9]),
+            _contribution("b", [[1100, 0, 0]], confidences=[0.2]),
+        )
+        assert frame.target_count == 2
+        np.testing.assert_array_equal(frame.indices[0], [0, 1])
+        np.testing.assert_array_equal(frame.indices[1], [0])
+        # 置信度加权均值
+        assert frame.coords[0, 0] == pytest.approx((1000 * 0.6 + 1100 * 0.2) / 0.8)
+        assert frame.confidences[0] == pytest.approx(0.6)
+
+    def test_same_device_and_different_labels_not_merged(self):
+        frame = self._fuse(
+            _contribution("a", [[0, 0, 0], [50, 0, 0]]),
+            _contribution("b", [[0, 0, 0]], labels=[1]),
+        )
+        assert frame.target_count == 3
+
+    def test_each_device_contributes_at_most_once_per_target(self):
+        """测试：b 的两个检测都靠近 a 的一个检测，只有最近的一个被合并"""
+        frame = self._fuse(
+            _contribution("a", [[0, 0, 0]]),
+            _contribution("b", [[150, 0, 0], [20, 0, 0]]),
+        )
+        assert frame.target_count == 2
+        assert frame.indices[1][1] == frame.indices[0][0]
+        assert frame.indices[1][0] != frame.indices[0][0]
+
+    def test_three_devices_chain_into_one_target(self):
+        frame = self._fuse(
+            _contribution("a", [[0, 0, 0]]),
+            _contribution("b", [[100, 0, 0]]),
+            _contribution("c", [[50, 0, 0]]),
+        )
+        assert frame.target_count == 1
+
+    def test_output_sorted_by_label_and_unknown_labels_dropped(self):
+        frame = self._fuse(
+            _contribution("a", [[0, 0, 0], [5000, 0, 0], [9000, 0, 0]], labels=[2, 0, 7]),
+            _contribution("b", [[0, 0, 0]], labels=[2]),
+        )
+        np.testing.assert_array_equal(frame.labels, [0, 2])
+        np.testing.assert_array_equal(frame.indices[0], [1, 0, -1])
+        np.testing.assert_array_equal(frame.indices[1], [1])
+
+    def test_track_bboxes_centered_on_targets(self):
+        fusion = CrossCameraFusion(device_ids=["a"], label_count=1, track_box_size=400.0)
+        frame = fusion.submit(_contribution("a", [[1000, -500, 30]]), now=0.0)[0]
+        np.testing.assert_allclose(frame.track_bboxes, [[800, -700, 1200, -300]])
+
+    def test_empty_frame(self):
+        frame = self._fuse(_contribution("a", np.empty((0, 3))), _contribution("b", np.empty((0, 3))))
+        assert frame.target_count == 0
+        assert [len(i) for i in frame.indices] == [0, 0]
+
+
+class TestDataProcessorFusion:
+    """DataProcessor 融合模式"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self):
+        reset_event_bus()
+        DecisionLayer._instance = None
+        yield
+        DecisionLayer._instance = None
+        reset_event_bus()
+
+    @pytest.fixture
+    def processor(self):
+        metadata = {
+            mxid: DeviceMetadataDTO(mxid=mxid, product_name="OAK-D", connection_status=ConnectionStatus.CONNECTED)
+            for mxid in ("left_mxid", "right_mxid")
+        }
+        bindings = {
+            DeviceRole.LEFT_CAMERA: DeviceRoleBindingDTO(
+                role=DeviceRole.LEFT_CAMERA, historical_mxids=["left_mxid"], active_mxid="left_mxid"
+            ),
+            DeviceRole.RIGHT_CAMERA: DeviceRoleBindingDTO(
+                role=DeviceRole.RIGHT_CAMERA, historical_mxids=["right_mxid"], active_mxid="right_mxid"
+            ),
+        }
+        config = DataProcessingConfigDTO(
+            coordinate_transforms={
+                role: CoordinateTransformConfigDTO(role=role)
+                for role in (DeviceRole.LEFT_CAMERA, DeviceRole.RIGHT_CAMERA)
+            },
+            filter_config=FilterConfigDTO(engine="object"),
+            fusion_config=FusionConfigDTO(enabled=True, time_window_ms=1000.0),
+        )
+        processor = DataProcessor(
+            config=config, device_metadata=metadata, bindings=bindings, label_map=["durian", "person"]
+        )
+        yield processor
+        processor.shutdown()
+
+    @staticmethod
+    def _batch(device_id, coords, labels, frame_id=1):
+        coords = np.asarray(coords, dtype=np.float32)
+        n = len(coords)
+        return DeviceDetectionBatch(
+            device_id=device_id,
+            frame_id=frame_id,
+            labels=np.asarray(labels, dtype=np.int32),
+            confidence=np.full(n, 0.9, dtype=np.float32),
+            bbox=np.tile(np.array([10, 10, 50, 50], dtype=np.float32), (n, 1)),
+            coords_h=np.hstack([coords, np.ones((n, 1), dtype=np.float32)]),
+        )
+
+    def test_uses_single_fused_filter_pool_set(self, processor):
+        assert processor._fusion is not None
+        assert {device for device, _ in processor._filter_manager._pools} == {FUSED_DEVICE_ID}
+
+    def test_duplicate_detection_processed_once(self, processor, monkeypatch):
+        received = []
+        get_event_bus().subscribe(EventType.PROCESSED_DATA, received.append)
+
+        decide_calls = []
+        original = processor.decision_layer.decide
+
+        def spy(device_id, filtered_coords, filtered_labels):
+            decide_calls.append((device_id, len(filtered_coords)))
+            return original(device_id=device_id, filtered_coords=filtered_coords, filtered_labels=filtered_labels)
+
+        monkeypatch.setattr(processor.decision_layer, "decide", spy)
+
+        left = self._batch("left_mxid", [[0, 500, 2000], [0, -800, 3000]], [0, 1])
+        right = self._batch("right_mxid", [[30, 500, 2000]], [0])
+
+        assert processor.process(left) is None
+        out_right = processor.process(right)
+
+        assert decide_calls == [(FUSED_DEVICE_ID, 2)]
+        assert out_right is not None and out_right.device_id == "right_mxid"
+        assert len(out_right.coords) == 1
+
+        get_event_bus().close(wait=True)
+        by_device = {d.device_id: d for d in received}
+        assert set(by_device) == {"left_mxid", "right_mxid"}
+        left_out = by_device["left_mxid"]
+        # 两个设备看到的同一目标共享融合后的坐标和状态
+        np.testing.assert_array_equal(left_out.coords[0], out_right.coords[0])
+        assert left_out.state_label[0] == out_right.state_label[0]
+        assert len(left_out.state_label) == 2
+
+    def test_fusion_disabled_by_default(self):
+        assert DataProcessingConfigDTO().fusion_config.enabled is False
+        assert not FusionConfigDTO(time_window_ms=0.0).validate()
@@ -0,0 +1,160 @@
+"""
+KalmanFilter 单元测试
+
+测试策略：
+- 匀速运动下的收敛性与相对滑动平均的滞后
+- 检测丢失期间的位置/边界框外推与失效重置
+- 与 FilterPool 配合时基于预测框的跨丢失帧匹配
+- 配置 DTO 与 create_filter_factory
+"""
+
+import numpy as np
+import pytest
+
+from oak_vision_system.core.dto.config_dto import FilterConfigDTO, KalmanFilterConfigDTO
+from oak_vision_system.core.dto.config_dto.enums import FilterType
+from oak_vision_system.modules.data_processing.filter_base import KalmanFilter, MovingAverageFilter
+from oak_vision_system.modules.data_processing.filter_manager import create_filter_factory
+from oak_vision_system.modules.data_processing.filterpool import FilterPool
+from oak_vision_system.modules.data_processing.tracker import HungarianTracker
+
+
+def _box(x: float, size: float = 40.0) -> np.ndarray:
+    return np.array([x, 100.0, x + size, 100.0 + size], dtype=np.float32)
+
+
+class TestKalmanFilterBasics:
+    """基本行为"""
+
+    def test_first_input_returns_measurement(self):
+        f = KalmanFilter()
+        out = f.input(np.array([100.0, 200.0, 300.0], dtype=np.float32), _box(0))
+        np.testing.assert_allclose(out, [100.0, 200.0, 300.0])
+        np.testing.assert_array_equal(f.current_bbox, _box(0))
+
+    def test_tracks_constant_velocity_with_less_lag_than_moving_average(self):
+        """测试：匀速运动下卡尔曼的滞后明显小于 8 帧滑动平均"""
+        rng = np.random.default_rng(0)
+        kf = KalmanFilter(process_noise=2.0, measurement_noise=10.0)
+        ma = MovingAverageFilter(queue_maxsize=8)
+        velocity = np.array([15.0, -5.0, 2.0])
+
+        for t in range(60):
+            truth = np.array([0.0, 500.0, 1000.0]) + velocity * t
+            z = (truth + rng.normal(0, 10.0, 3)).astype(np.float32)
+            kf_out = kf.input(z, _box(t)).copy()
+            ma_out = ma.input(z, _box(t)).copy()
+
+        np.testing.assert_allclose(kf.velocity, velocity, atol=4.0)
+        assert np.linalg.norm(kf_out - truth) < 15.0
+        # 滑动平均约滞后 3.5 帧
+        assert np.linalg.norm(ma_out - truth) > 40.0
+
+    def test_reset_clears_state(self):
+        f = KalmanFilter()
+        f.input(np.ones(3, dtype=np.float32), _box(0))
+        f.input(np.full(3, 5.0, dtype=np.float32), _box(5))
+        f.reset()
+        assert f.current_bbox is None
+        assert f.match_bbox is None
+        np.testing.assert_array_equal(f.velocity, np.zeros(3))
+        out = f.input(np.full(3, 7.0, dtype=np.float32), _box(0))
+        np.testing.assert_allclose(out, [7.0, 7.0, 7.0])
+
+
+class TestKalmanFilterPrediction:
+    """丢失期间的预测"""
+
+    def _warm_up(self, f, frames=20, step=10.0):
+        for t in range(frames):
+            f.input(np.array([t * step, 0.0, 0.0], dtype=np.float32), _box(t * step))
+
+    def test_miss_extrapolates_position_and_bbox(self):
+        f = KalmanFilter(max_missed_count=5)
+        self._warm_up(f)
+        before = f.current_value.copy()
+        bbox_before = f.current_bbox.copy()
+
+        assert f.miss() is True
+
+        assert f.current_value[0] == pytest.approx(before[0] + 10.0, abs=1.0)
+        assert f.current_bbox[0] == pytest.approx(bbox_before[0] + 10.0, abs=1.0)
+        # 匹配框再向前外推一帧
+        assert f.match_bbox[0] == pytest.approx(f.current_bbox[0] + 10.0, abs=1.0)
+
+    def test_miss_exceeding_limit_resets(self):
+        f = KalmanFilter(max_missed_count=3)
+        self._warm_up(f)
+        assert f.miss() is True
+        assert f.miss() is True
+        assert f.miss() is False
+        assert f.current_bbox is None
+        assert f.active_state is False
+
+    def test_pool_keeps_slot_through_misses_with_predicted_bbox(self):
+        """测试：目标丢失两帧后再次出现时，依靠预测框仍匹配到原槽位"""
+        tracker = HungarianTracker(iou_threshold=0.3)
+        pool = FilterPool(pool_size=4, filter_factory=lambda: KalmanFilter(), tracker=tracker)
+        conf = np.ones(1, dtype=np.float32)
+
+        x = 0.0
+        for _ in range(10):
+            pool.step_v2(np.array([[x, 0, 1000]], dtype=np.float32), _box(x)[None], conf)
+            x += 20.0
+        slot = int(pool.get_active_indices()[0])
+
+        # 两帧丢失（其他位置出现无关目标，触发未匹配槽位的 miss）
+        far = np.array([[5000, 0, 1000]], dtype=np.float32)
+        for _ in range(2):
+            pool.step_v2(far, _box(5000.0)[None], conf)
+            x += 20.0
+
+        # 静止框（停在最后一次观测处）与当前框已不重叠，只有外推框能匹配上
+        out = pool.step_v2(np.array([[x, 0, 1000]], dtype=np.float32), _box(x)[None], conf)
+        assert pool._filters[slot].current_bbox[0] == pytest.approx(x)
+        assert out[0, 0] == pytest.approx(x, abs=30.0)
+
+
+class TestKalmanConfig:
+    """配置与工厂函数"""
+
+    def test_default_filter_config_contains_kalman_defaults(self):
+        config = FilterConfigDTO()
+        assert isinstance(config.kalman_config, KalmanFilterConfigDTO)
+        assert config.get_active_filter_config() is config.moving_average_config
+
+    def test_active_config_for_kalman(self):
+        config = FilterConfigDTO(filter_type=FilterType.KALMAN)
+        assert config.get_active_filter_config() is config.kalman_config
+
+    def test_kalman_config_validation(self):
+        assert KalmanFilterConfigDTO().validate()
+        assert not KalmanFilterConfigDTO(measurement_noise=0.0).validate()
+        assert not KalmanFilterConfigDTO(process_noise=-1.0).validate()
+        assert FilterConfigDTO(filter_type=FilterType.KALMAN).validate()
+
+    def test_create_filter_factory(self):
+        kalman_factory = create_filter_factory(
+            FilterConfigDTO(
+                filter_type=FilterType.KALMAN,
+                kalman_config=KalmanFilterConfigDTO(process_noise=3.0, measurement_noise=12.0),
+            )
+        )
+        f = kalman_factory()
+        assert isinstance(f, KalmanFilter)
+        assert f._q == pytest.approx(9.0)
+        assert f._r == pytest.approx(144.0)
+        assert kalman_factory() is not f
+
+        ma = create_filter_factory(FilterConfigDTO())()
+        assert isinstance(ma, MovingAverageFilter)
+        assert ma._queue_maxsize == FilterConfigDTO().moving_average_config.window_size
+
+    def test_config_round_trip(self):
+        config = FilterConfigDTO(
+            filter_type=FilterType.KALMAN,
+            kalman_config=KalmanFilterConfigDTO(process_noise=1.5),
+        )
+        restored = FilterConfigDTO.from_dict(config.to_dict())
+        assert restored.filter_type == FilterType.KALMAN
+        assert restored.kalman_config.process_noise == 1.5
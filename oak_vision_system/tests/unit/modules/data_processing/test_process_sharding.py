@@ -0,0 +1,156 @@
+"""
+多进程分片单元测试
+
+测试策略：
+- 设备到分片的分配
+- 配置校验：分片与融合互斥
+- DataProcessor 分片模式端到端：分片进程完成变换和滤波，主进程决策并发布 PROCESSED_DATA
+"""
+
+import threading
+
+import numpy as np
+import pytest
+
+from oak_vision_system.core.dto.config_dto import (
+    CoordinateTransformConfigDTO,
+    DataProcessingConfigDTO,
+    FilterConfigDTO,
+    FusionConfigDTO,
+    ShardingConfigDTO,
+)
+from oak_vision_system.core.dto.config_dto.device_binding_dto import (
+    DeviceMetadataDTO,
+    DeviceRoleBindingDTO,
+)
+from oak_vision_system.core.dto.config_dto.enums import ConnectionStatus, DeviceRole
+from oak_vision_system.core.dto.detection_dto import DeviceDetectionBatch
+from oak_vision_system.core.event_bus import get_event_bus, reset_event_bus
+from oak_vision_system.core.event_bus.event_types import EventType
+from oak_vision_system.modules.data_processing.data_processor import DataProcessor
+from oak_vision_system.modules.data_processing.decision_layer import DecisionLayer
+from oak_vision_system.modules.data_processing.process_sharding import assign_shards
+
+
+class TestAssignShards:
+
+    def test_round_robin_over_sorted_ids(self):
+        assert assign_shards(["c", "a", "b"], 2) == [["a", "c"], ["b"]]
+
+    def test_empty_shards_dropped(self):
+        assert assign_shards(["a", "b"], 4) == [["a"], ["b"]]
+
+    def test_invalid_worker_count(self):
+        with pytest.raises(ValueError):
+            assign_shards(["a"], 0)
+
+
+class TestShardingConfig:
+
+    def test_disabled_by_default(self):
+        assert DataProcessingConfigDTO().sharding_config.enabled is False
+
+    def test_fusion_and_sharding_mutually_exclusive(self):
+        config = DataProcessingConfigDTO(
+            fusion_config=FusionConfigDTO(enabled=True),
+            sharding_config=ShardingConfigDTO(worker_processes=2),
+        )
+        assert not config.validate()
+        assert any("不能同时启用" in e for e in config.validation_errors)
+
+    def test_range_validation(self):
+        assert not ShardingConfigDTO(worker_processes=-1).validate()
+        assert not ShardingConfigDTO(max_detections=0).validate()
+        assert ShardingConfigDTO(worker_processes=4).validate()
+
+
+class TestDataProcessorSharding:
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self):
+        reset_event_bus()
+        DecisionLayer._instance = None
+        yield
+        DecisionLayer._instance = None
+        reset_event_bus()
+
+    @pytest.fixture
+    def processor(self):
+        metadata = {
+            mxid: DeviceMetadataDTO(mxid=mxid, product_name="OAK-D", connection_status=ConnectionStatus.CONNECTED)
+            for mxid in ("left_mxid", "right_mxid")
+        }
+        bindings = {
+            DeviceRole.LEFT_CAMERA: DeviceRoleBindingDTO(
+                role=DeviceRole.LEFT_CAMERA, historical_mxids=["left_mxid"], active_mxid="left_mxid"
+            ),
+            DeviceRole.RIGHT_CAMERA: DeviceRoleBindingDTO(
+                role=DeviceRole.RIGHT_CAMERA, historical_mxids=["right_mxid"], active_mxid="right_mxid"
+            ),
+        }
+        config = DataProcessingConfigDTO(
+            coordinate_transforms={
+                role: CoordinateTransformConfigDTO(role=role, translation_x=100.0)
+                for role in (DeviceRole.LEFT_CAMERA, DeviceRole.RIGHT_CAMERA)
+            },
+            filter_config=FilterConfigDTO(engine="object"),
+            sharding_config=ShardingConfigDTO(worker_processes=2, max_detections=8, ring_slots=4),
+        )
+        processor = DataProcessor(
+            config=config, device_metadata=metadata, bindings=bindings, label_map=["durian", "person"]
+        )
+        yield processor
+        processor.shutdown()
+
+    @staticmethod
+    def _batch(device_id, coords, labels, frame_id=1):
+        coords = np.asarray(coords, dtype=np.float32).reshape(-1, 3)
+        n = len(coords)
+        return DeviceDetectionBatch(
+            device_id=device_id,
+            frame_id=frame_id,
+            labels=np.asarray(labels, dtype=np.int32),
+            confidence=np.full(n, 0.9, dtype=np.float32),
+            bbox=np.tile(np.array([10, 10, 50, 50], dtype=np.float32), (n, 1)),
+            coords_h=np.hstack([coords, np.ones((n, 1), dtype=np.float32)]),
+            device_alias=f"{device_id}_alias",
+        )
+
+    def test_one_shard_per_device(self, processor):
+        assert processor._shards.shards == [["left_mxid"], ["right_mxid"]]
+
+    def test_results_published_from_shards(self, processor):
+        received = []
+        done = threading.Event()
+
+        def on_data(data):
+            received.append(data)
+            if len(received) == 3:
+                done.set()
+
+        get_event_bus().subscribe(EventType.PROCESSED_DATA, on_data)
+        assert processor.start()
+
+        bus = get_event_bus()
+        left_batch = self._batch("left_mxid", [[0, 500, 2000]], [0])
+        bus.publish(EventType.RAW_DETECTION_DATA, left_batch)
+        bus.publish(EventType.RAW_DETECTION_DATA, self._batch("right_mxid", [[0, -800, 3000], [1, 2, 3]], [1, 0]))
+        bus.publish(EventType.RAW_DETECTION_DATA, self._batch("left_mxid", np.empty((0, 3)), [], frame_id=2))
+
+        assert done.wait(timeout=30.0), f"只收到 {len(received)} 个结果"
+        assert processor.stop()
+
+        by_key = {(d.device_id, d.frame_id): d for d in received}
+        left = by_key[("left_mxid", 1)]
+        assert left.device_alias == "left_mxid_alias"
+        assert len(left.coords) == 1 and len(left.state_label) == 1
+        # 坐标变换在分片进程中执行，结果与主进程的变换一致
+        expected = processor._transformer.transform_coordinates("left_mxid", left_batch.coords_h)
+        np.testing.assert_allclose(left.coords, expected, rtol=1e-5)
+
+        right = by_key[("right_mxid", 1)]
+        np.testing.assert_array_equal(right.labels, [0, 1])  # 滤波输出按标签分组
+        assert len(right.state_label) == 2
+
+        assert len(by_key[("left_mxid", 2)].labels) == 0
+        assert processor.get_stats()["shard_stats"]["drop_count"] == 0
@@ -0,0 +1,153 @@
+"""
+门控稀疏关联单元测试
+
+测试策略：
+- _sparse_iou 与 _batch_iou 在相交元素上逐位一致，且不遗漏任何相交对
+- 贪心门控模式与稠密模式匹配结果（含插入顺序）完全相同
+- 匈牙利门控模式与稠密模式总 IoU 相同（随机场景下匹配完全相同）
+- 边界情况：空输入、无相交、阈值校验、小规模退回稠密计算
+"""
+
+import numpy as np
+import pytest
+
+from oak_vision_system.modules.data_processing.tracker import (
+    HungarianTracker,
+    OptimizedGreedyTracker,
+    create_tracker,
+)
+
+
+def _crowded_boxes(rng, n, spread=300.0, size=40.0, jitter=8.0):
+    """拥挤场景：大量尺寸相近的目标"""
+    xy = rng.uniform(0, spread, size=(n, 2))
+    wh = size + rng.uniform(-jitter, jitter, size=(n, 2))
+    return np.hstack([xy, xy + wh]).astype(np.float32)
+
+
+def _moved(rng, boxes, sigma=6.0):
+    shift = rng.normal(0, sigma, size=(len(boxes), 2))
+    return (boxes + np.hstack([shift, shift])).astype(np.float32)
+
+
+class TestSparseIoU:
+    @pytest.mark.parametrize("n,m", [(1, 1), (4, 32), (32, 4), (64, 64)])
+    def test_matches_dense_iou(self, n, m):
+        rng = np.random.default_rng(n * 100 + m)
+        prev = _crowded_boxes(rng, n)
+        curr = _crowded_boxes(rng, m)
+        tracker = OptimizedGreedyTracker(gated=True)
+
+        dense = tracker._batch_iou(prev, curr)
+        rows, cols, ious = tracker._sparse_iou(prev, curr)
+
+        assert ious.dtype == dense.dtype
+        np.testing.assert_array_equal(ious, dense[rows, cols])
+        # 所有相交对都被找到且没有重复
+        assert len(set(zip(rows.tolist(), cols.tolist()))) == len(rows)
+        assert len(rows) == int((dense > 0).sum())
+
+    def test_touching_boxes_are_not_candidates(self):
+        tracker = HungarianTracker(gated=True)
+        prev = np.array([[0, 0, 10, 10]], dtype=np.float32)
+        curr = np.array([[10, 0, 20, 10], [0, 10, 10, 20]], dtype=np.float32)
+        rows, _, _ = tracker._sparse_iou(prev, curr)
+        assert len(rows) == 0
+
+    def test_wide_box_found_across_sorted_window(self):
+        """测试：x_min 很小的宽框也能被右侧的框找到"""
+        tracker = HungarianTracker(gated=True)
+        prev = np.array([[450, 0, 460, 10]], dtype=np.float32)
+        curr = np.array([[0, 0, 500, 10], [100, 0, 110, 10], [455, 0, 470, 10]], dtype=np.float32)
+        rows, cols, _ = tracker._sparse_iou(prev, curr)
+        assert sorted(cols.tolist()) == [0, 2]
+
+
+class TestGatedMatch:
+    @pytest.mark.parametrize("seed", range(5))
+    @pytest.mark.parametrize("n,m", [(4, 4), (32, 32), (128, 128), (32, 4), (4, 128)])
+    def test_greedy_identical_to_dense(self, seed, n, m):
+        rng = np.random.default_rng(seed)
+        prev = _crowded_boxes(rng, n)
+        curr = _moved(rng, prev[:m]) if m <= n else _crowded_boxes(rng, m)
+
+        expected, dense = OptimizedGreedyTracker(iou_threshold=0.3).match(prev, curr)
+        actual, gated = OptimizedGreedyTracker(iou_threshold=0.3, gated=True, gate_min_cells=0).match(prev, curr)
+
+        assert list(actual.items()) == list(expected.items())
+        np.testing.assert_array_equal(gated, dense)
+
+    @pytest.mark.parametrize("seed", range(5))
+    @pytest.mark.parametrize("n,m", [(4, 4), (32, 32), (128, 128), (32, 4), (4, 128)])
+    def test_hungarian_equivalent_to_dense(self, seed, n, m):
+        rng = np.random.default_rng(seed)
+        prev = _crowded_boxes(rng, n)
+        curr = _moved(rng, prev[:m]) if m <= n else _crowded_boxes(rng, m)
+
+        expected, dense = HungarianTracker(iou_threshold=0.3).match(prev, curr)
+        actual, _ = HungarianTracker(iou_threshold=0.3, gated=True, gate_min_cells=0).match(prev, curr)
+
+        def total(matches):
+            return sum(float(dense[i, j]) for i, j in matches.items())
+
+        assert total(actual) == pytest.approx(total(expected), abs=1e-5)
+        assert actual == expected
+        assert list(actual) == sorted(actual)
+
+    def test_greedy_tie_breaking_follows_row_major_order(self):
+        """测试：IoU 相同时按 (prev_id, curr_id) 顺序分配，与稠密模式一致"""
+        prev = np.array([[0, 0, 10, 10], [0, 0, 10, 10]], dtype=np.float32)
+        curr = np.array([[0, 0, 10, 10], [0, 0, 10, 10]], dtype=np.float32)
+        dense, _ = OptimizedGreedyTracker().match(prev, curr)
+        gated, _ = OptimizedGreedyTracker(gated=True, gate_min_cells=0).match(prev, curr)
+        assert gated == dense == {0: 0, 1: 1}
+
+    @pytest.mark.parametrize("cls", [OptimizedGreedyTracker, HungarianTracker])
+    def test_no_overlap(self, cls):
+        prev = np.array([[0, 0, 10, 10]], dtype=np.float32)
+        curr = np.array([[100, 100, 110, 110]], dtype=np.float32)
+        matches, iou_matrix = cls(gated=True, gate_min_cells=0).match(prev, curr)
+        assert matches == {}
+        assert iou_matrix.shape == (1, 1)
+
+    @pytest.mark.parametrize("cls", [OptimizedGreedyTracker, HungarianTracker])
+    def test_empty_inputs(self, cls):
+        empty = np.zeros((0, 4), dtype=np.float32)
+        box = np.array([[0, 0, 10, 10]], dtype=np.float32)
+        assert cls(gated=True, gate_min_cells=0).match(empty, box)[0] == {}
+        assert cls(gated=True, gate_min_cells=0).match(box, empty)[0] == {}
+
+    def test_gated_requires_positive_threshold(self):
+        with pytest.raises(ValueError, match="iou_threshold"):
+            HungarianTracker(iou_threshold=0.0, gated=True)
+
+    def test_create_tracker_passes_gated(self):
+        tracker = create_tracker("hungarian", iou_threshold=0.4, gated=True)
+        assert isinstance(tracker, HungarianTracker)
+        assert tracker.gated is True
+        assert create_tracker("greedy").gated is False
+
+    def test_small_problems_fall_back_to_dense(self, monkeypatch):
+        """测试：规模低于 gate_min_cells 时不走门控路径"""
+        calls = []
+        tracker = OptimizedGreedyTracker(gated=True, gate_min_cells=16)
+        monkeypatch.setattr(tracker, "_match_gated", lambda p, c: calls.append(1) or ({}, None))
+        box = np.array([[0, 0, 10, 10]] * 4, dtype=np.float32)
+
+        tracker.match(box[:3], box[:3])
+        assert calls == []
+        tracker.match(box, box)
+        assert calls == [1]
+        assert OptimizedGreedyTracker(gated=True).gate_min_cells == OptimizedGreedyTracker.GATED_MIN_CELLS
+
+    def test_hungarian_gates_crowded_scenes_by_default(self, monkeypatch):
+        """测试：默认 gate_min_cells 下，32×32 规模的匈牙利匹配走按分量求解的门控路径"""
+        calls = []
+        tracker = HungarianTracker(gated=True)
+        monkeypatch.setattr(tracker, "_match_gated", lambda p, c: calls.append(1) or ({}, None))
+        boxes = _crowded_boxes(np.random.default_rng(0), 32)
+
+        tracker.match(boxes[:4], boxes[:4])
+        assert calls == []
+        tracker.match(boxes, boxes)
+        assert calls == [1]
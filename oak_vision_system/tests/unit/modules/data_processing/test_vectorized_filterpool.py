@@ -0,0 +1,383 @@
+"""
+向量化滤波引擎单元测试
+
+测试策略：
+- 随机多目标场景下，与对象引擎（FilterPool + MovingAverageFilter / KalmanFilter）逐帧逐位比对
+- 覆盖窗口未满/已满、定期重算、目标消失重置、槽位耗尽、丢失期间外推等路径
+- FilterManager engine 参数校验、from_config 引擎选择与预测行输出
+"""
+
+import numpy as np
+import pytest
+
+from oak_vision_system.core.dto.config_dto import FilterConfigDTO
+from oak_vision_system.core.dto.config_dto.device_binding_dto import DeviceMetadataDTO
+from oak_vision_system.core.dto.config_dto.enums import ConnectionStatus, FilterType
+from oak_vision_system.modules.data_processing.filter_base import KalmanFilter, MovingAverageFilter
+from oak_vision_system.modules.data_processing.filter_manager import PREDICTED_CONFIDENCE, FilterManager
+from oak_vision_system.modules.data_processing.filterpool import FilterPool
+from oak_vision_system.modules.data_processing.tracker import HungarianTracker, OptimizedGreedyTracker
+from oak_vision_system.modules.data_processing.vectorized_filterpool import (
+    VectorizedFilterPool,
+    VectorizedKalmanFilterPool,
+    _VectorizedPoolBase,
+)
+
+
+@pytest.fixture
+def device_metadata():
+    return {
+        "device_001": DeviceMetadataDTO(
+            mxid="device_001",
+            product_name="OAK-D",
+            connection_status=ConnectionStatus.CONNECTED,
+        ),
+        "device_002": DeviceMetadataDTO(
+            mxid="device_002",
+            product_name="OAK-D-Lite",
+            connection_status=ConnectionStatus.CONNECTED,
+        ),
+    }
+
+
+def _random_scene(rng, frames, max_objects=12, num_labels=3):
+    """生成带抖动、出现/消失的多目标检测序列"""
+    centers = rng.uniform(50, 550, size=(max_objects, 2))
+    velocity = rng.normal(0, 3, size=(max_objects, 2))
+    labels = rng.integers(0, num_labels, size=max_objects).astype(np.int32)
+    coords = rng.uniform(-1000, 1000, size=(max_objects, 3))
+    alive = rng.random(max_objects) < 0.7
+
+    scene = []
+    for _ in range(frames):
+        # 目标随机出现/消失
+        flip = rng.random(max_objects) < 0.05
+        alive = np.where(flip, ~alive, alive)
+        centers += velocity + rng.normal(0, 1, size=centers.shape)
+        coords += rng.normal(0, 20, size=coords.shape)
+
+        idx = np.flatnonzero(alive)
+        rng.shuffle(idx)
+        half = rng.uniform(15, 25, size=(len(idx), 1))
+        c = centers[idx]
+        bboxes = np.hstack([c - half, c + half]).astype(np.float32)
+        scene.append((
+            coords[idx].astype(np.float32),
+            bboxes,
+            rng.uniform(0.5, 1.0, size=len(idx)).astype(np.float32),
+            labels[idx],
+        ))
+    return scene
+
+
+class TestVectorizedFilterPoolEquivalence:
+    """与对象引擎的逐位一致性"""
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    @pytest.mark.parametrize("tracker_cls", [HungarianTracker, OptimizedGreedyTracker])
+    def test_manager_outputs_identical(self, device_metadata, seed, tracker_cls):
+        """测试：随机场景下两种引擎输出逐位一致"""
+        rng = np.random.default_rng(seed)
+        kwargs = dict(
+            device_metadata=device_metadata,
+            label_map=["durian", "person", "car"],
+            pool_size=8,
+            tracker=tracker_cls(iou_threshold=0.3),
+        )
+        obj = FilterManager(engine="object", **kwargs)
+        vec = FilterManager(engine="vectorized", **kwargs)
+
+        for coords, bboxes, confs, labels in _random_scene(rng, frames=150):
+            for device_id in ("device_001", "device_002"):
+                expected = obj.process(device_id, coords, bboxes, confs, labels)
+                actual = vec.process(device_id, coords, bboxes, confs, labels)
+                for e, a in zip(expected, actual):
+                    assert e.dtype == a.dtype
+                    np.testing.assert_array_equal(a, e)
+            assert obj.get_pool_stats() == vec.get_pool_stats()
+
+    @pytest.mark.parametrize("window,max_missed", [(1, 1), (3, 2), (8, 5)])
+    def test_pool_step_identical(self, window, max_missed):
+        """测试：单个池在不同窗口/丢失阈值下逐帧一致（含定期重算）"""
+        rng = np.random.default_rng(window)
+        tracker = HungarianTracker(iou_threshold=0.3)
+        obj = FilterPool(
+            pool_size=4,
+            filter_factory=lambda: MovingAverageFilter(queue_maxsize=window, max_missed_count=max_missed),
+            tracker=tracker,
+        )
+        vec = VectorizedFilterPool(
+            pool_size=4, queue_maxsize=window, max_missed_count=max_missed, tracker=tracker
+        )
+
+        for coords, bboxes, confs, _ in _random_scene(rng, frames=200, max_objects=6, num_labels=1):
+            if len(coords) == 0:
+                continue
+            expected = obj.step_v2(coords, bboxes, confs)
+            actual = vec.step_v2(coords, bboxes, confs)
+            np.testing.assert_array_equal(actual, expected)
+            np.testing.assert_array_equal(vec.active_mask, obj.active_mask)
+
+    def test_long_track_with_periodic_recalc(self):
+        """测试：单目标长时间跟踪，覆盖窗口满后的增量更新与多次定期重算"""
+        rng = np.random.default_rng(42)
+        obj = FilterPool(pool_size=2)
+        vec = VectorizedFilterPool(pool_size=2)
+        recalc_count = 0
+
+        for frame in range(100):
+            coords = rng.normal(500, 50, size=(1, 3)).astype(np.float32)
+            bboxes = np.array([[100 + frame, 100, 150 + frame, 150]], dtype=np.float32)
+            confs = np.ones(1, dtype=np.float32)
+            before = vec._next_recalc[0]
+            np.testing.assert_array_equal(vec.step_v2(coords, bboxes, confs), obj.step_v2(coords, bboxes, confs))
+            if vec._next_recalc[0] > before:
+                recalc_count += 1
+
+        assert recalc_count >= 4
+
+    def test_pool_exhaustion_outputs_zero(self):
+        """测试：槽位不足时未分配的检测输出为 0"""
+        pool = VectorizedFilterPool(pool_size=2)
+        coords = np.arange(9, dtype=np.float32).reshape(3, 3)
+        bboxes = np.array([[0, 0, 10, 10], [100, 100, 110, 110], [200, 200, 210, 210]], dtype=np.float32)
+        out = pool.step_v2(coords, bboxes, np.ones(3, dtype=np.float32))
+
+        np.testing.assert_array_equal(out[:2], coords[:2])
+        np.testing.assert_array_equal(out[2], np.zeros(3, dtype=np.float32))
+        assert pool.active_count == 2
+
+    def test_incomplete_subclass_cannot_be_constructed(self):
+        """测试：未实现全部抽象方法的向量化池在构造时即报错"""
+        class Incomplete(_VectorizedPoolBase):
+            def _reset_slots(self, slots):
+                pass
+
+        with pytest.raises(TypeError):
+            Incomplete(pool_size=2, max_missed_count=1, tracker=None, iou_threshold=0.5, gated=False)
+
+    def test_reset(self):
+        """测试：reset 后所有槽位空闲"""
+        pool = VectorizedFilterPool(pool_size=4)
+        pool.step_v2(np.ones((2, 3)), np.array([[0, 0, 1, 1], [5, 5, 6, 6]]), np.ones(2))
+        assert pool.active_count == 2
+        pool.reset()
+        assert pool.active_count == 0
+        assert pool.get_bbox_matrix().shape == (0, 4)
+
+
+class TestVectorizedKalmanFilterPoolEquivalence:
+    """卡尔曼池与对象引擎（FilterPool + KalmanFilter）的逐位一致性"""
+
+    @pytest.mark.parametrize("max_missed", [1, 3, 5])
+    def test_pool_step_identical(self, max_missed):
+        """测试：随机场景下逐帧一致，含丢失外推、失效重置与空帧"""
+        rng = np.random.default_rng(max_missed)
+        tracker = HungarianTracker(iou_threshold=0.3)
+        factory = lambda: KalmanFilter(process_noise=3.0, measurement_noise=15.0, max_missed_count=max_missed)
+        obj = FilterPool(pool_size=4, filter_factory=factory, tracker=tracker)
+        vec = VectorizedKalmanFilterPool.from_filter(factory(), pool_size=4, tracker=tracker)
+
+        for coords, bboxes, confs, _ in _random_scene(rng, frames=200, max_objects=6, num_labels=1):
+            np.testing.assert_array_equal(vec.step_v2(coords, bboxes, confs), obj.step_v2(coords, bboxes, confs))
+            np.testing.assert_array_equal(vec.active_mask, obj.active_mask)
+            np.testing.assert_array_equal(vec.get_bbox_matrix(), obj.get_bbox_matrix())
+            for e, a in zip(obj.coasting_tracks(), vec.coasting_tracks()):
+                np.testing.assert_array_equal(a, e)
+
+    @pytest.mark.parametrize("seed", [0, 1])
+    def test_manager_outputs_identical_with_predicted_rows(self, device_metadata, seed):
+        """测试：启用预测行输出时两种引擎的输出（含预测行）逐位一致"""
+        rng = np.random.default_rng(seed)
+        kwargs = dict(
+            device_metadata=device_metadata,
+            label_map=["durian", "person", "car"],
+            pool_size=8,
+            filter_factory=lambda: KalmanFilter(max_missed_count=3),
+            tracker=HungarianTracker(iou_threshold=0.3),
+            emit_predicted=True,
+        )
+        obj = FilterManager(engine="object", **kwargs)
+        vec = FilterManager(engine="vectorized", **kwargs)
+        assert isinstance(vec._pools[("device_001", 0)], VectorizedKalmanFilterPool)
+
+        for coords, bboxes, confs, labels in _random_scene(rng, frames=150):
+            expected = obj.process("device_001", coords, bboxes, confs, labels)
+            actual = vec.process("device_001", coords, bboxes, confs, labels)
+            for e, a in zip(expected, actual):
+                assert e.dtype == a.dtype
+                np.testing.assert_array_equal(a, e)
+        assert obj.get_pool_stats() == vec.get_pool_stats()
+
+
+class TestPredictedOutput:
+    """丢失期间目标的预测行输出"""
+
+    @staticmethod
+    def _track(manager, frames=6):
+        """单个目标（标签 0）沿 x 轴匀速运动若干帧：坐标每帧 20mm，边界框每帧 10px
+        （相邻帧 IoU 0.6，高于默认阈值 0.5，始终匹配到同一槽位）"""
+        for i in range(frames):
+            x = 20.0 * i
+            u = 10.0 * i
+            manager.process(
+                "device_001",
+                np.array([[x, 0, 1000]], dtype=np.float32),
+                np.array([[u, 100, u + 40, 140]], dtype=np.float32),
+                np.array([0.9], dtype=np.float32),
+                np.array([0], dtype=np.int32),
+            )
+
+    @pytest.mark.parametrize("engine", ["object", "vectorized"])
+    def test_coasting_kalman_track_is_emitted(self, device_metadata, engine):
+        """测试：目标丢失后以外推位置输出，置信度为 PREDICTED_CONFIDENCE，超过丢失阈值后不再输出"""
+        manager = FilterManager(
+            device_metadata=device_metadata,
+            label_map=["a", "b"],
+            filter_factory=lambda: KalmanFilter(max_missed_count=2),
+            engine=engine,
+            emit_predicted=True,
+        )
+        self._track(manager)
+        assert manager.get_pool_stats()[("device_001", 0)]["active_count"] == 1
+        empty = (np.empty((0, 3)), np.empty((0, 4)), np.empty(0), np.empty(0, dtype=np.int32))
+
+        coords, bboxes, confs, labels = manager.process("device_001", *empty)
+        assert len(coords) == 1
+        assert coords[0, 0] > 100.0  # 最后一次观测 x=100，沿运动方向外推
+        assert bboxes[0, 0] > 50.0
+        np.testing.assert_array_equal(confs, [PREDICTED_CONFIDENCE])
+        np.testing.assert_array_equal(labels, [0])
+
+        assert len(manager.process("device_001", *empty)[0]) == 0
+        assert manager.get_pool_stats()[("device_001", 0)]["active_count"] == 0
+
+    def test_predicted_rows_follow_detections(self, device_metadata):
+        """测试：其他标签有检测时，丢失目标的预测行追加在检测结果之后"""
+        manager = FilterManager(
+            device_metadata=device_metadata,
+            label_map=["a", "b"],
+            filter_factory=lambda: KalmanFilter(max_missed_count=3),
+            engine="vectorized",
+            emit_predicted=True,
+        )
+        self._track(manager)
+
+        coords, bboxes, confs, labels = manager.process(
+            "device_001",
+            np.array([[0, 0, 500]], dtype=np.float32),
+            np.array([[300, 300, 340, 340]], dtype=np.float32),
+            np.array([0.8], dtype=np.float32),
+            np.array([1], dtype=np.int32),
+        )
+        np.testing.assert_array_equal(labels, [1, 0])
+        np.testing.assert_array_equal(confs, np.array([0.8, PREDICTED_CONFIDENCE], dtype=np.float32))
+        np.testing.assert_array_equal(coords[0], [0, 0, 500])
+
+    def test_disabled_by_default(self, device_metadata):
+        manager = FilterManager(
+            device_metadata=device_metadata,
+            label_map=["a"],
+            filter_factory=KalmanFilter,
+            engine="vectorized",
+        )
+        assert not manager.emit_predicted
+        self._track(manager)
+        empty = (np.empty((0, 3)), np.empty((0, 4)), np.empty(0), np.empty(0, dtype=np.int32))
+        assert len(manager.process("device_001", *empty)[0]) == 0
+
+
+class TestFilterManagerEngine:
+    """FilterManager 引擎选择"""
+
+    def test_default_engine_is_object(self, device_metadata):
+        manager = FilterManager(device_metadata=device_metadata, label_map=["a"])
+        assert manager.engine == "object"
+        assert isinstance(manager._pools[("device_001", 0)], FilterPool)
+
+    def test_vectorized_engine_uses_factory_parameters(self, device_metadata):
+        manager = FilterManager(
+            device_metadata=device_metadata,
+            label_map=["a"],
+            pool_size=5,
+            filter_factory=lambda: MovingAverageFilter(queue_maxsize=4, max_missed_count=2),
+            engine="vectorized",
+        )
+        pool = manager._pools[("device_001", 0)]
+        assert isinstance(pool, VectorizedFilterPool)
+        assert pool.capacity == 5
+        assert pool._window == 4
+        assert pool._max_missed_count == 2
+
+    def test_invalid_engine(self, device_metadata):
+        with pytest.raises(ValueError, match="engine"):
+            FilterManager(device_metadata=device_metadata, label_map=["a"], engine="gpu")
+
+    def test_vectorized_engine_rejects_other_filters(self, device_metadata):
+        class OtherFilter(MovingAverageFilter):
+            pass
+
+        with pytest.raises(ValueError, match="MovingAverageFilter"):
+            FilterManager(
+                device_metadata=device_metadata,
+                label_map=["a"],
+                filter_factory=OtherFilter,
+                engine="vectorized",
+            )
+
+    def test_vectorized_engine_skips_unknown_labels(self, device_metadata):
+        """测试：超出 label_map 的标签被丢弃（与对象引擎一致）"""
+        kwargs = dict(device_metadata=device_metadata, label_map=["a", "b"])
+        coords = np.arange(12, dtype=np.float32).reshape(4, 3)
+        bboxes = np.array([[i * 50, 0, i * 50 + 10, 10] for i in range(4)], dtype=np.float32)
+        confs = np.full(4, 0.9, dtype=np.float32)
+        labels = np.array([5, 1, 0, 1], dtype=np.int32)
+
+        expected = FilterManager(engine="object", **kwargs).process("device_001", coords, bboxes, confs, labels)
+        actual = FilterManager(engine="vectorized", **kwargs).process("device_001", coords, bboxes, confs, labels)
+        for e, a in zip(expected, actual):
+            np.testing.assert_array_equal(a, e)
+        np.testing.assert_array_equal(actual[3], [0, 1, 1])
+
+    @pytest.mark.parametrize("filter_type,pool_cls", [
+        (FilterType.MOVING_AVERAGE, VectorizedFilterPool),
+        (FilterType.KALMAN, VectorizedKalmanFilterPool),
+    ])
+    def test_from_config_selects_vectorized_pool(self, device_metadata, filter_type, pool_cls):
+        config = FilterConfigDTO(filter_type=filter_type, engine="vectorized", emit_predicted=True)
+        manager = FilterManager.from_config(config, device_metadata=device_metadata, label_map=["a"])
+        assert manager.engine == "vectorized"
+        assert manager.emit_predicted
+        assert isinstance(manager._pools[("device_001", 0)], pool_cls)
+
+    @pytest.mark.parametrize("engine", ["object", "vectorized"])
+    def test_from_config_passes_tracker_settings(self, device_metadata, engine):
+        """测试：配置中的关联算法与门控开关传递到各滤波器池的跟踪器"""
+        config = FilterConfigDTO(engine=engine, tracker_method="greedy", tracker_gated=True)
+        manager = FilterManager.from_config(config, device_metadata=device_metadata, label_map=["a"])
+        tracker = manager._pools[("device_001", 0)]._tracker
+        assert isinstance(tracker, OptimizedGreedyTracker)
+        assert tracker.gated is True
+
+        default = FilterManager.from_config(FilterConfigDTO(), device_metadata=device_metadata, label_map=["a"])
+        assert isinstance(default._tracker, HungarianTracker)
+        assert default._tracker.gated is False
+
+    def test_tracker_config_validation(self):
+        assert FilterConfigDTO(tracker_method="greedy", tracker_gated=True).validate()
+        assert not FilterConfigDTO(tracker_method="sort").validate()
+        assert not FilterConfigDTO(tracker_gated=1).validate()
+        restored = FilterConfigDTO.from_dict(FilterConfigDTO(tracker_gated=True).to_dict())
+        assert restored.tracker_gated is True
+
+    def test_from_config_object_engine(self, device_metadata):
+        config = FilterConfigDTO(filter_type=FilterType.KALMAN, engine="object")
+        manager = FilterManager.from_config(config, device_metadata=device_metadata, label_map=["a"])
+        assert manager.engine == "object"
+        assert isinstance(manager._pools[("device_001", 0)], FilterPool)
+
+    def test_emit_predicted_config_round_trip(self):
+        config = FilterConfigDTO(emit_predicted=True)
+        assert config.validate()
+        assert FilterConfigDTO.from_dict(config.to_dict()).emit_predicted is True
+        assert not FilterConfigDTO(emit_predicted="yes").validate()
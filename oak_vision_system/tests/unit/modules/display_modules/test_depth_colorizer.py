@@ -0,0 +1,104 @@
+"""
+测试基于查找表的深度着色器
+
+验证 DepthColorizer：
+- 单帧（ema_alpha=1）结果与旧实现（np.percentile + 线性归一化 + applyColorMap）一致，
+  允许归一化范围按 16mm 直方图桶量化带来的色阶误差
+- 深度分布不变时查找表不重建，分布变化时按 EMA 逐步跟随
+- 未归一化时为 depth / 256 固定映射
+- 全零深度图输出调色板首色
+"""
+
+import unittest
+
+import cv2
+import numpy as np
+
+from oak_vision_system.modules.display_modules.depth_colorizer import DepthColorizer
+
+
+def _reference_colorize(depth: np.ndarray) -> np.ndarray:
+    """旧实现：降采样百分位数 + 浮点归一化 + applyColorMap"""
+    sample = depth[::4, ::4].astype(np.float32)
+    min_depth = np.percentile(sample[sample != 0], 1)
+    max_depth = np.percentile(sample, 99)
+    scaled = (depth.astype(np.float32) - min_depth) * (255.0 / (max_depth - min_depth))
+    normalized = np.clip(scaled, 0, 255).astype(np.uint8)
+    return cv2.applyColorMap(normalized, cv2.COLORMAP_HOT)
+
+
+class TestDepthColorizer(unittest.TestCase):
+    """测试深度着色器"""
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.depth = rng.integers(500, 4000, size=(240, 320), dtype=np.uint16)
+        self.depth[:20, :] = 0  # 无效深度
+
+    def test_matches_reference_colormap(self):
+        colorizer = DepthColorizer(ema_alpha=1.0)
+        result = colorizer.colorize(self.depth)
+
+        expected = _reference_colorize(self.depth)
+        self.assertEqual(result.shape, expected.shape)
+        self.assertEqual(result.dtype, np.uint8)
+        # 归一化范围量化到 16mm，3500mm 范围内色阶偏差约 1~2 级
+        diff = np.abs(result.astype(np.int16) - expected.astype(np.int16))
+        self.assertLessEqual(np.percentile(diff, 99), 12)
+
+    def test_writes_into_output_canvas(self):
+        colorizer = DepthColorizer()
+        out = np.empty(self.depth.shape + (3,), dtype=np.uint8)
+        result = colorizer.colorize(self.depth, out=out)
+        self.assertIs(result, out)
+
+    def test_lut_not_rebuilt_for_stable_scene(self):
+        colorizer = DepthColorizer()
+        for _ in range(10):
+            colorizer.colorize(self.depth)
+        self.assertEqual(colorizer.lut_rebuilds, 1)
+
+    def test_range_follows_distribution_change(self):
+        colorizer = DepthColorizer(ema_alpha=0.5)
+        colorizer.colorize(self.depth)
+        low, high = colorizer.depth_range
+
+        far = self.depth.copy()
+        far[far != 0] += 4000
+        colorizer.colorize(far)
+        _, high_after_one = colorizer.depth_range
+        for _ in range(20):
+            colorizer.colorize(far)
+        _, high_settled = colorizer.depth_range
+
+        self.assertGreater(high_after_one, high)
+        self.assertGreater(high_settled, 7500)
+
+    def test_fixed_mapping_without_normalization(self):
+        colorizer = DepthColorizer(normalize=False)
+        result = colorizer.colorize(self.depth)
+
+        expected = cv2.applyColorMap((self.depth >> 8).astype(np.uint8), cv2.COLORMAP_HOT)
+        np.testing.assert_array_equal(result, expected)
+        self.assertIsNone(colorizer.depth_range)
+
+    def test_all_zero_depth(self):
+        colorizer = DepthColorizer()
+        result = colorizer.colorize(np.zeros((48, 64), dtype=np.uint16))
+
+        black = cv2.applyColorMap(np.zeros((1, 1), dtype=np.uint8), cv2.COLORMAP_HOT)[0, 0]
+        self.assertTrue(np.all(result == black))
+
+    def test_rejects_non_uint16(self):
+        with self.assertRaises(TypeError):
+            DepthColorizer().colorize(np.zeros((4, 4), dtype=np.float32))
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            DepthColorizer(ema_alpha=0.0)
+        with self.assertRaises(ValueError):
+            DepthColorizer(low_percentile=99.0, high_percentile=1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
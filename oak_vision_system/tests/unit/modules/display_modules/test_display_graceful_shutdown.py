@@ -341,8 +341,9 @@ class TestRenderPacketPackagerGracefulShutdown(unittest.TestCase):
         for queue in packager.packet_queue.values():
             self.assertTrue(queue.empty())
         
-        # 验证缓冲区已清空
-        self.assertEqual(len(packager._buffer), 0)
+        # 验证配对环已清空
+        for ring in packager._rings.values():
+            self.assertEqual(len(ring), 0)
         
         # 验证缓存已清空
         for device_id, packet in packager._latest_packets.items():
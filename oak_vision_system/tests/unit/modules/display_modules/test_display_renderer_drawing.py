@@ -235,9 +235,9 @@ class TestDisplayRendererDetectionBoxes(unittest.TestCase):
         
         self.assertEqual(color, DEFAULT_DETECTION_COLOR)
     
-    @patch('oak_vision_system.modules.display_modules.display_renderer.cv2.putText')
+    @patch('oak_vision_system.modules.display_modules.text_sprites.TextSpriteCache.draw')
     @patch('oak_vision_system.modules.display_modules.display_renderer.cv2.rectangle')
-    def test_draw_detection_boxes_normalized_draws_labels(self, mock_rectangle, mock_put_text):
+    def test_draw_detection_boxes_normalized_draws_labels(self, mock_rectangle, mock_draw_text):
         """测试 _draw_detection_boxes_normalized() 绘制标签（需求 12.4）"""
         renderer = DisplayRenderer(
             config=self.config,
@@ -260,12 +260,12 @@ class TestDisplayRendererDetectionBoxes(unittest.TestCase):
             roiW=640, roiH=480, offsetX=0
         )
         
-        # 验证调用了 cv2.putText（绘制标签文字）
-        self.assertGreater(mock_put_text.call_count, 0)
+        # 验证绘制了标签文字
+        self.assertGreater(mock_draw_text.call_count, 0)
     
-    @patch('oak_vision_system.modules.display_modules.display_renderer.cv2.putText')
+    @patch('oak_vision_system.modules.display_modules.text_sprites.TextSpriteCache.draw')
     @patch('oak_vision_system.modules.display_modules.display_renderer.cv2.rectangle')
-    def test_draw_detection_boxes_normalized_draws_confidence(self, mock_rectangle, mock_put_text):
+    def test_draw_detection_boxes_normalized_draws_confidence(self, mock_rectangle, mock_draw_text):
         """测试 _draw_detection_boxes_normalized() 绘制置信度（需求 12.5）"""
         renderer = DisplayRenderer(
             config=self.config,
@@ -288,12 +288,12 @@ class TestDisplayRendererDetectionBoxes(unittest.TestCase):
             roiW=640, roiH=480, offsetX=0
         )
         
-        # 验证调用了 cv2.putText
-        self.assertGreater(mock_put_text.call_count, 0)
+        # 验证绘制了标签文字
+        self.assertGreater(mock_draw_text.call_count, 0)
         
         # 验证标签文本包含置信度（90%）
-        call_args = mock_put_text.call_args_list[0]
-        canvas_arg, text, position, font, font_scale, color, thickness = call_args[0]
+        call_args = mock_draw_text.call_args_list[0]
+        canvas_arg, text = call_args[0][:2]
         
         self.assertIn("90%", text)
     
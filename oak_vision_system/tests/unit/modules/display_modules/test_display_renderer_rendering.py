@@ -553,5 +553,38 @@ class TestDisplayRendererStateDriven(unittest.TestCase):
         self.mock_packager.get_packets.assert_not_called()
 
 
+    def test_render_once_headless_submits_only_new_packets(self):
+        """测试无头模式下缓存的重复包不再合成、不再提交视频流"""
+        config = DisplayConfigDTO(
+            enable_display=True,
+            enable_window=False,
+            target_fps=30,
+            window_width=640,
+            window_height=480,
+        )
+        stream_server = Mock()
+        renderer = DisplayRenderer(
+            config=config,
+            packager=self.mock_packager,
+            devices_list=self.devices_list,
+            role_bindings=self.role_bindings,
+            stream_server=stream_server,
+        )
+        renderer._display_mode = "single"
+        renderer._selected_device_role = DeviceRole.LEFT_CAMERA
+        
+        # 打包器在没有新包时重复返回同一个缓存包
+        packet = self._create_test_packet("device_001")
+        self.mock_packager.get_packet_by_mxid.return_value = packet
+        
+        with patch.object(renderer, '_render_single_device', wraps=renderer._render_single_device) as render:
+            renderer.render_once()
+            renderer.render_once()
+            renderer.render_once()
+        
+        # 只有首次出现的帧被合成并提交
+        self.assertEqual(render.call_count, 1)
+        stream_server.submit.assert_called_once()
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,59 @@
+"""
+测试半透明叠加绘制
+
+验证 blend_rect：
+- 与旧实现（整帧复制 + cv2.addWeighted）的像素结果一致
+- 只修改矩形区域内的像素
+- 超出画布的矩形被裁剪，完全在画布外时不修改
+"""
+
+import unittest
+
+import cv2
+import numpy as np
+
+from oak_vision_system.modules.display_modules.overlay import OVERLAY_ALPHA, blend_rect
+
+
+class TestBlendRect(unittest.TestCase):
+    """测试 ROI 就地混合"""
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.frame = rng.integers(0, 255, size=(120, 160, 3), dtype=np.uint8)
+
+    def _full_frame_blend(self, frame, top_left, bottom_right, color):
+        expected = frame.copy()
+        overlay = expected.copy()
+        cv2.rectangle(overlay, top_left, bottom_right, color, -1)
+        cv2.addWeighted(overlay, OVERLAY_ALPHA, expected, 1 - OVERLAY_ALPHA, 0, expected)
+        return expected
+
+    def test_matches_full_frame_blend(self):
+        for top_left, bottom_right, color in [
+            ((10, 20), (60, 40), (0, 0, 0)),
+            ((-5, -5), (30, 12), (0, 255, 255)),
+            ((140, 100), (200, 150), (255, 0, 0)),
+        ]:
+            expected = self._full_frame_blend(self.frame, top_left, bottom_right, color)
+            frame = self.frame.copy()
+            blend_rect(frame, top_left, bottom_right, color)
+            np.testing.assert_array_equal(frame, expected)
+
+    def test_only_roi_is_modified(self):
+        frame = self.frame.copy()
+        blend_rect(frame, (10, 20), (60, 40), (0, 0, 0))
+        outside = np.ones(frame.shape[:2], dtype=bool)
+        outside[20:41, 10:61] = False
+        np.testing.assert_array_equal(frame[outside], self.frame[outside])
+        self.assertFalse(np.array_equal(frame[20:41, 10:61], self.frame[20:41, 10:61]))
+
+    def test_rect_outside_frame_is_noop(self):
+        frame = self.frame.copy()
+        blend_rect(frame, (200, 200), (260, 240), (0, 0, 0))
+        blend_rect(frame, (-50, -50), (-10, -10), (0, 0, 0))
+        np.testing.assert_array_equal(frame, self.frame)
+
+
+if __name__ == "__main__":
+    unittest.main()
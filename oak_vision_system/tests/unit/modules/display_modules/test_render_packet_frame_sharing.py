@@ -0,0 +1,110 @@
+"""
+测试 RenderPacketPackager 与其他 RAW_FRAME_DATA 订阅者共享视频帧
+
+同一个 VideoFrameDTO 会被投递给所有订阅者（如录制线程、采集端接收器），
+打包器替换或清理缓存帧时不能回收该帧的图像缓冲区，其他订阅者持有的图像必须保持不变。
+"""
+
+import unittest
+
+import numpy as np
+
+from oak_vision_system.core.dto.data_processing_dto import (
+    DetectionStatusLabel,
+    DeviceProcessedDataDTO,
+)
+from oak_vision_system.core.dto.detection_dto import VideoFrameDTO
+from oak_vision_system.core.event_bus import DispatchMode, EventType
+from oak_vision_system.modules.display_modules.render_packet_packager import (
+    RenderPacketPackager,
+)
+from oak_vision_system.utils import get_frame_buffer_pool
+
+DEVICE_ID = "device_001"
+FRAME_SHAPE = (48, 64, 3)
+
+
+def _pooled_video_frame(frame_id: int) -> VideoFrameDTO:
+    """图像在首次读取时解码到帧缓冲区池的缓冲区中，内容为帧号"""
+    def load() -> np.ndarray:
+        buf = get_frame_buffer_pool().acquire(FRAME_SHAPE, np.uint8)
+        buf.fill(frame_id)
+        return buf
+
+    return VideoFrameDTO(device_id=DEVICE_ID, frame_id=frame_id, rgb_loader=load)
+
+
+def _processed_data(frame_id: int) -> DeviceProcessedDataDTO:
+    return DeviceProcessedDataDTO(
+        device_id=DEVICE_ID,
+        frame_id=frame_id,
+        labels=np.array([0], dtype=np.int32),
+        bbox=np.array([[0.1, 0.1, 0.3, 0.3]], dtype=np.float32),
+        coords=np.array([[100, 200, 300]], dtype=np.float32),
+        confidence=np.array([0.9], dtype=np.float32),
+        state_label=[DetectionStatusLabel.OBJECT_GRASPABLE],
+        device_alias="left",
+    )
+
+
+class TestRenderPacketFrameSharing(unittest.TestCase):
+    """测试打包器不回收与其他订阅者共享的帧"""
+
+    def setUp(self):
+        self.packager = RenderPacketPackager(devices_list=[DEVICE_ID], cache_max_age_sec=10.0)
+        self.event_bus = self.packager.event_bus
+        # 打包线程未启动（由测试手动处理事件），stop() 不会取消订阅
+        self.addCleanup(self.event_bus.unsubscribe, self.packager._video_frame_sub_id)
+        self.addCleanup(self.event_bus.unsubscribe, self.packager._processed_data_sub_id)
+
+        # 第二个订阅者：模拟录制线程，保存收到的视频帧
+        self.recorded = []
+        sub_id = self.event_bus.subscribe(
+            EventType.RAW_FRAME_DATA, self.recorded.append,
+            dispatch_mode=DispatchMode.INLINE,
+        )
+        self.addCleanup(self.event_bus.unsubscribe, sub_id)
+
+    def _publish_frame(self, frame_id: int) -> None:
+        self.event_bus.publish(EventType.RAW_FRAME_DATA, _pooled_video_frame(frame_id))
+        self.event_bus.publish(EventType.PROCESSED_DATA, _processed_data(frame_id))
+        queue = self.packager.event_queue
+        while not queue.empty():
+            self.packager._handle_single_event(queue.get_nowait())
+
+    def test_recorded_frame_survives_packet_replacement(self):
+        self._publish_frame(1)
+        packet = self.packager.get_packet_by_mxid(DEVICE_ID, timeout=0.01)
+        self.assertIsNotNone(packet)
+
+        # 渲染线程与录制线程读取同一帧（共享一次解码结果）
+        recorded = self.recorded[0]
+        self.assertIs(packet.video_frame, recorded)
+        self.assertIs(packet.video_frame.rgb_frame, recorded.rgb_frame)
+
+        # 新帧替换缓存帧；新帧的解码以及其他模块的池分配都不能拿到第 1 帧的缓冲区
+        self._publish_frame(2)
+        self.assertEqual(self.packager.get_packet_by_mxid(DEVICE_ID, timeout=0.01).video_frame.frame_id, 2)
+        self.packager.get_packet_by_mxid(DEVICE_ID, timeout=0.01).video_frame.rgb_frame
+        scratch = get_frame_buffer_pool().acquire(FRAME_SHAPE, np.uint8)
+        scratch.fill(255)
+
+        self.assertEqual(len(self.recorded), 2)
+        self.assertTrue(np.all(recorded.rgb_frame == 1))
+
+    def test_recorded_frame_survives_cache_expiry(self):
+        self._publish_frame(1)
+        self.packager.get_packet_by_mxid(DEVICE_ID, timeout=0.01).video_frame.rgb_frame
+        recorded = self.recorded[0]
+
+        # 缓存帧过期后被清理
+        self.packager.cache_max_age_sec = -1.0
+        self.assertIsNone(self.packager.get_packet_by_mxid(DEVICE_ID, timeout=0.01))
+        scratch = get_frame_buffer_pool().acquire(FRAME_SHAPE, np.uint8)
+        scratch.fill(255)
+
+        self.assertTrue(np.all(recorded.rgb_frame == 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
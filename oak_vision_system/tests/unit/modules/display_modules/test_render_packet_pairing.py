@@ -0,0 +1,161 @@
+"""
+测试 RenderPacketPackager 配对环
+
+验证：
+- 视频帧与检测数据按 frame_id 配对，配对后释放槽位
+- 重复到达不抛异常，保留最新数据
+- 超时的半配对被丢弃
+- 未配对数据不超过配对环容量（内存有界）
+- latest-only 模式：新帧配对成功后丢弃更早的半配对和迟到的旧帧数据
+- 帧号大幅回退（设备重连）后重新配对
+"""
+
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from oak_vision_system.core.dto.data_processing_dto import (
+    DetectionStatusLabel,
+    DeviceProcessedDataDTO,
+)
+from oak_vision_system.core.dto.detection_dto import VideoFrameDTO
+from oak_vision_system.modules.display_modules.render_packet_packager import (
+    DataType,
+    RawDataEvent,
+    RenderPacketPackager,
+)
+
+DEVICE_ID = "device_001"
+_MONOTONIC = "oak_vision_system.modules.display_modules.render_packet_packager.time.monotonic"
+
+
+def _video_event(frame_id: int) -> RawDataEvent:
+    video = VideoFrameDTO(
+        device_id=DEVICE_ID,
+        frame_id=frame_id,
+        rgb_frame=np.zeros((4, 4, 3), dtype=np.uint8),
+    )
+    return RawDataEvent(datatype=DataType.RAW_FRAME_DATA, video_data=video)
+
+
+def _detection_event(frame_id: int, confidence: float = 0.9) -> RawDataEvent:
+    detection = DeviceProcessedDataDTO(
+        device_id=DEVICE_ID,
+        frame_id=frame_id,
+        labels=np.array([0], dtype=np.int32),
+        bbox=np.array([[0.1, 0.1, 0.3, 0.3]], dtype=np.float32),
+        coords=np.array([[100, 200, 300]], dtype=np.float32),
+        confidence=np.array([confidence], dtype=np.float32),
+        state_label=[DetectionStatusLabel.OBJECT_GRASPABLE],
+        device_alias="left",
+    )
+    return RawDataEvent(datatype=DataType.PROCESSED_DATA, pro_data=detection)
+
+
+class TestRenderPacketPairing(unittest.TestCase):
+    """测试配对环"""
+
+    def _make_packager(self, **kwargs) -> RenderPacketPackager:
+        packager = RenderPacketPackager(devices_list=[DEVICE_ID], **kwargs)
+        self.addCleanup(packager.stop)
+        return packager
+
+    def _drain(self, packager):
+        queue = packager.packet_queue[DEVICE_ID]
+        packets = []
+        while not queue.empty():
+            packets.append(queue.get_nowait())
+        return packets
+
+    def test_pairs_video_and_detection(self):
+        packager = self._make_packager()
+        packager._handle_single_event(_video_event(1))
+        packager._handle_single_event(_detection_event(1))
+
+        packets = self._drain(packager)
+        self.assertEqual(len(packets), 1)
+        self.assertEqual(packets[0].video_frame.frame_id, 1)
+        self.assertEqual(len(packager._rings[DEVICE_ID]), 0)
+        self.assertEqual(packager._stats["render_packets"], 1)
+
+    def test_duplicate_arrival_keeps_latest(self):
+        packager = self._make_packager()
+        packager._handle_single_event(_detection_event(1, confidence=0.5))
+        packager._handle_single_event(_detection_event(1, confidence=0.8))
+        packager._handle_single_event(_video_event(1))
+
+        packets = self._drain(packager)
+        self.assertEqual(len(packets), 1)
+        self.assertAlmostEqual(float(packets[0].processed_detections.confidence[0]), 0.8, places=5)
+        self.assertEqual(packager._stats["duplicates"], 1)
+
+    def test_expired_partials_are_dropped(self):
+        packager = self._make_packager(timeout_sec=0.2)
+        with patch(_MONOTONIC, return_value=100.0):
+            packager._handle_single_event(_video_event(1))
+            packager._handle_single_event(_video_event(2))
+        with patch(_MONOTONIC, return_value=100.1):
+            packager._handle_single_event(_video_event(3))
+        with patch(_MONOTONIC, return_value=100.25):
+            packager._clean_buffer()
+
+        self.assertEqual(packager._stats["drops"], 2)
+        self.assertEqual(len(packager._rings[DEVICE_ID]), 1)
+
+    def test_unpaired_data_bounded_by_capacity(self):
+        packager = self._make_packager(pairing_capacity=8)
+        for frame_id in range(100):
+            packager._handle_single_event(_video_event(frame_id))
+
+        ring = packager._rings[DEVICE_ID]
+        self.assertEqual(len(ring), 8)
+        self.assertEqual(packager._stats["drops"], 92)
+
+        # 最近的帧仍可配对
+        packager._handle_single_event(_detection_event(99))
+        self.assertEqual(len(self._drain(packager)), 1)
+
+    def test_latest_only_discards_older_frames(self):
+        packager = self._make_packager(latest_only=True)
+        for frame_id in (1, 2, 3):
+            packager._handle_single_event(_video_event(frame_id))
+        packager._handle_single_event(_detection_event(3))
+
+        self.assertEqual(len(packager._rings[DEVICE_ID]), 0)
+        self.assertEqual(packager._stats["drops"], 2)
+
+        # 迟到的旧帧检测数据直接丢弃，不生成渲染包
+        packager._handle_single_event(_detection_event(2))
+        packets = self._drain(packager)
+        self.assertEqual([p.video_frame.frame_id for p in packets], [3])
+        self.assertEqual(packager._stats["drops"], 3)
+
+    def test_late_detection_pairs_without_latest_only(self):
+        packager = self._make_packager()
+        for frame_id in (1, 2, 3):
+            packager._handle_single_event(_video_event(frame_id))
+        packager._handle_single_event(_detection_event(3))
+        packager._handle_single_event(_detection_event(2))
+
+        packets = self._drain(packager)
+        self.assertEqual([p.video_frame.frame_id for p in packets], [3, 2])
+
+    def test_frame_id_reset_after_reconnect(self):
+        packager = self._make_packager(latest_only=True, pairing_capacity=8)
+        packager._handle_single_event(_video_event(1000))
+        packager._handle_single_event(_detection_event(1000))
+
+        packager._handle_single_event(_video_event(1))
+        packager._handle_single_event(_detection_event(1))
+
+        packets = self._drain(packager)
+        self.assertEqual([p.video_frame.frame_id for p in packets], [1000, 1])
+
+    def test_invalid_capacity(self):
+        with self.assertRaises(ValueError):
+            RenderPacketPackager(devices_list=[DEVICE_ID], pairing_capacity=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+"""
+测试 MJPEG 视频流服务
+
+验证 MjpegStreamServer：
+- 没有观看者时不编码
+- /stream 输出 multipart JPEG 帧，/snapshot.jpg 返回单帧
+- 编码线程全忙时跳过新帧，submit() 不阻塞
+- stop() 断开客户端且幂等
+"""
+
+import http.client
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+
+from oak_vision_system.modules.display_modules.stream_server import MjpegStreamServer
+
+
+class TestMjpegStreamServer(unittest.TestCase):
+    """测试 MJPEG 视频流服务"""
+
+    def setUp(self):
+        self.server = MjpegStreamServer(port=0, encoder_threads=1)
+        self.assertTrue(self.server.start())
+        self.host, self.port = self.server.address
+        self.frame = np.full((48, 64, 3), 128, dtype=np.uint8)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def _connect(self, path):
+        conn = http.client.HTTPConnection(self.host, self.port, timeout=5)
+        conn.request("GET", path)
+        return conn
+
+    def _wait_viewers(self, count):
+        deadline = time.monotonic() + 2.0
+        while self.server.get_stats()["viewers"] != count and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.server.get_stats()["viewers"], count)
+
+    def test_no_encoding_without_viewers(self):
+        self.assertFalse(self.server.submit(self.frame))
+
+        stats = self.server.get_stats()
+        self.assertEqual(stats["frames_submitted"], 1)
+        self.assertEqual(stats["frames_encoded"], 0)
+
+    def test_stream_delivers_jpeg_frames(self):
+        conn = self._connect("/stream")
+        response = conn.getresponse()
+        self.assertEqual(response.status, 200)
+        self.assertIn("multipart/x-mixed-replace", response.getheader("Content-Type"))
+        self._wait_viewers(1)
+
+        self.assertTrue(self.server.submit(self.frame))
+        boundary = response.readline()
+        self.assertTrue(boundary.startswith(b"--"))
+        headers = {}
+        while True:
+            line = response.readline().strip()
+            if not line:
+                break
+            name, value = line.decode().split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+        jpeg = response.read(int(headers["content-length"]))
+
+        self.assertEqual(headers["content-type"], "image/jpeg")
+        decoded = cv2.imdecode(np.frombuffer(jpeg, dtype=np.uint8), cv2.IMREAD_COLOR)
+        self.assertEqual(decoded.shape, self.frame.shape)
+        conn.close()
+
+    def test_snapshot_returns_next_frame(self):
+        result = {}
+
+        def fetch():
+            conn = self._connect("/snapshot.jpg")
+            response = conn.getresponse()
+            result["status"] = response.status
+            result["body"] = response.read()
+            conn.close()
+
+        thread = threading.Thread(target=fetch)
+        thread.start()
+        self._wait_viewers(1)
+        self.server.submit(self.frame)
+        thread.join(timeout=5)
+
+        self.assertEqual(result["status"], 200)
+        self.assertTrue(result["body"].startswith(b"\xff\xd8"))
+
+    def test_skips_frames_while_encoder_busy(self):
+        release = threading.Event()
+        real_imencode = cv2.imencode
+
+        def slow_imencode(*args, **kwargs):
+            release.wait(timeout=5)
+            return real_imencode(*args, **kwargs)
+
+        conn = self._connect("/stream")
+        conn.getresponse()
+        self._wait_viewers(1)
+
+        with patch("oak_vision_system.modules.display_modules.stream_server.cv2.imencode", slow_imencode):
+            start = time.monotonic()
+            self.assertTrue(self.server.submit(self.frame))
+            self.assertFalse(self.server.submit(self.frame))
+            self.assertFalse(self.server.submit(self.frame))
+            self.assertLess(time.monotonic() - start, 0.5)
+            release.set()
+            deadline = time.monotonic() + 2.0
+            while self.server.get_stats()["frames_encoded"] < 1 and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        stats = self.server.get_stats()
+        self.assertEqual(stats["frames_skipped"], 2)
+        self.assertEqual(stats["frames_encoded"], 1)
+        conn.close()
+
+    def test_stop_disconnects_clients_and_is_idempotent(self):
+        conn = self._connect("/stream")
+        conn.getresponse()
+        self._wait_viewers(1)
+
+        self.assertTrue(self.server.stop())
+        self.assertTrue(self.server.stop())
+        self.assertFalse(self.server.is_running)
+        self.assertFalse(self.server.submit(self.frame))
+        conn.close()
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            MjpegStreamServer(jpeg_quality=0)
+        with self.assertRaises(ValueError):
+            MjpegStreamServer(encoder_threads=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
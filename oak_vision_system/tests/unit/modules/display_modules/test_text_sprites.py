@@ -0,0 +1,110 @@
+"""
+测试文本精灵缓存
+
+验证 TextSpriteCache：
+- measure() 与 cv2.getTextSize 一致（整串精灵精确一致，字形拼接误差不超过 1 像素）
+- 整串精灵绘制结果与 cv2.putText(LINE_AA) 一致（误差上限由两种混合的取整方式推出，另限制平均误差）
+- 重复绘制命中缓存，超出上限时按 LRU 淘汰
+- 字形图集只按字符缓存，数字变化不产生新条目
+- 超出画布的文本被裁剪
+"""
+
+import unittest
+
+import cv2
+import numpy as np
+
+from oak_vision_system.modules.display_modules.text_sprites import TextSpriteCache
+
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+
+# cv2.putText 逐笔画以 8 位定点权重（a/256，每次混合取整）混合到画面上，笔画交汇处的像素
+# 会被混合多次；精灵则在黑底上经过同样的笔画得到覆盖率（量化到 1/255），再以浮点一次混合。
+# 每次笔画混合在两侧各带来至多 1 级取整差异，交汇处至多两次笔画混合，最终取整再差 0.5 级：
+# 单像素误差上限为 2 × 2 = 4 级。取整误差无偏，被文字覆盖的像素上平均误差应远小于 1 级。
+_MAX_BLEND_ERROR = 4
+_MEAN_BLEND_ERROR = 0.5
+
+
+class TestTextSpriteCache(unittest.TestCase):
+    """测试文本精灵缓存"""
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.frame = rng.integers(0, 255, size=(120, 320, 3), dtype=np.uint8)
+        self.cache = TextSpriteCache(font=FONT)
+
+    def test_measure_matches_get_text_size(self):
+        for text, scale, thickness in [("Label_3 90%", 0.5, 1), ("Device: left", 0.6, 1), ("FPS: 29.8", 0.7, 2)]:
+            expected = cv2.getTextSize(text, FONT, scale, thickness)
+            self.assertEqual(self.cache.measure(text, scale, thickness), expected)
+
+            (width, height), baseline = self.cache.measure(text, scale, thickness, volatile=True)
+            self.assertLessEqual(abs(width - expected[0][0]), 1)
+            self.assertEqual((height, baseline), (expected[0][1], expected[1]))
+
+    def test_sprite_matches_put_text(self):
+        cases = [
+            ("Label_3", 0.6, (0, 255, 255), 1),
+            ("Device: left 90%", 0.5, (255, 255, 0), 1),
+            ("FPS: 29.8", 0.7, (10, 200, 90), 2),
+        ]
+        for text, scale, color, thickness in cases:
+            with self.subTest(text=text):
+                expected = self.frame.copy()
+                cv2.putText(expected, text, (20, 60), FONT, scale, color, thickness, cv2.LINE_AA)
+
+                frame = self.frame.copy()
+                self.cache.draw(frame, text, (20, 60), scale, color, thickness)
+
+                diff = np.abs(frame.astype(np.int16) - expected.astype(np.int16))
+                covered = ((expected != self.frame) | (frame != self.frame)).any(axis=2)
+                self.assertTrue(covered.any())
+                self.assertLessEqual(diff.max(), _MAX_BLEND_ERROR)
+                self.assertLess(diff[covered].mean(), _MEAN_BLEND_ERROR)
+
+    def test_repeated_draw_hits_cache(self):
+        for _ in range(5):
+            self.cache.draw(self.frame, "Device: left", (10, 30), 0.6, (255, 255, 0))
+
+        stats = self.cache.get_stats()
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hits"], 4)
+        self.assertEqual(stats["sprites"], 1)
+
+    def test_lru_eviction(self):
+        cache = TextSpriteCache(max_sprites=2, font=FONT)
+        cache.draw(self.frame, "a", (10, 30), 0.5, (255, 255, 255))
+        cache.draw(self.frame, "b", (10, 30), 0.5, (255, 255, 255))
+        cache.draw(self.frame, "a", (10, 30), 0.5, (255, 255, 255))  # a 变为最近使用
+        cache.draw(self.frame, "c", (10, 30), 0.5, (255, 255, 255))  # 淘汰 b
+
+        cache.draw(self.frame, "a", (10, 30), 0.5, (255, 255, 255))
+        stats = cache.get_stats()
+        self.assertEqual(stats["evictions"], 1)
+        self.assertEqual(stats["sprites"], 2)
+        self.assertEqual(stats["hits"], 2)
+
+    def test_volatile_text_uses_glyph_atlas(self):
+        for value in range(100):
+            self.cache.draw(self.frame, f"({value}, {-value}, 1532) mm", (10, 60), 0.5, (255, 255, 255), volatile=True)
+
+        # 只缓存出现过的字符（空格不生成精灵）
+        charset = set("(), -mm0123456789") - {" "}
+        self.assertEqual(self.cache.get_stats()["sprites"], len(charset))
+
+    def test_clipped_outside_frame(self):
+        frame = self.frame.copy()
+        self.cache.draw(frame, "Q:Quit", (-500, -500), 0.5, (255, 255, 255))
+        np.testing.assert_array_equal(frame, self.frame)
+
+        self.cache.draw(frame, "Q:Quit", (300, 10), 0.5, (255, 255, 255))
+        self.assertFalse(np.array_equal(frame, self.frame))
+
+    def test_invalid_max_sprites(self):
+        with self.assertRaises(ValueError):
+            TextSpriteCache(max_sprites=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+"""LatencyTracer 单元测试
+
+覆盖直方图分桶精度、百分位计算、未启用时不记录、多线程分片合并以及窗口差值统计。
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+from oak_vision_system.core.event_bus import EventType
+from oak_vision_system.core.tracing import LatencyTracer, TraceStage, percentile_us
+from oak_vision_system.core.tracing.histogram import (
+    MAX_TRACKABLE_US,
+    bucket_index,
+    bucket_value,
+    max_us,
+)
+
+
+class TestHistogram:
+
+    def test_bucket_relative_error(self):
+        for value in (0, 1, 127, 128, 129, 1000, 12345, 999_999, MAX_TRACKABLE_US):
+            approx = bucket_value(bucket_index(value))
+            assert abs(approx - value) <= max(0.5, value / 64)
+
+    def test_bucket_index_is_monotonic(self):
+        indices = [bucket_index(v) for v in range(0, 5000, 7)]
+        assert indices == sorted(indices)
+
+    def test_percentiles(self):
+        counts = [0] * (bucket_index(MAX_TRACKABLE_US) + 1)
+        for value in range(1, 101):
+            counts[bucket_index(value)] += 1
+        assert percentile_us(counts, 50) == 50
+        assert percentile_us(counts, 99) == 99
+        assert max_us(counts) == 100
+        assert percentile_us([0, 0, 0], 50) == 0.0
+
+
+class TestLatencyTracer:
+
+    def test_disabled_tracer_records_nothing(self):
+        tracer = LatencyTracer(enabled=False, event_bus=Mock())
+        tracer.stamp(TraceStage.RENDER, time.monotonic())
+        assert tracer.snapshot().stages == {}
+
+    def test_missing_capture_ts_is_ignored(self):
+        tracer = LatencyTracer(enabled=True, event_bus=Mock())
+        tracer.stamp(TraceStage.RENDER, None)
+        assert tracer.snapshot().stages == {}
+
+    def test_snapshot_merges_threads_and_orders_stages(self):
+        tracer = LatencyTracer(enabled=True, event_bus=Mock())
+
+        def worker(stage, age):
+            for _ in range(50):
+                tracer.stamp(stage, time.monotonic() - age)
+
+        threads = [
+            threading.Thread(target=worker, args=(TraceStage.RENDER, 0.040)),
+            threading.Thread(target=worker, args=(TraceStage.RENDER, 0.040)),
+            threading.Thread(target=worker, args=(TraceStage.COLLECTOR_PICKUP, 0.005)),
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stages = tracer.snapshot().stages
+        assert list(stages) == [TraceStage.COLLECTOR_PICKUP, TraceStage.RENDER]
+        assert stages[TraceStage.RENDER].count == 100
+        assert 39.0 <= stages[TraceStage.RENDER].p50_ms < 45.0
+        assert 4.9 <= stages[TraceStage.COLLECTOR_PICKUP].p99_ms < 8.0
+
+    def test_snapshot_reports_window_deltas(self):
+        tracer = LatencyTracer(enabled=True, event_bus=Mock())
+        tracer.stamp(TraceStage.FILTER, time.monotonic())
+        assert tracer.snapshot().stages[TraceStage.FILTER].count == 1
+        assert tracer.snapshot().stages == {}
+        tracer.stamp(TraceStage.FILTER, time.monotonic())
+        tracer.stamp(TraceStage.FILTER, time.monotonic())
+        assert tracer.snapshot().stages[TraceStage.FILTER].count == 2
+
+    def test_publishes_performance_metrics(self):
+        event_bus = Mock()
+        tracer = LatencyTracer(enabled=True, event_bus=event_bus, publish_interval_s=0.02)
+        assert tracer.start()
+        tracer.stamp(TraceStage.DECISION, time.monotonic())
+        deadline = time.monotonic() + 2.0
+        while not event_bus.publish.called and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert tracer.stop()
+        assert tracer.stop()  # 幂等
+
+        event_type, payload = event_bus.publish.call_args.args
+        assert event_type == EventType.PERFORMANCE_METRICS
+        assert payload.stages[TraceStage.DECISION].count == 1
+
+    def test_disabled_tracer_start_is_noop(self):
+        tracer = LatencyTracer(enabled=False, event_bus=Mock())
+        assert tracer.start()
+        assert tracer.stop()
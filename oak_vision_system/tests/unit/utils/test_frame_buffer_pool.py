@@ -0,0 +1,80 @@
+"""FrameBufferPool 单元测试
+
+覆盖按尺寸复用、显式归还、非池数组忽略以及空闲数量上限。
+"""
+
+import numpy as np
+import pytest
+
+from oak_vision_system.utils.data_structures.buffer_pool import (
+    FrameBufferPool,
+    get_frame_buffer_pool,
+)
+
+
+class TestFrameBufferPool:
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            FrameBufferPool(max_free_per_key=-1)
+
+    def test_acquire_shape_and_dtype(self):
+        pool = FrameBufferPool()
+        buf = pool.acquire((4, 6, 3), np.uint8)
+        assert buf.shape == (4, 6, 3)
+        assert buf.dtype == np.uint8
+        assert buf.flags.c_contiguous
+        assert buf.flags.writeable
+
+    def test_released_buffer_is_reused_by_key(self):
+        pool = FrameBufferPool()
+        buf = pool.acquire((4, 6, 3), np.uint8)
+        assert pool.release(buf) is True
+
+        # 不同尺寸或类型不复用
+        other = pool.acquire((4, 6), np.uint8)
+        assert other is not buf
+        other_dtype = pool.acquire((4, 6, 3), np.float32)
+        assert other_dtype is not buf
+
+        assert pool.acquire((4, 6, 3), np.uint8) is buf
+        stats = pool.get_stats()
+        assert stats["reused"] == 1
+        assert stats["allocated"] == 3
+
+    def test_release_ignores_foreign_arrays(self):
+        pool = FrameBufferPool()
+        buf = pool.acquire((2, 2), np.uint16)
+
+        assert pool.release(None) is False
+        assert pool.release(np.zeros((2, 2), dtype=np.uint16)) is False
+        # 池数组的视图不是池数组本身
+        assert pool.release(buf[:1]) is False
+        assert pool.get_stats()["free_buffers"] == 0
+
+    def test_double_release_is_ignored(self):
+        pool = FrameBufferPool()
+        buf = pool.acquire((2, 2), np.uint8)
+        assert pool.release(buf) is True
+        assert pool.release(buf) is False
+        assert pool.get_stats()["free_buffers"] == 1
+
+    def test_free_list_is_bounded(self):
+        pool = FrameBufferPool(max_free_per_key=2)
+        bufs = [pool.acquire((3, 3), np.uint8) for _ in range(3)]
+        for buf in bufs:
+            assert pool.release(buf) is True
+
+        stats = pool.get_stats()
+        assert stats["free_buffers"] == 2
+        assert stats["discarded"] == 1
+        assert stats["free_bytes"] == 2 * 9
+
+    def test_clear_drops_free_buffers(self):
+        pool = FrameBufferPool()
+        pool.release(pool.acquire((3, 3), np.uint8))
+        pool.clear()
+        assert pool.get_stats()["free_buffers"] == 0
+
+    def test_shared_pool_is_singleton(self):
+        assert get_frame_buffer_pool() is get_frame_buffer_pool()
@@ -0,0 +1,149 @@
+"""RingOverflowQueue 单元测试
+
+覆盖 spsc / mpmc 两种模式下的溢出语义、阻塞获取、丢弃统计与压力接口，
+并验证其与 OverflowQueue 的行为一致性。
+"""
+
+import threading
+from queue import Empty
+
+import pytest
+
+from oak_vision_system.utils.data_structures.Queue import OverflowQueue, RingOverflowQueue
+
+
+MODES = ["spsc", "mpmc"]
+
+
+class TestRingOverflowQueueBasic:
+    """基础行为测试"""
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            RingOverflowQueue(maxsize=0)
+        with pytest.raises(ValueError):
+            RingOverflowQueue(maxsize=4, mode="lockfree")
+
+    @pytest.mark.parametrize("mode", MODES)
+    def test_fifo_order(self, mode):
+        q = RingOverflowQueue(maxsize=4, mode=mode)
+        for i in range(3):
+            assert q.put_with_overflow(i) is False
+        assert q.qsize() == 3
+        assert [q.get_nowait() for _ in range(3)] == [0, 1, 2]
+        assert q.empty()
+
+    @pytest.mark.parametrize("mode", MODES)
+    def test_overflow_drops_oldest(self, mode):
+        q = RingOverflowQueue(maxsize=3, mode=mode)
+        results = [q.put_with_overflow(i) for i in range(5)]
+
+        assert results == [False, False, False, True, True]
+        assert q.get_drop_count() == 2
+        assert q.full()
+        assert [q.get_nowait() for _ in range(3)] == [2, 3, 4]
+
+        q.reset_drop_count()
+        assert q.get_drop_count() == 0
+
+    @pytest.mark.parametrize("mode", MODES)
+    def test_matches_overflow_queue(self, mode):
+        """与 OverflowQueue 在相同操作序列下行为一致"""
+        ring = RingOverflowQueue(maxsize=5, mode=mode)
+        legacy = OverflowQueue(maxsize=5)
+        ops = [1] * 7 + [0] * 3 + [1] * 4 + [0] * 5
+
+        for i, op in enumerate(ops):
+            if op:
+                assert ring.put_with_overflow(i) == legacy.put_with_overflow(i)
+            else:
+                assert ring.get_nowait() == legacy.get_nowait()
+            assert ring.qsize() == legacy.qsize()
+            assert ring.get_usage_ratio() == legacy.get_usage_ratio()
+            assert ring.get_pressure_level() == legacy.get_pressure_level()
+            assert ring.get_available_space() == legacy.get_available_space()
+        assert ring.get_drop_count() == legacy.get_drop_count()
+
+    @pytest.mark.parametrize("mode", MODES)
+    def test_get_timeout_raises_empty(self, mode):
+        q = RingOverflowQueue(maxsize=2, mode=mode)
+        with pytest.raises(Empty):
+            q.get_nowait()
+        with pytest.raises(Empty):
+            q.get(timeout=0.01)
+
+    @pytest.mark.parametrize("mode", MODES)
+    def test_blocking_get_is_woken_by_producer(self, mode):
+        q = RingOverflowQueue(maxsize=2, mode=mode)
+        timer = threading.Timer(0.05, q.put_with_overflow, args=("item",))
+        timer.start()
+        try:
+            assert q.get(timeout=2.0) == "item"
+        finally:
+            timer.cancel()
+
+    def test_pressure_levels(self):
+        q = RingOverflowQueue(maxsize=20)
+        for _ in range(10):
+            q.put_with_overflow(0)
+        assert q.get_pressure_level() == "medium"
+        assert q.is_under_pressure(0.5)
+        for _ in range(8):
+            q.put_with_overflow(0)
+        assert q.get_pressure_level() == "high"
+        q.put_with_overflow(0)
+        assert q.get_pressure_level() == "critical"
+        assert q.is_nearly_full(1)
+
+
+class TestRingOverflowQueueConcurrency:
+    """并发场景测试"""
+
+    @pytest.mark.parametrize("mode", MODES)
+    def test_single_producer_single_consumer_order(self, mode):
+        """生产者高速写入时，消费者读到的序列严格递增且无重复"""
+        q = RingOverflowQueue(maxsize=8, mode=mode)
+        total = 20000
+        received = []
+        done = threading.Event()
+
+        def producer():
+            for i in range(total):
+                q.put_with_overflow(i)
+            done.set()
+
+        def consumer():
+            while True:
+                try:
+                    received.append(q.get(timeout=0.05))
+                except Empty:
+                    if done.is_set() and q.empty():
+                        return
+
+        threads = [threading.Thread(target=producer), threading.Thread(target=consumer)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=10.0)
+
+        assert received, "消费者应至少读到一个元素"
+        assert all(b > a for a, b in zip(received, received[1:]))
+        assert received[-1] == total - 1
+
+    def test_mpmc_multiple_producers_no_loss_without_overflow(self):
+        q = RingOverflowQueue(maxsize=4000, mode="mpmc")
+        per_producer = 1000
+
+        def producer(base):
+            for i in range(per_producer):
+                q.put_with_overflow(base + i)
+
+        threads = [threading.Thread(target=producer, args=(k * per_producer,)) for k in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        items = [q.get_nowait() for _ in range(q.qsize())]
+        assert sorted(items) == list(range(4 * per_producer))
+        assert q.get_drop_count() == 0
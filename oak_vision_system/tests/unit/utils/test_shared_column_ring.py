@@ -0,0 +1,105 @@
+"""SharedColumnRing 单元测试
+
+覆盖写入/读取、满缓冲区、行数截断、空帧以及共享内存释放（含仍有外部视图时）。
+跨进程传递由分片流水线测试覆盖。
+"""
+
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+from oak_vision_system.utils.data_structures.shared_ring import SharedColumnRing
+
+
+COLUMNS = {
+    "bbox": (np.float32, (4,)),
+    "labels": (np.int32, ()),
+}
+
+
+@pytest.fixture
+def ring():
+    r = SharedColumnRing(COLUMNS, slots=2, max_rows=3)
+    yield r
+    r.close()
+
+
+def _frame(n, offset=0):
+    return {
+        "bbox": np.arange(n * 4, dtype=np.float32).reshape(n, 4) + offset,
+        "labels": np.arange(n, dtype=np.int32) + offset,
+    }
+
+
+class TestSharedColumnRing:
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            SharedColumnRing(COLUMNS, slots=0, max_rows=1)
+        with pytest.raises(ValueError):
+            SharedColumnRing(COLUMNS, slots=1, max_rows=0)
+
+    def test_write_read_roundtrip_fifo(self, ring):
+        assert ring.write(1, 10, _frame(2), 2)
+        assert ring.write(2, 11, _frame(3, offset=100), 3)
+
+        key, frame_id, cols = ring.read(timeout=0)
+        assert (key, frame_id) == (1, 10)
+        np.testing.assert_array_equal(cols["bbox"], _frame(2)["bbox"])
+        np.testing.assert_array_equal(cols["labels"], [0, 1])
+
+        key, frame_id, cols = ring.read(timeout=0)
+        assert (key, frame_id) == (2, 11)
+        np.testing.assert_array_equal(cols["labels"], [100, 101, 102])
+        assert cols["labels"].dtype == np.int32
+
+    def test_read_returns_copy(self, ring):
+        ring.write(0, 1, _frame(1), 1)
+        _, _, cols = ring.read(timeout=0)
+        ring.write(0, 2, _frame(1, offset=50), 1)
+        ring.write(0, 3, _frame(1, offset=60), 1)
+        assert cols["labels"][0] == 0
+
+    def test_full_ring_rejects_without_blocking(self, ring):
+        assert ring.write(0, 1, _frame(1), 1)
+        assert ring.write(0, 2, _frame(1), 1)
+        assert not ring.write(0, 3, _frame(1), 1)
+        assert not ring.write(0, 3, _frame(1), 1, timeout=0.01)
+        ring.read(timeout=0)
+        assert ring.write(0, 3, _frame(1), 1)
+
+    def test_empty_read_returns_none(self, ring):
+        assert ring.try_read() is None
+        assert ring.read(timeout=0.01) is None
+
+    def test_rows_truncated_to_max_rows(self, ring):
+        ring.write(0, 1, _frame(5), 5)
+        _, _, cols = ring.read(timeout=0)
+        assert len(cols["labels"]) == 3
+        assert cols["bbox"].shape == (3, 4)
+
+    def test_empty_frame_has_zero_length_columns(self, ring):
+        ring.write(7, 1, {}, 0)
+        key, _, cols = ring.read(timeout=0)
+        assert key == 7
+        assert cols["bbox"].shape == (0, 4)
+        assert cols["labels"].shape == (0,)
+
+    def test_close_unlinks_shared_memory(self):
+        r = SharedColumnRing(COLUMNS, slots=1, max_rows=1)
+        name = r.name
+        r.close()
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+
+    def test_close_unlinks_even_with_exported_view(self):
+        r = SharedColumnRing(COLUMNS, slots=1, max_rows=1)
+        name = r.name
+        view = r._shm.buf[:1]  # 外部视图使 close() 抛出 BufferError
+        try:
+            r.close()
+            with pytest.raises(FileNotFoundError):
+                shared_memory.SharedMemory(name=name)
+        finally:
+            view.release()
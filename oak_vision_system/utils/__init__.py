@@ -20,7 +20,8 @@ from .logging_utils import (
 )
 
 # 自定义数据结构
-from .data_structures.Queue import OverflowQueue
+from .data_structures.Queue import OverflowQueue, RingOverflowQueue
+from .data_structures.buffer_pool import FrameBufferPool, get_frame_buffer_pool
 
 __all__ = [
     'build_oak_to_xyz_homogeneous',
@@ -32,5 +33,8 @@ __all__ = [
     'attach_exception_logger',
     'setup_exception_logger',
     'OverflowQueue',
+    'RingOverflowQueue',
+    'FrameBufferPool',
+    'get_frame_buffer_pool',
 ]
 
@@ -1,6 +1,7 @@
 from queue import Queue, Empty
 import threading
-from typing import TypeVar
+import time
+from typing import Generic, List, Optional, Tuple, TypeVar
 
 T = TypeVar("T")
 
@@ -189,3 +190,273 @@ class OverflowQueue(Queue[T]):
         非阻塞获取元素（类型安全的重载）
         """
         return super().get_nowait()
+
+
+class RingOverflowQueue(Generic[T]):
+    """
+    固定容量环形缓冲溢出队列
+
+    与 OverflowQueue 提供相同的接口（put_with_overflow / get / 丢弃统计 / 压力接口），
+    但基于预分配的环形数组实现，不再继承 queue.Queue：
+
+    - 入队只使用一把锁（不再额外嵌套 _drop_lock）
+    - 指标读取（qsize / get_usage_ratio / get_pressure_level / get_drop_count）
+      只读取整型计数器，不加锁，背压监控轮询时不与生产者竞争
+    - mode="spsc"：单生产者/单消费者无锁模式。生产者只写 _tail，消费者只写 _head，
+      每个槽位带序号（seqlock 风格），消费者借此识别被覆盖的旧元素
+    - mode="mpmc"：多生产者/多消费者模式，使用单把锁保护读写指针
+
+    注意：
+    - 不跟踪未完成任务，task_done() 为兼容接口（空操作），不支持 join()
+    - spsc 模式下必须保证只有一个线程调用 put_with_overflow、只有一个线程调用 get，
+      否则行为未定义；无法保证时请使用 mpmc 模式
+    """
+
+    MODES = ("spsc", "mpmc")
+
+    def __init__(self, maxsize: int, mode: str = "mpmc"):
+        """
+        初始化环形溢出队列
+
+        Args:
+            maxsize: 队列最大容量，必须 > 0
+            mode: "spsc"（单生产者/单消费者，无锁）或 "mpmc"（加锁，默认）
+
+        Raises:
+            ValueError: 如果 maxsize <= 0 或 mode 无效
+        """
+        if maxsize <= 0:
+            raise ValueError("RingOverflowQueue 必须指定 maxsize > 0")
+        if mode not in self.MODES:
+            raise ValueError(f"mode 必须为 {self.MODES} 之一，当前值: {mode}")
+
+        self.maxsize = maxsize
+        self.mode = mode
+        self._buf: List[Optional[T]] = [None] * maxsize
+        # 槽位序号：记录写入该槽位的全局写序号，-1 表示正在写入/无效
+        self._seq: List[int] = [-1] * maxsize
+        # 全局单调递增的读/写序号（不取模），size = _tail - _head
+        self._head = 0
+        self._tail = 0
+        self.drop_count = 0
+
+        # mpmc 模式下保护读写指针的唯一一把锁，以及基于同一把锁的条件变量
+        self._lock = threading.Lock()
+        self._not_empty_cond = threading.Condition(self._lock)
+        self._cond_waiters = 0
+
+        # spsc 模式下的消费者等待机制：仅在消费者确实阻塞时才由生产者触发 Event
+        self._waiting = False
+        self._not_empty = threading.Event()
+
+        self._put = self._put_spsc if mode == "spsc" else self._put_mpmc
+
+    # ========== 入队 ==========
+
+    def put_with_overflow(self, item: T) -> bool:
+        """
+        放入元素，队列满时丢弃最旧的元素。
+
+        该方法永不阻塞。
+
+        Args:
+            item: 要放入的元素
+
+        Returns:
+            bool: 是否丢弃了旧元素
+        """
+        return self._put(item)
+
+    def _put_mpmc(self, item: T) -> bool:
+        with self._lock:
+            dropped = False
+            tail = self._tail
+            if tail - self._head >= self.maxsize:
+                # 队列满：丢弃最旧元素
+                self._buf[self._head % self.maxsize] = None
+                self._head += 1
+                self.drop_count += 1
+                dropped = True
+            self._buf[tail % self.maxsize] = item
+            self._tail = tail + 1
+            if self._cond_waiters:
+                self._not_empty_cond.notify()
+            return dropped
+
+    def _put_spsc(self, item: T) -> bool:
+        tail = self._tail
+        slot = tail % self.maxsize
+        # 写满时直接覆盖最旧槽位，由消费者根据序号跳过被覆盖的元素
+        dropped = tail - self._head >= self.maxsize
+        if dropped:
+            self.drop_count += 1
+        # seqlock：先置无效，再写数据，最后发布序号
+        self._seq[slot] = -1
+        self._buf[slot] = item
+        self._seq[slot] = tail
+        self._tail = tail + 1
+        if self._waiting:
+            self._not_empty.set()
+        return dropped
+
+    # ========== 出队 ==========
+
+    def _try_get_spsc(self) -> Tuple[bool, Optional[T]]:
+        while True:
+            head = self._head
+            tail = self._tail
+            if head >= tail:
+                return False, None
+            if tail - head > self.maxsize:
+                # 生产者已覆盖了尚未读取的元素，跳到仍然有效的最旧位置
+                head = tail - self.maxsize
+            slot = head % self.maxsize
+            seq_before = self._seq[slot]
+            item = self._buf[slot]
+            seq_after = self._seq[slot]
+            if seq_before == head and seq_after == head:
+                # 消费者不回写槽位（槽位只由生产者写入），引用在被覆盖时释放
+                self._head = head + 1
+                return True, item
+            # 读取期间槽位被覆盖：以最新写指针重新定位
+            self._head = max(head + 1, self._tail - self.maxsize)
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> T:
+        """
+        获取元素
+
+        Args:
+            block: 是否阻塞等待
+            timeout: 阻塞等待的超时时间（秒），None 表示无限等待
+
+        Raises:
+            Empty: 非阻塞且队列为空，或等待超时
+        """
+        if self.mode == "mpmc":
+            return self._get_mpmc(block, timeout)
+
+        ok, item = self._try_get_spsc()
+        if ok:
+            return item  # type: ignore[return-value]
+        if not block:
+            raise Empty
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            # 先声明等待再复查，避免错过生产者的通知
+            self._not_empty.clear()
+            self._waiting = True
+            try:
+                ok, item = self._try_get_spsc()
+                if ok:
+                    return item  # type: ignore[return-value]
+                if deadline is None:
+                    self._not_empty.wait()
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise Empty
+                    self._not_empty.wait(remaining)
+            finally:
+                self._waiting = False
+            ok, item = self._try_get_spsc()
+            if ok:
+                return item  # type: ignore[return-value]
+
+    def _get_mpmc(self, block: bool, timeout: Optional[float]) -> T:
+        with self._not_empty_cond:
+            if not block:
+                if self._head >= self._tail:
+                    raise Empty
+            else:
+                deadline = None if timeout is None else time.monotonic() + timeout
+                while self._head >= self._tail:
+                    remaining = None
+                    if deadline is not None:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise Empty
+                    self._cond_waiters += 1
+                    try:
+                        self._not_empty_cond.wait(remaining)
+                    finally:
+                        self._cond_waiters -= 1
+            head = self._head
+            slot = head % self.maxsize
+            item = self._buf[slot]
+            self._buf[slot] = None
+            self._head = head + 1
+            return item  # type: ignore[return-value]
+
+    def get_nowait(self) -> T:
+        """非阻塞获取元素"""
+        return self.get(block=False)
+
+    def task_done(self) -> None:
+        """兼容 queue.Queue 接口（环形队列不跟踪未完成任务）"""
+        pass
+
+    # ========== 容量接口 ==========
+
+    def qsize(self) -> int:
+        """当前元素数量（无锁快照）"""
+        size = self._tail - self._head
+        if size < 0:
+            return 0
+        return size if size < self.maxsize else self.maxsize
+
+    def empty(self) -> bool:
+        return self.qsize() == 0
+
+    def full(self) -> bool:
+        return self.qsize() >= self.maxsize
+
+    # ========== 统计接口 ==========
+
+    def get_drop_count(self) -> int:
+        """获取累计丢弃次数"""
+        return self.drop_count
+
+    def reset_drop_count(self) -> None:
+        """重置丢弃计数器"""
+        self.drop_count = 0
+
+    # ========== 背压控制接口 ==========
+
+    def get_usage_ratio(self) -> float:
+        """获取队列使用率，范围 [0.0, 1.0]"""
+        return self.qsize() / self.maxsize
+
+    def get_available_space(self) -> int:
+        """获取队列剩余空间"""
+        return self.maxsize - self.qsize()
+
+    def is_under_pressure(self, threshold: float = 0.8) -> bool:
+        """检查队列使用率是否超过阈值"""
+        if not 0.0 <= threshold <= 1.0:
+            raise ValueError(f"threshold 必须在 [0.0, 1.0] 范围内，当前值: {threshold}")
+        return self.get_usage_ratio() >= threshold
+
+    def is_nearly_full(self, threshold: int = 1) -> bool:
+        """检查队列是否接近满载（按“剩余空位”判断）"""
+        if threshold < 0:
+            raise ValueError(f"threshold 必须 >= 0，当前值: {threshold}")
+        return self.get_available_space() <= threshold
+
+    def get_pressure_level(self) -> str:
+        """
+        获取队列压力等级
+
+        Returns:
+            str: "low" | "medium" | "high" | "critical"
+        """
+        usage = self.get_usage_ratio()
+
+        if usage < 0.5:
+            return "low"
+        elif usage < 0.8:
+            return "medium"
+        elif usage < 0.95:
+            return "high"
+        else:
+            return "critical"
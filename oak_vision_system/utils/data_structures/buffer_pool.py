@@ -0,0 +1,137 @@
+"""
+帧缓冲区池
+
+按 (shape, dtype) 分组回收 NumPy 数组，供渲染器、深度可视化和视频流编码复用，
+避免每帧分配整幅图像带来的分配器抖动和缺页中断。
+
+释放语义是显式的：acquire() 取得的缓冲区在调用方确认不再使用后通过 release() 归还；
+从未归还的缓冲区由 GC 正常回收，不会影响池的正确性。release() 只接受由本池发出、
+且仍然存活的数组，传入其他数组（包括池数组的视图）会被忽略，因此调用方可以对来源
+不确定的数组直接调用 release()。
+
+只有能确定自己持有最后一个引用的模块才能归还缓冲区：通过事件总线发布、可能被多个
+订阅者同时持有的数据（如 VideoFrameDTO 的图像）不应从池中分配。
+
+线程安全：所有操作在同一把锁内完成，锁内只做字典/列表操作。
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# 缓冲区分组键：(shape, dtype)
+BufferKey = Tuple[Tuple[int, ...], np.dtype]
+
+
+class FrameBufferPool:
+    """
+    按尺寸分组的帧缓冲区池
+
+    每个分组最多保留 max_free_per_key 个空闲缓冲区，超出部分在 release() 时直接丢弃，
+    交给 GC 回收，从而限制池的常驻内存。
+    """
+
+    def __init__(self, max_free_per_key: int = 4) -> None:
+        """
+        Args:
+            max_free_per_key: 每个 (shape, dtype) 分组最多保留的空闲缓冲区数量
+        """
+        if max_free_per_key < 0:
+            raise ValueError("max_free_per_key 不能为负数")
+        self._max_free_per_key = max_free_per_key
+        self._lock = threading.Lock()
+        self._free: Dict[BufferKey, List[np.ndarray]] = {}
+        # 已发出且尚未归还的缓冲区：id -> 数组（弱引用，避免 id 复用导致误收）
+        self._outstanding: "weakref.WeakValueDictionary[int, np.ndarray]" = weakref.WeakValueDictionary()
+        self._stats = {"allocated": 0, "reused": 0, "released": 0, "discarded": 0}
+
+    @staticmethod
+    def _key(shape: Tuple[int, ...], dtype) -> BufferKey:
+        return (tuple(int(s) for s in shape), np.dtype(dtype))
+
+    def acquire(self, shape: Tuple[int, ...], dtype=np.uint8) -> np.ndarray:
+        """
+        取得一个指定形状和类型的缓冲区，内容未初始化
+
+        Args:
+            shape: 数组形状
+            dtype: 数组类型
+
+        Returns:
+            C 连续的可写数组
+        """
+        key = self._key(shape, dtype)
+        with self._lock:
+            free = self._free.get(key)
+            if free:
+                buf = free.pop()
+                self._stats["reused"] += 1
+            else:
+                buf = None
+                self._stats["allocated"] += 1
+        if buf is None:
+            buf = np.empty(key[0], dtype=key[1])
+        with self._lock:
+            self._outstanding[id(buf)] = buf
+        return buf
+
+    def release(self, buf: Optional[np.ndarray]) -> bool:
+        """
+        归还缓冲区
+
+        Args:
+            buf: acquire() 取得的数组；None 或非本池数组会被忽略
+
+        Returns:
+            bool: 是否被本池接收
+        """
+        if buf is None:
+            return False
+        with self._lock:
+            if self._outstanding.get(id(buf)) is not buf:
+                return False
+            del self._outstanding[id(buf)]
+            self._stats["released"] += 1
+            free = self._free.setdefault(self._key(buf.shape, buf.dtype), [])
+            if len(free) >= self._max_free_per_key:
+                self._stats["discarded"] += 1
+                return True
+            free.append(buf)
+        return True
+
+    def clear(self) -> None:
+        """丢弃所有空闲缓冲区（已发出的缓冲区不受影响）"""
+        with self._lock:
+            self._free.clear()
+
+    def get_stats(self) -> dict:
+        """
+        获取统计信息
+
+        Returns:
+            dict: allocated / reused / released / discarded 计数，
+                  以及 free_buffers（空闲数）和 free_bytes（空闲字节数）
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["free_buffers"] = sum(len(v) for v in self._free.values())
+            stats["free_bytes"] = sum(b.nbytes for v in self._free.values() for b in v)
+        return stats
+
+
+_default_pool: Optional[FrameBufferPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def get_frame_buffer_pool() -> FrameBufferPool:
+    """获取进程内共享的帧缓冲区池（单例）"""
+    global _default_pool
+    if _default_pool is None:
+        with _default_pool_lock:
+            if _default_pool is None:
+                _default_pool = FrameBufferPool()
+    return _default_pool
@@ -0,0 +1,219 @@
+"""
+共享内存列式环形缓冲区
+
+用于进程间传递列式检测数据（每帧若干行，每列一个定长数组），避免 pickle DTO。
+所有槽位的列数组预分配在一块 multiprocessing.shared_memory 中，
+写入/读取只是 NumPy 切片拷贝。
+
+同步方式：两个信号量组成的有界缓冲区
+- items：已写入、待读取的槽位数
+- free：空闲槽位数
+信号量的 acquire/release 同时充当跨进程内存屏障，保证读者看到完整的槽位数据。
+
+约束：单生产者单消费者（每端各自在本地维护槽位游标）。
+"""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from typing import Dict, Mapping, Optional, Tuple
+
+import numpy as np
+
+# 列定义：列名 -> (dtype, 每行形状)，例如 {"bbox": (np.float32, (4,)), "labels": (np.int32, ())}
+ColumnSpec = Dict[str, Tuple[object, Tuple[int, ...]]]
+
+_ALIGN = 64
+_HEADER_WIDTH = 3  # key, frame_id, count
+
+
+def _align(n: int) -> int:
+    return (n + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+class SharedColumnRing:
+    """
+    共享内存列式 SPSC 环形缓冲区
+
+    创建方持有共享内存并负责 unlink；实例可以作为 multiprocessing.Process 的参数
+    传给子进程，子进程按名称重新映射同一块共享内存。
+
+    每个槽位携带一个整数 key（如设备编号）、一个 frame_id 和行数 count。
+    """
+
+    def __init__(
+        self,
+        columns: ColumnSpec,
+        *,
+        slots: int,
+        max_rows: int,
+        ctx: Optional[mp.context.BaseContext] = None,
+    ) -> None:
+        """
+        Args:
+            columns: 列定义
+            slots: 槽位数量
+            max_rows: 每个槽位的最大行数，超出部分在写入时截断
+            ctx: multiprocessing 上下文（信号量需与子进程使用同一上下文）
+        """
+        if slots <= 0:
+            raise ValueError("slots 必须大于 0")
+        if max_rows <= 0:
+            raise ValueError("max_rows 必须大于 0")
+
+        ctx = ctx if ctx is not None else mp.get_context()
+        self._columns = {name: (np.dtype(dtype), tuple(shape)) for name, (dtype, shape) in columns.items()}
+        self._slots = slots
+        self._max_rows = max_rows
+        self._items = ctx.Semaphore(0)
+        self._free = ctx.Semaphore(slots)
+
+        self._shm = shared_memory.SharedMemory(create=True, size=self._layout_size())
+        self._owner = True
+        self._map_views()
+
+    # ------ 进程间传递 ------
+
+    def __getstate__(self) -> dict:
+        return {
+            "name": self._shm.name,
+            "columns": self._columns,
+            "slots": self._slots,
+            "max_rows": self._max_rows,
+            "items": self._items,
+            "free": self._free,
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        self._columns = state["columns"]
+        self._slots = state["slots"]
+        self._max_rows = state["max_rows"]
+        self._items = state["items"]
+        self._free = state["free"]
+        self._shm = shared_memory.SharedMemory(name=state["name"])
+        self._owner = False
+        self._map_views()
+
+    # ------ 属性 ------
+
+    @property
+    def name(self) -> str:
+        """共享内存名称"""
+        return self._shm.name
+
+    @property
+    def slots(self) -> int:
+        return self._slots
+
+    @property
+    def max_rows(self) -> int:
+        return self._max_rows
+
+    # ------ 读写 ------
+
+    def write(
+        self,
+        key: int,
+        frame_id: int,
+        columns: Mapping[str, np.ndarray],
+        count: int,
+        timeout: Optional[float] = 0.0,
+    ) -> bool:
+        """
+        写入一个槽位
+
+        Args:
+            key: 槽位键（如设备编号）
+            frame_id: 帧ID
+            columns: 各列数据，每列前 count 行有效；缺省的列不写入
+            count: 行数，超过 max_rows 时截断
+            timeout: 等待空闲槽位的时间；0 表示不等待，None 表示一直等待
+
+        Returns:
+            bool: 是否写入成功（缓冲区满且超时返回 False）
+        """
+        if timeout == 0.0:
+            if not self._free.acquire(False):
+                return False
+        elif not self._free.acquire(True, timeout):
+            return False
+
+        slot = self._write_pos
+        self._write_pos = (slot + 1) % self._slots
+        n = min(count, self._max_rows)
+        header = self._header[slot]
+        header[0] = key
+        header[1] = frame_id
+        header[2] = n
+        for name, data in columns.items():
+            self._views[name][slot, :n] = data[:n]
+
+        self._items.release()
+        return True
+
+    def read(self, timeout: Optional[float] = None) -> Optional[Tuple[int, int, Dict[str, np.ndarray]]]:
+        """
+        读取一个槽位（数据被拷贝出共享内存，槽位随即释放）
+
+        Args:
+            timeout: 等待数据的时间；0 表示不等待，None 表示一直等待
+
+        Returns:
+            (key, frame_id, columns)，超时返回 None
+        """
+        if timeout == 0.0:
+            if not self._items.acquire(False):
+                return None
+        elif not self._items.acquire(True, timeout):
+            return None
+        return self._read_slot()
+
+    def try_read(self) -> Optional[Tuple[int, int, Dict[str, np.ndarray]]]:
+        """非阻塞读取"""
+        return self.read(timeout=0.0)
+
+    def close(self) -> None:
+        """解除本进程的映射；创建方同时释放共享内存"""
+        self._views = {}
+        self._header = None
+        try:
+            self._shm.close()
+        except BufferError:
+            # 仍有外部视图引用时无法解除映射，交由进程退出时回收；
+            # 共享内存名称仍需由创建方释放，否则会泄漏到 /dev/shm
+            pass
+        if self._owner:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+            self._owner = False
+
+    # ------ 内部实现 ------
+
+    def _read_slot(self) -> Tuple[int, int, Dict[str, np.ndarray]]:
+        slot = self._read_pos
+        self._read_pos = (slot + 1) % self._slots
+        key, frame_id, n = (int(v) for v in self._header[slot])
+        data = {name: view[slot, :n].copy() for name, view in self._views.items()}
+        self._free.release()
+        return key, frame_id, data
+
+    def _layout_size(self) -> int:
+        size = _align(self._slots * _HEADER_WIDTH * 8)
+        for dtype, shape in self._columns.values():
+            size += _align(self._slots * self._max_rows * int(np.prod(shape, dtype=np.int64)) * dtype.itemsize)
+        return size
+
+    def _map_views(self) -> None:
+        buf = self._shm.buf
+        self._header = np.ndarray((self._slots, _HEADER_WIDTH), dtype=np.int64, buffer=buf, offset=0)
+        offset = _align(self._slots * _HEADER_WIDTH * 8)
+        self._views: Dict[str, np.ndarray] = {}
+        for name, (dtype, shape) in self._columns.items():
+            full_shape = (self._slots, self._max_rows) + shape
+            self._views[name] = np.ndarray(full_shape, dtype=dtype, buffer=buf, offset=offset)
+            offset += _align(int(np.prod(full_shape, dtype=np.int64)) * dtype.itemsize)
+        self._write_pos = 0
+        self._read_pos = 0
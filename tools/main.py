@@ -22,6 +22,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from oak_vision_system.core.system_manager import SystemManager
 from oak_vision_system.core.event_bus import get_event_bus
+from oak_vision_system.core.tracing import initialize_latency_tracer
 from oak_vision_system.modules.config_manager.device_config_manager import DeviceConfigManager
 from oak_vision_system.modules.data_collector.collector import OAKDataCollector
 from oak_vision_system.modules.data_processing.data_processor import DataProcessor
@@ -100,7 +101,8 @@ def create_modules(config_manager: DeviceConfigManager, logger: logging.Logger):
 
         collector = OAKDataCollector(
             config=oak_config,
-            available_devices=list(device_metadata.values())
+            available_devices=list(device_metadata.values()),
+            system_config=config_manager.get_system_config(),
         )
         modules['collector'] = collector
         logger.info("    [OK] OAKDataCollector 创建成功")
@@ -167,7 +169,7 @@ def register_modules(system_manager : SystemManager, modules, logger):
     
     try:
         # 按优先级注册模块
-        # 优先级：数据源(10) < 处理器(30) < 显示(50) < 通信(70)
+        # 优先级：数据源(10) < 处理器(30) < 显示(50) < 通信(70) < 延迟追踪(90)
         
         # 1. 数据采集模块（优先级 10）
         system_manager.register_module(
@@ -202,6 +204,14 @@ def register_modules(system_manager : SystemManager, modules, logger):
         )
         logger.info("  [OK] CAN 已注册（优先级: 70）")
         
+        # 5. 延迟追踪统计发布（优先级 90，未启用 enable_profiling 时不启动线程）
+        system_manager.register_module(
+            "tracer",
+            modules['tracer'],
+            priority=90
+        )
+        logger.info("  [OK] Tracer 已注册（优先级: 90）")
+        
         logger.info("[OK] 所有模块注册完成")
         
     except Exception as e:
@@ -225,8 +235,13 @@ def main():
     # 3. 加载配置
     config_manager = load_configuration(CONFIG_PATH, logger)
     
-    # 4. 创建模块
+    # 4. 初始化延迟追踪（各模块在创建时取得追踪器引用），并创建模块
+    tracer = initialize_latency_tracer(
+        enabled=config_manager.get_system_config().enable_profiling,
+        event_bus=get_event_bus(),
+    )
     modules = create_modules(config_manager, logger)
+    modules['tracer'] = tracer
     
     # 5. 创建 SystemManager
     logger.info("创建 SystemManager...")